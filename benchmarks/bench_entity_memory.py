@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+Memoria y tiempo de construcción de entidades y DTOs con ``__slots__``.
+
+Para cada clase compara la versión actual (``@dataclass(slots=True)``) con una
+copia equivalente sin slots (con ``__dict__`` por instancia, como antes):
+- Tiempo de construir N instancias (100k por defecto).
+- Memoria asignada para mantenerlas vivas (tracemalloc; incluye los valores de
+  los campos, que son iguales en ambas variantes).
+- Tiempo de convertirlas a dict con el convertidor de ``BaseEntitySerializer``.
+
+Uso:
+    python benchmarks/bench_entity_memory.py --count 100000
+
+No necesita Django configurado.
+"""
+
+import argparse
+import dataclasses
+import gc
+import sys
+import timeit
+import tracemalloc
+from datetime import datetime, timezone
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+sys.path[:0] = [str(ROOT_DIR), str(ROOT_DIR / "src")]
+
+from apps.playlists.domain.entities import PlaylistSongEntity  # noqa: E402
+from apps.songs.api.dtos import SongResponseDTO  # noqa: E402
+from apps.songs.domain.entities import SongEntity  # noqa: E402
+from common.serializers import get_dto_converter  # noqa: E402
+
+NOW = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+FACTORIES = {
+    SongEntity: lambda cls, i: cls(
+        id=f"song-{i}",
+        title=f"Song {i}",
+        artist_id="artist-1",
+        artist_name="Artist",
+        duration_seconds=180,
+        play_count=i,
+        created_at=NOW,
+    ),
+    SongResponseDTO: lambda cls, i: cls(
+        id=f"song-{i}",
+        title=f"Song {i}",
+        artist_name="Artist",
+        genre_names=["rock"],
+        duration_seconds=180,
+        created_at=NOW,
+    ),
+    PlaylistSongEntity: lambda cls, i: cls(
+        id=f"ps-{i}",
+        playlist_id="playlist-1",
+        song_id=f"song-{i}",
+        position=i,
+        added_at=NOW,
+    ),
+}
+
+
+def without_slots(cls):
+    """Copia de la dataclass ``cls`` sin slots (con ``__dict__``)"""
+    fields = [
+        (
+            f.name,
+            f.type,
+            dataclasses.field(default=f.default, default_factory=f.default_factory),
+        )
+        for f in dataclasses.fields(cls)
+    ]
+    namespace = {}
+    if hasattr(cls, "__post_init__"):
+        namespace["__post_init__"] = cls.__post_init__
+    return dataclasses.make_dataclass(
+        f"{cls.__name__}Dict", fields, namespace=namespace
+    )
+
+
+def allocated(build) -> int:
+    gc.collect()
+    tracemalloc.start()
+    instances = build()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del instances
+    return size
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--count", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    count = args.count
+    print(f"{count} instancias")
+    print(
+        f"{'clase':<22}{'variante':<10}{'memoria (MB)':>14}"
+        f"{'construcción (ms)':>20}{'a dict (ms)':>14}"
+    )
+    for cls, factory in FACTORIES.items():
+        for label, variant in (("dict", without_slots(cls)), ("slots", cls)):
+
+            def build():
+                return [factory(variant, i) for i in range(count)]
+
+            memory = allocated(build)
+            construction = min(timeit.repeat(build, repeat=args.repeat, number=1))
+            instances = build()
+            converter = get_dto_converter(variant)
+            to_dict = min(
+                timeit.repeat(
+                    lambda: [converter(x) for x in instances],
+                    repeat=args.repeat,
+                    number=1,
+                )
+            )
+            print(
+                f"{cls.__name__:<22}{label:<10}{memory / 2**20:>14.1f}"
+                f"{construction * 1000:>20.1f}{to_dict * 1000:>14.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
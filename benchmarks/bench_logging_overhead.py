@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""
+Microbenchmark del coste del logging en el camino caliente.
+
+Mide:
+- ``SongEntityModelMapper.models_to_entities`` sobre N filas (10k por defecto)
+  con DEBUG habilitado y deshabilitado.
+- El overhead por llamada de ``@log_execution`` / ``@log_performance`` frente a
+  la función sin decorar: activos, con el nivel deshabilitado y desactivados
+  por módulo (passthrough).
+
+Uso:
+    python benchmarks/bench_logging_overhead.py --rows 10000 --repeat 5
+
+Las variables de entorno de Django (SECRET_KEY, DATABASE_URL...) deben estar
+definidas, igual que para ``manage.py``. No accede a la base de datos.
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import sys
+import timeit
+import uuid
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+sys.path[:0] = [str(ROOT_DIR), str(ROOT_DIR / "src")]
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings")
+
+import django  # noqa: E402
+
+django.setup()
+
+from django.conf import settings  # noqa: E402
+
+from apps.albums.infrastructure.models import AlbumModel  # noqa: E402
+from apps.artists.infrastructure.models import ArtistModel  # noqa: E402
+from apps.genres.infrastructure.models import GenreModel  # noqa: E402
+from apps.songs.api.mappers.song_entity_model_mapper import (  # noqa: E402
+    SongEntityModelMapper,
+)
+from apps.songs.infrastructure.models import SongModel  # noqa: E402
+from common.utils.logging_decorators import (  # noqa: E402
+    log_execution,
+    log_performance,
+)
+
+
+def build_models(rows: int):
+    """
+    Modelos sin guardar, con artista y álbum resueltos (como select_related) y
+    géneros precargados (como prefetch_related), así que no hay consultas.
+    """
+    artist = ArtistModel(id=uuid.uuid4(), name="Benchmark Artist")
+    album = AlbumModel(id=uuid.uuid4(), title="Benchmark Album", artist=artist)
+    models = []
+    for i in range(rows):
+        model = SongModel(
+            id=uuid.uuid4(),
+            title=f"Song {i}",
+            artist=artist,
+            album=album,
+            duration_seconds=180,
+            play_count=i,
+        )
+        model._prefetched_objects_cache = {"genres": GenreModel.objects.none()}
+        models.append(model)
+    return models
+
+
+def best_of(stmt, repeat: int, number: int = 1) -> float:
+    return min(timeit.repeat(stmt, repeat=repeat, number=number)) / number
+
+
+def bench_mapper(rows: int, repeat: int) -> None:
+    models = build_models(rows)
+    mapper = SongEntityModelMapper()
+    mapper_logger = mapper.logger
+    # Sin handlers: se mide el coste de construir el registro, no la E/S
+    mapper_logger.propagate = False
+
+    print(f"\nSongEntityModelMapper.models_to_entities ({rows} filas)")
+    for label, level in (("DEBUG habilitado", logging.DEBUG), ("INFO", logging.INFO)):
+        mapper_logger.setLevel(level)
+        elapsed = best_of(lambda: mapper.models_to_entities(models), repeat)
+        print(
+            f"  {label:<18} {elapsed * 1000:8.2f} ms  "
+            f"{elapsed / rows * 1e6:6.2f} µs/fila"
+        )
+
+
+def _make_use_case():
+    # Los decoradores se aplican al definir la clase y leen la configuración
+    # por módulo en ese momento (el módulo de las funciones es __name__)
+    class BenchUseCase:
+        def plain(self, value):
+            return value
+
+        @log_execution(include_args=True, include_result=False, log_level="DEBUG")
+        @log_performance(threshold_seconds=1.0)
+        def decorated(self, value):
+            return value
+
+        @log_execution(include_args=True, include_result=False, log_level="DEBUG")
+        @log_performance(threshold_seconds=1.0)
+        async def adecorated(self, value):
+            return value
+
+    return BenchUseCase()
+
+
+def bench_decorators(calls: int, repeat: int) -> None:
+    module = __name__
+    decorators_logger = logging.getLogger(f"decorators.{module}")
+    decorators_logger.propagate = False
+
+    use_case = _make_use_case()
+    settings.LOGGING_DECORATORS = {"ENABLED": True, "MODULES": {module: False}}
+    passthrough = _make_use_case()
+    del settings.LOGGING_DECORATORS
+
+    argument = build_models(1)[0]
+
+    print(f"\nOverhead por llamada ({calls} llamadas, argumento SongModel)")
+    baseline = best_of(lambda: use_case.plain(argument), repeat, calls)
+    rows = [("sin decorar", baseline)]
+
+    decorators_logger.setLevel(logging.DEBUG)
+    decorated = best_of(lambda: use_case.decorated(argument), repeat, calls)
+    rows.append(("activo (DEBUG)", decorated))
+    decorators_logger.setLevel(logging.INFO)
+    disabled = best_of(lambda: use_case.decorated(argument), repeat, calls)
+    rows.append(("nivel deshabilitado", disabled))
+    bare = best_of(lambda: passthrough.decorated(argument), repeat, calls)
+    rows.append(("passthrough (módulo)", bare))
+
+    for label, elapsed in rows:
+        print(
+            f"  {label:<22} {elapsed * 1e9:8.0f} ns/llamada  "
+            f"(+{(elapsed - baseline) * 1e9:.0f} ns)"
+        )
+
+    async def run_async(target, n):
+        for _ in range(n):
+            await target.adecorated(argument)
+
+    print("\n  async (event loop incluido)")
+    for label, level, target in (
+        ("activo (DEBUG)", logging.DEBUG, use_case),
+        ("nivel deshabilitado", logging.INFO, use_case),
+        ("passthrough (módulo)", logging.INFO, passthrough),
+    ):
+        decorators_logger.setLevel(level)
+        elapsed = best_of(lambda: asyncio.run(run_async(target, calls)), repeat)
+        print(f"  {label:<22} {elapsed / calls * 1e9:8.0f} ns/llamada")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--rows", type=int, default=10_000)
+    parser.add_argument("--calls", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    bench_mapper(args.rows, args.repeat)
+    bench_decorators(args.calls, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Benchmark del renderizado de listas de canciones.
+
+Para 10, 100 y 1000 canciones mide por separado:
+- Mapeo modelo → entidad → DTO.
+- DTO → dict: recorriendo ``__dataclass_fields__`` (antes) frente al
+  convertidor precalculado de ``BaseEntitySerializer``.
+- ``SongListSerializer(many=True).data`` completo.
+- Codificación: ``JSONRenderer`` de DRF frente a ``ORJSONRenderer``.
+
+Comprueba además que ambas conversiones y ambos renderers producen
+exactamente la misma salida.
+
+Uso:
+    python benchmarks/bench_song_list_rendering.py --repeat 5
+
+Las variables de entorno de Django (SECRET_KEY, DATABASE_URL...) deben estar
+definidas, igual que para ``manage.py``. No accede a la base de datos.
+"""
+
+import argparse
+import logging
+import os
+import sys
+import timeit
+import uuid
+from datetime import datetime, timezone
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+sys.path[:0] = [str(ROOT_DIR), str(ROOT_DIR / "src")]
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings")
+
+import django  # noqa: E402
+
+django.setup()
+
+from rest_framework.renderers import JSONRenderer  # noqa: E402
+
+from apps.albums.infrastructure.models import AlbumModel  # noqa: E402
+from apps.artists.infrastructure.models import ArtistModel  # noqa: E402
+from apps.genres.infrastructure.models import GenreModel  # noqa: E402
+from apps.songs.api.serializers import SongListSerializer  # noqa: E402
+from apps.songs.infrastructure.models import SongModel  # noqa: E402
+from common.core.renderers import ORJSONRenderer  # noqa: E402
+from common.serializers import get_dto_converter  # noqa: E402
+
+SIZES = (10, 100, 1000)
+
+
+def build_models(rows: int):
+    """Modelos sin guardar con relaciones resueltas y géneros precargados"""
+    now = datetime(2025, 1, 1, 12, 30, 15, 123456, tzinfo=timezone.utc)
+    artist = ArtistModel(id=uuid.uuid4(), name="Benchmark Artist")
+    album = AlbumModel(id=uuid.uuid4(), title="Benchmark Album", artist=artist)
+    models = []
+    for i in range(rows):
+        model = SongModel(
+            id=uuid.uuid4(),
+            title=f"Canción {i} — “Live”",
+            artist=artist,
+            album=album,
+            duration_seconds=180 + i,
+            play_count=i,
+            created_at=now,
+            release_date=now,
+            file_url=f"https://cdn.example.com/songs/{i}.mp3",
+        )
+        model._prefetched_objects_cache = {"genres": GenreModel.objects.none()}
+        models.append(model)
+    return models
+
+
+def legacy_dto_to_dict(dto_instance):
+    """Conversión anterior: recorre ``__dataclass_fields__`` en cada fila"""
+    return {
+        field: getattr(dto_instance, field)
+        for field in dto_instance.__dataclass_fields__
+    }
+
+
+def best_of(stmt, repeat: int, number: int) -> float:
+    return min(timeit.repeat(stmt, repeat=repeat, number=number)) / number
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    # Como en producción (INFO): los logs DEBUG de los mappers no cuentan
+    logging.disable(logging.DEBUG)
+
+    mapper = SongListSerializer.mapper_class
+    drf_renderer = JSONRenderer()
+    orjson_renderer = ORJSONRenderer()
+
+    columns = ("filas", "modelo→DTO", "dict genérico", "dict precalc.")
+    columns += ("serializer", "JSON DRF", "JSON orjson")
+    print("".join(f"{c:>15}" for c in columns) + "   (ms)")
+    for rows in SIZES:
+        models = build_models(rows)
+        number = max(1, 1000 // rows)
+        dtos = [mapper.entity_to_dto(mapper.model_to_entity(m)) for m in models]
+        converter = get_dto_converter(type(dtos[0]))
+        assert [converter(d) for d in dtos] == [legacy_dto_to_dict(d) for d in dtos]
+
+        data = {"count": rows, "results": SongListSerializer(models, many=True).data}
+        assert orjson_renderer.render(data) == drf_renderer.render(data)
+
+        timings = [
+            lambda: [mapper.entity_to_dto(mapper.model_to_entity(m)) for m in models],
+            lambda: [legacy_dto_to_dict(d) for d in dtos],
+            lambda: [converter(d) for d in dtos],
+            lambda: SongListSerializer(models, many=True).data,
+            lambda: drf_renderer.render(data),
+            lambda: orjson_renderer.render(data),
+        ]
+        results = [best_of(stmt, args.repeat, number) * 1000 for stmt in timings]
+        print(f"{rows:>15}" + "".join(f"{r:>15.2f}" for r in results))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,262 @@
+#!/usr/bin/env python3
+"""
+Load test de los endpoints calientes: vistas sync (+ async_to_sync) vs async.
+
+Levanta uvicorn dos veces sobre la misma base de datos, una con
+``ASYNC_VIEWS_ENABLED=false`` y otra con ``true``, y compara requests/segundo
+y latencias p50/p99 de cada endpoint.
+
+Uso:
+    python benchmarks/load_test_async_views.py --duration 15 --concurrency 50
+
+    # Contra un servidor ya levantado (sin comparar modos)
+    python benchmarks/load_test_async_views.py --base-url http://localhost:8000
+
+Las variables de entorno de Django (DATABASE_URL, SECRET_KEY...) deben estar
+definidas, igual que para ``manage.py``. El endpoint de playlists requiere
+``--playlist-id`` y ``--token`` (JWT de Supabase).
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import subprocess
+import sys
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import List, Optional
+
+import httpx
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+
+
+@dataclass
+class EndpointResult:
+    name: str
+    latencies: List[float] = field(default_factory=list)
+    errors: int = 0
+    elapsed: float = 0.0
+
+    @property
+    def requests_per_second(self) -> float:
+        return len(self.latencies) / self.elapsed if self.elapsed else 0.0
+
+    def percentile(self, pct: float) -> float:
+        if not self.latencies:
+            return 0.0
+        ordered = sorted(self.latencies)
+        index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+        return ordered[index] * 1000
+
+    @property
+    def mean_ms(self) -> float:
+        return statistics.fmean(self.latencies) * 1000 if self.latencies else 0.0
+
+
+async def _hammer(
+    client: httpx.AsyncClient,
+    method: str,
+    url: str,
+    headers: dict,
+    deadline: float,
+    result: EndpointResult,
+) -> None:
+    while time.perf_counter() < deadline:
+        start = time.perf_counter()
+        try:
+            response = await client.request(method, url, headers=headers)
+            if response.status_code >= 400:
+                result.errors += 1
+                continue
+        except httpx.HTTPError:
+            result.errors += 1
+            continue
+        result.latencies.append(time.perf_counter() - start)
+
+
+async def run_endpoint(
+    base_url: str,
+    name: str,
+    method: str,
+    path: str,
+    concurrency: int,
+    duration: float,
+    headers: Optional[dict] = None,
+) -> EndpointResult:
+    result = EndpointResult(name=name)
+    limits = httpx.Limits(max_connections=concurrency)
+    async with httpx.AsyncClient(
+        base_url=base_url, limits=limits, timeout=30
+    ) as client:
+        # Calentamiento: primera request fuera de la medición
+        await client.request(method, path, headers=headers or {})
+
+        started = time.perf_counter()
+        deadline = started + duration
+        await asyncio.gather(
+            *(
+                _hammer(client, method, path, headers or {}, deadline, result)
+                for _ in range(concurrency)
+            )
+        )
+        result.elapsed = time.perf_counter() - started
+    return result
+
+
+async def discover_song_id(base_url: str) -> Optional[str]:
+    async with httpx.AsyncClient(base_url=base_url, timeout=30) as client:
+        response = await client.get("/api/songs/most-popular/")
+        results = response.json().get("results") or []
+        return results[0]["id"] if results else None
+
+
+def build_endpoints(args, song_id: Optional[str]) -> List[tuple]:
+    endpoints = [("most-popular", "GET", "/api/songs/most-popular/", None)]
+    if song_id:
+        endpoints.append(("lyrics", "GET", f"/api/songs/{song_id}/lyrics/", None))
+        if args.include_writes:
+            endpoints.append(
+                (
+                    "increment-play-count",
+                    "POST",
+                    f"/api/songs/{song_id}/increment-play-count/",
+                    None,
+                )
+            )
+    if args.playlist_id and args.token:
+        endpoints.append(
+            (
+                "playlist-songs",
+                "GET",
+                f"/api/playlists/playlist-songs/{args.playlist_id}/songs/",
+                {"Authorization": f"Bearer {args.token}"},
+            )
+        )
+    return endpoints
+
+
+async def run_suite(base_url: str, args) -> List[EndpointResult]:
+    song_id = args.song_id or await discover_song_id(base_url)
+    results = []
+    for name, method, path, headers in build_endpoints(args, song_id):
+        results.append(
+            await run_endpoint(
+                base_url,
+                name,
+                method,
+                path,
+                args.concurrency,
+                args.duration,
+                headers,
+            )
+        )
+    return results
+
+
+def start_server(port: int, async_views: bool, workers: int) -> subprocess.Popen:
+    env = os.environ.copy()
+    env["ASYNC_VIEWS_ENABLED"] = "true" if async_views else "false"
+    return subprocess.Popen(
+        [
+            sys.executable,
+            "-m",
+            "uvicorn",
+            "config.asgi:application",
+            "--port",
+            str(port),
+            "--workers",
+            str(workers),
+            "--lifespan",
+            "off",
+            "--no-access-log",
+            "--log-level",
+            "warning",
+        ],
+        cwd=ROOT_DIR,
+        env=env,
+        stdout=subprocess.DEVNULL,
+    )
+
+
+def wait_until_ready(base_url: str, timeout: float = 60.0) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            httpx.get(f"{base_url}/api/songs/most-popular/", timeout=5)
+            return
+        except httpx.HTTPError:
+            time.sleep(0.5)
+    raise RuntimeError(f"Server at {base_url} did not start in {timeout}s")
+
+
+def print_results(title: str, results: List[EndpointResult]) -> None:
+    print(f"\n== {title} ==")
+    print(
+        f"{'endpoint':<22}{'req/s':>10}{'mean ms':>10}"
+        f"{'p50 ms':>10}{'p99 ms':>10}{'errors':>8}"
+    )
+    for r in results:
+        print(
+            f"{r.name:<22}{r.requests_per_second:>10.1f}{r.mean_ms:>10.1f}"
+            f"{r.percentile(50):>10.1f}{r.percentile(99):>10.1f}{r.errors:>8}"
+        )
+
+
+def print_comparison(sync_results, async_results) -> None:
+    print("\n== async vs sync ==")
+    print(f"{'endpoint':<22}{'req/s Δ':>10}{'p99 Δ':>10}")
+    for sync_r, async_r in zip(sync_results, async_results):
+        rps = (
+            (async_r.requests_per_second / sync_r.requests_per_second - 1) * 100
+            if sync_r.requests_per_second
+            else 0.0
+        )
+        p99 = (
+            (async_r.percentile(99) / sync_r.percentile(99) - 1) * 100
+            if sync_r.percentile(99)
+            else 0.0
+        )
+        print(f"{sync_r.name:<22}{rps:>+9.1f}%{p99:>+9.1f}%")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--base-url", help="Servidor ya levantado (no compara)")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--duration", type=float, default=10.0)
+    parser.add_argument("--song-id")
+    parser.add_argument("--playlist-id")
+    parser.add_argument("--token")
+    parser.add_argument(
+        "--include-writes",
+        action="store_true",
+        help="Incluye POST increment-play-count (modifica la base de datos)",
+    )
+    args = parser.parse_args()
+
+    if args.base_url:
+        print_results(args.base_url, asyncio.run(run_suite(args.base_url, args)))
+        return
+
+    base_url = f"http://127.0.0.1:{args.port}"
+    runs = {}
+    for label, async_views in (("sync + async_to_sync", False), ("async", True)):
+        server = start_server(args.port, async_views, args.workers)
+        try:
+            wait_until_ready(base_url)
+            runs[label] = asyncio.run(run_suite(base_url, args))
+        finally:
+            server.terminate()
+            server.wait()
+        print_results(label, runs[label])
+
+    print_comparison(runs["sync + async_to_sync"], runs["async"])
+
+
+if __name__ == "__main__":
+    main()
@@ -1,23 +1,33 @@
 import os
 import sys
 
-from src.common.utils import get_logger
-
-logger = get_logger(__name__)
-
-logger.info("Loading ASGI application...")
 BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 
 sys.path.append(os.path.join(BASE_DIR, "src"))
 
+# Sólo logging_config: ni Supabase ni el ORM se importan antes de configurar Django
+from common.utils.logging_config import get_logger  # noqa: E402
+
+logger = get_logger(__name__)
+
+logger.info("Loading ASGI application...")
 logger.info(f"Adding {os.path.join(BASE_DIR, 'src')} to sys.path")
 
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings")
 
+# Los settings de base de datos ajustan las conexiones persistentes para ASGI
+os.environ.setdefault("SERVER_INTERFACE", "asgi")
+
 logger.info("Setting DJANGO_SETTINGS_MODULE to config.settings")
 
 from django.core.asgi import get_asgi_application  # noqa: E402
 
 application = get_asgi_application()
 
+from common.utils.metrics import start_metrics_exporter  # noqa: E402
+from common.utils.warmup import start_warmup  # noqa: E402
+
+start_metrics_exporter()
+start_warmup()
+
 logger.info("ASGI application loaded successfully.")
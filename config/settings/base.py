@@ -1,14 +1,30 @@
 import os
 
-from src.common.utils import LoggingConfig
+from common.utils.logging_config import LoggingConfig
 
 from .apps_settings import INSTALLED_APPS, SPECTACULAR_SETTINGS  # noqa: F401
 from .auth_settings import AUTH_PASSWORD_VALIDATORS  # noqa: F401
+from .cache_settings import CACHE_FACADE, CACHES  # noqa: F401
 from .database_settings import DATABASES  # noqa: F401
 from .jazzmin_settings import JAZZMIN_SETTINGS, JAZZMIN_UI_TWEAKS  # noqa: F401
-from .lyrics_settings import GENIUS_CLIENT_ID, GENIUS_CLIENT_SECRET  # noqa: F401
+from .logging_settings import (  # noqa: F401
+    LOG_FORMAT,
+    LOG_QUEUE_DROP_POLICY,
+    LOG_QUEUE_ENABLED,
+    LOG_QUEUE_SIZE,
+    LOGGING_DECORATORS,
+)
+from .lyrics_settings import (  # noqa: F401
+    GENIUS_CLIENT_ID,
+    GENIUS_CLIENT_SECRET,
+    LYRICS_BACKFILL,
+    LYRICS_LOOKUP,
+)
+from .metrics_settings import METRICS, REQUEST_TIMING  # noqa: F401
 from .middleware_settings import MIDDLEWARE  # noqa: F401
+from .play_events_settings import GENRE_POPULARITY, PLAY_EVENTS, TRENDING  # noqa: F401
 from .rest_framework_settings import REST_FRAMEWORK  # noqa: F401
+from .song_import_settings import SONG_IMPORT  # noqa: F401
 
 # Temporarily disabled Stripe settings for migrations
 from .stripe_settings import (  # noqa: F401
@@ -28,6 +44,7 @@ from .supabase_settings import (  # noqa: F401
 )
 from .templates_settings import TEMPLATES  # noqa: F401
 from .utils.env import BASE_DIR, ENVIRONMENT, env
+from .warmup_settings import WARMUP  # noqa: F401
 from .youtube_settings import (  # noqa: F401
     RANDOM_MUSIC_QUERIES,
     YOUTUBE_API_KEY,
@@ -68,6 +85,11 @@ ROOT_URLCONF = "config.urls"
 
 WSGI_APPLICATION = "config.wsgi.application"
 
+ASGI_APPLICATION = "config.asgi.application"
+
+# Vistas async nativas para los endpoints calientes (requiere servir con ASGI)
+ASYNC_VIEWS_ENABLED = env.bool("ASYNC_VIEWS_ENABLED", default=False)
+
 STATIC_URL = "/static/"
 
 # STATICFILES_DIRS = [BASE_DIR / "static"]
@@ -81,7 +103,16 @@ MEDIA_ROOT = os.path.join(BASE_DIR, "media/")
 
 DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 
-LOGGING = LoggingConfig.get_logging_config(bool(DEBUG), ENVIRONMENT)
+LOGGING_CONFIG = "common.utils.logging_config.configure_logging"
+
+LOGGING = LoggingConfig.get_logging_config(
+    bool(DEBUG),
+    ENVIRONMENT,
+    json_format=LOG_FORMAT == "json",
+    queue_enabled=LOG_QUEUE_ENABLED,
+    queue_size=LOG_QUEUE_SIZE,
+    drop_policy=LOG_QUEUE_DROP_POLICY,
+)
 
 DJANGO_ALLOW_ASYNC_UNSAFE = True
 
@@ -0,0 +1,38 @@
+from .utils.env import env
+
+# Si se define REDIS_URL se usa Redis como caché compartida entre procesos
+# (requiere `pip install redis`); si no, caché en memoria del proceso.
+REDIS_URL = env("REDIS_URL", default=None)
+
+if REDIS_URL:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.redis.RedisCache",
+            "LOCATION": REDIS_URL,
+            "KEY_PREFIX": "streamflow_music",
+            "TIMEOUT": 300,
+        }
+    }
+else:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+            "LOCATION": "streamflow-music",
+            "TIMEOUT": 300,
+            "OPTIONS": {"MAX_ENTRIES": 5000},
+        }
+    }
+
+# Fachada de caché (common.utils.cache_facade): nivel local LRU + TTL y,
+# opcionalmente, el nivel compartido de CACHES
+CACHE_FACADE = {
+    "KEY_PREFIX": "streamflow",
+    "DEFAULT_TTL": env.int("CACHE_DEFAULT_TTL", default=300),
+    "LOCAL_MAX_SIZE": env.int("CACHE_LOCAL_MAX_SIZE", default=1024),
+    "SHARED_ALIAS": (
+        "default"
+        if env.bool("CACHE_USE_SHARED_TIER", default=bool(REDIS_URL))
+        else None
+    ),
+    "VERSION_CHECK_INTERVAL": env.float("CACHE_VERSION_CHECK_INTERVAL", default=1.0),
+}
@@ -1,6 +1,10 @@
+import os
 import sys
+import warnings
+from typing import Any, Dict
 
 import dj_database_url
+from django.core.exceptions import ImproperlyConfigured
 
 from .utils.env import env
 
@@ -15,6 +19,85 @@ database_test = {
 # Detectar si se está ejecutando en modo test
 is_testing = len(sys.argv) > 1 and sys.argv[1] == "test"
 
+# "asgi" lo establece config/asgi.py antes de cargar los settings
+SERVER_INTERFACE = os.getenv("SERVER_INTERFACE", "wsgi")
+
+# Conexiones persistentes (segundos) y verificación antes de reutilizarlas
+DB_CONN_MAX_AGE = env.int("DB_CONN_MAX_AGE", default=600)
+DB_CONN_HEALTH_CHECKS = env.bool("DB_CONN_HEALTH_CHECKS", default=True)
+
+# Pool de conexiones de psycopg 3 (requiere `pip install "psycopg[pool]"`). Sin
+# valor explícito se activa bajo ASGI con PostgreSQL: sin pool cada request
+# abriría una conexión nueva (ver build_database_config)
+DB_POOL_ENABLED = env.bool("DB_POOL_ENABLED", default=None)
+DB_POOL_MIN_SIZE = env.int("DB_POOL_MIN_SIZE", default=2)
+DB_POOL_MAX_SIZE = env.int("DB_POOL_MAX_SIZE", default=10)
+DB_POOL_TIMEOUT = env.float("DB_POOL_TIMEOUT", default=10.0)
+
+
+def _build_pool_options() -> dict:
+    """Opciones de ``OPTIONS["pool"]`` para el backend de PostgreSQL"""
+    try:
+        import psycopg_pool  # noqa: F401
+    except ImportError as exc:
+        raise ImproperlyConfigured(
+            "The PostgreSQL connection pool (DB_POOL_ENABLED, on by default under "
+            'ASGI) requires psycopg 3 with pool support: pip install "psycopg[pool]"'
+        ) from exc
+
+    return {
+        "min_size": DB_POOL_MIN_SIZE,
+        "max_size": DB_POOL_MAX_SIZE,
+        "timeout": DB_POOL_TIMEOUT,
+    }
+
+
+def build_database_config(database_url: str) -> Dict[str, Any]:
+    """
+    Construye la configuración de la base de datos por defecto.
+
+    - WSGI: conexiones persistentes (``CONN_MAX_AGE``) con health checks.
+    - ASGI: cada request ejecuta el código sync en un hilo propio
+      (``sync_to_async`` thread-sensitive), así que una conexión persistente
+      quedaría huérfana con el hilo. Se cierran al final del request y se
+      reutilizan desde el pool de psycopg, activo por defecto con PostgreSQL.
+    - Pool: Django exige ``CONN_MAX_AGE = 0`` cuando se usa el pool.
+    """
+    is_postgresql = "postgresql" in dj_database_url.parse(database_url)["ENGINE"]
+
+    pool_enabled = DB_POOL_ENABLED
+    if pool_enabled is None:
+        pool_enabled = SERVER_INTERFACE == "asgi" and is_postgresql
+    elif not pool_enabled and SERVER_INTERFACE == "asgi" and is_postgresql:
+        warnings.warn(
+            "DB_POOL_ENABLED=false under ASGI: every request opens a new "
+            "PostgreSQL connection",
+            RuntimeWarning,
+            stacklevel=2,
+        )
+
+    conn_max_age = DB_CONN_MAX_AGE
+    if pool_enabled or SERVER_INTERFACE == "asgi":
+        conn_max_age = 0
+
+    config: Dict[str, Any] = dict(
+        dj_database_url.parse(
+            database_url,
+            conn_max_age=conn_max_age,
+            conn_health_checks=DB_CONN_HEALTH_CHECKS and conn_max_age > 0,
+        )
+    )
+
+    if pool_enabled:
+        if not is_postgresql:
+            raise ImproperlyConfigured(
+                "DB_POOL_ENABLED is only supported with PostgreSQL databases"
+            )
+        config.setdefault("OPTIONS", {})["pool"] = _build_pool_options()
+
+    return config
+
+
 if is_testing:
     DATABASES = {"default": database_test}
 else:
@@ -23,4 +106,4 @@ else:
         raise ValueError(
             "DATABASE_URL environment variable must be set and must be a string."
         )
-    DATABASES = {"default": dj_database_url.parse(database_url)}
+    DATABASES = {"default": build_database_config(database_url)}
@@ -0,0 +1,23 @@
+from .utils.env import env
+
+# Logging en segundo plano: los loggers sólo encolan y un hilo escribe en
+# consola y ficheros. La cola está acotada y, si se llena, se descartan
+# registros ("drop_new" o "drop_oldest") en lugar de bloquear la petición.
+LOG_QUEUE_ENABLED = env.bool("LOG_QUEUE_ENABLED", default=False)
+LOG_QUEUE_SIZE = env.int("LOG_QUEUE_SIZE", default=10_000)
+LOG_QUEUE_DROP_POLICY = env("LOG_QUEUE_DROP_POLICY", default="drop_new")
+
+# "text" (por defecto) o "json" para logs estructurados
+LOG_FORMAT = env("LOG_FORMAT", default="text")
+
+# Decoradores @log_execution / @log_performance (common.utils.logging_decorators).
+# Desactivados para un módulo se sustituyen por la función original; activados
+# no formatean nada si el nivel del logger "decorators.<módulo>" no lo permite.
+LOGGING_DECORATORS = {
+    "ENABLED": env.bool("LOG_DECORATORS_ENABLED", default=True),
+    # Prefijo de módulo -> activado (gana el prefijo más largo)
+    "MODULES": {
+        module: False
+        for module in env.list("LOG_DECORATORS_DISABLED_MODULES", default=[])
+    },
+}
@@ -2,3 +2,28 @@ from .utils.env import env
 
 GENIUS_CLIENT_ID = env("GENIUS_CLIENT_ID")
 GENIUS_CLIENT_SECRET = env("GENIUS_CLIENT_SECRET")
+
+# Búsqueda masiva de letras (``update_lyrics``): las canciones se leen por
+# bloques de LYRICS_BACKFILL_CHUNK_SIZE ordenadas por id, con como mucho
+# LYRICS_BACKFILL_CONCURRENCY búsquedas en curso, y las letras encontradas se
+# guardan por lotes de LYRICS_BACKFILL_WRITE_BATCH_SIZE junto con el punto de
+# reanudación.
+LYRICS_BACKFILL = {
+    "CHUNK_SIZE": env.int("LYRICS_BACKFILL_CHUNK_SIZE", default=500),
+    "CONCURRENCY": env.int("LYRICS_BACKFILL_CONCURRENCY", default=3),
+    "WRITE_BATCH_SIZE": env.int("LYRICS_BACKFILL_WRITE_BATCH_SIZE", default=100),
+}
+
+# Búsquedas de letras sin resultado (apps.songs.infrastructure.lyrics_lookups):
+# la canción no se vuelve a buscar hasta pasadas LYRICS_LOOKUP_RETRY_AFTER_HOURS,
+# multiplicadas por LYRICS_LOOKUP_BACKOFF_FACTOR con cada fallo seguido y hasta
+# LYRICS_LOOKUP_MAX_RETRY_AFTER_HOURS. Tras un error se reintenta a los
+# LYRICS_LOOKUP_ERROR_RETRY_MINUTES.
+LYRICS_LOOKUP = {
+    "RETRY_AFTER_HOURS": env.float("LYRICS_LOOKUP_RETRY_AFTER_HOURS", default=24.0),
+    "BACKOFF_FACTOR": env.float("LYRICS_LOOKUP_BACKOFF_FACTOR", default=2.0),
+    "MAX_RETRY_AFTER_HOURS": env.float(
+        "LYRICS_LOOKUP_MAX_RETRY_AFTER_HOURS", default=720.0
+    ),
+    "ERROR_RETRY_MINUTES": env.float("LYRICS_LOOKUP_ERROR_RETRY_MINUTES", default=15.0),
+}
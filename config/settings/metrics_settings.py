@@ -0,0 +1,22 @@
+from .utils.env import env
+
+# Instrumentación por request (common.utils.request_timing): consultas a la
+# base de datos, llamadas a servicios externos y spans de casos de uso.
+# La cabecera Server-Timing expone los tiempos internos: sólo en desarrollo
+# salvo que se active explícitamente.
+REQUEST_TIMING = {
+    "ENABLED": env.bool("REQUEST_TIMING_ENABLED", default=True),
+    "SERVER_TIMING_HEADER": env.bool(
+        "SERVER_TIMING_HEADER", default=env.bool("DEBUG", default=False)
+    ),
+    "QUERY_COUNT_WARNING": env.int("REQUEST_QUERY_COUNT_WARNING", default=50),
+}
+
+# Registro de métricas en memoria (common.utils.metrics). Con METRICS_EXPORT_PATH
+# un hilo en segundo plano escribe un snapshot JSON cada METRICS_EXPORT_INTERVAL
+# segundos; el snapshot también se ve en /admin/metrics/.
+METRICS = {
+    "MAX_METRICS": env.int("METRICS_MAX_METRICS", default=1000),
+    "EXPORT_PATH": env("METRICS_EXPORT_PATH", default=None),
+    "EXPORT_INTERVAL": env.float("METRICS_EXPORT_INTERVAL", default=60.0),
+}
@@ -1,15 +1,21 @@
 CUSTOM_MIDDLEWARE = [
+    # Se agrega esto para medir consultas, servicios externos y casos de uso
+    # por request (cabecera Server-Timing e histogramas por endpoint)
+    "common.middlewares.request_timing_middleware.RequestTimingMiddleware",
     # Se agrega esto para el manejo de errores
     "common.middlewares.error_handler_middleware.ErrorHandlerMiddleware",
     # Se agrega esto para el manejo de logs
     "common.middlewares.logging_middleware.LoggingMiddleware",
+    # Se agrega esto para medir las conexiones a la base de datos por request
+    "common.middlewares.db_connection_metrics_middleware.DatabaseConnectionMetricsMiddleware",
 ]
 
 DJANGO_MIDDLEWARE = [
     # Se agrega esto para el acople con django
     "corsheaders.middleware.CorsMiddleware",
     "django.middleware.security.SecurityMiddleware",
-    "whitenoise.middleware.WhiteNoiseMiddleware",
+    # WhiteNoise con soporte async para no forzar el modo sync bajo ASGI
+    "common.middlewares.static_files_middleware.StaticFilesMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
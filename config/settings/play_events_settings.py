@@ -0,0 +1,36 @@
+from .utils.env import env
+
+# Registro de reproducciones (apps.songs.infrastructure.play_events). Cada worker
+# acumula las reproducciones en memoria y las vuelca por lotes cada
+# PLAY_EVENTS_FLUSH_INTERVAL segundos o al llegar a PLAY_EVENTS_FLUSH_SIZE; los
+# contadores de canciones y las estadísticas se actualizan en ese volcado.
+PLAY_EVENTS = {
+    "FLUSH_SIZE": env.int("PLAY_EVENTS_FLUSH_SIZE", default=500),
+    "FLUSH_INTERVAL": env.float("PLAY_EVENTS_FLUSH_INTERVAL", default=5.0),
+    "MAX_PENDING": env.int("PLAY_EVENTS_MAX_PENDING", default=50000),
+    "BATCH_SIZE": env.int("PLAY_EVENTS_BATCH_SIZE", default=1000),
+    "RETENTION_DAYS": env.int("PLAY_EVENTS_RETENTION_DAYS", default=90),
+}
+
+# Tendencias (apps.songs.infrastructure.trending): reproducciones con
+# decaimiento exponencial de vida media TRENDING_HALF_LIFE_HOURS. Las puntuaciones
+# por debajo de TRENDING_MIN_SCORE reproducciones equivalentes se ponen a 0 al
+# ejecutar ``update_trending_scores``. Si nadie la ejecuta, el volcado mueve la
+# época cuando tiene más de TRENDING_MAX_EPOCH_AGE_HALF_LIVES vidas medias.
+TRENDING = {
+    "HALF_LIFE_HOURS": env.float("TRENDING_HALF_LIFE_HOURS", default=24.0),
+    "MIN_SCORE": env.float("TRENDING_MIN_SCORE", default=0.05),
+    "MAX_EPOCH_AGE_HALF_LIVES": env.float(
+        "TRENDING_MAX_EPOCH_AGE_HALF_LIVES", default=32.0
+    ),
+    "MAX_LIMIT": env.int("TRENDING_MAX_LIMIT", default=100),
+}
+
+# Popularidad de géneros (apps.genres.infrastructure.popularity): reproducciones
+# totales de sus canciones más GENRE_POPULARITY_RECENT_WEIGHT veces las de los
+# últimos GENRE_POPULARITY_RECENT_DAYS días. Se recalcula con
+# ``update_genre_popularity``.
+GENRE_POPULARITY = {
+    "RECENT_DAYS": env.int("GENRE_POPULARITY_RECENT_DAYS", default=7),
+    "RECENT_WEIGHT": env.int("GENRE_POPULARITY_RECENT_WEIGHT", default=10),
+}
@@ -0,0 +1,10 @@
+from .utils.env import env
+
+# Importación masiva de canciones (``import_songs``): los registros del
+# manifiesto se insertan por lotes de SONG_IMPORT_BATCH_SIZE, cada uno en su
+# transacción, y los audios locales se suben al storage con como mucho
+# SONG_IMPORT_UPLOAD_CONCURRENCY subidas en curso.
+SONG_IMPORT = {
+    "BATCH_SIZE": env.int("SONG_IMPORT_BATCH_SIZE", default=1000),
+    "UPLOAD_CONCURRENCY": env.int("SONG_IMPORT_UPLOAD_CONCURRENCY", default=8),
+}
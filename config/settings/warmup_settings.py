@@ -0,0 +1,12 @@
+from .utils.env import env
+
+# Calentamiento del worker (common.utils.warmup): al crear la aplicación se
+# cargan el URLconf y las dependencias de import diferido (yt_dlp,
+# googleapiclient, stripe) para que no las pague la primera petición. Con
+# WARMUP_BACKGROUND=false se hace antes de aceptar peticiones (gunicorn
+# --preload).
+WARMUP = {
+    "ENABLED": env.bool("WARMUP_ENABLED", default=True),
+    "BACKGROUND": env.bool("WARMUP_BACKGROUND", default=True),
+    "URLCONF": env.bool("WARMUP_URLCONF", default=True),
+}
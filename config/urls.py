@@ -2,6 +2,8 @@ from django.contrib import admin
 from django.http import JsonResponse
 from django.urls import include, path
 
+from common.views import metrics_view
+
 
 def home_view(request):
     """Vista simple para la página de inicio"""
@@ -12,6 +14,7 @@ def home_view(request):
             "version": "1.0.0",
             "available_endpoints": {
                 "admin": "/admin/",
+                "admin_metrics": "/admin/metrics/",
                 "docs": "/docs/",
                 "api_test": "/api/test/",
                 "auth_register": "/api/auth/register/",
@@ -24,6 +27,8 @@ def home_view(request):
 
 urlpatterns = [
     path("", home_view, name="home"),  # Página de inicio
+    # Métricas en memoria (sólo staff)
+    path("admin/metrics/", admin.site.admin_view(metrics_view), name="metrics"),
     path("admin/", admin.site.urls),
     path("docs/", include("docs.urls")),
     path("api/", include("api.urls")),
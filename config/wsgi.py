@@ -19,3 +19,9 @@ os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings")
 
 
 application = get_wsgi_application()
+
+from common.utils.metrics import start_metrics_exporter  # noqa: E402
+from common.utils.warmup import start_warmup  # noqa: E402
+
+start_metrics_exporter()
+start_warmup()
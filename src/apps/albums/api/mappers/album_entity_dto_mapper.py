@@ -14,7 +14,7 @@ class AlbumEntityDTOMapper(AbstractEntityDtoMapper[AlbumEntity, AlbumResponseDTO
         """
         Convierte una entidad del dominio a DTO de respuesta.
         """
-        self.logger.debug(f"Converting entity to DTO for album {entity.id}")
+        self.logger.debug("Converting entity to DTO for album %s", entity.id)
 
         return AlbumResponseDTO(
             id=entity.id,
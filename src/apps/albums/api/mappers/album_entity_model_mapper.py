@@ -15,7 +15,7 @@ class AlbumEntityModelMapper(AbstractEntityModelMapper[AlbumEntity, AlbumModel])
         """
         Convierte un modelo Django AlbumModel a entidad del dominio AlbumEntity.
         """
-        self.logger.debug(f"Converting model to entity for album {model.id}")
+        self.logger.debug("Converting model to entity for album %s", model.id)
         artist_name = (
             model.artist.name if hasattr(model, "artist") and model.artist else ""
         )
@@ -38,7 +38,7 @@ class AlbumEntityModelMapper(AbstractEntityModelMapper[AlbumEntity, AlbumModel])
         """
         Convierte una entidad AlbumEntity a una instancia del modelo Django AlbumModel.
         """
-        self.logger.debug(f"Converting entity to model instance for album {entity.id}")
+        self.logger.debug("Converting entity to model instance for album %s", entity.id)
         return AlbumModel(
             id=entity.id,
             title=entity.title,
@@ -59,7 +59,7 @@ class AlbumEntityModelMapper(AbstractEntityModelMapper[AlbumEntity, AlbumModel])
         """
         Convierte una entidad AlbumEntity a datos del modelo Django (diccionario).
         """
-        self.logger.debug(f"Converting entity to model data for album {entity.id}")
+        self.logger.debug("Converting entity to model data for album %s", entity.id)
 
         model_data = {
             "title": entity.title,
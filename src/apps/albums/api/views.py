@@ -4,7 +4,7 @@ from rest_framework.permissions import AllowAny
 from apps.albums.api.serializers import AlbumResponseSerializer
 from apps.albums.infrastructure.filters import AlbumModelFilter
 from apps.albums.infrastructure.models.album_model import AlbumModel
-from common.mixins import FilteredViewSetMixin
+from common.mixins import ConditionalGetMixin, FilteredViewSetMixin
 
 
 @extend_schema_view(
@@ -41,7 +41,7 @@ from common.mixins import FilteredViewSetMixin
         summary="Get album details",
     ),
 )
-class AlbumViewSet(FilteredViewSetMixin):
+class AlbumViewSet(ConditionalGetMixin, FilteredViewSetMixin):
     """ViewSet para gestión de álbumes (solo lectura) con filtros integrados"""
 
     queryset = AlbumModel.objects.select_related("artist").all().order_by("-created_at")
@@ -49,6 +49,11 @@ class AlbumViewSet(FilteredViewSetMixin):
 
     permission_classes = [AllowAny]
 
+    # Peticiones condicionales: el nombre del artista forma parte de la respuesta
+    conditional_fields = ("updated_at", "artist__updated_at")
+    conditional_counter_fields = ("play_count",)
+    last_modified_field = None
+
     def get_serializer_class(self):
         return AlbumResponseSerializer
 
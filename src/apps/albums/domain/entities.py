@@ -3,7 +3,7 @@ from datetime import date, datetime
 from typing import Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class AlbumEntity:
     """Entidad que representa un álbum"""
 
@@ -1,4 +1,5 @@
 from django.db import models
+from django.db.models.functions import Upper
 
 
 class AlbumModel(models.Model):
@@ -63,6 +64,12 @@ class AlbumModel(models.Model):
         ordering = ["-created_at"]
         indexes = [
             models.Index(fields=["title"]),
+            # Búsquedas por título sin distinguir mayúsculas (``title__iexact``),
+            # también dentro de los álbumes de un artista
+            models.Index(Upper("title"), name="albums_title_upper_idx"),
+            models.Index(
+                "artist", Upper("title"), name="albums_artist_title_upper_idx"
+            ),
             models.Index(fields=["artist"]),
             models.Index(fields=["release_date"]),
             models.Index(fields=["play_count"]),
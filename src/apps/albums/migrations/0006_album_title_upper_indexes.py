@@ -0,0 +1,28 @@
+# Generated by Django 5.2.4 on 2026-10-19 04:09
+
+import django.db.models.functions.text
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("albums", "0005_remove_albummodel_albums_artist__2d0263_idx_and_more"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="albummodel",
+            index=models.Index(
+                django.db.models.functions.text.Upper("title"),
+                name="albums_title_upper_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="albummodel",
+            index=models.Index(
+                models.F("artist"),
+                django.db.models.functions.text.Upper("title"),
+                name="albums_artist_title_upper_idx",
+            ),
+        ),
+    ]
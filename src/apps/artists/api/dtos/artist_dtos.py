@@ -3,7 +3,7 @@ from datetime import datetime
 from typing import Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class ArtistResponseDTO:
     """DTO para respuestas de artista"""
 
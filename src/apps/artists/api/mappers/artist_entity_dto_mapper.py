@@ -14,7 +14,7 @@ class ArtistEntityDTOMapper(AbstractEntityDtoMapper[ArtistEntity, ArtistResponse
         """
         Convierte una entidad del dominio a DTO de respuesta.
         """
-        self.logger.debug(f"Converting entity to DTO for artist {entity.id}")
+        self.logger.debug("Converting entity to DTO for artist %s", entity.id)
 
         return ArtistResponseDTO(
             id=entity.id,
@@ -19,7 +19,7 @@ class ArtistEntityModelMapper(AbstractEntityModelMapper[ArtistEntity, ArtistMode
         """
         Convierte un modelo Django ArtistModel a entidad del dominio ArtistEntity.
         """
-        self.logger.debug(f"Converting model to entity for artist {model.id}")
+        self.logger.debug("Converting model to entity for artist %s", model.id)
         return ArtistEntity(
             id=str(model.id),
             name=model.name,
@@ -35,7 +35,9 @@ class ArtistEntityModelMapper(AbstractEntityModelMapper[ArtistEntity, ArtistMode
         """
         Convierte una entidad ArtistEntity a una instancia del modelo Django ArtistModel.
         """
-        self.logger.debug(f"Converting entity to model instance for artist {entity.id}")
+        self.logger.debug(
+            "Converting entity to model instance for artist %s", entity.id
+        )
         model_instance = ArtistModel(
             id=entity.id,
             name=entity.name,
@@ -53,7 +55,7 @@ class ArtistEntityModelMapper(AbstractEntityModelMapper[ArtistEntity, ArtistMode
         """
         Convierte una entidad ArtistEntity a datos del modelo Django (diccionario).
         """
-        self.logger.debug(f"Converting entity to model data for artist {entity.id}")
+        self.logger.debug("Converting entity to model data for artist %s", entity.id)
         model_data = {
             "name": entity.name,
             "biography": entity.biography,
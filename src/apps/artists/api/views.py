@@ -5,7 +5,7 @@ from drf_spectacular.utils import extend_schema, extend_schema_view
 from apps.artists.api.serializers import ArtistResponseSerializer
 from apps.artists.infrastructure.filters import ArtistModelFilter
 from apps.artists.infrastructure.models import ArtistModel
-from common.mixins import FilteredViewSetMixin
+from common.mixins import ConditionalGetMixin, FilteredViewSetMixin
 
 
 @extend_schema_view(
@@ -39,7 +39,7 @@ from common.mixins import FilteredViewSetMixin
         summary="Get artist details",
     ),
 )
-class ArtistViewSet(FilteredViewSetMixin):
+class ArtistViewSet(ConditionalGetMixin, FilteredViewSetMixin):
     """ViewSet para gestión de artistas (solo lectura) con filtros integrados"""
 
     queryset = ArtistModel.objects.all().order_by("-created_at")
@@ -1,4 +1,5 @@
 from django.db import models
+from django.db.models.functions import Upper
 
 
 class ArtistModel(models.Model):
@@ -28,6 +29,8 @@ class ArtistModel(models.Model):
         ordering = ["-created_at"]
         indexes = [
             models.Index(fields=["name"]),
+            # Búsquedas por nombre sin distinguir mayúsculas (``name__iexact``)
+            models.Index(Upper("name"), name="artists_name_upper_idx"),
             models.Index(fields=["is_verified"]),
             models.Index(fields=["followers_count"]),
         ]
@@ -0,0 +1,20 @@
+# Generated by Django 5.2.4 on 2026-10-19 04:09
+
+import django.db.models.functions.text
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("artists", "0004_remove_artistmodel_unique_artist_source_per_type_and_more"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="artistmodel",
+            index=models.Index(
+                django.db.models.functions.text.Upper("name"),
+                name="artists_name_upper_idx",
+            ),
+        ),
+    ]
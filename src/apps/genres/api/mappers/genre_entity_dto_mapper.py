@@ -18,7 +18,7 @@ class GenreEntityDTOMapper(AbstractEntityDtoMapper[GenreEntity, GenreResponseDTO
         """
         Convierte una entidad del dominio a DTO de respuesta.
         """
-        self.logger.debug(f"Converting entity to DTO for genre {entity.id}")
+        self.logger.debug("Converting entity to DTO for genre %s", entity.id)
 
         return GenreResponseDTO(
             id=entity.id,
@@ -19,7 +19,7 @@ class GenreEntityModelMapper(AbstractEntityModelMapper[GenreEntity, GenreModel])
         """
         Convierte un modelo Django GenreModel a entidad del dominio GenreEntity.
         """
-        self.logger.debug(f"Converting model to entity for genre {model.id}")
+        self.logger.debug("Converting model to entity for genre %s", model.id)
         return GenreEntity(
             id=str(model.id),
             name=model.name,
@@ -35,7 +35,7 @@ class GenreEntityModelMapper(AbstractEntityModelMapper[GenreEntity, GenreModel])
         """
         Convierte una entidad GenreEntity a una instancia del modelo Django GenreModel.
         """
-        self.logger.debug(f"Converting entity to model instance for genre {entity.id}")
+        self.logger.debug("Converting entity to model instance for genre %s", entity.id)
         return GenreModel(
             id=entity.id,
             name=entity.name,
@@ -51,7 +51,7 @@ class GenreEntityModelMapper(AbstractEntityModelMapper[GenreEntity, GenreModel])
         """
         Convierte una entidad GenreEntity a datos del modelo Django (diccionario).
         """
-        self.logger.debug(f"Converting entity to model data for genre {entity.id}")
+        self.logger.debug("Converting entity to model data for genre %s", entity.id)
         return {
             "name": entity.name,
             "description": entity.description,
@@ -9,10 +9,11 @@ from rest_framework.response import Response
 from apps.genres.api.serializers import GenreSerializer
 from apps.genres.infrastructure.filters import GenreModelFilter
 from apps.genres.infrastructure.models import GenreModel
-from common.mixins import FilteredViewSetMixin
+from common.mixins import CachedResponseMixin, FilteredViewSetMixin
 from common.utils.schema_decorators import paginated_list_endpoint
 
 from ..api.mappers import GenreMapper
+from ..infrastructure.cache import get_popular_genres_cache
 from ..infrastructure.repository import GenreRepository
 from ..use_cases import GetAllGenresUseCase, GetGenreUseCase, GetPopularGenresUseCase
 
@@ -22,7 +23,7 @@ from ..use_cases import GetAllGenresUseCase, GetGenreUseCase, GetPopularGenresUs
     retrieve=extend_schema(tags=["Genres"], description="Get a specific genre by ID"),
     popular=extend_schema(tags=["Genres"], description="Get popular genres"),
 )
-class GenreViewSet(FilteredViewSetMixin):
+class GenreViewSet(CachedResponseMixin, FilteredViewSetMixin):
     """ViewSet para consulta de géneros musicales (solo lectura) con filtros integrados"""
 
     queryset = GenreModel.objects.all()
@@ -47,7 +48,15 @@ class GenreViewSet(FilteredViewSetMixin):
     )
     @action(detail=False, methods=["get"], url_path="popular")
     def popular(self, request):
-        """Obtiene los géneros más populares"""
+        """Obtiene los géneros más populares (cacheado, con ETag)"""
+        return self.cached_response(
+            request,
+            get_popular_genres_cache(),
+            lambda: self._build_popular_response(request),
+        )
+
+    def _build_popular_response(self, request):
+        """Construye la respuesta paginada de géneros populares"""
         popular_genres = async_to_sync(self.get_popular_genres.execute)()
         genre_dtos = [self.mapper.entity_to_dto(genre) for genre in popular_genres]
 
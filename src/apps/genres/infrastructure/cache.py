@@ -0,0 +1,16 @@
+"""Cachés de lectura de géneros compartidas por todos los usuarios"""
+
+from common.utils.cache_facade import CacheFacade, get_cache
+
+POPULAR_GENRES_CACHE_NAMESPACE = "genres.popular"
+POPULAR_GENRES_CACHE_TTL = 300
+
+
+def get_popular_genres_cache() -> CacheFacade:
+    """Caché de las respuestas de géneros populares"""
+    return get_cache(POPULAR_GENRES_CACHE_NAMESPACE, ttl=POPULAR_GENRES_CACHE_TTL)
+
+
+def invalidate_popular_genres_cache() -> None:
+    """Invalida los géneros populares tras guardar o borrar un género"""
+    get_popular_genres_cache().invalidate()
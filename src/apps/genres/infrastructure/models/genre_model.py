@@ -17,7 +17,7 @@ class GenreModel(models.Model):
         verbose_name="Color representativo",
         help_text="Color en formato hexadecimal (#RRGGBB)",
     )
-    popularity_score = models.PositiveIntegerField(
+    popularity_score = models.PositiveBigIntegerField(
         default=0, verbose_name="Puntuación de popularidad"
     )
     created_at = models.DateTimeField(
@@ -0,0 +1,73 @@
+"""
+Popularidad de géneros calculada a partir de las reproducciones.
+
+``refresh_genre_popularity`` actualiza ``GenreModel.popularity_score`` de todos
+los géneros con un único UPDATE con subconsultas correlacionadas sobre la tabla
+``songs.genres``: la base de datos hace la agregación y no se carga ninguna fila
+en Python.
+
+    popularity_score = reproducciones totales de sus canciones
+                       + RECENT_WEIGHT * reproducciones de los últimos RECENT_DAYS
+"""
+
+from datetime import timedelta
+from typing import Any, Dict
+
+from django.db.models import Count, OuterRef, Subquery, Sum, Value
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+
+from apps.songs.infrastructure.models import PlayEventModel, SongModel
+from common.utils.logging_config import get_logger
+
+from .cache import invalidate_popular_genres_cache
+from .models import GenreModel
+
+logger = get_logger(__name__)
+
+DEFAULT_GENRE_POPULARITY_SETTINGS: Dict[str, Any] = {
+    "RECENT_DAYS": 7,
+    "RECENT_WEIGHT": 10,
+}
+
+
+def get_genre_popularity_settings() -> Dict[str, Any]:
+    """Configuración de la popularidad de géneros, por defecto si Django no está listo"""
+    config = dict(DEFAULT_GENRE_POPULARITY_SETTINGS)
+    try:
+        from django.conf import settings
+
+        if settings.configured:
+            config.update(getattr(settings, "GENRE_POPULARITY", {}))
+    except ImportError:
+        pass
+    return config
+
+
+def refresh_genre_popularity() -> int:
+    """Recalcula la popularidad de todos los géneros; devuelve cuántos se actualizaron"""
+    config = get_genre_popularity_settings()
+    since = timezone.now() - timedelta(days=config["RECENT_DAYS"])
+    song_genres = SongModel.genres.through
+
+    total_plays = (
+        song_genres.objects.filter(genremodel_id=OuterRef("pk"))
+        .values("genremodel_id")
+        .annotate(total=Sum("songmodel__play_count"))
+        .values("total")
+    )
+    recent_plays = (
+        PlayEventModel.objects.filter(song__genres=OuterRef("pk"), played_at__gte=since)
+        .values("song__genres")
+        .annotate(total=Count("id"))
+        .values("total")
+    )
+
+    updated = GenreModel.objects.update(
+        popularity_score=Coalesce(Subquery(total_plays), Value(0))
+        + config["RECENT_WEIGHT"] * Coalesce(Subquery(recent_plays), Value(0))
+    )
+
+    invalidate_popular_genres_cache()
+    logger.info(f"Popularity refreshed for {updated} genres")
+    return updated
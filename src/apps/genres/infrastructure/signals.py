@@ -0,0 +1,15 @@
+"""Señales que mantienen coherentes las cachés de géneros"""
+
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .cache import invalidate_popular_genres_cache
+from .models import GenreModel
+
+
+@receiver(post_save, sender=GenreModel, dispatch_uid="genres_invalidate_popular_save")
+@receiver(
+    post_delete, sender=GenreModel, dispatch_uid="genres_invalidate_popular_delete"
+)
+def invalidate_popular_genres(sender, instance, **kwargs):
+    invalidate_popular_genres_cache()
@@ -0,0 +1,16 @@
+from django.core.management.base import BaseCommand
+
+from apps.genres.infrastructure.popularity import refresh_genre_popularity
+
+
+class Command(BaseCommand):
+    help = (
+        "Recompute genre popularity from song play counts and recent play events "
+        "(run periodically, e.g. hourly)"
+    )
+
+    def handle(self, *args, **options):
+        updated = refresh_genre_popularity()
+        self.stdout.write(
+            self.style.SUCCESS(f"Popularity updated for {updated} genres")
+        )
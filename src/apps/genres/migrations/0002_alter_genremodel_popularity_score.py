@@ -0,0 +1,19 @@
+# Generated by Django 5.2.4 on 2026-10-19 03:42
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("genres", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="genremodel",
+            name="popularity_score",
+            field=models.PositiveBigIntegerField(
+                default=0, verbose_name="Puntuación de popularidad"
+            ),
+        ),
+    ]
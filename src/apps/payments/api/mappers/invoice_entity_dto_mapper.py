@@ -17,7 +17,7 @@ class InvoiceEntityDTOMapper(
         """
         Convierte una entidad del dominio Invoice a DTO de respuesta InvoiceResponseDTO.
         """
-        self.logger.debug(f"Converting entity to DTO for invoice {entity.id}")
+        self.logger.debug("Converting entity to DTO for invoice %s", entity.id)
 
         return InvoiceResponseDTO(
             id=entity.id,
@@ -40,7 +40,7 @@ class InvoiceEntityDTOMapper(
         """
         Convierte un DTO a entidad del dominio Invoice.
         """
-        self.logger.debug(f"Converting DTO to entity for invoice {dto.id}")
+        self.logger.debug("Converting DTO to entity for invoice %s", dto.id)
 
         # Convertir string de status a enum
         if isinstance(dto.status, str):
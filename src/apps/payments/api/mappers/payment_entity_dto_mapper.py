@@ -16,7 +16,7 @@ class PaymentEntityDTOMapper(
         """
         Convierte una entidad del dominio Payment a DTO de respuesta PaymentResponseDTO.
         """
-        self.logger.debug(f"Converting entity to DTO for payment {entity.id}")
+        self.logger.debug("Converting entity to DTO for payment %s", entity.id)
 
         return PaymentResponseDTO(
             id=entity.id,
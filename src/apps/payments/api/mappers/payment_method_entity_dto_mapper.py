@@ -16,7 +16,7 @@ class PaymentMethodEntityDTOMapper(
         """
         Convierte una entidad del dominio PaymentMethod a DTO de respuesta PaymentMethodResponseDTO.
         """
-        self.logger.debug(f"Converting entity to DTO for payment method {entity.id}")
+        self.logger.debug("Converting entity to DTO for payment method %s", entity.id)
 
         return PaymentMethodResponseDTO(
             id=entity.id,
@@ -35,7 +35,7 @@ class PaymentMethodEntityDTOMapper(
         """
         Convierte un DTO a entidad del dominio PaymentMethod.
         """
-        self.logger.debug(f"Converting DTO to entity for payment method {dto.id}")
+        self.logger.debug("Converting DTO to entity for payment method %s", dto.id)
 
         return PaymentMethodEntity(
             id=dto.id,
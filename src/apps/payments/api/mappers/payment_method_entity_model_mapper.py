@@ -18,7 +18,7 @@ class PaymentMethodEntityModelMapper(
         """
         Convierte un modelo Django PaymentMethodModel a entidad del dominio PaymentMethod.
         """
-        self.logger.debug(f"Converting model to entity for payment method {model.id}")
+        self.logger.debug("Converting model to entity for payment method %s", model.id)
         return PaymentMethodEntity(
             id=str(model.id),
             user_id=str(model.user.pk),
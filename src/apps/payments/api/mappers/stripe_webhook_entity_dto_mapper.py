@@ -38,7 +38,9 @@ class StripeWebhookEventEntityDTOMapper(
         """
         Convierte un DTO StripeWebhookEventResponseDTO a entidad del dominio StripeWebhookEventEntity.
         """
-        self.logger.debug(f"Converting DTO to entity for stripe webhook event {dto.id}")
+        self.logger.debug(
+            "Converting DTO to entity for stripe webhook event %s", dto.id
+        )
 
         return StripeWebhookEventEntity(
             id=dto.id,
@@ -16,7 +16,7 @@ class SubscriptionEntityDTOMapper(
         """
         Convierte una entidad del dominio Subscription a DTO de respuesta SubscriptionResponseDTO.
         """
-        self.logger.debug(f"Converting entity to DTO for subscription {entity.id}")
+        self.logger.debug("Converting entity to DTO for subscription %s", entity.id)
 
         return SubscriptionResponseDTO(
             id=entity.id,
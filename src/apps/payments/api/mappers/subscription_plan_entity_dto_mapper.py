@@ -18,7 +18,9 @@ class SubscriptionPlanEntityDTOMapper(
         """
         Convierte una entidad del dominio SubscriptionPlan a DTO de respuesta SubscriptionPlanResponseDTO.
         """
-        self.logger.debug(f"Converting entity to DTO for subscription plan {entity.id}")
+        self.logger.debug(
+            "Converting entity to DTO for subscription plan %s", entity.id
+        )
 
         return SubscriptionPlanResponseDTO(
             id=entity.id,
@@ -1,8 +1,10 @@
 from typing import Any, Dict, List
 
-import stripe
 from django.conf import settings
 
+from common.utils.lazy_import import lazy_import
+from common.utils.request_timing import timed
+
 from ...domain.exceptions import (
     BillingPortalError,
     CheckoutSessionError,
@@ -15,6 +17,10 @@ from ...domain.exceptions import (
 )
 from ...domain.interfaces import IStripeService
 
+# El SDK de Stripe tarda más de un segundo en importarse: se carga al crear el
+# primer servicio (ver common.utils.warmup)
+stripe = lazy_import("stripe")
+
 
 class StripeService(IStripeService):
     """Implementación del servicio de Stripe"""
@@ -23,6 +29,7 @@ class StripeService(IStripeService):
         stripe.api_key = settings.STRIPE_SECRET_KEY
         stripe.api_version = "2023-10-16"
 
+    @timed("stripe")
     def create_customer(self, user_profile_id: str, email: str, name: str) -> str:
         """Crea un cliente en Stripe"""
         try:
@@ -33,6 +40,7 @@ class StripeService(IStripeService):
         except Exception as e:
             raise CustomerCreationError(f"Error creando cliente: {e}")
 
+    @timed("stripe")
     def create_checkout_session(
         self,
         customer_id: str,
@@ -65,6 +73,7 @@ class StripeService(IStripeService):
         except Exception as e:
             raise CheckoutSessionError(f"Error creando sesión de checkout: {e}")
 
+    @timed("stripe")
     def create_billing_portal_session(
         self, customer_id: str, return_url: str
     ) -> Dict[str, Any]:
@@ -77,6 +86,7 @@ class StripeService(IStripeService):
         except Exception as e:
             raise BillingPortalError(f"Error creando portal de facturación: {e}")
 
+    @timed("stripe")
     def get_subscription(self, subscription_id: str) -> Dict[str, Any]:
         """Obtiene una suscripción de Stripe"""
         try:
@@ -99,6 +109,7 @@ class StripeService(IStripeService):
         except Exception as e:
             raise SubscriptionError(f"Error obteniendo suscripción: {e}")
 
+    @timed("stripe")
     def cancel_subscription(self, subscription_id: str) -> Dict[str, Any] | None:
         """Cancela una suscripción en Stripe"""
         try:
@@ -114,6 +125,7 @@ class StripeService(IStripeService):
         except Exception as e:
             raise SubscriptionError(f"Error cancelando suscripción: {e}")
 
+    @timed("stripe")
     def get_upcoming_invoice(self, customer_id: str) -> Dict[str, Any] | None:
         """Obtiene la próxima factura de un cliente"""
         try:
@@ -133,6 +145,7 @@ class StripeService(IStripeService):
         except Exception as e:
             raise InvoiceError(f"Error obteniendo próxima factura: {e}")
 
+    @timed("stripe")
     def get_payment_methods(self, customer_id: str) -> List[Dict[str, Any]]:
         """Obtiene los métodos de pago de un cliente"""
         try:
@@ -171,6 +184,7 @@ class StripeService(IStripeService):
         except Exception as e:
             raise WebhookError(f"Firma de webhook inválida: {e}")
 
+    @timed("stripe")
     def get_customer(self, customer_id: str) -> Dict[str, Any]:
         """Obtiene información de un cliente"""
         try:
@@ -185,6 +199,7 @@ class StripeService(IStripeService):
         except Exception as e:
             raise CustomerCreationError(f"Error obteniendo cliente: {e}")
 
+    @timed("stripe")
     def create_payment_intent(
         self, amount: int, currency: str, customer_id: str, **kwargs
     ) -> Dict[str, Any]:
@@ -205,6 +220,7 @@ class StripeService(IStripeService):
         except Exception as e:
             raise PaymentMethodError(f"Error creando Payment Intent: {e}")
 
+    @timed("stripe")
     def get_invoice_history(
         self, customer_id: str, limit: int = 10
     ) -> List[Dict[str, Any]]:
@@ -228,6 +244,7 @@ class StripeService(IStripeService):
         except Exception as e:
             raise InvoiceError(f"Error obteniendo historial de facturas: {e}")
 
+    @timed("stripe")
     def get_price(self, price_id: str) -> Dict[str, Any]:
         """Obtiene información de un precio"""
         try:
@@ -250,6 +267,7 @@ class StripeService(IStripeService):
         except Exception as e:
             raise StripeServiceError(f"Error obteniendo precio: {e}")
 
+    @timed("stripe")
     def get_product(self, product_id: str) -> Dict[str, Any]:
         """Obtiene información de un producto"""
         try:
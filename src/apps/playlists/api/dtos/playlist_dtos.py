@@ -3,7 +3,7 @@ from datetime import datetime
 from typing import Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class PlaylistResponseDTO:
     """DTO para respuestas de playlist"""
 
@@ -19,7 +19,7 @@ class PlaylistResponseDTO:
     updated_at: Optional[datetime] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class PlaylistSongResponseDTO:
     """DTO para respuestas de canción en playlist"""
 
@@ -25,12 +25,12 @@ class PlaylistEntityDTOMapper(
         Returns:
             DTO de respuesta de playlist
         """
-        self.logger.debug(f"Converting entity to DTO for playlist {entity.id}")
+        self.logger.debug("Converting entity to DTO for playlist %s", entity.id)
 
         # Usar el conteo de canciones de la entidad si está disponible
         song_count = (
             entity.song_count
-            if entity.songs is not None
+            if entity.total_songs is not None or entity.songs is not None
             else self._get_playlist_song_count_sync(entity.id)
         )
 
@@ -66,7 +66,7 @@ class PlaylistEntityDTOMapper(
         Returns:
             Entidad de playlist
         """
-        self.logger.debug(f"Converting DTO to entity for playlist {dto.id}")
+        self.logger.debug("Converting DTO to entity for playlist %s", dto.id)
 
         return PlaylistEntity(
             id=dto.id,
@@ -19,7 +19,7 @@ class PlaylistEntityModelMapper(
         self, model: PlaylistModel, include_songs: bool = False
     ) -> PlaylistEntity:
         """Convierte un PlaylistModel a PlaylistEntity"""
-        self.logger.debug(f"Converting model to entity for playlist {model.id}")
+        self.logger.debug("Converting model to entity for playlist %s", model.id)
 
         songs = None
         if include_songs:
@@ -36,11 +36,13 @@ class PlaylistEntityModelMapper(
             created_at=model.created_at,
             updated_at=model.updated_at,
             songs=songs,
+            # Anotación de los querysets que ya cuentan las canciones
+            total_songs=getattr(model, "playlist_song_count", None),
         )
 
     def entity_to_model(self, entity: PlaylistEntity) -> PlaylistModel:
         """Convierte una PlaylistEntity a PlaylistModel"""
-        self.logger.debug(f"Converting entity to model for playlist {entity.id}")
+        self.logger.debug("Converting entity to model for playlist %s", entity.id)
 
         return PlaylistModel(
             id=entity.id,
@@ -56,7 +58,7 @@ class PlaylistEntityModelMapper(
 
     def entity_to_model_data(self, entity: PlaylistEntity) -> Dict[str, Any]:
         """Convierte una PlaylistEntity a datos para PlaylistModel"""
-        self.logger.debug(f"Converting entity to model data for playlist {entity.id}")
+        self.logger.debug("Converting entity to model data for playlist %s", entity.id)
 
         return {
             "id": entity.id,
@@ -28,11 +28,23 @@ class PlaylistSongEntityDTOMapper(
         Returns:
             DTO de respuesta de canción en playlist
         """
-        self.logger.debug(f"Converting entity to DTO for playlist song {entity.id}")
+        self.logger.debug("Converting entity to DTO for playlist song %s", entity.id)
 
-        # Obtener información de la canción
-        song_info = self._get_song_info_sync(entity.song_id)
+        # La información de la canción ya viene en la entidad si se cargó
+        # junto a la playlist; si no, se consulta
+        if entity.song_title is not None:
+            return PlaylistSongResponseDTO(
+                id=entity.id,
+                playlist_id=entity.playlist_id,
+                song_id=entity.song_id,
+                position=entity.position,
+                added_at=entity.added_at,
+                song_title=entity.song_title,
+                song_artist=entity.song_artist,
+                song_duration=entity.song_duration,
+            )
 
+        song_info = self._get_song_info_sync(entity.song_id)
         return PlaylistSongResponseDTO(
             id=entity.id,
             playlist_id=entity.playlist_id,
@@ -54,7 +66,7 @@ class PlaylistSongEntityDTOMapper(
         Returns:
             Entidad de canción en playlist
         """
-        self.logger.debug(f"Converting DTO to entity for playlist song {dto.id}")
+        self.logger.debug("Converting DTO to entity for playlist song %s", dto.id)
 
         from datetime import datetime
 
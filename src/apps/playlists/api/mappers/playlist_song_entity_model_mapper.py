@@ -17,7 +17,7 @@ class PlaylistSongEntityModelMapper(
 
     def model_to_entity(self, model: PlaylistSongModel) -> PlaylistSongEntity:
         """Convierte un PlaylistSongModel a PlaylistSongEntity"""
-        self.logger.debug(f"Converting model to entity for playlist song {model.id}")
+        self.logger.debug("Converting model to entity for playlist song %s", model.id)
 
         return PlaylistSongEntity(
             id=str(model.id),
@@ -29,7 +29,7 @@ class PlaylistSongEntityModelMapper(
 
     def entity_to_model(self, entity: PlaylistSongEntity) -> PlaylistSongModel:
         """Convierte una PlaylistSongEntity a PlaylistSongModel"""
-        self.logger.debug(f"Converting entity to model for playlist song {entity.id}")
+        self.logger.debug("Converting entity to model for playlist song %s", entity.id)
 
         return PlaylistSongModel(
             id=entity.id,
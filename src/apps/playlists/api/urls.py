@@ -1,7 +1,17 @@
+from django.conf import settings
 from django.urls import include, path
 from rest_framework.routers import DefaultRouter
 
-from apps.playlists.api.views import PlaylistSongViewSet, PlaylistViewSet
+from apps.playlists.api.views import (
+    AsyncPlaylistSongViewSet,
+    PlaylistSongViewSet,
+    PlaylistViewSet,
+)
+
+# En modo ASGI se usa la variante async que espera los casos de uso
+playlist_song_viewset = (
+    AsyncPlaylistSongViewSet if settings.ASYNC_VIEWS_ENABLED else PlaylistSongViewSet
+)
 
 # Router para las APIs REST
 router = DefaultRouter()
@@ -11,12 +21,12 @@ urlpatterns = [
     path("", include(router.urls)),
     path(
         "playlist-songs/<uuid:pk>/songs/",
-        PlaylistSongViewSet.as_view({"get": "list_songs", "post": "add_song"}),
+        playlist_song_viewset.as_view({"get": "list_songs", "post": "add_song"}),
         name="playlist-songs",
     ),
     path(
         "playlist-songs/<uuid:pk>/songs/<uuid:song_id>/",
-        PlaylistSongViewSet.as_view({"delete": "remove_song"}),
+        playlist_song_viewset.as_view({"delete": "remove_song"}),
         name="playlist-songs-delete",
     ),
 ]
@@ -1,4 +1,5 @@
+from .async_playlist_song_views import AsyncPlaylistSongViewSet
 from .playlist_song_views import PlaylistSongViewSet
 from .playlist_views import PlaylistViewSet
 
-__all__ = ["PlaylistViewSet", "PlaylistSongViewSet"]
+__all__ = ["PlaylistViewSet", "PlaylistSongViewSet", "AsyncPlaylistSongViewSet"]
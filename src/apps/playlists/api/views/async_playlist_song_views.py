@@ -0,0 +1,45 @@
+"""
+Variante async de ``PlaylistSongViewSet`` para el modo de producción ASGI.
+
+La lectura de canciones espera el caso de uso directamente; las acciones de
+escritura heredadas siguen siendo sync y se ejecutan con ``sync_to_async``.
+"""
+
+from asgiref.sync import sync_to_async
+from django.http import Http404
+from rest_framework import status
+from rest_framework.response import Response
+
+from apps.playlists.api.serializers import PlaylistSongResponseSerializer
+from apps.playlists.use_cases import GetPlaylistSongsUseCase
+from common.mixins import AsyncAPIViewMixin
+from common.utils.schema_decorators import same_schema_as
+
+from .playlist_song_views import PlaylistSongViewSet
+
+
+class AsyncPlaylistSongViewSet(AsyncAPIViewMixin, PlaylistSongViewSet):
+    """Variante async de ``PlaylistSongViewSet``"""
+
+    @same_schema_as(PlaylistSongViewSet.list_songs)
+    async def list_songs(self, request, pk=None):
+        """Lista las canciones de una playlist"""
+        self.logger.debug(f"playlist_id={pk}")
+
+        if not pk:
+            raise Http404("Playlist no encontrada")
+
+        playlist_id = str(pk)
+
+        get_songs_use_case = GetPlaylistSongsUseCase(self.playlist_repository)
+        playlist_songs = await get_songs_use_case.execute(playlist_id)
+
+        # El mapper consulta la información de las canciones (ORM sync)
+        song_dtos = await sync_to_async(self.mapper.entities_to_dtos)(playlist_songs)
+
+        serializer = PlaylistSongResponseSerializer(song_dtos, many=True)
+
+        self.logger.info(
+            f"Retrieved {len(playlist_songs)} songs for playlist {playlist_id}"
+        )
+        return Response(serializer.data, status=status.HTTP_200_OK)
@@ -1,8 +1,10 @@
 from typing import List
 
 from asgiref.sync import async_to_sync
+from django.db.models import Count, Q
 from django.http import Http404
-from drf_spectacular.utils import extend_schema, extend_schema_view
+from drf_spectacular.types import OpenApiTypes
+from drf_spectacular.utils import OpenApiParameter, extend_schema, extend_schema_view
 from rest_framework import status
 from rest_framework.parsers import FormParser, JSONParser, MultiPartParser
 from rest_framework.permissions import AllowAny, IsAuthenticated
@@ -11,16 +13,18 @@ from rest_framework.response import Response
 from apps.playlists.api.serializers import (
     PlaylistCreateSerializer,
     PlaylistResponseSerializer,
+    PlaylistSongResponseSerializer,
     PlaylistUpdateSerializer,
 )
+from apps.playlists.infrastructure.cache import get_public_playlists_cache
 from apps.playlists.infrastructure.filters import PlaylistModelFilter
 from apps.playlists.infrastructure.models.playlist_model import PlaylistModel
 from apps.playlists.infrastructure.repository import PlaylistRepository
 from apps.playlists.use_cases import (
     CreatePlaylistUseCase,
     DeletePlaylistUseCase,
+    GetPlaylistUseCase,
     GetPublicAndUserPlaylistsUseCase,
-    GetUserPlaylistsUseCase,
     UpdatePlaylistUseCase,
 )
 from apps.user_profile.infrastructure.permissions import (
@@ -28,10 +32,13 @@ from apps.user_profile.infrastructure.permissions import (
     IsPlaylistOwnerOrPublic,
 )
 from common.factories.storage_service_factory import StorageServiceFactory
+from common.mixins.cached_response_mixin import CachedResponseMixin
+from common.mixins.conditional_get_mixin import ConditionalGetMixin
 from common.mixins.crud_viewset_mixin import CRUDViewSetMixin
+from common.utils.result_window import ResultWindow
 
 from ..dtos import CreatePlaylistRequestDTO, UpdatePlaylistRequestDTO
-from ..mappers import PlaylistEntityDTOMapper
+from ..mappers import PlaylistEntityDTOMapper, PlaylistSongEntityDTOMapper
 
 # Constantes para mensajes de error
 PLAYLIST_NOT_FOUND_MSG = "Playlist no encontrada"
@@ -41,6 +48,11 @@ ERROR_RETRIEVING_PLAYLIST_MSG = "Error obteniendo playlist"
 ERROR_UPDATING_PLAYLIST_MSG = "Error actualizando playlist"
 ERROR_DELETING_PLAYLIST_MSG = "Error eliminando playlist"
 DELETE_FAILED_MSG = "No se pudo eliminar la playlist"
+INVALID_SONGS_LIMIT_MSG = "songs_limit debe ser un entero entre 1 y {max}"
+
+# Canciones incluidas en el detalle con include_songs
+DEFAULT_SONGS_LIMIT = 20
+MAX_SONGS_LIMIT = 100
 
 
 @extend_schema_view(
@@ -49,7 +61,28 @@ DELETE_FAILED_MSG = "No se pudo eliminar la playlist"
         description="List public playlists and user playlists (if authenticated).",
     ),
     retrieve=extend_schema(
-        tags=["Playlist"], description="Get a specific user playlist by ID"
+        tags=["Playlist"],
+        description=(
+            "Get a playlist by ID (owned by the user or public). With "
+            "`include_songs=true` the first page of songs is embedded in `songs`."
+        ),
+        parameters=[
+            OpenApiParameter(
+                name="include_songs",
+                type=OpenApiTypes.BOOL,
+                location=OpenApiParameter.QUERY,
+                required=False,
+                description="Embed the first page of songs",
+            ),
+            OpenApiParameter(
+                name="songs_limit",
+                type=OpenApiTypes.INT,
+                location=OpenApiParameter.QUERY,
+                required=False,
+                default=DEFAULT_SONGS_LIMIT,
+                description=f"Number of embedded songs (1-{MAX_SONGS_LIMIT})",
+            ),
+        ],
     ),
     create=extend_schema(
         tags=["Playlist"],
@@ -62,9 +95,13 @@ DELETE_FAILED_MSG = "No se pudo eliminar la playlist"
         tags=["Playlist"], description="Delete user playlist (authentication required)"
     ),
 )
-class PlaylistViewSet(CRUDViewSetMixin):
+class PlaylistViewSet(ConditionalGetMixin, CachedResponseMixin, CRUDViewSetMixin):
     """ViewSet para gestionar playlists"""
 
+    # Peticiones condicionales: añadir o quitar canciones no toca updated_at
+    conditional_counter_fields = ("playlist_song_count",)
+    last_modified_field = None
+
     queryset = PlaylistModel.objects.all()
     serializer_class = PlaylistResponseSerializer
     filterset_class = PlaylistModelFilter
@@ -76,6 +113,7 @@ class PlaylistViewSet(CRUDViewSetMixin):
         self.playlist_repository = PlaylistRepository()
         self.storage_service = StorageServiceFactory.create_playlist_images_service()
         self.mapper = PlaylistEntityDTOMapper()
+        self.song_mapper = PlaylistSongEntityDTOMapper()
 
     def get_serializer_class(self) -> type:
         if self.action == "create":
@@ -105,6 +143,30 @@ class PlaylistViewSet(CRUDViewSetMixin):
 
     def list(self, request):
         """Lista las playlists públicas y del usuario autenticado"""
+        if not request.user.is_authenticated:
+            # El listado anónimo (sólo públicas) es igual para todos: se cachea
+            return self.cached_response(
+                request,
+                get_public_playlists_cache(),
+                lambda: self._build_list_response(request),
+            )
+        return self.conditional_response(
+            request,
+            self.get_list_validators(request),
+            lambda: self._build_list_response(request),
+        )
+
+    def get_conditional_queryset(self):
+        """Playlists visibles para el usuario, con su número de canciones"""
+        user_id = self.request.user.id
+        queryset = PlaylistModel.objects.annotate(
+            playlist_song_count=Count("playlist_songs")
+        )
+        # Igual que list y retrieve: públicas o del propio usuario
+        return queryset.filter(Q(is_public=True) | Q(user__id=user_id))
+
+    def _build_list_response(self, request):
+        """Construye el listado paginado de playlists"""
         self.logger.debug(
             f"user_id={request.user.id if request.user.is_authenticated else 'anonymous'}",
         )
@@ -118,7 +180,14 @@ class PlaylistViewSet(CRUDViewSetMixin):
             f"Executing GetPublicAndUserPlaylistsUseCase for user: {user_id}"
         )
 
-        playlists = async_to_sync(get_use_case.execute)(queryset, user_id)
+        # El paginador pide el total y la ventana de la página: sólo se
+        # cargan y mapean las playlists de la página solicitada
+        playlists = ResultWindow(
+            count=lambda: async_to_sync(get_use_case.count)(queryset, user_id),
+            fetch=lambda offset, limit: async_to_sync(get_use_case.execute)(
+                queryset, user_id, offset, limit
+            ),
+        )
 
         user_info = (
             f"user {request.user.id}"
@@ -126,7 +195,6 @@ class PlaylistViewSet(CRUDViewSetMixin):
             else "anonymous user"
         )
 
-        # Paso 3: Paginación y serialización de la lista de entidades en memoria.
         page = self.paginate_queryset(playlists)
 
         if page is not None:
@@ -135,6 +203,7 @@ class PlaylistViewSet(CRUDViewSetMixin):
             self.logger.info(f"Retrieved {len(page)} playlists for {user_info}")
             return self.get_paginated_response(serializer.data)
 
+        playlists = async_to_sync(get_use_case.execute)(queryset, user_id)
         playlist_dtos = self.mapper.entities_to_dtos(playlists)
         serializer = PlaylistResponseSerializer(playlist_dtos, many=True)
         self.logger.info(f"Retrieved {len(playlists)} playlists for {user_info}")
@@ -177,21 +246,53 @@ class PlaylistViewSet(CRUDViewSetMixin):
         if not pk:
             raise Http404(PLAYLIST_NOT_FOUND_MSG)
 
-        playlist_id = str(pk)
-        user_id = str(request.user.id)
+        try:
+            songs_limit = self.get_songs_limit(request)
+        except ValueError:
+            return Response(
+                {"error": INVALID_SONGS_LIMIT_MSG.format(max=MAX_SONGS_LIMIT)},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        if songs_limit:
+            # Las canciones incluidas cambian sin tocar la playlist (reordenar,
+            # editar una canción): sin validadores condicionales
+            return self._build_retrieve_response(request, pk, songs_limit)
 
-        get_use_case = GetUserPlaylistsUseCase(self.playlist_repository)
-        playlists = async_to_sync(get_use_case.execute)(user_id)
+        return self.conditional_response(
+            request,
+            self.get_detail_validators(request, pk),
+            lambda: self._build_retrieve_response(request, pk),
+        )
 
-        playlist = next((p for p in playlists if p.id == playlist_id), None)
+    def get_songs_limit(self, request) -> int:
+        """Canciones a incluir en el detalle, 0 si no se piden (ValueError si no es válido)"""
+        if request.GET.get("include_songs", "false").lower() not in ("true", "1"):
+            return 0
+        songs_limit = int(request.GET.get("songs_limit", DEFAULT_SONGS_LIMIT))
+        if not 1 <= songs_limit <= MAX_SONGS_LIMIT:
+            raise ValueError(songs_limit)
+        return songs_limit
+
+    def _build_retrieve_response(self, request, pk, songs_limit: int = 0):
+        """Construye el detalle de la playlist"""
+        playlist_id = str(pk)
+
+        get_use_case = GetPlaylistUseCase(self.playlist_repository)
+        playlist = async_to_sync(get_use_case.execute)(playlist_id, songs_limit)
         if not playlist:
             raise Http404(PLAYLIST_NOT_FOUND_MSG)
 
-        playlist_dto = self.mapper.entity_to_dto(playlist)
-        serializer = PlaylistResponseSerializer(playlist_dto)
+        # Propietario o playlist pública
+        self.check_object_permissions(request, playlist)
 
-        self.logger.info(f"Retrieved playlist {playlist_id} for user {user_id}")
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        data = PlaylistResponseSerializer(self.mapper.entity_to_dto(playlist)).data
+        if playlist.songs is not None:
+            song_dtos = self.song_mapper.entities_to_dtos(playlist.songs)
+            data["songs"] = PlaylistSongResponseSerializer(song_dtos, many=True).data
+
+        self.logger.info(f"Retrieved playlist {playlist_id} for user {request.user.id}")
+        return Response(data, status=status.HTTP_200_OK)
 
     def update(self, request, pk=None):
         """Actualiza una playlist"""
@@ -8,3 +8,7 @@ from django.apps import AppConfig
 class PlaylistsConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "apps.playlists"
+
+    def ready(self):
+        # Invalidación de cachés de lectura
+        from .infrastructure import signals  # noqa: F401
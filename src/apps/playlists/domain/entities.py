@@ -3,7 +3,7 @@ from datetime import datetime
 from typing import List, Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class PlaylistEntity:
     """Entidad de dominio para las playlists"""
 
@@ -17,6 +17,7 @@ class PlaylistEntity:
     playlist_img: Optional[str] = None  # URL de la imagen de la playlist
     updated_at: Optional[datetime] = None
     songs: Optional[List["PlaylistSongEntity"]] = None  # Relación con canciones
+    total_songs: Optional[int] = None  # Número de canciones calculado en la consulta
 
     def __post_init__(self):
         """Validaciones de negocio"""
@@ -29,10 +30,12 @@ class PlaylistEntity:
     @property
     def song_count(self) -> int:
         """Retorna el número de canciones en la playlist"""
+        if self.total_songs is not None:
+            return self.total_songs
         return len(self.songs) if self.songs else 0
 
 
-@dataclass
+@dataclass(slots=True)
 class PlaylistSongEntity:
     """Entidad de dominio para las canciones en playlists"""
 
@@ -41,6 +44,10 @@ class PlaylistSongEntity:
     song_id: str
     position: int
     added_at: datetime
+    # Datos de la canción, si se cargaron en la misma consulta
+    song_title: Optional[str] = None
+    song_artist: Optional[str] = None
+    song_duration: Optional[int] = None
 
     def __post_init__(self):
         """Validaciones de negocio"""
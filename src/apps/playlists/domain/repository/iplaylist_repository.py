@@ -30,6 +30,10 @@ class IPlaylistRepository(IBaseRepository[PlaylistEntity, Any]):
     async def get_by_user_id(self, user_id: str) -> List[PlaylistEntity]:
         """Obtiene todas las playlists de un usuario"""
 
+    @abstractmethod
+    async def get_playlist_by_id(self, playlist_id: str) -> Optional[PlaylistEntity]:
+        """Obtiene una playlist con su propietario y número de canciones (una consulta)"""
+
     @abstractmethod
     async def get_default_playlist(
         self, user_id: str, name: str = "Favoritos"
@@ -57,6 +61,12 @@ class IPlaylistRepository(IBaseRepository[PlaylistEntity, Any]):
     async def get_playlist_songs(self, playlist_id: str) -> List[PlaylistSongEntity]:
         """Obtiene todas las canciones de una playlist"""
 
+    @abstractmethod
+    async def get_playlist_songs_page(
+        self, playlist_id: str, offset: int = 0, limit: int = 20
+    ) -> List[PlaylistSongEntity]:
+        """Obtiene una ventana de canciones de la playlist con los datos de cada canción"""
+
     @abstractmethod
     async def get_public_playlists(
         self,
@@ -73,21 +83,29 @@ class IPlaylistRepository(IBaseRepository[PlaylistEntity, Any]):
     async def is_song_in_playlist(self, playlist_id: str, song_id: str) -> bool:
         """Verifica si una canción está en una playlist específica"""
 
+    @abstractmethod
+    async def count_from_queryset(self, queryset: QuerySet) -> int:
+        """Cuenta las playlists de un queryset sin cargarlas"""
+
     @abstractmethod
     @sync_to_async
     def _get_playlists_from_queryset_sync(
-        self, queryset: QuerySet
+        self, queryset: QuerySet, offset: int = 0, limit: Optional[int] = None
     ) -> List[PlaylistEntity]:
-        """Convierte un queryset de Django a una lista de entidades de playlist"""
+        """Convierte un queryset de Django (o una ventana de él) a entidades de playlist"""
 
-    async def get_from_queryset(self, queryset: QuerySet) -> List[PlaylistEntity]:
+    async def get_from_queryset(
+        self, queryset: QuerySet, offset: int = 0, limit: Optional[int] = None
+    ) -> List[PlaylistEntity]:
         """
         Obtiene una lista de entidades de playlist a partir de un queryset.
 
         Args:
             queryset (QuerySet): QuerySet de Django con los resultados.
+            offset (int): Primera fila a devolver.
+            limit (Optional[int]): Número de filas (None para todas).
 
         Returns:
             List[PlaylistEntity]: Lista de entidades de playlist.
         """
-        return await self._get_playlists_from_queryset_sync(queryset)
+        return await self._get_playlists_from_queryset_sync(queryset, offset, limit)
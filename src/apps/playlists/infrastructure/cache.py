@@ -0,0 +1,16 @@
+"""Cachés de lectura de playlists compartidas por todos los usuarios"""
+
+from common.utils.cache_facade import CacheFacade, get_cache
+
+PUBLIC_PLAYLISTS_CACHE_NAMESPACE = "playlists.public"
+PUBLIC_PLAYLISTS_CACHE_TTL = 60
+
+
+def get_public_playlists_cache() -> CacheFacade:
+    """Caché del listado de playlists públicas (usuarios anónimos)"""
+    return get_cache(PUBLIC_PLAYLISTS_CACHE_NAMESPACE, ttl=PUBLIC_PLAYLISTS_CACHE_TTL)
+
+
+def invalidate_public_playlists_cache() -> None:
+    """Invalida el listado tras cambios en playlists públicas o de visibilidad"""
+    get_public_playlists_cache().invalidate()
@@ -1,8 +1,9 @@
 from typing import List, Optional
 
 from asgiref.sync import sync_to_async
+from django.core.exceptions import ValidationError
 from django.db import models
-from django.db.models import QuerySet
+from django.db.models import Count, QuerySet
 
 from apps.playlists.api.mappers.playlist_entity_model_mapper import (
     PlaylistEntityModelMapper,
@@ -71,6 +72,22 @@ class PlaylistRepository(
 
         return [self.mapper.model_to_entity(model) for model in models]
 
+    async def get_playlist_by_id(self, playlist_id: str) -> Optional[PlaylistEntity]:
+        """Obtiene una playlist con su propietario y número de canciones (una consulta)"""
+        self.logger.debug(f"Getting playlist: {playlist_id}")
+
+        try:
+            model = await (
+                PlaylistModel.objects.select_related("user")
+                .annotate(playlist_song_count=Count("playlist_songs"))
+                .filter(id=playlist_id)
+                .afirst()
+            )
+        except ValidationError:
+            # ID mal formado
+            return None
+        return self.mapper.model_to_entity(model) if model else None
+
     async def get_default_playlist(
         self, user_id: str, name: str = "Favoritos"
     ) -> Optional[PlaylistEntity]:
@@ -219,6 +236,41 @@ class PlaylistRepository(
             for model in models
         ]
 
+    async def get_playlist_songs_page(
+        self, playlist_id: str, offset: int = 0, limit: int = 20
+    ) -> List[PlaylistSongEntity]:
+        """Obtiene una ventana de canciones de la playlist con los datos de cada canción (un JOIN)"""
+        self.logger.debug(
+            f"Getting songs {offset}-{offset + limit} for playlist: {playlist_id}"
+        )
+
+        rows = (
+            PlaylistSongModel.objects.filter(playlist_id=playlist_id)
+            .order_by("position")
+            .values(
+                "id",
+                "song_id",
+                "position",
+                "added_at",
+                "song__title",
+                "song__artist__name",
+                "song__duration_seconds",
+            )[offset : offset + limit]
+        )
+        return [
+            PlaylistSongEntity(
+                id=str(row["id"]),
+                playlist_id=playlist_id,
+                song_id=str(row["song_id"]),
+                position=row["position"],
+                added_at=row["added_at"],
+                song_title=row["song__title"],
+                song_artist=row["song__artist__name"],
+                song_duration=row["song__duration_seconds"],
+            )
+            async for row in rows
+        ]
+
     async def get_public_playlists(
         self,
     ) -> List[PlaylistEntity]:
@@ -266,8 +318,20 @@ class PlaylistRepository(
             playlist_id=playlist_id, song_id=song_id
         ).aexists()
 
+    async def count_from_queryset(self, queryset: QuerySet) -> int:
+        """Cuenta las playlists de un queryset sin cargarlas"""
+        return await queryset.acount()
+
     @sync_to_async
     def _get_playlists_from_queryset_sync(
-        self, queryset: QuerySet
+        self, queryset: QuerySet, offset: int = 0, limit: Optional[int] = None
     ) -> List[PlaylistEntity]:
+        # Propietario y número de canciones en la misma consulta (sin N+1)
+        queryset = queryset.select_related("user").annotate(
+            playlist_song_count=Count("playlist_songs")
+        )
+        if limit is not None:
+            # El pk desempata created_at para que las páginas sean estables
+            ordering = queryset.query.order_by or PlaylistModel._meta.ordering
+            queryset = queryset.order_by(*ordering, "pk")[offset : offset + limit]
         return self.mapper.models_to_entities(list(queryset))
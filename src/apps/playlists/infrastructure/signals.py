@@ -0,0 +1,38 @@
+"""Señales que mantienen coherente la caché de playlists públicas"""
+
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from .cache import invalidate_public_playlists_cache
+from .models import PlaylistModel, PlaylistSongModel
+
+
+@receiver(pre_save, sender=PlaylistModel, dispatch_uid="playlists_track_visibility")
+def track_previous_visibility(sender, instance, **kwargs):
+    """Guarda si la playlist era pública antes de guardarla (sólo si ahora es privada)"""
+    if instance._state.adding or instance.is_public:
+        instance._was_public = False
+        return
+    instance._was_public = sender.objects.filter(
+        pk=instance.pk, is_public=True
+    ).exists()
+
+
+@receiver(post_save, sender=PlaylistModel, dispatch_uid="playlists_invalidate_save")
+def invalidate_on_playlist_save(sender, instance, **kwargs):
+    if instance.is_public or getattr(instance, "_was_public", False):
+        invalidate_public_playlists_cache()
+
+
+@receiver(post_delete, sender=PlaylistModel, dispatch_uid="playlists_invalidate_delete")
+def invalidate_on_playlist_delete(sender, instance, **kwargs):
+    if instance.is_public:
+        invalidate_public_playlists_cache()
+
+
+@receiver(post_save, sender=PlaylistSongModel, dispatch_uid="playlist_songs_save")
+@receiver(post_delete, sender=PlaylistSongModel, dispatch_uid="playlist_songs_delete")
+def invalidate_on_playlist_songs_change(sender, instance, **kwargs):
+    """El número de canciones forma parte del listado público"""
+    if PlaylistModel.objects.filter(pk=instance.playlist_id, is_public=True).exists():
+        invalidate_public_playlists_cache()
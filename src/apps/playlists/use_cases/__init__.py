@@ -3,6 +3,7 @@ from .create_playlist_use_case import CreatePlaylistUseCase
 from .delete_playlist_use_case import DeletePlaylistUseCase
 from .ensure_default_playlist_use_case import EnsureDefaultPlaylistUseCase
 from .get_playlist_songs_use_case import GetPlaylistSongsUseCase
+from .get_playlist_use_case import GetPlaylistUseCase
 from .get_public_and_user_playlists_use_case import GetPublicAndUserPlaylistsUseCase
 from .get_user_playlists_use_case import GetUserPlaylistsUseCase
 from .remove_song_from_playlist_use_case import RemoveSongFromPlaylistUseCase
@@ -14,6 +15,7 @@ __all__ = [
     "DeletePlaylistUseCase",
     "EnsureDefaultPlaylistUseCase",
     "GetPlaylistSongsUseCase",
+    "GetPlaylistUseCase",
     "GetPublicAndUserPlaylistsUseCase",
     "GetUserPlaylistsUseCase",
     "RemoveSongFromPlaylistUseCase",
@@ -0,0 +1,52 @@
+from typing import Optional
+
+from common.interfaces.ibase_use_case import BaseUseCase
+from common.utils.logging_decorators import log_execution, log_performance
+
+from ..domain.entities import PlaylistEntity
+from ..domain.exceptions import PlaylistValidationException
+from ..domain.repository.iplaylist_repository import IPlaylistRepository
+
+
+class GetPlaylistUseCase(BaseUseCase[str, Optional[PlaylistEntity]]):
+    """Caso de uso para obtener una playlist por ID"""
+
+    def __init__(self, playlist_repository: IPlaylistRepository):
+        super().__init__()
+        self.repository = playlist_repository
+
+    @log_execution(include_args=True, include_result=False, log_level="DEBUG")
+    @log_performance(threshold_seconds=1.0)
+    async def execute(
+        self, playlist_id: str, songs_limit: int = 0
+    ) -> Optional[PlaylistEntity]:
+        """
+        Obtiene una playlist y, opcionalmente, su primera página de canciones
+
+        Args:
+            playlist_id: ID de la playlist
+            songs_limit: Canciones a incluir en ``songs`` (0 para no incluirlas)
+
+        Returns:
+            La playlist, o None si no existe
+
+        Raises:
+            PlaylistValidationException: Si el ID es inválido
+        """
+        try:
+            if not playlist_id:
+                raise PlaylistValidationException("El ID de la playlist es requerido")
+
+            playlist = await self.repository.get_playlist_by_id(playlist_id)
+            if playlist is None or songs_limit <= 0:
+                return playlist
+
+            # El número total de canciones ya viene en la entidad
+            playlist.songs = await self.repository.get_playlist_songs_page(
+                playlist_id, limit=songs_limit
+            )
+            return playlist
+
+        except Exception as e:
+            self.logger.error(f"Error getting playlist: {str(e)}")
+            raise
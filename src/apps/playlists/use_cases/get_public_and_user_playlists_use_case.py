@@ -1,4 +1,4 @@
-from typing import List
+from typing import List, Optional
 
 from django.db.models import Q, QuerySet
 
@@ -21,7 +21,13 @@ class GetPublicAndUserPlaylistsUseCase(BaseUseCase[dict, List[PlaylistEntity]]):
 
     @log_execution(include_args=True, include_result=False, log_level="DEBUG")
     @log_performance(threshold_seconds=1.0)
-    async def execute(self, queryset: QuerySet, user_id: str) -> List[PlaylistEntity]:
+    async def execute(
+        self,
+        queryset: QuerySet,
+        user_id: str,
+        offset: int = 0,
+        limit: Optional[int] = None,
+    ) -> List[PlaylistEntity]:
         """
         Ejecuta el caso de uso para obtener playlists públicas y del usuario,
         aplicando los filtros del queryset.
@@ -29,6 +35,8 @@ class GetPublicAndUserPlaylistsUseCase(BaseUseCase[dict, List[PlaylistEntity]]):
         Args:
             queryset: El QuerySet de Django, pre-filtrado por la vista.
             user_id: ID del usuario autenticado (opcional).
+            offset: Primera playlist de la página.
+            limit: Tamaño de la página (None para todas).
 
         Returns:
             Lista de entidades de playlist (públicas + del usuario).
@@ -36,31 +44,33 @@ class GetPublicAndUserPlaylistsUseCase(BaseUseCase[dict, List[PlaylistEntity]]):
         self.logger.info(f"Getting playlists for user: {user_id}")
 
         try:
-            if user_id:
-                # Usa un Q object para combinar filtros en el queryset de manera eficiente.
-                # Busca playlists públicas o playlists del usuario autenticado.
-                combined_filter = Q(is_public=True) | Q(user__id=user_id)
-                final_queryset = queryset.filter(combined_filter)
-
-                # El repositorio se encarga de ejecutar el queryset y mapear a entidades.
-                playlists = await self.playlist_repository.get_from_queryset(
-                    final_queryset
-                )
+            # El repositorio ejecuta sólo la ventana pedida y la mapea a entidades
+            playlists = await self.playlist_repository.get_from_queryset(
+                self._visible_playlists(queryset, user_id), offset, limit
+            )
 
+            if user_id:
                 self.logger.info(
                     f"Retrieved {len(playlists)} combined playlists for user: {user_id}"
                 )
-                return playlists
             else:
-                # Para usuarios anónimos, solo se buscan las playlists públicas.
-                public_playlists_queryset = queryset.filter(is_public=True)
-                playlists = await self.playlist_repository.get_from_queryset(
-                    public_playlists_queryset
-                )
-
                 self.logger.info(f"Retrieved {len(playlists)} public playlists")
-                return playlists
+            return playlists
 
         except Exception as e:
             self.logger.error(f"Error getting public and user playlists: {str(e)}")
             raise e
+
+    async def count(self, queryset: QuerySet, user_id: str) -> int:
+        """Número total de playlists visibles (para la paginación)"""
+        return await self.playlist_repository.count_from_queryset(
+            self._visible_playlists(queryset, user_id)
+        )
+
+    @staticmethod
+    def _visible_playlists(queryset: QuerySet, user_id: Optional[str]) -> QuerySet:
+        if user_id:
+            # Playlists públicas o del usuario autenticado
+            return queryset.filter(Q(is_public=True) | Q(user__id=user_id))
+        # Para usuarios anónimos, solo se buscan las playlists públicas
+        return queryset.filter(is_public=True)
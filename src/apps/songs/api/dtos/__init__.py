@@ -1,6 +1,7 @@
 from .song_dtos import (
     IncrementCountRequestDTO,
     RandomSongsRequestDTO,
+    SongPlayHistoryRequestDTO,
     SongResponseDTO,
     SongSearchRequestDTO,
 )
@@ -10,4 +11,5 @@ __all__ = [
     "SongSearchRequestDTO",
     "RandomSongsRequestDTO",
     "IncrementCountRequestDTO",
+    "SongPlayHistoryRequestDTO",
 ]
@@ -3,7 +3,7 @@ from datetime import datetime
 from typing import List, Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class SongResponseDTO:
     """DTO para respuestas de canción"""
 
@@ -20,6 +20,7 @@ class SongResponseDTO:
     file_url: Optional[str] = None
     thumbnail_url: Optional[str] = None
     lyrics: Optional[str] = None
+    has_lyrics: bool = False
     play_count: int = 0
     favorite_count: int = 0
     download_count: int = 0
@@ -64,3 +65,12 @@ class IncrementCountRequestDTO:
     """DTO para incrementar contadores"""
 
     song_id: str
+
+
+@dataclass
+class SongPlayHistoryRequestDTO:
+    """DTO para las reproducciones de una canción por ventana de tiempo"""
+
+    song_id: str
+    granularity: str = "day"  # "hour" o "day"
+    days: int = 7
@@ -17,7 +17,7 @@ class SongEntityDTOMapper(AbstractEntityDtoMapper[SongEntity, SongResponseDTO]):
         Convierte una entidad del dominio a DTO de respuesta.
         Obtiene nombres de géneros usando los IDs.
         """
-        self.logger.debug(f"Converting entity to DTO for song {entity.id}")
+        self.logger.debug("Converting entity to DTO for song %s", entity.id)
 
         # Obtener nombres de géneros basándose en genre_ids (síncronamente)
         genre_names = self._get_genre_names_from_ids_sync(entity.genre_ids or [])
@@ -39,6 +39,7 @@ class SongEntityDTOMapper(AbstractEntityDtoMapper[SongEntity, SongResponseDTO]):
             file_url=entity.file_url,
             thumbnail_url=entity.thumbnail_url,
             lyrics=entity.lyrics,
+            has_lyrics=entity.has_lyrics,
             play_count=entity.play_count,
             favorite_count=entity.favorite_count,
             download_count=entity.download_count,
@@ -67,6 +68,7 @@ class SongEntityDTOMapper(AbstractEntityDtoMapper[SongEntity, SongResponseDTO]):
             file_url=dto.file_url,
             thumbnail_url=dto.thumbnail_url,
             lyrics=dto.lyrics,
+            has_lyrics=dto.has_lyrics,
             play_count=dto.play_count,
             favorite_count=dto.favorite_count,
             download_count=dto.download_count,
@@ -1,7 +1,7 @@
-from typing import Any, Dict, List
+from typing import Any, Dict, Optional
 
 from apps.songs.domain.entities import SongEntity
-from apps.songs.infrastructure.models import SongModel
+from apps.songs.infrastructure.models import SongLyricsModel, SongModel
 from common.interfaces.imapper import AbstractEntityModelMapper
 
 
@@ -15,12 +15,14 @@ class SongEntityModelMapper(AbstractEntityModelMapper[SongEntity, SongModel]):
         """
         Convierte un modelo Django SongModel a entidad del dominio SongEntity.
         """
-        self.logger.debug(f"Converting model to entity for song {model.id}")
+        self.logger.debug("Converting model to entity for song %s", model.id)
 
         genre_ids = []
-        if hasattr(model, "genres"):
+        # Un solo acceso al related manager (hasattr ya construye uno)
+        genres = getattr(model, "genres", None)
+        if genres is not None:
             try:
-                genre_ids = [str(genre.id) for genre in model.genres.all()]
+                genre_ids = [str(genre.id) for genre in genres.all()]
             except Exception:
                 genre_ids = []
 
@@ -38,7 +40,8 @@ class SongEntityModelMapper(AbstractEntityModelMapper[SongEntity, SongModel]):
             track_number=model.track_number,
             file_url=model.file_url,
             thumbnail_url=model.thumbnail_url,
-            lyrics=model.lyrics,
+            lyrics=self._get_loaded_lyrics(model),
+            has_lyrics=model.has_lyrics,
             play_count=model.play_count,
             favorite_count=model.favorite_count,
             download_count=model.download_count,
@@ -52,11 +55,21 @@ class SongEntityModelMapper(AbstractEntityModelMapper[SongEntity, SongModel]):
             release_date=model.release_date,
         )
 
+    @staticmethod
+    def _get_loaded_lyrics(model: SongModel) -> Optional[str]:
+        """Letra si se cargó con ``select_related("lyrics_entry")``; nunca consulta"""
+        if not SongModel.lyrics_entry.is_cached(model):
+            return None
+        try:
+            return model.lyrics_entry.text
+        except SongLyricsModel.DoesNotExist:
+            return None
+
     def entity_to_model(self, entity: SongEntity) -> SongModel:
         """
         Convierte una entidad SongEntity a una instancia del modelo Django SongModel.
         """
-        self.logger.debug(f"Converting entity to model instance for song {entity.id}")
+        self.logger.debug("Converting entity to model instance for song %s", entity.id)
 
         model_instance = SongModel(
             id=entity.id if hasattr(entity, "id") and entity.id is not None else None,
@@ -65,7 +78,6 @@ class SongEntityModelMapper(AbstractEntityModelMapper[SongEntity, SongModel]):
             track_number=entity.track_number,
             file_url=entity.file_url,
             thumbnail_url=entity.thumbnail_url,
-            lyrics=entity.lyrics,
             play_count=entity.play_count,
             favorite_count=entity.favorite_count,
             download_count=entity.download_count,
@@ -85,7 +97,7 @@ class SongEntityModelMapper(AbstractEntityModelMapper[SongEntity, SongModel]):
         """
         Convierte una entidad SongEntity a datos del modelo Django (diccionario).
         """
-        self.logger.debug(f"Converting entity to model data for song {entity.id}")
+        self.logger.debug("Converting entity to model data for song %s", entity.id)
 
         model_data = {
             "title": entity.title,
@@ -93,7 +105,6 @@ class SongEntityModelMapper(AbstractEntityModelMapper[SongEntity, SongModel]):
             "track_number": entity.track_number,
             "file_url": entity.file_url,
             "thumbnail_url": entity.thumbnail_url,
-            "lyrics": entity.lyrics,
             "play_count": entity.play_count,
             "favorite_count": entity.favorite_count,
             "download_count": entity.download_count,
@@ -113,24 +124,3 @@ class SongEntityModelMapper(AbstractEntityModelMapper[SongEntity, SongModel]):
             model_data["album_id"] = entity.album_id
 
         return model_data
-
-    async def set_entity_genres_to_model(
-        self, model: SongModel, genre_ids: List[str]
-    ) -> None:
-        """
-        Asigna los géneros a un modelo de canción ya guardado.
-
-        Args:
-            model: Instancia del modelo SongModel ya guardada en la base de datos
-            genre_ids: Lista de IDs de géneros a asignar
-        """
-        if genre_ids:
-            # Necesitamos importar aquí para evitar imports circulares
-            from asgiref.sync import sync_to_async
-
-            from apps.genres.infrastructure.models import GenreModel
-
-            genre_objects = await sync_to_async(list)(
-                GenreModel.objects.filter(id__in=genre_ids)
-            )
-            await sync_to_async(model.genres.set)(genre_objects)
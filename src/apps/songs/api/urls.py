@@ -1,14 +1,26 @@
+from django.conf import settings
 from django.urls import include, path
 from rest_framework.routers import DefaultRouter
 
 from .views import (
+    AsyncIncrementPlayCountAPIView,
+    AsyncLyricsView,
+    AsyncMostPopularSongsView,
+    AsyncRandomSongsView,
+    AsyncSongPlayHistoryView,
+    AsyncTrendingSongsView,
     IncrementPlayCountAPIView,
     MostPopularSongsView,
     RandomSongsView,
+    SongPlayHistoryView,
     SongViewSet,
+    TrendingSongsView,
 )
 from .views.lyrics_viewset import LyricsView
 
+# En modo ASGI se usan las variantes async que esperan los casos de uso
+ASYNC_VIEWS = settings.ASYNC_VIEWS_ENABLED
+
 # Router para el ViewSet
 router = DefaultRouter()
 router.register(r"list", SongViewSet, basename="songs-viewset")
@@ -17,18 +29,40 @@ urlpatterns = [
     # ViewSet para listado y detalle con filtros (incluye búsqueda unificada con YouTube)
     path("", include(router.urls)),
     # Canciones aleatorias
-    path("random/", RandomSongsView.as_view(), name="random-songs"),
+    path(
+        "random/",
+        (AsyncRandomSongsView if ASYNC_VIEWS else RandomSongsView).as_view(),
+        name="random-songs",
+    ),
     # Canciones más populares
-    path("most-popular/", MostPopularSongsView.as_view(), name="most-popular-songs"),
+    path(
+        "most-popular/",
+        (AsyncMostPopularSongsView if ASYNC_VIEWS else MostPopularSongsView).as_view(),
+        name="most-popular-songs",
+    ),
+    # Canciones en tendencia (top precalculado por trending_score)
+    path(
+        "trending/",
+        (AsyncTrendingSongsView if ASYNC_VIEWS else TrendingSongsView).as_view(),
+        name="trending-songs",
+    ),
     # Nueva vista API para incrementar contador (más consistente)
     path(
         "<uuid:song_id>/increment-play-count/",
-        IncrementPlayCountAPIView.as_view(),
+        (
+            AsyncIncrementPlayCountAPIView if ASYNC_VIEWS else IncrementPlayCountAPIView
+        ).as_view(),
         name="increment-play-count",
     ),
+    # Reproducciones por hora o día (registro de reproducciones)
+    path(
+        "<uuid:song_id>/plays/",
+        (AsyncSongPlayHistoryView if ASYNC_VIEWS else SongPlayHistoryView).as_view(),
+        name="song-play-history",
+    ),
     path(
         "<uuid:song_id>/lyrics/",
-        LyricsView.as_view(),
+        (AsyncLyricsView if ASYNC_VIEWS else LyricsView).as_view(),
         name="get-lyrics",
     ),
 ]
@@ -1,11 +1,29 @@
+from .async_song_views import (
+    AsyncIncrementPlayCountAPIView,
+    AsyncLyricsView,
+    AsyncMostPopularSongsView,
+    AsyncRandomSongsView,
+    AsyncSongPlayHistoryView,
+    AsyncTrendingSongsView,
+)
 from .increment_play_count_api_view import IncrementPlayCountAPIView
 from .most_popular_songs_view import MostPopularSongsView
 from .random_songs_view import RandomSongsView
+from .song_play_history_view import SongPlayHistoryView
 from .song_viewset import SongViewSet
+from .trending_songs_view import TrendingSongsView
 
 __all__ = [
     "RandomSongsView",
     "MostPopularSongsView",
     "IncrementPlayCountAPIView",
+    "SongPlayHistoryView",
     "SongViewSet",
+    "TrendingSongsView",
+    "AsyncRandomSongsView",
+    "AsyncMostPopularSongsView",
+    "AsyncIncrementPlayCountAPIView",
+    "AsyncLyricsView",
+    "AsyncSongPlayHistoryView",
+    "AsyncTrendingSongsView",
 ]
@@ -0,0 +1,123 @@
+"""
+Variantes async de las vistas de canciones para el modo de producción ASGI.
+
+Esperan los casos de uso directamente en lugar de envolverlos en
+``async_to_sync``. Se activan con ``ASYNC_VIEWS_ENABLED`` (ver ``urls.py``).
+"""
+
+from rest_framework import status
+from rest_framework.response import Response
+
+from common.mixins import AsyncAPIViewMixin
+from common.utils.schema_decorators import same_schema_as
+
+from ...infrastructure.cache import get_most_played_cache, get_trending_cache
+from ..dtos import IncrementCountRequestDTO
+from .increment_play_count_api_view import IncrementPlayCountAPIView
+from .lyrics_viewset import LyricsView
+from .most_popular_songs_view import MostPopularSongsView
+from .random_songs_view import RandomSongsView
+from .song_play_history_view import SongPlayHistoryView
+from .trending_songs_view import TrendingSongsView
+
+
+class AsyncMostPopularSongsView(AsyncAPIViewMixin, MostPopularSongsView):
+    """Variante async de ``MostPopularSongsView``"""
+
+    @same_schema_as(MostPopularSongsView.get)
+    async def get(self, request):
+        """Obtiene las canciones más populares/reproducidas (cacheado, con ETag)"""
+        return await self.acached_response(
+            request, get_most_played_cache(), lambda: self.abuild_response(request)
+        )
+
+    async def abuild_response(self, request):
+        """Variante async de ``build_response``"""
+        try:
+            self.log_request_info("Get most popular songs")
+            songs = await self.ahandle_use_case_execution(
+                self.get_most_played_songs_use_case
+            )
+            songs_dtos = await self.amap_entities_to_dtos(songs, self.mapper)
+            return self.songs_response(request, songs_dtos)
+        except Exception as e:
+            return self.error_response(e)
+
+
+class AsyncTrendingSongsView(AsyncAPIViewMixin, TrendingSongsView):
+    """Variante async de ``TrendingSongsView``"""
+
+    @same_schema_as(TrendingSongsView.get)
+    async def get(self, request):
+        """Obtiene las canciones en tendencia (cacheado, con ETag)"""
+        return await self.acached_response(
+            request, get_trending_cache(), lambda: self.abuild_response(request)
+        )
+
+    async def abuild_response(self, request):
+        """Variante async de ``build_response``"""
+        try:
+            self.log_request_info("Get trending songs")
+            songs = await self.ahandle_use_case_execution(
+                self.get_trending_songs_use_case, self.get_limit(request)
+            )
+            songs_dtos = await self.amap_entities_to_dtos(songs, self.mapper)
+            return self.songs_response(request, songs_dtos)
+        except Exception as e:
+            return self.error_response(e)
+
+
+class AsyncRandomSongsView(AsyncAPIViewMixin, RandomSongsView):
+    """Variante async de ``RandomSongsView``"""
+
+    @same_schema_as(RandomSongsView.get)
+    async def get(self, request):
+        """Obtiene canciones aleatorias"""
+        try:
+            songs = await self.ahandle_use_case_execution(
+                self.get_random_songs_use_case, self.build_request_dto(request)
+            )
+            songs_dtos = await self.amap_entities_to_dtos(songs, self.mapper)
+            return self.paginate_and_respond(songs_dtos, request)
+        except Exception as e:
+            return self.error_response(e)
+
+
+class AsyncIncrementPlayCountAPIView(AsyncAPIViewMixin, IncrementPlayCountAPIView):
+    """Variante async de ``IncrementPlayCountAPIView``"""
+
+    @same_schema_as(IncrementPlayCountAPIView.post)
+    async def post(self, request, song_id):
+        """Incrementa el contador de reproducciones"""
+        request_dto = IncrementCountRequestDTO(song_id=song_id)
+        song = await self.increment_use_case.execute(request_dto)
+
+        if not song:
+            return Response(
+                {"error": "Song not found"}, status=status.HTTP_404_NOT_FOUND
+            )
+
+        return Response({"play_count": song.play_count}, status=status.HTTP_200_OK)
+
+
+class AsyncLyricsView(AsyncAPIViewMixin, LyricsView):
+    """Variante async de ``LyricsView``"""
+
+    @same_schema_as(LyricsView.get)
+    async def get(self, request, song_id):
+        lyrics = await self.get_lyrics_use_case.execute(song_id)
+        return Response({"lyrics": lyrics}, status=status.HTTP_200_OK)
+
+
+class AsyncSongPlayHistoryView(AsyncAPIViewMixin, SongPlayHistoryView):
+    """Variante async de ``SongPlayHistoryView``"""
+
+    @same_schema_as(SongPlayHistoryView.get)
+    async def get(self, request, song_id):
+        """Obtiene las reproducciones de la canción por periodo"""
+        request_dto, error = self.parse_request(request, song_id)
+        if error:
+            return error
+
+        history = await self.play_history_use_case.execute(request_dto)
+        return self.build_response(request_dto, history)
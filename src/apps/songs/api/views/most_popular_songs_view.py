@@ -2,16 +2,17 @@ from rest_framework import status
 from rest_framework.response import Response
 from rest_framework.serializers import Serializer
 
-from common.mixins import UseCaseAPIViewMixin
+from common.mixins import CachedResponseMixin, UseCaseAPIViewMixin
 from common.utils.schema_decorators import paginated_list_endpoint
 
+from ...infrastructure.cache import get_most_played_cache
 from ...infrastructure.repository.song_repository import SongRepository
 from ...use_cases import GetMostPlayedSongsUseCase
 from ..mappers import SongMapper
 from ..serializers.song_serializers import SongListSerializer
 
 
-class MostPopularSongsView(UseCaseAPIViewMixin):
+class MostPopularSongsView(CachedResponseMixin, UseCaseAPIViewMixin):
     """Vista para obtener las canciones más populares/reproducidas"""
 
     def __init__(self):
@@ -30,7 +31,13 @@ class MostPopularSongsView(UseCaseAPIViewMixin):
         description="Get the most popular/played songs from the database",
     )
     def get(self, request):
-        """Obtiene las canciones más populares/reproducidas"""
+        """Obtiene las canciones más populares/reproducidas (cacheado, con ETag)"""
+        return self.cached_response(
+            request, get_most_played_cache(), lambda: self.build_response(request)
+        )
+
+    def build_response(self, request):
+        """Construye la respuesta paginada ejecutando el caso de uso"""
         try:
             self.log_request_info("Get most popular songs")
 
@@ -39,18 +46,24 @@ class MostPopularSongsView(UseCaseAPIViewMixin):
 
             # Convertir a DTOs usando el método helper
             songs_dtos = self.map_entities_to_dtos(songs, self.mapper)
+            return self.songs_response(request, songs_dtos)
+        except Exception as e:
+            return self.error_response(e)
 
-            self.logger.info(f"Retrieved {len(songs_dtos)} most popular songs")
-            return self.paginate_and_respond(songs_dtos, request)
+    def songs_response(self, request, songs_dtos):
+        """Respuesta paginada con los DTOs de las canciones"""
+        self.logger.info(f"Retrieved {len(songs_dtos)} most popular songs")
+        return self.paginate_and_respond(songs_dtos, request)
 
-        except ValueError:
+    def error_response(self, error: Exception) -> Response:
+        """Respuesta de error según la excepción del caso de uso"""
+        if isinstance(error, ValueError):
             self.logger.warning("Invalid limit parameter")
             return Response(
                 {"error": "Invalid limit parameter"}, status=status.HTTP_400_BAD_REQUEST
             )
-        except Exception as e:
-            self.logger.error(f"Error getting most popular songs: {str(e)}")
-            return Response(
-                {"error": "Internal server error"},
-                status=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            )
+        self.logger.error(f"Error getting most popular songs: {str(error)}")
+        return Response(
+            {"error": "Internal server error"},
+            status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+        )
@@ -56,14 +56,7 @@ class RandomSongsView(UseCaseAPIViewMixin):
     def get(self, request):
         """Obtiene canciones aleatorias"""
         try:
-            self.log_request_info("Get random songs")
-
-            page_size = self.paginator.page_size
-            force_refresh = request.GET.get("force_refresh", "false").lower() == "true"
-
-            request_dto = RandomSongsRequestDTO(
-                count=page_size, force_refresh=force_refresh
-            )
+            request_dto = self.build_request_dto(request)
 
             # Ejecutar caso de uso usando el método helper
             songs = self.handle_use_case_execution(
@@ -75,10 +68,22 @@ class RandomSongsView(UseCaseAPIViewMixin):
 
             # Usar el método heredado del PaginationMixin
             return self.paginate_and_respond(songs_dtos, request)
-
         except Exception as e:
-            self.logger.error(f"Error getting random songs: {str(e)}")
-            return Response(
-                {"error": "Failed to retrieve random songs"},
-                status=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            )
+            return self.error_response(e)
+
+    def build_request_dto(self, request) -> RandomSongsRequestDTO:
+        """Petición al caso de uso a partir de la query"""
+        self.log_request_info("Get random songs")
+
+        page_size = self.paginator.page_size
+        force_refresh = request.GET.get("force_refresh", "false").lower() == "true"
+
+        return RandomSongsRequestDTO(count=page_size, force_refresh=force_refresh)
+
+    def error_response(self, error: Exception) -> Response:
+        """Respuesta de error del caso de uso"""
+        self.logger.error(f"Error getting random songs: {str(error)}")
+        return Response(
+            {"error": "Failed to retrieve random songs"},
+            status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+        )
@@ -0,0 +1,117 @@
+"""Vista API con las reproducciones de una canción por hora o día"""
+
+from asgiref.sync import async_to_sync
+from drf_spectacular.types import OpenApiTypes
+from drf_spectacular.utils import OpenApiParameter, extend_schema
+from rest_framework import status
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from ...infrastructure.play_events import get_play_events_settings
+from ...infrastructure.repository.song_repository import SongRepository
+from ...use_cases import GetSongPlayHistoryUseCase
+from ..dtos import SongPlayHistoryRequestDTO
+
+GRANULARITIES = ("hour", "day")
+
+
+class SongPlayHistoryView(APIView):
+    """Vista para consultar el histórico de reproducciones de una canción"""
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.repository = SongRepository()
+        self.play_history_use_case = GetSongPlayHistoryUseCase(self.repository)
+
+    def parse_request(self, request, song_id):
+        """Valida los parámetros; devuelve ``(dto, None)`` o ``(None, Response 400)``"""
+        granularity = request.GET.get("granularity", "day")
+        if granularity not in GRANULARITIES:
+            return None, Response(
+                {"error": "granularity must be 'hour' or 'day'"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        max_days = get_play_events_settings()["RETENTION_DAYS"]
+        try:
+            days = int(request.GET.get("days", 7))
+        except ValueError:
+            days = 0
+        if not 1 <= days <= max_days:
+            return None, Response(
+                {"error": f"days must be between 1 and {max_days}"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        return (
+            SongPlayHistoryRequestDTO(
+                song_id=str(song_id), granularity=granularity, days=days
+            ),
+            None,
+        )
+
+    def build_response(self, request_dto, history):
+        return Response(
+            {
+                "song_id": request_dto.song_id,
+                "granularity": request_dto.granularity,
+                "total": sum(item["plays"] for item in history),
+                "plays": history,
+            },
+            status=status.HTTP_200_OK,
+        )
+
+    @extend_schema(
+        tags=["Songs"],
+        description="Get play counts of a song per hour or per day over a recent time window",
+        request=None,
+        parameters=[
+            OpenApiParameter(
+                name="song_id",
+                location=OpenApiParameter.PATH,
+                required=True,
+                type=OpenApiTypes.UUID,
+            ),
+            OpenApiParameter(
+                name="granularity",
+                type=OpenApiTypes.STR,
+                enum=list(GRANULARITIES),
+                default="day",
+            ),
+            OpenApiParameter(
+                name="days",
+                type=OpenApiTypes.INT,
+                default=7,
+                description="Size of the window in days (up to the retention period)",
+            ),
+        ],
+        responses={
+            200: {
+                "type": "object",
+                "properties": {
+                    "song_id": {"type": "string"},
+                    "granularity": {"type": "string"},
+                    "total": {"type": "integer"},
+                    "plays": {
+                        "type": "array",
+                        "items": {
+                            "type": "object",
+                            "properties": {
+                                "period": {"type": "string"},
+                                "plays": {"type": "integer"},
+                            },
+                        },
+                    },
+                },
+            },
+            400: {"type": "object", "properties": {"error": {"type": "string"}}},
+        },
+    )
+    def get(self, request, song_id):
+        """Obtiene las reproducciones de la canción por periodo"""
+        request_dto, error = self.parse_request(request, song_id)
+        if error:
+            return error
+
+        history = async_to_sync(self.play_history_use_case.execute)(request_dto)
+        return self.build_response(request_dto, history)
@@ -13,7 +13,7 @@ from apps.songs.infrastructure.models import SongModel
 from apps.songs.infrastructure.repository.song_repository import SongRepository
 from apps.songs.use_cases import SearchSongsUseCase
 from common.factories.unified_music_service_factory import get_music_service
-from common.mixins import LoggingMixin
+from common.mixins import ConditionalGetMixin, LoggingMixin
 
 
 @extend_schema_view(
@@ -44,7 +44,7 @@ from common.mixins import LoggingMixin
         - `release_after`/`release_before`: Release date range
         - `popular`: Only popular songs (>1000 plays)
         - `recent`: Only recently added songs
-        - `trending`: Only trending songs (played recently)
+        - `trending`: Only trending songs, ranked by time-decayed recent plays
         - `search`: General search in title, artist, album, and lyrics
         - `include_youtube`: Include YouTube results when using title search (default: true)
         - `min_results`: Minimum number of results to return (triggers YouTube search if needed)
@@ -52,7 +52,8 @@ from common.mixins import LoggingMixin
         **Ordering:**
         Use `ordering` parameter with: title, duration_seconds, play_count,
         favorite_count, download_count, created_at, updated_at, last_played_at,
-        release_date, artist__name, album__title, artist__followers_count
+        release_date, artist__name, album__title, artist__followers_count,
+        trending_score
 
         **YouTube Integration:**
         When using the `title` parameter, if local results are fewer than
@@ -67,7 +68,7 @@ from common.mixins import LoggingMixin
         summary="Get song details",
     ),
 )
-class SongViewSet(LoggingMixin, viewsets.ReadOnlyModelViewSet):
+class SongViewSet(ConditionalGetMixin, LoggingMixin, viewsets.ReadOnlyModelViewSet):
     """ViewSet para gestión de canciones (solo lectura) con filtros integrados y búsqueda en YouTube"""
 
     def __init__(self, **kwargs):
@@ -91,6 +92,14 @@ class SongViewSet(LoggingMixin, viewsets.ReadOnlyModelViewSet):
     lookup_field = "id"
     lookup_url_kwarg = "id"
 
+    # Peticiones condicionales: artista y álbum forman parte de la respuesta (la
+    # letra sólo del detalle), y los contadores se incrementan sin tocar
+    # updated_at (de ahí sin Last-Modified)
+    conditional_fields = ("updated_at", "artist__updated_at", "album__updated_at")
+    conditional_detail_fields = ("lyrics_entry__updated_at",)
+    conditional_counter_fields = ("play_count", "favorite_count", "download_count")
+    last_modified_field = None
+
     # Campos por los que se puede ordenar
     ordering_fields = [
         "title",
@@ -105,6 +114,7 @@ class SongViewSet(LoggingMixin, viewsets.ReadOnlyModelViewSet):
         "artist__name",
         "album__title",
         "artist__followers_count",
+        "trending_score",
     ]
     ordering = ["-created_at"]  # Ordenamiento por defecto
 
@@ -116,6 +126,10 @@ class SongViewSet(LoggingMixin, viewsets.ReadOnlyModelViewSet):
         """
         return SongSerializer
 
+    def get_conditional_queryset(self):
+        """Queryset base para los validadores, sin la búsqueda en YouTube"""
+        return self.queryset.all()
+
     def get_queryset(self):
         """
         Personalizar el queryset base con optimizaciones y búsqueda en YouTube si es necesario
@@ -125,6 +139,9 @@ class SongViewSet(LoggingMixin, viewsets.ReadOnlyModelViewSet):
 
         # Optimizar consultas incluyendo datos relacionados
         queryset = queryset.select_related("artist", "album").prefetch_related("genres")
+        if self.action == "retrieve":
+            # Sólo el detalle incluye la letra: los listados no leen song_lyrics
+            queryset = queryset.select_related("lyrics_entry")
 
         # Verificar si se está usando búsqueda por título
         title_query = (
@@ -172,6 +189,16 @@ class SongViewSet(LoggingMixin, viewsets.ReadOnlyModelViewSet):
 
         return queryset
 
+    def filter_queryset(self, queryset):
+        """Con ``trending=true`` y sin ``ordering`` explícito se ordena por tendencia"""
+        queryset = super().filter_queryset(queryset)
+        if (
+            self.request.GET.get("trending", "").lower() in ("true", "1")
+            and "ordering" not in self.request.GET
+        ):
+            queryset = queryset.order_by("-trending_score")
+        return queryset
+
     async def _fetch_youtube_results(self, query: str, needed_count: int):
         """
         Busca canciones en YouTube y las guarda en la BD si no existen
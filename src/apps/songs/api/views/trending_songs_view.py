@@ -0,0 +1,88 @@
+from drf_spectacular.types import OpenApiTypes
+from drf_spectacular.utils import OpenApiParameter
+from rest_framework import status
+from rest_framework.response import Response
+from rest_framework.serializers import Serializer
+
+from common.mixins import CachedResponseMixin, UseCaseAPIViewMixin
+from common.utils.schema_decorators import paginated_list_endpoint
+
+from ...infrastructure.cache import get_trending_cache
+from ...infrastructure.repository.song_repository import SongRepository
+from ...infrastructure.trending import get_trending_settings
+from ...use_cases import GetTrendingSongsUseCase
+from ..mappers import SongMapper
+from ..serializers.song_serializers import SongListSerializer
+
+
+class TrendingSongsView(CachedResponseMixin, UseCaseAPIViewMixin):
+    """Vista para obtener las canciones en tendencia"""
+
+    def __init__(self):
+        super().__init__()
+        self.repository = SongRepository()
+        self.get_trending_songs_use_case = GetTrendingSongsUseCase(self.repository)
+        self.mapper = SongMapper()
+
+    def get_serializer_class(self) -> type[Serializer]:
+        """Return the serializer class for this view"""
+        return SongListSerializer
+
+    def get_limit(self, request) -> int:
+        """``limit`` de la query (ValueError si no es válido)"""
+        limit = int(request.GET.get("limit", 20))
+        if not 1 <= limit <= get_trending_settings()["MAX_LIMIT"]:
+            raise ValueError(limit)
+        return limit
+
+    @paginated_list_endpoint(
+        serializer_class=SongListSerializer,
+        tags=["Songs"],
+        description="Get trending songs ranked by time-decayed recent plays",
+        parameters=[
+            OpenApiParameter(
+                name="limit",
+                type=OpenApiTypes.INT,
+                location=OpenApiParameter.QUERY,
+                required=False,
+                default=20,
+                description="Number of trending songs (1-100)",
+            )
+        ],
+    )
+    def get(self, request):
+        """Obtiene las canciones en tendencia (cacheado, con ETag)"""
+        return self.cached_response(
+            request, get_trending_cache(), lambda: self.build_response(request)
+        )
+
+    def build_response(self, request):
+        """Construye la respuesta paginada ejecutando el caso de uso"""
+        try:
+            self.log_request_info("Get trending songs")
+
+            songs = self.handle_use_case_execution(
+                self.get_trending_songs_use_case, self.get_limit(request)
+            )
+            songs_dtos = self.map_entities_to_dtos(songs, self.mapper)
+            return self.songs_response(request, songs_dtos)
+        except Exception as e:
+            return self.error_response(e)
+
+    def songs_response(self, request, songs_dtos):
+        """Respuesta paginada con los DTOs de las canciones"""
+        self.logger.info(f"Retrieved {len(songs_dtos)} trending songs")
+        return self.paginate_and_respond(songs_dtos, request)
+
+    def error_response(self, error: Exception) -> Response:
+        """Respuesta de error: 400 si ``limit`` no es válido, 500 si no"""
+        if isinstance(error, ValueError):
+            self.logger.warning("Invalid limit parameter")
+            return Response(
+                {"error": "Invalid limit parameter"}, status=status.HTTP_400_BAD_REQUEST
+            )
+        self.logger.error(f"Error getting trending songs: {str(error)}")
+        return Response(
+            {"error": "Internal server error"},
+            status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+        )
@@ -4,3 +4,7 @@ from django.apps import AppConfig
 class SongsConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "apps.songs"
+
+    def ready(self):
+        # Invalidación de cachés de lectura
+        from .infrastructure import signals  # noqa: F401
@@ -3,7 +3,7 @@ from datetime import datetime
 from typing import List, Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class SongEntity:
     """Entidad que representa una canción en la aplicación"""
 
@@ -18,7 +18,8 @@ class SongEntity:
     track_number: Optional[int] = None
     file_url: Optional[str] = None  # URL del archivo de audio en Supabase
     thumbnail_url: Optional[str] = None  # URL de la imagen en Supabase
-    lyrics: Optional[str] = None
+    lyrics: Optional[str] = None  # Sólo si se cargó (ver has_lyrics)
+    has_lyrics: bool = False
 
     # Métricas internas de la aplicación
     play_count: int = 0  # Reproducciones en nuestra app
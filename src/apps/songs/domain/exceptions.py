@@ -19,3 +19,9 @@ class SongUpdateException(DomainException):
 class SongPlayCountException(DomainException):
     def __init__(self, message: str):
         super().__init__(message)
+
+
+class InvalidImportRowException(DomainException):
+    def __init__(self, position: int, message: str):
+        super().__init__(f"Record {position}: {message}", code=400)
+        self.position = position
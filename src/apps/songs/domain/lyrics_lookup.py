@@ -0,0 +1,47 @@
+"""
+Registro de búsquedas de letras por canción.
+
+Cada búsqueda sin resultado aplaza la siguiente: tras ``misses`` fallos
+seguidos se espera ``base * factor ** (misses - 1)`` horas, con un máximo. Así
+las canciones sin letra (instrumentales, por ejemplo) no se buscan en todas
+las fuentes cada vez que alguien las abre. Un error (no un "no encontrada")
+sólo aplaza la búsqueda unos minutos y no cuenta como fallo.
+"""
+
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import List, Optional
+
+FOUND = "found"
+NOT_FOUND = "not_found"
+ERROR = "error"
+
+# Tope del exponente: el retraso ya está limitado por ``max_hours``
+_MAX_EXPONENT = 32
+
+
+@dataclass
+class LyricsLookupAttempt:
+    """Última búsqueda de letras de una canción"""
+
+    song_id: str
+    outcome: str
+    last_attempt_at: datetime
+    misses: int = 0
+    sources_tried: List[str] = field(default_factory=list)
+    # None cuando se encontró la letra: no hay nada que reintentar
+    next_attempt_at: Optional[datetime] = None
+
+    def is_due(self, now: datetime) -> bool:
+        """Si se puede volver a buscar en ``now``"""
+        return self.next_attempt_at is None or now >= self.next_attempt_at
+
+
+def retry_delay(
+    misses: int, base_hours: float, factor: float, max_hours: float
+) -> timedelta:
+    """Espera tras ``misses`` búsquedas seguidas sin resultado"""
+    if misses <= 0:
+        return timedelta(0)
+    exponent = min(misses - 1, _MAX_EXPONENT)
+    return timedelta(hours=min(base_hours * factor**exponent, max_hours))
@@ -1,14 +1,22 @@
 from abc import abstractmethod
-from typing import Any, List, Optional
+from datetime import datetime
+from typing import Any, Dict, List, Optional
 
 from common.interfaces.ibase_repository import IBaseRepository
 
 from ..entities import SongEntity
+from ..lyrics_lookup import LyricsLookupAttempt
 
 
 class ISongRepository(IBaseRepository[SongEntity, Any]):
     """Interface para el repositorio de canciones"""
 
+    @abstractmethod
+    async def save(  # pyright: ignore[reportIncompatibleMethodOverride]
+        self, entity: SongEntity, reload: bool = True
+    ) -> SongEntity:
+        """Guarda una canción; con ``reload=False`` no la vuelve a leer"""
+
     @abstractmethod
     async def get_by_source(
         self, source_type: str, source_id: str
@@ -37,9 +45,41 @@ class ISongRepository(IBaseRepository[SongEntity, Any]):
     async def get_most_played(self, limit: int = 10) -> List[SongEntity]:
         """Obtiene las canciones más reproducidas"""
 
+    @abstractmethod
+    async def get_trending(self, limit: int = 20) -> List[SongEntity]:
+        """Obtiene las canciones en tendencia"""
+
     @abstractmethod
     async def increment_play_count(self, song_id: str) -> bool:
-        """Incrementa el contador de reproducciones"""
+        """Registra una reproducción (el contador se actualiza por lotes)"""
+
+    @abstractmethod
+    async def get_pending_play_count(self, song_id: str) -> int:
+        """Reproducciones registradas aún no sumadas al contador"""
+
+    @abstractmethod
+    async def get_play_counts(
+        self, song_id: str, since: datetime, granularity: str = "day"
+    ) -> List[Dict[str, Any]]:
+        """Reproducciones desde ``since`` agrupadas por ``hour`` o ``day``"""
+
+    @abstractmethod
+    async def get_lyrics(self, song_id: str) -> Optional[str]:
+        """Letra de la canción"""
+
+    @abstractmethod
+    async def save_lyrics(self, song_id: str, lyrics: str) -> None:
+        """Guarda la letra de la canción"""
+
+    @abstractmethod
+    async def get_lyrics_lookup(self, song_id: str) -> Optional[LyricsLookupAttempt]:
+        """Última búsqueda de letras de la canción"""
+
+    @abstractmethod
+    async def record_lyrics_lookup(
+        self, song_id: str, outcome: str, sources_tried: List[str]
+    ) -> None:
+        """Registra el resultado de una búsqueda de letras"""
 
     @abstractmethod
     async def increment_favorite_count(self, song_id: str) -> bool:
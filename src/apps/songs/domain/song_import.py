@@ -0,0 +1,162 @@
+"""
+Validación de los registros de un manifiesto de importación de canciones.
+
+Cada registro describe un track: título, artista, álbum opcional, origen
+(``source_type`` y ``source_id``, la clave que hace idempotente la
+importación) y el audio, como ruta local que se sube al storage
+(``file_path``) o como URL ya publicada (``file_url``). Los géneros pueden
+venir como lista o como texto separado por ``;`` o ``|``.
+"""
+
+import re
+from dataclasses import dataclass, field
+from typing import Any, List, Mapping, Optional, Tuple
+from urllib.parse import urlparse
+
+from .exceptions import InvalidImportRowException
+
+SOURCE_TYPES = ("youtube", "upload", "spotify", "soundcloud")
+DEFAULT_SOURCE_TYPE = "upload"
+
+# Longitudes máximas de las columnas de destino
+MAX_TITLE_LENGTH = 255
+MAX_ARTIST_NAME_LENGTH = 200
+MAX_ALBUM_TITLE_LENGTH = 300
+MAX_SOURCE_ID_LENGTH = 100
+MAX_URL_LENGTH = 500
+MAX_DURATION_SECONDS = 86400
+
+FIELDS = (
+    "title",
+    "artist",
+    "album",
+    "genres",
+    "source_type",
+    "source_id",
+    "source_url",
+    "file_path",
+    "file_url",
+    "thumbnail_url",
+    "duration_seconds",
+    "track_number",
+)
+
+_GENRE_SEPARATORS = re.compile(r"[;|]")
+
+
+@dataclass(slots=True)
+class ImportTrack:
+    """Track válido de un manifiesto"""
+
+    position: int
+    title: str
+    artist: str
+    source_type: str
+    source_id: str
+    album: Optional[str] = None
+    genres: List[str] = field(default_factory=list)
+    source_url: Optional[str] = None
+    file_path: Optional[str] = None
+    file_url: Optional[str] = None
+    thumbnail_url: Optional[str] = None
+    duration_seconds: int = 0
+    track_number: Optional[int] = None
+
+    @property
+    def source_key(self) -> Tuple[str, str]:
+        return self.source_type, self.source_id
+
+
+def parse_import_track(
+    record: Mapping[str, Any],
+    position: int,
+    default_source_type: str = DEFAULT_SOURCE_TYPE,
+) -> ImportTrack:
+    """
+    Valida un registro del manifiesto.
+
+    Raises:
+        InvalidImportRowException: Si falta un campo obligatorio o un valor no
+            cabe en la base de datos
+    """
+    unknown = sorted(str(key) for key in record if key not in FIELDS)
+    if unknown:
+        raise InvalidImportRowException(
+            position, f"unknown fields: {', '.join(unknown)}"
+        )
+
+    def text(name: str, max_length: int) -> Optional[str]:
+        value = record.get(name)
+        value = " ".join(str(value).split()) if value is not None else ""
+        if not value:
+            return None
+        if len(value) > max_length:
+            raise InvalidImportRowException(
+                position, f"'{name}' is longer than {max_length} characters"
+            )
+        return value
+
+    def required_text(name: str, max_length: int) -> str:
+        value = text(name, max_length)
+        if value is None:
+            raise InvalidImportRowException(position, f"'{name}' is required")
+        return value
+
+    def url(name: str) -> Optional[str]:
+        value = text(name, MAX_URL_LENGTH)
+        if value and urlparse(value).scheme not in ("http", "https"):
+            raise InvalidImportRowException(position, f"'{name}' is not an http(s) URL")
+        return value
+
+    def integer(name: str, minimum: int, maximum: int) -> Optional[int]:
+        value = record.get(name)
+        if value is None or str(value).strip() == "":
+            return None
+        try:
+            number = int(str(value).strip())
+        except ValueError:
+            raise InvalidImportRowException(position, f"'{name}' must be an integer")
+        if not minimum <= number <= maximum:
+            raise InvalidImportRowException(
+                position, f"'{name}' must be between {minimum} and {maximum}"
+            )
+        return number
+
+    source_type = (text("source_type", 20) or default_source_type).lower()
+    if source_type not in SOURCE_TYPES:
+        raise InvalidImportRowException(
+            position,
+            f"'source_type' must be one of: {', '.join(SOURCE_TYPES)}",
+        )
+
+    file_path = text("file_path", 4096)
+    file_url = url("file_url")
+    if not file_path and not file_url:
+        raise InvalidImportRowException(
+            position, "either 'file_path' or 'file_url' is required"
+        )
+
+    return ImportTrack(
+        position=position,
+        title=required_text("title", MAX_TITLE_LENGTH),
+        artist=required_text("artist", MAX_ARTIST_NAME_LENGTH),
+        album=text("album", MAX_ALBUM_TITLE_LENGTH),
+        genres=_parse_genres(record.get("genres")),
+        source_type=source_type,
+        source_id=required_text("source_id", MAX_SOURCE_ID_LENGTH),
+        source_url=url("source_url"),
+        file_path=file_path,
+        file_url=file_url,
+        thumbnail_url=url("thumbnail_url"),
+        duration_seconds=integer("duration_seconds", 0, MAX_DURATION_SECONDS) or 0,
+        track_number=integer("track_number", 1, 2**31 - 1),
+    )
+
+
+def _parse_genres(value: Any) -> List[str]:
+    """Nombres de géneros sin vacíos ni repetidos, en orden"""
+    if not value:
+        return []
+    names = value if isinstance(value, list) else _GENRE_SEPARATORS.split(str(value))
+    genres = [" ".join(str(name).split()) for name in names]
+    return list(dict.fromkeys(name for name in genres if name))
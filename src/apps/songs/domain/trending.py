@@ -0,0 +1,31 @@
+"""
+Puntuación de tendencia: reproducciones con decaimiento exponencial.
+
+Una reproducción en ``t`` vale ``2 ** ((t - epoch) / half_life)`` respecto a una
+época común. Todas las puntuaciones decaen al mismo ritmo, así que el orden
+entre canciones no cambia con el paso del tiempo: basta con sumar el peso de
+cada reproducción nueva y ordenar por la columna. Para que los pesos no crezcan
+sin límite se mueve la época periódicamente (``rebase_factor``).
+"""
+
+from datetime import datetime
+
+
+def play_weight(played_at: datetime, epoch: datetime, half_life_hours: float) -> float:
+    """Peso de una reproducción respecto a ``epoch``"""
+    elapsed_hours = (played_at - epoch).total_seconds() / 3600
+    return 2 ** (elapsed_hours / half_life_hours)
+
+
+def rebase_factor(
+    old_epoch: datetime, new_epoch: datetime, half_life_hours: float
+) -> float:
+    """Factor que lleva una puntuación de ``old_epoch`` a ``new_epoch``"""
+    return play_weight(old_epoch, new_epoch, half_life_hours)
+
+
+def current_score(
+    score: float, epoch: datetime, now: datetime, half_life_hours: float
+) -> float:
+    """Puntuación en ``now`` (reproducciones equivalentes con decaimiento)"""
+    return score * rebase_factor(epoch, now, half_life_hours)
@@ -0,0 +1,290 @@
+"""
+Resolución por lotes de artistas y álbumes durante la ingesta.
+
+Para N tracks se normalizan los nombres (``name_key``), se buscan los que
+faltan en la caché LRU del proceso con una consulta para artistas y otra para
+álbumes, y los que no existen se crean con un único ``bulk_create``. Ingerir 50
+tracks del mismo artista cuesta unas pocas consultas por tabla, y ninguna si el
+artista ya está en la caché.
+
+No hay restricción única sobre los nombres: en PostgreSQL la creación se
+serializa por clave con ``pg_advisory_xact_lock`` y, con el bloqueo tomado, se
+vuelve a buscar y sólo se inserta lo que aún falta, así que dos ingestas
+simultáneas no duplican artistas ni álbumes. Si ya hay duplicados, gana la fila
+más antigua.
+
+Las filas creadas envían ``post_save`` (``created=True``) igual que un
+``save()``, para que las estadísticas del catálogo sigan cuadrando.
+"""
+
+import hashlib
+import uuid
+from dataclasses import dataclass
+from functools import reduce
+from operator import or_
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from asgiref.sync import sync_to_async
+from django.db import connection, transaction
+from django.db.models import Q
+from django.db.models.signals import post_save
+
+from apps.albums.infrastructure.models.album_model import AlbumModel
+from apps.artists.infrastructure.models.artist_model import ArtistModel
+from common.utils.logging_config import get_logger
+from common.utils.performance_cache import PerformanceCache
+
+logger = get_logger(__name__)
+
+ARTIST_ALBUM_CACHE_SIZE = 4096
+ARTIST_ALBUM_CACHE_TTL = 600
+
+# Nombres por consulta (condiciones OR de ``iexact``)
+LOOKUP_CHUNK = 200
+
+# Id y nombre (o título) guardados de un artista o álbum
+CatalogRef = Tuple[str, str]
+
+_cache = PerformanceCache(
+    default_ttl=ARTIST_ALBUM_CACHE_TTL, max_size=ARTIST_ALBUM_CACHE_SIZE
+)
+
+
+def get_artist_album_cache() -> PerformanceCache:
+    """Caché LRU del proceso: clave normalizada -> (id, nombre)"""
+    return _cache
+
+
+def name_key(name: str) -> str:
+    """
+    Clave de comparación de nombres: sin distinguir mayúsculas y con los
+    espacios colapsados. ``iexact`` no colapsa espacios, así que las consultas
+    buscan el nombre recibido y los resultados se agrupan por esta clave.
+    """
+    return " ".join(name.split()).upper()
+
+
+@dataclass(slots=True)
+class ArtistAlbumRequest:
+    """Artista y álbum de un track, ya limpios"""
+
+    artist_name: str
+    album_title: Optional[str] = None
+    artist_image_url: Optional[str] = None
+    album_cover_url: Optional[str] = None
+
+
+@dataclass(slots=True)
+class ResolvedArtistAlbum:
+    """Ids del artista y álbum de un track (None si no se pudieron resolver)"""
+
+    artist_id: Optional[str] = None
+    artist_name: Optional[str] = None
+    album_id: Optional[str] = None
+    album_title: Optional[str] = None
+
+
+def resolve_artists_albums_sync(
+    requests: Sequence[ArtistAlbumRequest],
+) -> List[ResolvedArtistAlbum]:
+    """Resuelve (o crea) los artistas y álbumes de un lote de tracks"""
+    artists = _resolve_artists(
+        {
+            name_key(request.artist_name): request
+            for request in reversed(requests)
+            if request.artist_name
+        }
+    )
+
+    album_requests: Dict[Tuple[str, str], ArtistAlbumRequest] = {}
+    for request in reversed(requests):
+        artist = artists.get(name_key(request.artist_name or ""))
+        if artist and request.album_title:
+            album_requests[(artist[0], name_key(request.album_title))] = request
+    albums = _resolve_albums(album_requests)
+
+    results = []
+    for request in requests:
+        result = ResolvedArtistAlbum()
+        artist = artists.get(name_key(request.artist_name or ""))
+        if artist:
+            result.artist_id, result.artist_name = artist
+            album = albums.get((artist[0], name_key(request.album_title or "")))
+            if album:
+                result.album_id, result.album_title = album
+        results.append(result)
+    return results
+
+
+resolve_artists_albums = sync_to_async(resolve_artists_albums_sync)
+
+
+def _resolve_artists(
+    wanted: Dict[str, ArtistAlbumRequest],
+) -> Dict[str, CatalogRef]:
+    resolved = _from_cache("artist", wanted)
+    missing = {key: wanted[key].artist_name for key in wanted if key not in resolved}
+    if missing:
+        resolved.update(_find_artists(missing))
+        new = {key: name for key, name in missing.items() if key not in resolved}
+        if new:
+            resolved.update(
+                _create_missing(
+                    "artist",
+                    new,
+                    _find_artists,
+                    lambda key: ArtistModel(
+                        id=uuid.uuid4(),
+                        name=wanted[key].artist_name,
+                        image_url=wanted[key].artist_image_url,
+                    ),
+                )
+            )
+    _to_cache("artist", resolved)
+    return resolved
+
+
+def _resolve_albums(
+    wanted: Dict[Tuple[str, str], ArtistAlbumRequest],
+) -> Dict[Tuple[str, str], CatalogRef]:
+    resolved = _from_cache("album", wanted)
+    # Sólo se piden álbumes de tracks con título
+    missing = {
+        key: wanted[key].album_title or "" for key in wanted if key not in resolved
+    }
+    if missing:
+        resolved.update(_find_albums(missing))
+        new = {key: title for key, title in missing.items() if key not in resolved}
+        if new:
+            resolved.update(
+                _create_missing(
+                    "album",
+                    new,
+                    _find_albums,
+                    lambda key: AlbumModel(
+                        id=uuid.uuid4(),
+                        title=wanted[key].album_title,
+                        artist_id=key[0],
+                        cover_image_url=wanted[key].album_cover_url,
+                    ),
+                )
+            )
+    _to_cache("album", resolved)
+    return resolved
+
+
+def _create_missing(
+    kind: str,
+    names: Dict[Any, str],
+    find: Callable[[Dict[Any, str]], Dict[Any, CatalogRef]],
+    build: Callable[[Any], Any],
+) -> Dict[Any, CatalogRef]:
+    """
+    Crea las filas de ``names`` que sigan sin existir con el bloqueo de sus
+    claves tomado; devuelve las encontradas y las creadas.
+    """
+    with transaction.atomic():
+        _lock_keys(kind, names)
+        # Otra ingesta pudo crearlas mientras esperábamos el bloqueo
+        found = find(names)
+        created = {key: build(key) for key in names if key not in found}
+        if created:
+            model_class = type(next(iter(created.values())))
+            model_class.objects.bulk_create(created.values())
+            for key, instance in created.items():
+                post_save.send(
+                    sender=model_class, instance=instance, created=True, raw=False
+                )
+                found[key] = (str(instance.id), names[key])
+            logger.info(f"Created {len(created)} {kind}s")
+    return found
+
+
+def _lock_keys(kind: str, keys) -> None:
+    """
+    Bloqueos de la transacción por clave en PostgreSQL, en orden para no
+    provocar interbloqueos. SQLite (desarrollo y tests) no admite escrituras
+    concurrentes y no los necesita.
+    """
+    if connection.vendor != "postgresql":
+        return
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT pg_advisory_xact_lock(lock_id) "
+            "FROM unnest(%s::bigint[]) AS lock_id",
+            [_lock_ids(kind, keys)],
+        )
+
+
+def _lock_ids(kind: str, keys) -> List[int]:
+    """Ids de bloqueo (bigint) ordenados de las claves"""
+    return sorted(
+        {
+            int.from_bytes(
+                hashlib.blake2b(_cache_key(kind, key).encode(), digest_size=8).digest(),
+                "big",
+                signed=True,
+            )
+            for key in keys
+        }
+    )
+
+
+def _find_artists(names: Dict[str, str]) -> Dict[str, CatalogRef]:
+    """Artistas existentes por nombre (sin distinguir mayúsculas), el más antiguo"""
+    found: Dict[str, CatalogRef] = {}
+    items = list(names.values())
+    for start in range(0, len(items), LOOKUP_CHUNK):
+        condition = reduce(
+            or_, (Q(name__iexact=name) for name in items[start : start + LOOKUP_CHUNK])
+        )
+        rows = (
+            ArtistModel.objects.filter(condition)
+            .order_by("created_at", "id")
+            .values_list("id", "name")
+        )
+        for artist_id, name in rows:
+            found.setdefault(name_key(name), (str(artist_id), name))
+    return {key: found[key] for key in names if key in found}
+
+
+def _find_albums(
+    titles: Dict[Tuple[str, str], str],
+) -> Dict[Tuple[str, str], CatalogRef]:
+    """Álbumes existentes por artista y título (sin distinguir mayúsculas)"""
+    found: Dict[Tuple[str, str], CatalogRef] = {}
+    items = list(titles.items())
+    for start in range(0, len(items), LOOKUP_CHUNK):
+        condition = reduce(
+            or_,
+            (
+                Q(artist_id=artist_id, title__iexact=title)
+                for (artist_id, _), title in items[start : start + LOOKUP_CHUNK]
+            ),
+        )
+        rows = (
+            AlbumModel.objects.filter(condition)
+            .order_by("created_at", "id")
+            .values_list("id", "artist_id", "title")
+        )
+        for album_id, artist_id, title in rows:
+            found.setdefault((str(artist_id), name_key(title)), (str(album_id), title))
+    return {key: found[key] for key in titles if key in found}
+
+
+def _cache_key(kind: str, key) -> str:
+    return f"{kind}:{':'.join(key) if isinstance(key, tuple) else key}"
+
+
+def _from_cache(kind: str, keys) -> Dict:
+    resolved = {}
+    for key in keys:
+        ref = _cache.get(_cache_key(kind, key))
+        if ref is not None:
+            resolved[key] = ref
+    return resolved
+
+
+def _to_cache(kind: str, resolved: Dict) -> None:
+    for key, ref in resolved.items():
+        _cache.set(_cache_key(kind, key), ref)
@@ -0,0 +1,30 @@
+"""Cachés de lectura de canciones compartidas por todos los usuarios"""
+
+from common.utils.cache_facade import CacheFacade, get_cache
+
+MOST_PLAYED_CACHE_NAMESPACE = "songs.most_played"
+MOST_PLAYED_CACHE_TTL = 60
+
+
+def get_most_played_cache() -> CacheFacade:
+    """Caché de las respuestas de canciones más reproducidas"""
+    return get_cache(MOST_PLAYED_CACHE_NAMESPACE, ttl=MOST_PLAYED_CACHE_TTL)
+
+
+def invalidate_most_played_cache() -> None:
+    """Invalida el ranking tras volcar contadores de reproducción o borrar canciones"""
+    get_most_played_cache().invalidate()
+
+
+TRENDING_CACHE_NAMESPACE = "songs.trending"
+TRENDING_CACHE_TTL = 60
+
+
+def get_trending_cache() -> CacheFacade:
+    """Caché de las respuestas de canciones en tendencia"""
+    return get_cache(TRENDING_CACHE_NAMESPACE, ttl=TRENDING_CACHE_TTL)
+
+
+def invalidate_trending_cache() -> None:
+    """Invalida las tendencias tras volcar reproducciones o recalcular puntuaciones"""
+    get_trending_cache().invalidate()
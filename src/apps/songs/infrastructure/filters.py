@@ -49,9 +49,7 @@ class SongModelFilter(filters.FilterSet):
     )
 
     # Filtros booleanos
-    has_lyrics = filters.BooleanFilter(
-        field_name="lyrics", lookup_expr="isnull", exclude=True
-    )
+    has_lyrics = filters.BooleanFilter(field_name="has_lyrics")
     has_file_url = filters.BooleanFilter(
         field_name="file_url", lookup_expr="isnull", exclude=True
     )
@@ -81,7 +79,8 @@ class SongModelFilter(filters.FilterSet):
         method="filter_recent", help_text="Filter recently added songs"
     )
     trending = filters.BooleanFilter(
-        method="filter_trending", help_text="Filter trending songs (recently played)"
+        method="filter_trending",
+        help_text="Filter trending songs (time-decayed recent plays)",
     )
 
     # Búsqueda general
@@ -157,16 +156,10 @@ class SongModelFilter(filters.FilterSet):
         return queryset
 
     def filter_trending(self, queryset, name, value):
-        """Filtrar canciones en tendencia (reproducidas recientemente)"""
+        """Filtrar canciones en tendencia (reproducciones recientes con decaimiento)"""
         if value:
-            from datetime import timedelta
-
-            from django.utils import timezone
-
-            seven_days_ago = timezone.now() - timedelta(days=7)
-            return queryset.filter(last_played_at__gte=seven_days_ago).order_by(
-                "-last_played_at", "-play_count"
-            )
+            # trending_score está indexada: el top se lee del índice
+            return queryset.filter(trending_score__gt=0).order_by("-trending_score")
         return queryset
 
     def filter_search(self, queryset, name, value):
@@ -176,7 +169,7 @@ class SongModelFilter(filters.FilterSet):
                 Q(title__icontains=value)
                 | Q(artist__name__icontains=value)
                 | Q(album__title__icontains=value)
-                | Q(lyrics__icontains=value)
+                | Q(lyrics_entry__text__icontains=value)
                 | Q(genres__name__icontains=value)
             ).distinct()  # distinct() para evitar duplicados por joins
         return queryset
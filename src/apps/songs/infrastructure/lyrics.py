@@ -0,0 +1,65 @@
+"""
+Almacenamiento de letras en ``song_lyrics``.
+
+Escribir una letra actualiza también ``SongModel.has_lyrics`` en la misma
+transacción: el flag es lo que usan los filtros y la búsqueda de pendientes.
+"""
+
+from typing import Dict, Optional
+
+from asgiref.sync import sync_to_async
+from django.db import transaction
+
+from .models import SongLyricsModel, SongModel
+
+
+async def get_song_lyrics(song_id: str) -> Optional[str]:
+    """Letra de la canción, o None si no tiene"""
+    return (
+        await SongLyricsModel.objects.filter(song_id=song_id)
+        .values_list("text", flat=True)
+        .afirst()
+    )
+
+
+def save_song_lyrics_sync(song_id: str, text: str) -> None:
+    """Guarda (o reemplaza) la letra y marca la canción con ``has_lyrics``"""
+    with transaction.atomic():
+        SongLyricsModel.objects.update_or_create(
+            song_id=song_id, defaults={"text": text}
+        )
+        SongModel.objects.filter(id=song_id, has_lyrics=False).update(has_lyrics=True)
+
+
+save_song_lyrics = sync_to_async(save_song_lyrics_sync)
+
+
+def save_lyrics_batch_sync(lyrics: Dict[str, str]) -> int:
+    """
+    Guarda un lote de letras (``{song_id: texto}``) con un único upsert.
+
+    Devuelve cuántas se guardaron: se omiten las canciones borradas mientras
+    se buscaba su letra.
+    """
+    if not lyrics:
+        return 0
+    with transaction.atomic():
+        song_ids = list(
+            SongModel.objects.filter(id__in=list(lyrics)).values_list("id", flat=True)
+        )
+        SongLyricsModel.objects.bulk_create(
+            [
+                SongLyricsModel(song_id=song_id, text=lyrics[str(song_id)])
+                for song_id in song_ids
+            ],
+            update_conflicts=True,
+            unique_fields=["song"],
+            update_fields=["text", "updated_at"],
+        )
+        SongModel.objects.filter(id__in=song_ids, has_lyrics=False).update(
+            has_lyrics=True
+        )
+    return len(song_ids)
+
+
+save_lyrics_batch = sync_to_async(save_lyrics_batch_sync)
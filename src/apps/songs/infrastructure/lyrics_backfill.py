@@ -0,0 +1,308 @@
+"""
+Búsqueda masiva de letras (``update_lyrics``).
+
+Las canciones se leen por bloques ordenados por id (keyset, sólo id, título,
+artista y origen) y pasan por ``bounded_map``: como mucho ``CONCURRENCY``
+búsquedas en curso y unos pocos bloques en memoria, sea cual sea el tamaño del
+catálogo. Las letras encontradas se guardan por lotes con un upsert en
+``song_lyrics`` y, tras cada lote, se guarda en
+``LyricsBackfillCheckpointModel`` el id hasta el que todo está procesado para
+poder reanudar tras una interrupción.
+
+El orden por id (UUID aleatorio) no sigue la popularidad: una ejecución con
+``limit`` procesa las siguientes canciones tras el punto guardado, no las más
+escuchadas. Ejecuciones sucesivas recorren todo el catálogo sin repetir.
+
+El resultado de cada búsqueda se registra en ``song_lyrics_lookups``, y las
+canciones con una búsqueda fallida reciente se omiten hasta que toque
+reintentarlas (ver ``domain.lyrics_lookup``).
+"""
+
+import time
+from collections import Counter, deque
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Deque, Dict, Optional, Set
+
+from django.utils import timezone
+
+from common.adapters.lyrics import LyricsLookup, LyricsService
+from common.mixins.logging_mixin import LoggingMixin
+from common.utils.bounded_pipeline import bounded_map
+
+from ..domain.lyrics_lookup import ERROR, FOUND, NOT_FOUND
+from .lyrics import save_lyrics_batch
+from .lyrics_lookups import LookupOutcome, record_lyrics_lookups
+from .models import LyricsBackfillCheckpointModel, SongModel
+
+DEFAULT_LYRICS_BACKFILL_SETTINGS: Dict[str, Any] = {
+    "CHUNK_SIZE": 500,
+    "CONCURRENCY": 3,
+    "WRITE_BATCH_SIZE": 100,
+}
+
+
+def get_lyrics_backfill_settings() -> Dict[str, Any]:
+    """Configuración de la búsqueda masiva, por defecto si Django no está listo"""
+    config = dict(DEFAULT_LYRICS_BACKFILL_SETTINGS)
+    try:
+        from django.conf import settings
+
+        if settings.configured:
+            config.update(getattr(settings, "LYRICS_BACKFILL", {}))
+    except ImportError:
+        pass
+    return config
+
+
+@dataclass(slots=True)
+class PendingSong:
+    """Datos mínimos de una canción para buscar su letra"""
+
+    id: str
+    title: str
+    artist: str
+    youtube_id: Optional[str] = None
+
+
+async def iter_songs_for_lyrics(
+    after: Optional[str] = None,
+    only_without_lyrics: bool = True,
+    chunk_size: int = 500,
+    limit: Optional[int] = None,
+) -> AsyncIterator[PendingSong]:
+    """
+    Canciones con id mayor que ``after``, por bloques de ``chunk_size``.
+
+    Con ``only_without_lyrics`` sólo las que no tienen letra y no tienen la
+    búsqueda aplazada.
+    """
+    queryset = SongModel.objects.order_by("id").values(
+        "id", "title", "artist__name", "source_type", "source_id"
+    )
+    if only_without_lyrics:
+        queryset = queryset.filter(has_lyrics=False).exclude(
+            lyrics_lookup__next_attempt_at__gt=timezone.now()
+        )
+
+    remaining = limit
+    while remaining is None or remaining > 0:
+        size = chunk_size if remaining is None else min(chunk_size, remaining)
+        page = queryset if after is None else queryset.filter(id__gt=after)
+        rows = [row async for row in page[:size]]
+        for row in rows:
+            yield PendingSong(
+                id=str(row["id"]),
+                title=row["title"],
+                artist=row["artist__name"] or "Unknown",
+                youtube_id=(
+                    row["source_id"] if row["source_type"] == "youtube" else None
+                ),
+            )
+        if len(rows) < size:
+            return
+        after = rows[-1]["id"]
+        if remaining is not None:
+            remaining -= len(rows)
+
+
+async def load_checkpoint(name: str) -> Optional[LyricsBackfillCheckpointModel]:
+    return await LyricsBackfillCheckpointModel.objects.filter(name=name).afirst()
+
+
+async def save_checkpoint(
+    name: str, last_song_id: str, processed: int, updated: int
+) -> None:
+    await LyricsBackfillCheckpointModel.objects.aupdate_or_create(
+        name=name,
+        defaults={
+            "last_song_id": last_song_id,
+            "processed": processed,
+            "updated": updated,
+        },
+    )
+
+
+async def clear_checkpoint(name: str) -> None:
+    await LyricsBackfillCheckpointModel.objects.filter(name=name).adelete()
+
+
+@dataclass
+class LyricsBackfillStats:
+    """Resultado de una ejecución; ``to_dict`` mantiene las claves del comando"""
+
+    processed: int = 0
+    updated: int = 0
+    errors: int = 0
+    elapsed: float = 0.0
+    resumed_from: Optional[str] = None
+    completed: bool = False
+    # Consultas y aciertos por fuente de letras
+    source_attempts: Counter = field(default_factory=Counter)
+    source_hits: Counter = field(default_factory=Counter)
+
+    @property
+    def skipped(self) -> int:
+        return self.processed - self.updated - self.errors
+
+    @property
+    def songs_per_second(self) -> float:
+        return self.processed / self.elapsed if self.elapsed > 0 else 0.0
+
+    def record(self, lookup: LyricsLookup) -> None:
+        self.source_attempts.update(lookup.sources_tried)
+        if lookup.source:
+            self.source_hits[lookup.source] += 1
+
+    def source_stats(self) -> Dict[str, Dict[str, Any]]:
+        return {
+            source: {
+                "attempts": attempts,
+                "hits": self.source_hits[source],
+                "hit_rate": self.source_hits[source] / attempts,
+            }
+            for source, attempts in self.source_attempts.most_common()
+        }
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "total_processed": self.processed,
+            "updated": self.updated,
+            "skipped": self.skipped,
+            "errors": self.errors,
+            "elapsed_seconds": round(self.elapsed, 2),
+            "songs_per_second": round(self.songs_per_second, 2),
+            "resumed_from": self.resumed_from,
+            "completed": self.completed,
+            "sources": self.source_stats(),
+        }
+
+
+class LyricsBackfill(LoggingMixin):
+    """
+    Busca y guarda letras para muchas canciones (ver docstring del módulo).
+
+    Usage:
+        stats = await LyricsBackfill(LyricsService()).run(limit=1000)
+    """
+
+    def __init__(
+        self,
+        lyrics_service: LyricsService,
+        concurrency: Optional[int] = None,
+        chunk_size: Optional[int] = None,
+        write_batch_size: Optional[int] = None,
+    ):
+        super().__init__()
+        config = get_lyrics_backfill_settings()
+        self.lyrics_service = lyrics_service
+        self.concurrency = concurrency or config["CONCURRENCY"]
+        self.chunk_size = chunk_size or config["CHUNK_SIZE"]
+        self.write_batch_size = write_batch_size or config["WRITE_BATCH_SIZE"]
+
+    async def run(
+        self,
+        limit: Optional[int] = None,
+        only_without_lyrics: bool = True,
+        resume: bool = True,
+    ) -> LyricsBackfillStats:
+        """
+        Procesa hasta ``limit`` canciones (todas si es None).
+
+        Con ``resume`` continúa tras el último punto guardado; al recorrer todo
+        el catálogo el punto se borra y la siguiente ejecución empieza de cero.
+        """
+        name = "missing" if only_without_lyrics else "all"
+        stats = LyricsBackfillStats()
+        checkpoint = await load_checkpoint(name) if resume else None
+        if not resume:
+            await clear_checkpoint(name)
+        base_processed = checkpoint.processed if checkpoint else 0
+        base_updated = checkpoint.updated if checkpoint else 0
+        after = checkpoint.last_song_id if checkpoint else None
+        stats.resumed_from = str(after) if after else None
+
+        # Ids en orden de lectura aún no cerrados, y los ya terminados de entre
+        # ellos: el punto de reanudación avanza hasta el primero sin terminar
+        dispatched: Deque[str] = deque()
+        finished: Set[str] = set()
+        watermark = stats.resumed_from
+        found: Dict[str, str] = {}
+        outcomes: Dict[str, LookupOutcome] = {}
+        read = 0
+        saved_at = 0
+
+        async def songs() -> AsyncIterator[PendingSong]:
+            nonlocal read
+            async for song in iter_songs_for_lyrics(
+                after, only_without_lyrics, self.chunk_size, limit
+            ):
+                read += 1
+                dispatched.append(song.id)
+                yield song
+
+        async def flush() -> None:
+            nonlocal saved_at
+            stats.updated += await save_lyrics_batch(found)
+            await record_lyrics_lookups(outcomes)
+            found.clear()
+            outcomes.clear()
+            if watermark:
+                await save_checkpoint(
+                    name,
+                    watermark,
+                    base_processed + stats.processed,
+                    base_updated + stats.updated,
+                )
+            saved_at = stats.processed
+            stats.elapsed = time.perf_counter() - start
+            self.logger.info(
+                f"Lyrics backfill: {stats.processed} processed, "
+                f"{stats.updated} updated, {stats.songs_per_second:.1f} songs/s"
+            )
+
+        start = time.perf_counter()
+        self.logger.info(
+            f"Starting lyrics backfill (resume from {stats.resumed_from or 'start'})"
+        )
+        async for result in bounded_map(songs(), self._lookup, self.concurrency):
+            song = result.item
+            stats.processed += 1
+            if result.error is not None:
+                stats.errors += 1
+                outcomes[song.id] = (ERROR, [])
+                self.logger.error(
+                    f"Error looking up lyrics for {song.id}: {result.error}"
+                )
+            else:
+                lookup = result.value
+                stats.record(lookup)
+                outcomes[song.id] = (
+                    FOUND if lookup.lyrics else NOT_FOUND,
+                    lookup.sources_tried,
+                )
+                if lookup.lyrics:
+                    found[song.id] = lookup.lyrics
+
+            finished.add(song.id)
+            while dispatched and dispatched[0] in finished:
+                watermark = dispatched.popleft()
+                finished.discard(watermark)
+
+            if (
+                len(found) >= self.write_batch_size
+                or stats.processed - saved_at >= self.chunk_size
+            ):
+                await flush()
+
+        await flush()
+        stats.completed = limit is None or read < limit
+        if stats.completed:
+            await clear_checkpoint(name)
+        stats.elapsed = time.perf_counter() - start
+        self.logger.info(f"Lyrics backfill finished: {stats.to_dict()}")
+        return stats
+
+    async def _lookup(self, song: PendingSong) -> LyricsLookup:
+        return await self.lyrics_service.find_lyrics(
+            title=song.title, artist=song.artist, youtube_id=song.youtube_id
+        )
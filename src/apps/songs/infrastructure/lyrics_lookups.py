@@ -0,0 +1,121 @@
+"""
+Registro de búsquedas de letras en ``song_lyrics_lookups``.
+
+Cada búsqueda (desde la API o ``update_lyrics``) guarda su resultado, las
+fuentes consultadas y, si no encontró nada, cuándo puede repetirse según
+``LYRICS_LOOKUP`` (ver ``domain.lyrics_lookup``).
+"""
+
+from datetime import timedelta
+from typing import Any, Dict, List, Optional, Tuple
+
+from asgiref.sync import sync_to_async
+from django.db import transaction
+from django.utils import timezone
+
+from ..domain.lyrics_lookup import (
+    ERROR,
+    FOUND,
+    LyricsLookupAttempt,
+    retry_delay,
+)
+from .models import SongLyricsLookupModel, SongModel
+
+DEFAULT_LYRICS_LOOKUP_SETTINGS: Dict[str, Any] = {
+    "RETRY_AFTER_HOURS": 24.0,
+    "BACKOFF_FACTOR": 2.0,
+    "MAX_RETRY_AFTER_HOURS": 720.0,
+    "ERROR_RETRY_MINUTES": 15.0,
+}
+
+# Resultado y fuentes consultadas de una búsqueda
+LookupOutcome = Tuple[str, List[str]]
+
+
+def get_lyrics_lookup_settings() -> Dict[str, Any]:
+    """Configuración del aplazamiento de búsquedas, por defecto si Django no está listo"""
+    config = dict(DEFAULT_LYRICS_LOOKUP_SETTINGS)
+    try:
+        from django.conf import settings
+
+        if settings.configured:
+            config.update(getattr(settings, "LYRICS_LOOKUP", {}))
+    except ImportError:
+        pass
+    return config
+
+
+def _to_attempt(model: SongLyricsLookupModel) -> LyricsLookupAttempt:
+    return LyricsLookupAttempt(
+        song_id=str(model.pk),  # la canción es la clave primaria
+        outcome=model.outcome,
+        last_attempt_at=model.last_attempt_at,
+        misses=model.misses,
+        sources_tried=list(model.sources_tried or []),
+        next_attempt_at=model.next_attempt_at,
+    )
+
+
+async def get_lyrics_lookup(song_id: str) -> Optional[LyricsLookupAttempt]:
+    """Última búsqueda de letras de la canción, o None si nunca se buscó"""
+    model = await SongLyricsLookupModel.objects.filter(song_id=song_id).afirst()
+    return _to_attempt(model) if model else None
+
+
+def record_lyrics_lookups_sync(outcomes: Dict[str, LookupOutcome]) -> None:
+    """Guarda el resultado de un lote de búsquedas (``{song_id: resultado}``)"""
+    if not outcomes:
+        return
+    config = get_lyrics_lookup_settings()
+    now = timezone.now()
+    with transaction.atomic():
+        # Las canciones borradas mientras se buscaban no se registran
+        song_ids = list(
+            SongModel.objects.filter(id__in=list(outcomes)).values_list("id", flat=True)
+        )
+        previous = dict(
+            SongLyricsLookupModel.objects.filter(song_id__in=song_ids).values_list(
+                "song_id", "misses"
+            )
+        )
+        rows = []
+        for song_id in song_ids:
+            outcome, sources_tried = outcomes[str(song_id)]
+            misses = previous.get(song_id, 0)
+            if outcome == FOUND:
+                misses, next_attempt_at = 0, None
+            elif outcome == ERROR:
+                next_attempt_at = now + timedelta(minutes=config["ERROR_RETRY_MINUTES"])
+            else:
+                misses += 1
+                next_attempt_at = now + retry_delay(
+                    misses,
+                    config["RETRY_AFTER_HOURS"],
+                    config["BACKOFF_FACTOR"],
+                    config["MAX_RETRY_AFTER_HOURS"],
+                )
+            rows.append(
+                SongLyricsLookupModel(
+                    song_id=song_id,
+                    outcome=outcome,
+                    sources_tried=sources_tried,
+                    misses=misses,
+                    last_attempt_at=now,
+                    next_attempt_at=next_attempt_at,
+                )
+            )
+        SongLyricsLookupModel.objects.bulk_create(
+            rows,
+            update_conflicts=True,
+            unique_fields=["song"],
+            update_fields=[
+                "outcome",
+                "sources_tried",
+                "misses",
+                "last_attempt_at",
+                "next_attempt_at",
+            ],
+        )
+
+
+record_lyrics_lookups = sync_to_async(record_lyrics_lookups_sync)
@@ -1,3 +1,15 @@
+from .lyrics_backfill_checkpoint_model import LyricsBackfillCheckpointModel
+from .play_event_model import PlayEventModel
+from .song_lyrics_lookup_model import SongLyricsLookupModel
+from .song_lyrics_model import SongLyricsModel
 from .song_model import SongModel
+from .trending_state_model import TrendingStateModel
 
-__all__ = ["SongModel"]
+__all__ = [
+    "LyricsBackfillCheckpointModel",
+    "PlayEventModel",
+    "SongLyricsLookupModel",
+    "SongLyricsModel",
+    "SongModel",
+    "TrendingStateModel",
+]
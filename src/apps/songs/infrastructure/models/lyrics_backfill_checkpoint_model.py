@@ -0,0 +1,22 @@
+from django.db import models
+
+
+class LyricsBackfillCheckpointModel(models.Model):
+    """
+    Progreso de ``update_lyrics``: todas las canciones con id hasta
+    ``last_song_id`` ya se procesaron y sus letras están guardadas.
+    """
+
+    name = models.CharField(max_length=50, primary_key=True)
+    last_song_id = models.UUIDField(null=True, blank=True)
+    processed = models.PositiveIntegerField(default=0)
+    updated = models.PositiveIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = "song_lyrics_backfill"
+        verbose_name = "Progreso de letras"
+        verbose_name_plural = "Progreso de letras"
+
+    def __str__(self):
+        return f"{self.name}: {self.processed} processed"
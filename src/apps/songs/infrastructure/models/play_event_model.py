@@ -0,0 +1,33 @@
+from django.db import models
+
+
+class PlayEventModel(models.Model):
+    """
+    Registro append-only de reproducciones. ``day`` (fecha local de la
+    reproducción) es la clave de partición lógica: las consultas por ventana y
+    la retención (``prune_play_events``) trabajan por rangos de días.
+    """
+
+    id = models.BigAutoField(primary_key=True)
+    song = models.ForeignKey(
+        "songs.SongModel",
+        on_delete=models.CASCADE,
+        related_name="play_events",
+        db_index=False,  # Cubierto por play_events_song_time_idx
+    )
+    played_at = models.DateTimeField()
+    day = models.DateField()
+
+    class Meta:
+        db_table = "song_play_events"
+        verbose_name = "Reproducción"
+        verbose_name_plural = "Reproducciones"
+        indexes = [
+            models.Index(fields=["day", "song"], name="play_events_day_song_idx"),
+            models.Index(
+                fields=["song", "played_at"], name="play_events_song_time_idx"
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.song_id} @ {self.played_at}"
@@ -0,0 +1,34 @@
+from django.db import models
+
+
+class SongLyricsLookupModel(models.Model):
+    """
+    Última búsqueda de letras de una canción (ver ``domain.lyrics_lookup``):
+    hasta ``next_attempt_at`` no se vuelve a buscar.
+    """
+
+    OUTCOME_CHOICES = [
+        ("found", "Encontrada"),
+        ("not_found", "No encontrada"),
+        ("error", "Error"),
+    ]
+
+    song = models.OneToOneField(
+        "songs.SongModel",
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name="lyrics_lookup",
+    )
+    outcome = models.CharField(max_length=20, choices=OUTCOME_CHOICES)
+    sources_tried = models.JSONField(default=list, blank=True)
+    misses = models.PositiveIntegerField(default=0)
+    last_attempt_at = models.DateTimeField()
+    next_attempt_at = models.DateTimeField(null=True, blank=True, db_index=True)
+
+    class Meta:
+        db_table = "song_lyrics_lookups"
+        verbose_name = "Búsqueda de letra"
+        verbose_name_plural = "Búsquedas de letras"
+
+    def __str__(self):
+        return f"{self.song_id}: {self.outcome}"
@@ -0,0 +1,26 @@
+from django.db import models
+
+
+class SongLyricsModel(models.Model):
+    """
+    Letra de una canción. Vive fuera de ``songs`` para que los listados, que no
+    la usan, no lean ni transfieran el texto; ``SongModel.has_lyrics`` indica
+    si existe la fila.
+    """
+
+    song = models.OneToOneField(
+        "songs.SongModel",
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name="lyrics_entry",
+    )
+    text = models.TextField()
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = "song_lyrics"
+        verbose_name = "Letra"
+        verbose_name_plural = "Letras"
+
+    def __str__(self):
+        return f"Lyrics of {self.song_id}"
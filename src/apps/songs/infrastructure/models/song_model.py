@@ -50,13 +50,16 @@ class SongModel(models.Model):
     file_url = models.URLField(null=True, blank=True, max_length=500)
     thumbnail_url = models.URLField(null=True, blank=True, max_length=500)
 
-    # Contenido adicional
-    lyrics = models.TextField(null=True, blank=True)  # NOSONAR
+    # Contenido adicional: la letra está en SongLyricsModel (tabla song_lyrics)
+    has_lyrics = models.BooleanField(default=False)
 
     # Métricas internas de la aplicación
     play_count = models.PositiveIntegerField(default=0, db_index=True)
     favorite_count = models.PositiveIntegerField(default=0)
     download_count = models.PositiveIntegerField(default=0)
+    # Suma de reproducciones con decaimiento exponencial relativa a la época de
+    # TrendingStateModel (ver domain.trending): ordenar por ella es exacto
+    trending_score = models.FloatField(default=0)
 
     # Metadatos de origen (para saber de dónde vino la canción)
     source_type = models.CharField(
@@ -99,6 +102,8 @@ class SongModel(models.Model):
             models.Index(fields=["play_count"], name="songs_most_played_idx"),
             models.Index(fields=["favorite_count"], name="songs_most_favorited_idx"),
             models.Index(fields=["last_played_at"], name="songs_recently_played_idx"),
+            models.Index(fields=["trending_score"], name="songs_trending_idx"),
+            models.Index(fields=["has_lyrics"], name="songs_has_lyrics_idx"),
         ]
         constraints = [
             models.UniqueConstraint(
@@ -0,0 +1,20 @@
+from django.db import models
+from django.utils import timezone
+
+
+class TrendingStateModel(models.Model):
+    """Época común de ``SongModel.trending_score`` en una única fila (``id=1``)"""
+
+    SINGLETON_ID = 1
+
+    id = models.PositiveSmallIntegerField(primary_key=True, default=SINGLETON_ID)
+    epoch = models.DateTimeField(default=timezone.now)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = "song_trending_state"
+        verbose_name = "Estado de tendencias"
+        verbose_name_plural = "Estado de tendencias"
+
+    def __str__(self):
+        return f"epoch={self.epoch.isoformat()}"
@@ -0,0 +1,250 @@
+"""
+Ingesta de reproducciones por lotes.
+
+Cada reproducción se añade a un buffer en memoria del worker (sin consultas).
+El volcado inserta los eventos en ``song_play_events`` con ``bulk_create`` y, en
+la misma transacción, suma a ``SongModel.play_count`` y ``trending_score`` las
+reproducciones de cada canción con un único UPDATE por lote. Después invalida
+los rankings de más reproducidas y tendencias y envía ``plays_recorded``
+(estadísticas).
+"""
+
+import threading
+from collections import Counter
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Dict, Hashable, List, Optional, Tuple, TypeVar
+
+from django.db import close_old_connections, transaction
+from django.db.models import (
+    Case,
+    DateTimeField,
+    F,
+    FloatField,
+    IntegerField,
+    Value,
+    When,
+)
+from django.utils import timezone
+
+from common.utils.batch_buffer import BatchBuffer
+from common.utils.logging_config import get_logger
+
+from ..domain.trending import play_weight
+from .cache import invalidate_most_played_cache, invalidate_trending_cache
+from .models import PlayEventModel, SongModel
+from .signals import PlayRecord, plays_recorded
+from .trending import get_trending_settings, lock_trending_state, rebase_stale_epoch
+
+logger = get_logger(__name__)
+
+DEFAULT_PLAY_EVENTS_SETTINGS: Dict[str, Any] = {
+    "FLUSH_SIZE": 500,
+    "FLUSH_INTERVAL": 5.0,
+    "MAX_PENDING": 50000,
+    "BATCH_SIZE": 1000,
+    "RETENTION_DAYS": 90,
+}
+
+K = TypeVar("K", bound=Hashable)
+
+# Canciones por UPDATE de contadores (tamaño de los CASE)
+COUNTER_UPDATE_CHUNK = 500
+
+
+def get_play_events_settings() -> Dict[str, Any]:
+    """Configuración del registro de reproducciones, por defecto si Django no está listo"""
+    config = dict(DEFAULT_PLAY_EVENTS_SETTINGS)
+    try:
+        from django.conf import settings
+
+        if settings.configured:
+            config.update(getattr(settings, "PLAY_EVENTS", {}))
+    except ImportError:
+        pass
+    return config
+
+
+@dataclass(slots=True)
+class PlayEvent:
+    """Reproducción pendiente de volcar"""
+
+    song_id: str
+    played_at: datetime
+
+
+def save_play_events(events: List[PlayEvent], batch_size: int = 1000) -> None:
+    """Vuelca un lote de reproducciones (ver docstring del módulo)"""
+    try:
+        _save_play_events(events, batch_size)
+    finally:
+        # El hilo de volcado vive lo que el proceso: respeta CONN_MAX_AGE
+        close_old_connections()
+
+
+def _save_play_events(events: List[PlayEvent], batch_size: int) -> None:
+    songs = {
+        str(row["id"]): row
+        for row in SongModel.objects.filter(
+            id__in={event.song_id for event in events}
+        ).values("id", "artist_id", "play_count")
+    }
+    # Canciones borradas mientras sus reproducciones estaban en el buffer
+    events = [event for event in events if event.song_id in songs]
+    if not events:
+        return
+
+    per_song: Dict[str, List[Any]] = {}
+    per_song_day: Dict[Tuple[str, Any], List[Any]] = {}
+    rows = []
+    for event in events:
+        day = timezone.localdate(event.played_at)
+        rows.append(
+            PlayEventModel(song_id=event.song_id, played_at=event.played_at, day=day)
+        )
+        _count_play(per_song, event.song_id, event.played_at)
+        _count_play(per_song_day, (event.song_id, day), event.played_at)
+
+    song_totals = list(per_song.items())
+    half_life = get_trending_settings()["HALF_LIFE_HOURS"]
+    with transaction.atomic():
+        state = lock_trending_state()
+        rebase_stale_epoch(state)
+        epoch = state.epoch
+        weights: Dict[str, float] = dict.fromkeys(per_song, 0.0)
+        for event in events:
+            weights[event.song_id] += play_weight(event.played_at, epoch, half_life)
+
+        PlayEventModel.objects.bulk_create(rows, batch_size=batch_size)
+        for start in range(0, len(song_totals), COUNTER_UPDATE_CHUNK):
+            chunk = song_totals[start : start + COUNTER_UPDATE_CHUNK]
+            SongModel.objects.filter(id__in=[song_id for song_id, _ in chunk]).update(
+                play_count=F("play_count")
+                + Case(
+                    *(
+                        When(id=song_id, then=Value(count))
+                        for song_id, (count, _) in chunk
+                    ),
+                    output_field=IntegerField(),
+                ),
+                last_played_at=Case(
+                    *(
+                        When(id=song_id, then=Value(last))
+                        for song_id, (_, last) in chunk
+                    ),
+                    output_field=DateTimeField(),
+                ),
+                trending_score=F("trending_score")
+                + Case(
+                    *(
+                        When(id=song_id, then=Value(weights[song_id]))
+                        for song_id, _ in chunk
+                    ),
+                    output_field=FloatField(),
+                ),
+            )
+
+    # Los eventos ya están guardados: nada de lo que sigue puede hacer fallar
+    # el volcado, o el buffer los reintentaría y se contarían dos veces
+    for invalidate in (invalidate_most_played_cache, invalidate_trending_cache):
+        try:
+            invalidate()
+        except Exception as e:
+            logger.error(f"Could not invalidate {invalidate.__name__}: {e}")
+    try:
+        _send_plays_recorded(songs, per_song_day)
+    except Exception as e:
+        logger.error(f"Could not send plays_recorded: {e}")
+
+
+def _count_play(totals: Dict[K, List[Any]], key: K, played_at: datetime) -> None:
+    """Suma una reproducción a ``totals[key]`` (``[recuento, última reproducción]``)"""
+    entry = totals.setdefault(key, [0, played_at])
+    entry[0] += 1
+    entry[1] = max(entry[1], played_at)
+
+
+def _send_plays_recorded(
+    songs: Dict[str, Dict[str, Any]],
+    per_song_day: Dict[Tuple[str, Any], List[Any]],
+) -> None:
+    """Envía ``plays_recorded`` con una ``PlayRecord`` por canción y día"""
+    first_plays = {song_id for song_id, row in songs.items() if not row["play_count"]}
+    records = []
+    for (song_id, _), (count, last) in sorted(
+        per_song_day.items(), key=lambda item: item[1][1]
+    ):
+        artist_id = songs[song_id]["artist_id"]
+        records.append(
+            PlayRecord(
+                song_id=song_id,
+                artist_id=str(artist_id) if artist_id else None,
+                played_at=last,
+                count=count,
+                first_play=song_id in first_plays,
+            )
+        )
+        first_plays.discard(song_id)
+
+    for receiver, response in plays_recorded.send_robust(
+        sender=SongModel, plays=records
+    ):
+        if isinstance(response, Exception):
+            logger.error(f"Error in plays_recorded receiver {receiver}: {response}")
+
+
+class PlayEventBuffer(BatchBuffer[PlayEvent]):
+    """Buffer de reproducciones del worker con recuento pendiente por canción"""
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self._pending: Counter = Counter()
+        self._pending_lock = threading.Lock()
+
+    def record(self, song_id: str, played_at: Optional[datetime] = None) -> None:
+        """Registra una reproducción (sin E/S)"""
+        song_id = str(song_id)
+        with self._pending_lock:
+            self._pending[song_id] += 1
+        self.add(PlayEvent(song_id=song_id, played_at=played_at or timezone.now()))
+
+    def pending_count(self, song_id: str) -> int:
+        """Reproducciones de la canción aún no sumadas a ``play_count``"""
+        return self._pending.get(str(song_id), 0)
+
+    def on_flushed(self, items: List[PlayEvent]) -> None:
+        self._discount(items)
+
+    def on_dropped(self, items: List[PlayEvent]) -> None:
+        logger.warning(f"Dropped {len(items)} play events (buffer full)")
+        self._discount(items)
+
+    def _discount(self, items: List[PlayEvent]) -> None:
+        with self._pending_lock:
+            self._pending.subtract(event.song_id for event in items)
+            for event in items:
+                if self._pending.get(event.song_id, 0) <= 0:
+                    self._pending.pop(event.song_id, None)
+
+
+_buffer: Optional[PlayEventBuffer] = None
+_buffer_lock = threading.Lock()
+
+
+def get_play_event_buffer() -> PlayEventBuffer:
+    """Buffer de reproducciones de este proceso"""
+    global _buffer
+
+    with _buffer_lock:
+        if _buffer is not None:
+            return _buffer
+        config = get_play_events_settings()
+        batch_size = config["BATCH_SIZE"]
+        _buffer = PlayEventBuffer(
+            flush=lambda events: save_play_events(events, batch_size),
+            name="play_events",
+            flush_size=config["FLUSH_SIZE"],
+            flush_interval=float(config["FLUSH_INTERVAL"]),
+            max_pending=config["MAX_PENDING"],
+        )
+        return _buffer
@@ -1,15 +1,25 @@
-from typing import List, Optional, cast
+from dataclasses import replace
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
 
 from asgiref.sync import sync_to_async
-from django.db.models import Q
+from django.db import transaction
+from django.db.models import Count, F, Q
+from django.db.models.functions import TruncHour
+from django.utils import timezone
 
 from apps.artists.infrastructure.models.artist_model import ArtistModel
+from apps.genres.infrastructure.models import GenreModel
 from apps.songs.api.mappers import SongEntityModelMapper
 from common.core import BaseDjangoRepository
 
 from ...domain.entities import SongEntity
+from ...domain.lyrics_lookup import LyricsLookupAttempt
 from ...domain.repository.Isong_repository import ISongRepository
-from ..models.song_model import SongModel
+from ..lyrics import get_song_lyrics, save_song_lyrics, save_song_lyrics_sync
+from ..lyrics_lookups import get_lyrics_lookup, record_lyrics_lookups
+from ..models import PlayEventModel, SongModel
+from ..play_events import get_play_event_buffer
 
 
 class SongRepository(BaseDjangoRepository[SongEntity, SongModel], ISongRepository):
@@ -19,9 +29,16 @@ class SongRepository(BaseDjangoRepository[SongEntity, SongModel], ISongRepositor
         super().__init__(SongModel, SongEntityModelMapper())
 
     async def save(  # pyright: ignore[reportIncompatibleMethodOverride]
-        self, entity: SongEntity
+        self, entity: SongEntity, reload: bool = True
     ) -> SongEntity:
-        """Guarda una canción"""
+        """
+        Guarda una canción.
+
+        Las existentes se actualizan con un único UPDATE y los géneros se
+        escriben por id en la tabla intermedia (los ids que no existen se
+        ignoran). Con ``reload=False`` la entidad devuelta se construye con los
+        datos ya conocidos, sin volver a leerla.
+        """
         try:
             song_data = self.mapper.entity_to_model_data(entity)
 
@@ -30,39 +47,96 @@ class SongRepository(BaseDjangoRepository[SongEntity, SongModel], ISongRepositor
                 f"Saving song with data: artist_id={song_data.get('artist_id')}, album_id={song_data.get('album_id')}"
             )
 
+            song_obj, genre_ids = await sync_to_async(self._write_song)(
+                entity, song_data
+            )
+
+            if reload:
+                song_obj = await (
+                    self.model_class.objects.select_related(
+                        "artist", "album", "lyrics_entry"
+                    )
+                    .prefetch_related("genres")
+                    .aget(id=song_obj.id)
+                )
+                return await sync_to_async(self.mapper.model_to_entity)(song_obj)
+
+            return replace(
+                entity,
+                id=str(song_obj.id),
+                genre_ids=genre_ids,
+                has_lyrics=bool(entity.lyrics) or entity.has_lyrics,
+                created_at=song_obj.created_at or entity.created_at,
+                updated_at=song_obj.updated_at,
+            )
+
+        except Exception as e:
+            self.logger.error(f"Error saving song: {str(e)}")
+            raise
+
+    def _write_song(
+        self, entity: SongEntity, song_data: Dict[str, Any]
+    ) -> Tuple[SongModel, List[str]]:
+        """
+        Fila, géneros y letra de la canción en una transacción; devuelve la
+        fila y los géneros escritos
+        """
+        with transaction.atomic():
+            song_obj = None
             if entity.id:
-                try:
-                    song_obj = await self.model_class.objects.aget(id=entity.id)
-                    for key, value in song_data.items():
-                        setattr(song_obj, key, value)
-                    await song_obj.asave()
-                except self.model_class.DoesNotExist:
+                now = timezone.now()
+                if self.model_class.objects.filter(id=entity.id).update(
+                    **song_data, updated_at=now
+                ):
+                    # Solo se conocen los campos escritos (created_at no)
+                    song_obj = self.model_class(
+                        id=entity.id, updated_at=now, **song_data
+                    )
+                else:
                     self.logger.warning(
                         f"Song with ID {entity.id} not found, creating new one"
                     )
-                    song_obj = await self.model_class.objects.acreate(**song_data)
-            else:
-                song_obj = await self.model_class.objects.acreate(**song_data)
-
-            song_mapper = cast(SongEntityModelMapper, self.mapper)
-            if entity.genre_ids:
-                await song_mapper.set_entity_genres_to_model(song_obj, entity.genre_ids)
+            created = song_obj is None
+            if song_obj is None:
+                song_obj = self.model_class.objects.create(**song_data)
 
-            else:
-                await song_obj.genres.aclear()
+            genre_ids = self._write_genres(song_obj.id, entity.genre_ids or [], created)
 
-            # Recargar el objeto con las relaciones para el mapper
-            song_obj = await (
-                self.model_class.objects.select_related("artist", "album")
-                .prefetch_related("genres")
-                .aget(id=song_obj.id)
-            )
+            # La letra va en su propia tabla; None no borra una letra existente
+            if entity.lyrics:
+                save_song_lyrics_sync(song_obj.id, entity.lyrics)
 
-            return await sync_to_async(self.mapper.model_to_entity)(song_obj)
+        return song_obj, genre_ids
 
-        except Exception as e:
-            self.logger.error(f"Error saving song: {str(e)}")
-            raise
+    def _write_genres(self, song_id, genre_ids: List[str], created: bool) -> List[str]:
+        """
+        Sustituye los géneros de la canción escribiendo directamente en la
+        tabla intermedia; devuelve los escritos. Los ids que no existen en
+        ``genres`` se descartan en lugar de violar la clave foránea.
+        """
+        known = {
+            str(genre_id)
+            for genre_id in GenreModel.objects.filter(
+                id__in=set(genre_ids)
+            ).values_list("id", flat=True)
+        }
+        genre_ids = [
+            genre_id for genre_id in dict.fromkeys(genre_ids) if genre_id in known
+        ]
+        through = self.model_class.genres.through
+        if not created:
+            through.objects.filter(songmodel_id=song_id).exclude(
+                genremodel_id__in=genre_ids
+            ).delete()
+        if genre_ids:
+            through.objects.bulk_create(
+                [
+                    through(songmodel_id=song_id, genremodel_id=genre_id)
+                    for genre_id in genre_ids
+                ],
+                ignore_conflicts=not created,
+            )
+        return genre_ids
 
     async def get_by_source(
         self, source_type: str, source_id: str
@@ -190,22 +264,65 @@ class SongRepository(BaseDjangoRepository[SongEntity, SongModel], ISongRepositor
             self.logger.error(f"Error getting most played songs: {str(e)}")
             return []
 
-    async def increment_play_count(self, song_id: str) -> bool:
-        """Incrementa el contador de reproducciones"""
+    async def get_trending(self, limit: int = 20) -> List[SongEntity]:
+        """Obtiene las canciones en tendencia (lectura del índice de trending_score)"""
         try:
-            song = await self.model_class.objects.aget(
-                id=song_id,
-            )
-            await song.increment_play_count()
-            return True
-        except SongModel.DoesNotExist:
-            self.logger.warning(f"Song with id {song_id} not found")
-            return False
+            songs = await sync_to_async(
+                lambda: list(
+                    SongModel.objects.select_related("artist", "album")
+                    .prefetch_related("genres")
+                    .filter(trending_score__gt=0)
+                    .order_by("-trending_score")[:limit]
+                )
+            )()
+            return await sync_to_async(self.mapper.models_to_entities)(songs)
         except Exception as e:
-            self.logger.error(
-                f"Error incrementing play count for song {song_id}: {str(e)}"
-            )
-            return False
+            self.logger.error(f"Error getting trending songs: {str(e)}")
+            return []
+
+    async def increment_play_count(self, song_id: str) -> bool:
+        """
+        Registra una reproducción en el buffer del worker. ``play_count`` se
+        actualiza en el siguiente volcado (ver ``play_events``).
+        """
+        get_play_event_buffer().record(song_id)
+        return True
+
+    async def get_pending_play_count(self, song_id: str) -> int:
+        """Reproducciones registradas por este worker aún sin volcar"""
+        return get_play_event_buffer().pending_count(song_id)
+
+    async def get_play_counts(
+        self, song_id: str, since: datetime, granularity: str = "day"
+    ) -> List[Dict[str, Any]]:
+        """Reproducciones de una canción desde ``since`` agrupadas por hora o día"""
+        events = PlayEventModel.objects.filter(song_id=song_id, played_at__gte=since)
+        if granularity == "hour":
+            events = events.annotate(period=TruncHour("played_at"))
+        else:
+            events = events.annotate(period=F("day"))
+
+        return await sync_to_async(list)(
+            events.values("period").annotate(plays=Count("id")).order_by("period")
+        )
+
+    async def get_lyrics(self, song_id: str) -> Optional[str]:
+        """Letra de la canción (tabla song_lyrics)"""
+        return await get_song_lyrics(song_id)
+
+    async def save_lyrics(self, song_id: str, lyrics: str) -> None:
+        """Guarda la letra de la canción y actualiza ``has_lyrics``"""
+        await save_song_lyrics(song_id, lyrics)
+
+    async def get_lyrics_lookup(self, song_id: str) -> Optional[LyricsLookupAttempt]:
+        """Última búsqueda de letras (tabla song_lyrics_lookups)"""
+        return await get_lyrics_lookup(song_id)
+
+    async def record_lyrics_lookup(
+        self, song_id: str, outcome: str, sources_tried: List[str]
+    ) -> None:
+        """Registra la búsqueda y, si no encontró nada, cuándo repetirla"""
+        await record_lyrics_lookups({str(song_id): (outcome, sources_tried)})
 
     async def increment_favorite_count(self, song_id: str) -> bool:
         """Incrementa el contador de favoritos"""
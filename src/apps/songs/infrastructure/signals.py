@@ -0,0 +1,48 @@
+"""Señales que mantienen coherentes las cachés de canciones"""
+
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional
+
+from django.db.models.signals import post_delete
+from django.dispatch import Signal, receiver
+
+from apps.albums.infrastructure.models.album_model import AlbumModel
+from apps.artists.infrastructure.models.artist_model import ArtistModel
+
+from .artist_album_resolver import get_artist_album_cache
+from .cache import invalidate_most_played_cache
+from .models import SongModel
+
+
+@dataclass(slots=True)
+class PlayRecord:
+    """Reproducciones de una canción ya sumadas a su ``play_count``"""
+
+    song_id: str
+    artist_id: Optional[str]
+    played_at: datetime
+    count: int = 1
+    # True si son las primeras reproducciones de la canción
+    first_play: bool = False
+
+
+# Enviada tras actualizar los contadores; argumento ``plays``: List[PlayRecord]
+plays_recorded = Signal()
+
+# Enviada tras cada lote de ``import_songs`` (las filas se insertan con
+# ``bulk_create``, sin ``post_save``); argumento ``count``: canciones creadas
+songs_imported = Signal()
+
+
+@receiver(post_delete, sender=SongModel, dispatch_uid="songs_invalidate_most_played")
+def invalidate_most_played_on_delete(sender, instance, **kwargs):
+    invalidate_most_played_cache()
+
+
+@receiver(post_delete, sender=ArtistModel, dispatch_uid="songs_forget_artist")
+@receiver(post_delete, sender=AlbumModel, dispatch_uid="songs_forget_album")
+def forget_resolved_artist_album(sender, instance, **kwargs):
+    # Los ids resueltos no pueden apuntar a filas borradas (en este proceso;
+    # en el resto caducan con ARTIST_ALBUM_CACHE_TTL)
+    get_artist_album_cache().clear()
@@ -0,0 +1,351 @@
+"""
+Importación masiva de canciones desde un manifiesto (``import_songs``).
+
+El manifiesto (CSV, JSON o JSON Lines, ver ``common.utils.record_reader``) se
+lee y valida registro a registro (``domain.song_import``) y se procesa por
+lotes de ``BATCH_SIZE``:
+
+1. Se descartan los tracks cuyo ``(source_type, source_id)`` ya existe, con
+   una consulta por lote: volver a lanzar la importación (tras un fallo, por
+   ejemplo) continúa donde se quedó sin duplicar canciones ni subidas.
+2. Los audios locales se suben al storage con como mucho
+   ``UPLOAD_CONCURRENCY`` subidas en curso (``bounded_map``).
+3. Artistas y álbumes se resuelven en lote (``artist_album_resolver``) y los
+   géneros con un diccionario nombre -> id cargado una vez.
+4. Las canciones y sus géneros se insertan con ``bulk_create`` en una
+   transacción por lote.
+"""
+
+import os
+import re
+import time
+import uuid
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Dict, Iterable, List, Optional, Set, Tuple
+
+from asgiref.sync import sync_to_async
+from django.db import transaction
+from django.db.models import Q
+
+from apps.genres.infrastructure.models import GenreModel
+from common.factories import StorageServiceFactory
+from common.interfaces import IStorageService
+from common.mixins.logging_mixin import LoggingMixin
+from common.utils.bounded_pipeline import bounded_map
+from common.utils.record_reader import RecordError, iter_records
+
+from ..domain.exceptions import InvalidImportRowException
+from ..domain.song_import import DEFAULT_SOURCE_TYPE, ImportTrack, parse_import_track
+from .artist_album_resolver import (
+    ArtistAlbumRequest,
+    name_key,
+    resolve_artists_albums_sync,
+)
+from .models import SongModel
+from .signals import songs_imported
+
+DEFAULT_SONG_IMPORT_SETTINGS: Dict[str, Any] = {
+    "BATCH_SIZE": 1000,
+    "UPLOAD_CONCURRENCY": 8,
+}
+
+# Errores de validación guardados en el resultado (todos van al log)
+MAX_REPORTED_ERRORS = 50
+
+_UNSAFE_NAME_CHARS = re.compile(r"[^A-Za-z0-9._-]")
+
+
+def get_song_import_settings() -> Dict[str, Any]:
+    """Configuración de la importación, por defecto si Django no está listo"""
+    config = dict(DEFAULT_SONG_IMPORT_SETTINGS)
+    try:
+        from django.conf import settings
+
+        if settings.configured:
+            config.update(getattr(settings, "SONG_IMPORT", {}))
+    except ImportError:
+        pass
+    return config
+
+
+@dataclass
+class SongImportStats:
+    """Resultado de una importación"""
+
+    read: int = 0
+    imported: int = 0
+    existing: int = 0
+    duplicates: int = 0
+    invalid: int = 0
+    failed: int = 0
+    elapsed: float = 0.0
+    dry_run: bool = False
+    errors: List[str] = field(default_factory=list)
+    unknown_genres: Counter = field(default_factory=Counter)
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.read / self.elapsed if self.elapsed > 0 else 0.0
+
+    def add_error(self, message: str) -> None:
+        if len(self.errors) < MAX_REPORTED_ERRORS:
+            self.errors.append(message)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "read": self.read,
+            "imported": self.imported,
+            "existing": self.existing,
+            "duplicates": self.duplicates,
+            "invalid": self.invalid,
+            "failed": self.failed,
+            "elapsed_seconds": round(self.elapsed, 2),
+            "rows_per_second": round(self.rows_per_second, 2),
+            "dry_run": self.dry_run,
+            "errors": list(self.errors),
+            "unknown_genres": dict(self.unknown_genres.most_common(20)),
+        }
+
+
+class SongImporter(LoggingMixin):
+    """
+    Importa las canciones de un manifiesto (ver docstring del módulo).
+
+    Usage:
+        stats = await SongImporter().run("catalog.jsonl")
+    """
+
+    def __init__(
+        self,
+        batch_size: Optional[int] = None,
+        upload_concurrency: Optional[int] = None,
+        media_root: Optional[str] = None,
+        default_source_type: str = DEFAULT_SOURCE_TYPE,
+        storage_service: Optional[IStorageService] = None,
+    ):
+        super().__init__()
+        config = get_song_import_settings()
+        self.batch_size = batch_size or config["BATCH_SIZE"]
+        self.upload_concurrency = upload_concurrency or config["UPLOAD_CONCURRENCY"]
+        self.media_root = media_root
+        self.default_source_type = default_source_type
+        self._storage_service = storage_service
+        self._genre_ids: Optional[Dict[str, str]] = None
+
+    @property
+    def storage_service(self) -> IStorageService:
+        # Sólo se crea si el manifiesto tiene audios locales
+        if self._storage_service is None:
+            self._storage_service = StorageServiceFactory.create_music_files_service()
+        return self._storage_service
+
+    async def run(
+        self,
+        path: str,
+        format: Optional[str] = None,
+        limit: Optional[int] = None,
+        dry_run: bool = False,
+    ) -> SongImportStats:
+        """
+        Importa hasta ``limit`` registros del manifiesto (todos si es None).
+
+        Con ``dry_run`` sólo valida y cuenta las canciones que se crearían.
+        """
+        stats = SongImportStats(dry_run=dry_run)
+        media_root = self.media_root or os.path.dirname(os.path.abspath(path))
+        batch: List[ImportTrack] = []
+
+        def invalid(message: str) -> None:
+            stats.invalid += 1
+            stats.add_error(message)
+            self.logger.warning(f"Skipping invalid record: {message}")
+
+        def unreadable(error: RecordError) -> None:
+            stats.read += 1
+            invalid(str(error))
+
+        start = time.perf_counter()
+        self.logger.info(f"Starting song import from {path}")
+        for position, record in iter_records(path, format, on_error=unreadable):
+            stats.read += 1
+            try:
+                batch.append(
+                    parse_import_track(record, position, self.default_source_type)
+                )
+            except InvalidImportRowException as e:
+                invalid(e.message)
+            if len(batch) >= self.batch_size:
+                await self._import_batch(batch, media_root, stats)
+                batch = []
+                stats.elapsed = time.perf_counter() - start
+                self.logger.info(
+                    f"Song import: {stats.read} read, {stats.imported} imported, "
+                    f"{stats.rows_per_second:.1f} rows/s"
+                )
+            if limit is not None and stats.read >= limit:
+                break
+
+        if batch:
+            await self._import_batch(batch, media_root, stats)
+        stats.elapsed = time.perf_counter() - start
+        self.logger.info(f"Song import finished: {stats.to_dict()}")
+        return stats
+
+    async def _import_batch(
+        self, batch: List[ImportTrack], media_root: str, stats: SongImportStats
+    ) -> None:
+        unique: Dict[Tuple[str, str], ImportTrack] = {}
+        for track in batch:
+            if track.source_key in unique:
+                stats.duplicates += 1
+            else:
+                unique[track.source_key] = track
+
+        existing = await sync_to_async(existing_source_keys)(unique)
+        stats.existing += len(existing)
+        tracks = [track for key, track in unique.items() if key not in existing]
+        if stats.dry_run:
+            stats.imported += len(tracks)
+            return
+
+        pending = [track for track in tracks if not track.file_url]
+        async for result in bounded_map(
+            _iterate(pending),
+            lambda track: self._upload(track, media_root),
+            self.upload_concurrency,
+        ):
+            track = result.item
+            if result.error is not None:
+                stats.failed += 1
+                stats.add_error(f"Record {track.position}: {result.error}")
+                self.logger.error(
+                    f"Error uploading audio for record {track.position}: "
+                    f"{result.error}"
+                )
+            else:
+                track.file_url = result.value
+
+        ready = [track for track in tracks if track.file_url]
+        if ready:
+            inserted = await sync_to_async(self._write_batch)(ready, stats)
+            stats.imported += inserted
+            # Filas insertadas a la vez por otra importación
+            stats.existing += len(ready) - inserted
+
+    async def _upload(self, track: ImportTrack, media_root: str) -> str:
+        return await sync_to_async(self._upload_sync, thread_sensitive=False)(
+            track, media_root
+        )
+
+    def _upload_sync(self, track: ImportTrack, media_root: str) -> str:
+        """Sube el audio local del track y devuelve su URL pública"""
+        # Sólo se suben los tracks sin file_url, que llevan file_path
+        assert track.file_path
+        path = os.path.join(media_root, os.path.expanduser(track.file_path))
+        if not os.path.isfile(path):
+            raise FileNotFoundError(f"Audio file not found: {path}")
+
+        # Nombre fijo por origen: repetir la subida sobrescribe el fichero
+        extension = os.path.splitext(path)[1].lower() or ".mp3"
+        source_id = _UNSAFE_NAME_CHARS.sub("_", track.source_id)
+        file_name = f"audio/imports/{track.source_type}/{source_id}{extension}"
+        with open(path, "rb") as file_obj:
+            if not self.storage_service.upload_item(file_name, file_obj):
+                raise RuntimeError(f"Upload failed: {file_name}")
+        file_url = self.storage_service.get_item_url(file_name)
+        if not file_url:
+            raise RuntimeError(f"No public URL for {file_name}")
+        return file_url
+
+    def _write_batch(self, tracks: List[ImportTrack], stats: SongImportStats) -> int:
+        """Inserta las canciones del lote y devuelve cuántas se crearon"""
+        # Fuera de la transacción: el resolver guarda en caché lo que crea
+        refs = resolve_artists_albums_sync(
+            [
+                ArtistAlbumRequest(artist_name=track.artist, album_title=track.album)
+                for track in tracks
+            ]
+        )
+        genre_ids = self._get_genre_ids()
+
+        songs = []
+        song_genres: Dict[uuid.UUID, List[str]] = {}
+        for track, ref in zip(tracks, refs):
+            song_id = uuid.uuid4()
+            songs.append(
+                SongModel(
+                    id=song_id,
+                    title=track.title,
+                    artist_id=ref.artist_id,
+                    album_id=ref.album_id,
+                    duration_seconds=track.duration_seconds,
+                    track_number=track.track_number,
+                    file_url=track.file_url,
+                    thumbnail_url=track.thumbnail_url,
+                    source_type=track.source_type,
+                    source_id=track.source_id,
+                    source_url=track.source_url,
+                )
+            )
+            song_genres[song_id] = []
+            for name in track.genres:
+                genre_id = genre_ids.get(name_key(name))
+                if genre_id:
+                    song_genres[song_id].append(genre_id)
+                else:
+                    stats.unknown_genres[name] += 1
+
+        through = SongModel.genres.through
+        with transaction.atomic():
+            SongModel.objects.bulk_create(
+                songs, batch_size=self.batch_size, ignore_conflicts=True
+            )
+            inserted = set(
+                SongModel.objects.filter(id__in=list(song_genres)).values_list(
+                    "id", flat=True
+                )
+            )
+            through.objects.bulk_create(
+                [
+                    through(songmodel_id=song_id, genremodel_id=genre_id)
+                    for song_id in inserted
+                    for genre_id in dict.fromkeys(song_genres[song_id])
+                ],
+                batch_size=self.batch_size,
+            )
+
+        if inserted:
+            songs_imported.send(sender=SongModel, count=len(inserted))
+        return len(inserted)
+
+    def _get_genre_ids(self) -> Dict[str, str]:
+        """Ids de los géneros por nombre normalizado (se cargan una vez)"""
+        if self._genre_ids is None:
+            self._genre_ids = {
+                name_key(name): str(genre_id)
+                for genre_id, name in GenreModel.objects.values_list("id", "name")
+            }
+        return self._genre_ids
+
+
+def existing_source_keys(
+    keys: Iterable[Tuple[str, str]],
+) -> Set[Tuple[str, str]]:
+    """Claves ``(source_type, source_id)`` que ya tienen canción"""
+    by_type: Dict[str, List[str]] = {}
+    for source_type, source_id in keys:
+        by_type.setdefault(source_type, []).append(source_id)
+    if not by_type:
+        return set()
+    condition = Q()
+    for source_type, source_ids in by_type.items():
+        condition |= Q(source_type=source_type, source_id__in=source_ids)
+    return set(
+        SongModel.objects.filter(condition).values_list("source_type", "source_id")
+    )
+
+
+async def _iterate(items: Iterable[Any]) -> AsyncIterator[Any]:
+    for item in items:
+        yield item
@@ -0,0 +1,161 @@
+"""
+Mantenimiento de ``SongModel.trending_score`` (ver ``domain.trending``).
+
+El volcado de reproducciones suma el peso de cada reproducción nueva a la
+columna, así que el top de tendencias es una lectura del índice
+``songs_trending_idx``. ``update_trending_scores`` mueve la época de forma
+periódica (y descarta las puntuaciones residuales) o reconstruye las
+puntuaciones desde el registro de reproducciones. Si no se ejecuta, el propio
+volcado mueve la época antes de que los pesos desborden (``rebase_stale_epoch``).
+"""
+
+from collections import defaultdict
+from datetime import datetime, timedelta
+from typing import Any, Dict, Optional
+
+from django.db import transaction
+from django.db.models import Count, F
+from django.db.models.functions import TruncHour
+from django.utils import timezone
+
+from common.utils.logging_config import get_logger
+
+from ..domain.trending import play_weight, rebase_factor
+from .cache import invalidate_trending_cache
+from .models import PlayEventModel, SongModel, TrendingStateModel
+
+logger = get_logger(__name__)
+
+DEFAULT_TRENDING_SETTINGS: Dict[str, Any] = {
+    "HALF_LIFE_HOURS": 24.0,
+    "MIN_SCORE": 0.05,
+    # Los pesos crecen como 2 ** (edad de la época / vida media): 2 ** 32 deja
+    # margen de sobra en un float (desborda hacia 2 ** 1024)
+    "MAX_EPOCH_AGE_HALF_LIVES": 32.0,
+    "MAX_LIMIT": 100,
+}
+
+
+def get_trending_settings() -> Dict[str, Any]:
+    """Configuración de tendencias, por defecto si Django no está listo"""
+    config = dict(DEFAULT_TRENDING_SETTINGS)
+    try:
+        from django.conf import settings
+
+        if settings.configured:
+            config.update(getattr(settings, "TRENDING", {}))
+    except ImportError:
+        pass
+    return config
+
+
+def lock_trending_state() -> TrendingStateModel:
+    """
+    Fila de la época bloqueada hasta el final de la transacción: los volcados y
+    el cambio de época no se solapan.
+    """
+    state = (
+        TrendingStateModel.objects.select_for_update()
+        .filter(id=TrendingStateModel.SINGLETON_ID)
+        .first()
+    )
+    if state is None:
+        TrendingStateModel.objects.get_or_create(id=TrendingStateModel.SINGLETON_ID)
+        state = TrendingStateModel.objects.select_for_update().get(
+            id=TrendingStateModel.SINGLETON_ID
+        )
+    return state
+
+
+def rebase_trending_scores(now: Optional[datetime] = None) -> int:
+    """
+    Lleva las puntuaciones a la época ``now`` y pone a 0 las que quedan por
+    debajo de ``MIN_SCORE``. No cambia el orden. Devuelve cuántas se pusieron a 0.
+    """
+    now = now or timezone.now()
+
+    with transaction.atomic():
+        cleared = _rebase(lock_trending_state(), now, get_trending_settings())
+
+    invalidate_trending_cache()
+    logger.info(f"Trending scores rebased to {now.isoformat()} ({cleared} cleared)")
+    return cleared
+
+
+def rebase_stale_epoch(
+    state: TrendingStateModel, now: Optional[datetime] = None
+) -> bool:
+    """
+    Con la época ya bloqueada (``lock_trending_state``), la mueve a ``now`` si
+    tiene más de ``MAX_EPOCH_AGE_HALF_LIVES`` vidas medias, para que el volcado
+    no desborde aunque no se ejecute ``update_trending_scores``. Devuelve si la
+    movió; la caché de tendencias la invalida quien llama.
+    """
+    config = get_trending_settings()
+    now = now or timezone.now()
+    max_age = timedelta(
+        hours=config["HALF_LIFE_HOURS"] * config["MAX_EPOCH_AGE_HALF_LIVES"]
+    )
+    if now - state.epoch <= max_age:
+        return False
+
+    cleared = _rebase(state, now, config)
+    logger.warning(
+        f"Trending epoch older than {max_age}, rebased during flush "
+        f"({cleared} cleared); schedule update_trending_scores"
+    )
+    return True
+
+
+def _rebase(state: TrendingStateModel, now: datetime, config: Dict[str, Any]) -> int:
+    """Cambio de época con ``state`` bloqueado; devuelve cuántas se pusieron a 0"""
+    factor = rebase_factor(state.epoch, now, config["HALF_LIFE_HOURS"])
+    scored = SongModel.objects.filter(trending_score__gt=0)
+    scored.update(trending_score=F("trending_score") * factor)
+    cleared = scored.filter(trending_score__lt=config["MIN_SCORE"]).update(
+        trending_score=0
+    )
+    state.epoch = now
+    state.save(update_fields=["epoch", "updated_at"])
+    return cleared
+
+
+def rebuild_trending_scores(now: Optional[datetime] = None) -> int:
+    """
+    Recalcula las puntuaciones desde el registro de reproducciones (agrupado
+    por hora). Devuelve cuántas canciones quedan con puntuación.
+    """
+    config = get_trending_settings()
+    half_life = config["HALF_LIFE_HOURS"]
+    now = now or timezone.now()
+
+    with transaction.atomic():
+        # Con la época bloqueada ningún volcado se queda fuera del recálculo
+        state = lock_trending_state()
+
+        scores: Dict[str, float] = defaultdict(float)
+        hourly_plays = (
+            PlayEventModel.objects.annotate(hour=TruncHour("played_at"))
+            .values("song_id", "hour")
+            .annotate(plays=Count("id"))
+        )
+        for row in hourly_plays.iterator():
+            # Mitad de la hora como instante representativo
+            played_at = row["hour"] + timedelta(minutes=30)
+            scores[row["song_id"]] += row["plays"] * play_weight(
+                played_at, now, half_life
+            )
+
+        songs = [
+            SongModel(id=song_id, trending_score=score)
+            for song_id, score in scores.items()
+            if score >= config["MIN_SCORE"]
+        ]
+        SongModel.objects.filter(trending_score__gt=0).update(trending_score=0)
+        SongModel.objects.bulk_update(songs, ["trending_score"], batch_size=500)
+        state.epoch = now
+        state.save(update_fields=["epoch", "updated_at"])
+
+    invalidate_trending_cache()
+    logger.info(f"Trending scores rebuilt for {len(songs)} songs")
+    return len(songs)
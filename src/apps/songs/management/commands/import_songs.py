@@ -0,0 +1,105 @@
+import asyncio
+
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.songs.domain.song_import import DEFAULT_SOURCE_TYPE, FIELDS, SOURCE_TYPES
+from apps.songs.use_cases import ImportSongsUseCase
+
+
+class Command(BaseCommand):
+    help = (
+        "Import songs in bulk from a CSV, JSON or JSON Lines manifest. Fields: "
+        f"{', '.join(FIELDS)}. Songs that already exist (same source_type and "
+        "source_id) are skipped, so an interrupted import can be run again."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("manifest", help="Path to the manifest file")
+        parser.add_argument(
+            "--format",
+            choices=["csv", "json", "jsonl"],
+            default=None,
+            help="Manifest format (default: from the file extension)",
+        )
+        parser.add_argument(
+            "--media-root",
+            default=None,
+            help="Directory that file_path values are relative to "
+            "(default: the manifest's directory)",
+        )
+        parser.add_argument(
+            "--source-type",
+            choices=SOURCE_TYPES,
+            default=DEFAULT_SOURCE_TYPE,
+            help=f"source_type for records without one (default: {DEFAULT_SOURCE_TYPE})",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=None,
+            help="Songs inserted per transaction (default: SONG_IMPORT)",
+        )
+        parser.add_argument(
+            "--upload-concurrency",
+            type=int,
+            default=None,
+            help="Maximum number of concurrent media uploads (default: SONG_IMPORT)",
+        )
+        parser.add_argument(
+            "--limit",
+            type=int,
+            default=0,
+            help="Maximum number of records to read, 0 for all (default: 0)",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Validate the manifest and count new songs without importing",
+        )
+
+    def handle(self, *args, **options):
+        try:
+            stats = asyncio.run(
+                ImportSongsUseCase().execute(
+                    options["manifest"],
+                    format=options["format"],
+                    limit=options["limit"] or None,
+                    dry_run=options["dry_run"],
+                    batch_size=options["batch_size"],
+                    upload_concurrency=options["upload_concurrency"],
+                    media_root=options["media_root"],
+                    default_source_type=options["source_type"],
+                )
+            )
+        except Exception as e:
+            raise CommandError(f"Error during song import: {str(e)}")
+
+        if stats["dry_run"]:
+            self.stdout.write(self.style.SUCCESS("\n✅ Manifest validated (dry run)"))
+        else:
+            self.stdout.write(self.style.SUCCESS("\n✅ Song import completed!"))
+        self.stdout.write("📊 Statistics:")
+        self.stdout.write(f'   - Records read: {stats["read"]}')
+        label = "Would import" if stats["dry_run"] else "Imported"
+        self.stdout.write(f'   - {label}: {stats["imported"]}')
+        self.stdout.write(f'   - Already imported: {stats["existing"]}')
+        self.stdout.write(f'   - Duplicated in manifest: {stats["duplicates"]}')
+        self.stdout.write(f'   - Invalid: {stats["invalid"]}')
+        self.stdout.write(f'   - Failed uploads: {stats["failed"]}')
+        self.stdout.write(
+            f'   - Throughput: {stats["rows_per_second"]} rows/s '
+            f'({stats["elapsed_seconds"]}s)'
+        )
+
+        if stats["unknown_genres"]:
+            self.stdout.write(
+                "🎼 Unknown genres (ignored): "
+                + ", ".join(
+                    f"{name} ({count})"
+                    for name, count in stats["unknown_genres"].items()
+                )
+            )
+        if stats["errors"]:
+            self.stdout.write(self.style.WARNING("⚠️  Errors:"))
+            for error in stats["errors"]:
+                self.stdout.write(f"   - {error}")
@@ -0,0 +1,41 @@
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from apps.songs.infrastructure.models import PlayEventModel
+from apps.songs.infrastructure.play_events import get_play_events_settings
+
+
+class Command(BaseCommand):
+    help = "Delete play events older than the retention period, one day at a time"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--days",
+            type=int,
+            default=None,
+            help="Days of play events to keep (default: PLAY_EVENTS['RETENTION_DAYS'])",
+        )
+
+    def handle(self, *args, **options):
+        days = options["days"] or get_play_events_settings()["RETENTION_DAYS"]
+        cutoff = timezone.localdate() - timedelta(days=days)
+
+        # Un DELETE por día: usa el índice (day, song) y mantiene las
+        # transacciones pequeñas
+        expired_days = (
+            PlayEventModel.objects.filter(day__lt=cutoff)
+            .values_list("day", flat=True)
+            .distinct()
+            .order_by("day")
+        )
+        total = 0
+        for day in list(expired_days):
+            deleted, _ = PlayEventModel.objects.filter(day=day).delete()
+            total += deleted
+            self.stdout.write(f"- {day}: {deleted} events")
+
+        self.stdout.write(
+            self.style.SUCCESS(f"Deleted {total} play events older than {cutoff}")
+        )
@@ -13,7 +13,11 @@ class Command(BaseCommand):
             "--limit",
             type=int,
             default=50,
-            help="Maximum number of songs to process (default: 50)",
+            help=(
+                "Maximum number of songs to process, 0 for all (default: 50). "
+                "Songs are taken in id order after the saved checkpoint, not by "
+                "popularity; each run continues where the previous one stopped"
+            ),
         )
         parser.add_argument(
             "--force",
@@ -23,24 +27,37 @@ class Command(BaseCommand):
         parser.add_argument(
             "--concurrent",
             type=int,
-            default=3,
-            help="Maximum number of concurrent requests (default: 3)",
+            default=None,
+            help="Maximum number of concurrent requests (default: LYRICS_BACKFILL)",
+        )
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=None,
+            help="Songs read from the database per query (default: LYRICS_BACKFILL)",
+        )
+        parser.add_argument(
+            "--restart",
+            action="store_true",
+            help="Ignore the saved checkpoint and start from the first song",
         )
         parser.add_argument(
             "--verbose", action="store_true", help="Show detailed progress information"
         )
 
     def handle(self, *args, **options):
-        limit = options["limit"]
+        limit = options["limit"] or None
         force_update = options["force"]
         max_concurrent = options["concurrent"]
+        restart = options["restart"]
         verbose = options["verbose"]
 
         if verbose:
             self.stdout.write(self.style.SUCCESS("Starting lyrics update process..."))
-            self.stdout.write(f"- Limit: {limit} songs")
+            self.stdout.write(f"- Limit: {limit or 'all'} songs")
             self.stdout.write(f"- Force update: {force_update}")
-            self.stdout.write(f"- Max concurrent: {max_concurrent}")
+            self.stdout.write(f"- Max concurrent: {max_concurrent or 'default'}")
+            self.stdout.write(f"- Resume from checkpoint: {not restart}")
 
         try:
             # Crear el use case
@@ -55,6 +72,8 @@ class Command(BaseCommand):
                     limit=limit,
                     only_without_lyrics=not force_update,
                     max_concurrent=max_concurrent,
+                    resume=not restart,
+                    chunk_size=options["chunk_size"],
                 )
             )
 
@@ -65,6 +84,13 @@ class Command(BaseCommand):
             self.stdout.write(f'   - Updated: {stats["updated"]}')
             self.stdout.write(f'   - Skipped: {stats["skipped"]}')
             self.stdout.write(f'   - Errors: {stats["errors"]}')
+            if "songs_per_second" in stats:
+                self.stdout.write(
+                    f'   - Throughput: {stats["songs_per_second"]} songs/s '
+                    f'({stats["elapsed_seconds"]}s)'
+                )
+            if stats.get("resumed_from"):
+                self.stdout.write(f'   - Resumed after song: {stats["resumed_from"]}')
 
             if stats.get("error_message"):
                 self.stdout.write(
@@ -76,5 +102,21 @@ class Command(BaseCommand):
                 success_rate = (stats["updated"] / stats["total_processed"]) * 100
                 self.stdout.write(f"   - Success rate: {success_rate:.1f}%")
 
+            sources = stats.get("sources") or {}
+            if sources:
+                self.stdout.write("🔎 Sources:")
+                for source, source_stats in sources.items():
+                    self.stdout.write(
+                        f'   - {source}: {source_stats["hits"]}/'
+                        f'{source_stats["attempts"]} '
+                        f'({source_stats["hit_rate"] * 100:.1f}% hit rate)'
+                    )
+
+            if stats.get("completed") is False and not stats.get("error_message"):
+                self.stdout.write(
+                    "⏸  Limit reached: run the command again to continue "
+                    "from the checkpoint"
+                )
+
         except Exception as e:
             raise CommandError(f"Error during lyrics update: {str(e)}")
@@ -0,0 +1,33 @@
+from django.core.management.base import BaseCommand
+
+from apps.songs.infrastructure.trending import (
+    rebase_trending_scores,
+    rebuild_trending_scores,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Rebase song trending scores to the current time and clear decayed ones "
+        "(run periodically, e.g. hourly)"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--rebuild",
+            action="store_true",
+            help="Recompute all trending scores from the play event log",
+        )
+
+    def handle(self, *args, **options):
+        if options["rebuild"]:
+            scored = rebuild_trending_scores()
+            self.stdout.write(
+                self.style.SUCCESS(f"Trending scores rebuilt ({scored} songs)")
+            )
+            return
+
+        cleared = rebase_trending_scores()
+        self.stdout.write(
+            self.style.SUCCESS(f"Trending scores updated ({cleared} cleared)")
+        )
@@ -0,0 +1,43 @@
+# Generated by Django 5.2.4 on 2026-10-19 03:36
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("songs", "0005_remove_songmodel_songs_album_t_6c7985_idx_and_more"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="PlayEventModel",
+            fields=[
+                ("id", models.BigAutoField(primary_key=True, serialize=False)),
+                ("played_at", models.DateTimeField()),
+                ("day", models.DateField()),
+                (
+                    "song",
+                    models.ForeignKey(
+                        db_index=False,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="play_events",
+                        to="songs.songmodel",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Reproducción",
+                "verbose_name_plural": "Reproducciones",
+                "db_table": "song_play_events",
+                "indexes": [
+                    models.Index(
+                        fields=["day", "song"], name="play_events_day_song_idx"
+                    ),
+                    models.Index(
+                        fields=["song", "played_at"], name="play_events_song_time_idx"
+                    ),
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,43 @@
+# Generated by Django 5.2.4 on 2026-10-19 03:40
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("albums", "0005_remove_albummodel_albums_artist__2d0263_idx_and_more"),
+        ("artists", "0004_remove_artistmodel_unique_artist_source_per_type_and_more"),
+        ("genres", "0001_initial"),
+        ("songs", "0006_playeventmodel"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="TrendingStateModel",
+            fields=[
+                (
+                    "id",
+                    models.PositiveSmallIntegerField(
+                        default=1, primary_key=True, serialize=False
+                    ),
+                ),
+                ("epoch", models.DateTimeField(default=django.utils.timezone.now)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                "verbose_name": "Estado de tendencias",
+                "verbose_name_plural": "Estado de tendencias",
+                "db_table": "song_trending_state",
+            },
+        ),
+        migrations.AddField(
+            model_name="songmodel",
+            name="trending_score",
+            field=models.FloatField(default=0),
+        ),
+        migrations.AddIndex(
+            model_name="songmodel",
+            index=models.Index(fields=["trending_score"], name="songs_trending_idx"),
+        ),
+    ]
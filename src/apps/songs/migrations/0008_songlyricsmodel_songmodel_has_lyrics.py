@@ -0,0 +1,44 @@
+# Generated by Django 5.2.4 on 2026-10-19 03:53
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("songs", "0007_songmodel_trending_score"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="SongLyricsModel",
+            fields=[
+                (
+                    "song",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="lyrics_entry",
+                        serialize=False,
+                        to="songs.songmodel",
+                    ),
+                ),
+                ("text", models.TextField()),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                "verbose_name": "Letra",
+                "verbose_name_plural": "Letras",
+                "db_table": "song_lyrics",
+            },
+        ),
+        migrations.AddField(
+            model_name="songmodel",
+            name="has_lyrics",
+            field=models.BooleanField(default=False),
+        ),
+        migrations.AddIndex(
+            model_name="songmodel",
+            index=models.Index(fields=["has_lyrics"], name="songs_has_lyrics_idx"),
+        ),
+    ]
@@ -0,0 +1,62 @@
+from django.db import migrations, transaction
+
+# Canciones por lote: cada lote es una transacción, así que la migración puede
+# reanudarse si se interrumpe (los lotes ya copiados se ignoran)
+BATCH_SIZE = 1000
+
+
+def copy_lyrics_to_table(apps, schema_editor):
+    """Copia songs.lyrics a song_lyrics y marca has_lyrics, por lotes de pk"""
+    SongModel = apps.get_model("songs", "SongModel")
+    SongLyricsModel = apps.get_model("songs", "SongLyricsModel")
+
+    songs = (
+        SongModel.objects.filter(lyrics__isnull=False).exclude(lyrics="").order_by("pk")
+    )
+    last_pk = None
+    while True:
+        batch = songs if last_pk is None else songs.filter(pk__gt=last_pk)
+        rows = list(batch.values_list("pk", "lyrics")[:BATCH_SIZE])
+        if not rows:
+            return
+        with transaction.atomic():
+            SongLyricsModel.objects.bulk_create(
+                [SongLyricsModel(song_id=pk, text=text) for pk, text in rows],
+                ignore_conflicts=True,
+            )
+            SongModel.objects.filter(pk__in=[pk for pk, _ in rows]).update(
+                has_lyrics=True
+            )
+        last_pk = rows[-1][0]
+
+
+def copy_lyrics_to_songs(apps, schema_editor):
+    """Operación inversa: devuelve las letras a songs.lyrics"""
+    SongModel = apps.get_model("songs", "SongModel")
+    SongLyricsModel = apps.get_model("songs", "SongLyricsModel")
+
+    last_pk = None
+    while True:
+        entries = SongLyricsModel.objects.order_by("pk")
+        if last_pk is not None:
+            entries = entries.filter(pk__gt=last_pk)
+        rows = list(entries.values_list("pk", "text")[:BATCH_SIZE])
+        if not rows:
+            return
+        with transaction.atomic():
+            SongModel.objects.bulk_update(
+                [SongModel(pk=pk, lyrics=text) for pk, text in rows], ["lyrics"]
+            )
+        last_pk = rows[-1][0]
+
+
+class Migration(migrations.Migration):
+    atomic = False
+
+    dependencies = [
+        ("songs", "0008_songlyricsmodel_songmodel_has_lyrics"),
+    ]
+
+    operations = [
+        migrations.RunPython(copy_lyrics_to_table, copy_lyrics_to_songs),
+    ]
@@ -0,0 +1,16 @@
+# Generated by Django 5.2.4 on 2026-10-19 03:53
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("songs", "0009_backfill_song_lyrics"),
+    ]
+
+    operations = [
+        migrations.RemoveField(
+            model_name="songmodel",
+            name="lyrics",
+        ),
+    ]
@@ -0,0 +1,30 @@
+# Generated by Django 5.2.4 on 2026-10-19 04:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("songs", "0010_remove_songmodel_lyrics"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="LyricsBackfillCheckpointModel",
+            fields=[
+                (
+                    "name",
+                    models.CharField(max_length=50, primary_key=True, serialize=False),
+                ),
+                ("last_song_id", models.UUIDField(blank=True, null=True)),
+                ("processed", models.PositiveIntegerField(default=0)),
+                ("updated", models.PositiveIntegerField(default=0)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                "verbose_name": "Progreso de letras",
+                "verbose_name_plural": "Progreso de letras",
+                "db_table": "song_lyrics_backfill",
+            },
+        ),
+    ]
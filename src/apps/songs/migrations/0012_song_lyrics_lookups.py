@@ -0,0 +1,51 @@
+# Generated by Django 5.2.4 on 2026-10-19 04:04
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("songs", "0011_lyrics_backfill_checkpoint"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="SongLyricsLookupModel",
+            fields=[
+                (
+                    "song",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="lyrics_lookup",
+                        serialize=False,
+                        to="songs.songmodel",
+                    ),
+                ),
+                (
+                    "outcome",
+                    models.CharField(
+                        choices=[
+                            ("found", "Encontrada"),
+                            ("not_found", "No encontrada"),
+                            ("error", "Error"),
+                        ],
+                        max_length=20,
+                    ),
+                ),
+                ("sources_tried", models.JSONField(blank=True, default=list)),
+                ("misses", models.PositiveIntegerField(default=0)),
+                ("last_attempt_at", models.DateTimeField()),
+                (
+                    "next_attempt_at",
+                    models.DateTimeField(blank=True, db_index=True, null=True),
+                ),
+            ],
+            options={
+                "verbose_name": "Búsqueda de letra",
+                "verbose_name_plural": "Búsquedas de letras",
+                "db_table": "song_lyrics_lookups",
+            },
+        ),
+    ]
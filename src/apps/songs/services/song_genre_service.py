@@ -93,7 +93,8 @@ class SongGenreService(LoggingMixin):
             # Asignar géneros a la canción
             song.genres.set(genre_objects)
             song.genre_names = [genre.name for genre in genre_objects]
-            await song.asave(update_fields=["genre_names"])
+            # updated_at también, para que los ETags del detalle reflejen el cambio
+            await song.asave(update_fields=["genre_names", "updated_at"])
 
             self.logger.info(
                 f"Géneros asignados a '{song.title}': "
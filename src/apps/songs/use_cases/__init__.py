@@ -1,7 +1,10 @@
 from .get_most_played_songs_use_case import GetMostPlayedSongsUseCase
 from .get_random_songs_use_case import GetRandomSongsUseCase
 from .get_songs_by_album_use_case import GetSongsByAlbumUseCase
+from .get_song_play_history_use_case import GetSongPlayHistoryUseCase
 from .get_songs_by_artist_use_case import GetSongsByArtistUseCase
+from .get_trending_songs_use_case import GetTrendingSongsUseCase
+from .import_songs_use_case import ImportSongsUseCase
 from .increment_play_count_use_case import IncrementPlayCountUseCase
 from .save_track_as_song_use_case import SaveTrackAsSongUseCase
 from .search_songs_use_case import SearchSongsUseCase
@@ -13,5 +16,8 @@ __all__ = [
     "GetSongsByAlbumUseCase",
     "GetMostPlayedSongsUseCase",
     "IncrementPlayCountUseCase",
+    "GetSongPlayHistoryUseCase",
+    "GetTrendingSongsUseCase",
     "SaveTrackAsSongUseCase",
+    "ImportSongsUseCase",
 ]
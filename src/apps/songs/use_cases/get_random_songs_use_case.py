@@ -103,6 +103,15 @@ class GetRandomSongsUseCase(BaseUseCase[RandomSongsRequestDTO, List[SongEntity]]
                     )
                     return None
 
+        # Artistas y álbumes de todos los tracks en un solo lote: cada
+        # SaveTrackAsSongUseCase los encuentra después en la caché del resolver
+        try:
+            await SaveTrackAsSongUseCase(self.song_repository).prefetch_artists_albums(
+                tracks
+            )
+        except Exception as e:
+            self.logger.warning(f"Failed to prefetch artists and albums: {str(e)}")
+
         tasks = [process_single_track(track) for track in tracks]
         results = await asyncio.gather(*tasks, return_exceptions=True)
 
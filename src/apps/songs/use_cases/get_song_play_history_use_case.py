@@ -0,0 +1,51 @@
+from datetime import timedelta
+from typing import Any, Dict, List
+
+from django.utils import timezone
+
+from common.interfaces.ibase_use_case import BaseUseCase
+from common.utils.logging_decorators import log_execution, log_performance
+
+from ..api.dtos import SongPlayHistoryRequestDTO
+from ..domain.repository import ISongRepository
+
+
+class GetSongPlayHistoryUseCase(
+    BaseUseCase[SongPlayHistoryRequestDTO, List[Dict[str, Any]]]
+):
+    """Caso de uso para obtener las reproducciones de una canción por hora o día"""
+
+    def __init__(self, repository: ISongRepository):
+        super().__init__()
+        self.repository = repository
+
+    @log_execution(include_args=True, include_result=False, log_level="DEBUG")
+    @log_performance(
+        threshold_seconds=1.0
+    )  # Agregación sobre el índice (song, played_at)
+    async def execute(
+        self, request_dto: SongPlayHistoryRequestDTO
+    ) -> List[Dict[str, Any]]:
+        """
+        Obtiene las reproducciones de los últimos ``days`` días
+
+        Args:
+            request_dto: DTO con song_id, granularity y days
+
+        Returns:
+            Lista de ``{"period", "plays"}`` ordenada por periodo
+        """
+        since = timezone.now() - timedelta(days=request_dto.days)
+        if request_dto.granularity == "day":
+            # Días completos: desde el inicio del primer día local
+            since = timezone.localtime(since).replace(
+                hour=0, minute=0, second=0, microsecond=0
+            )
+
+        history = await self.repository.get_play_counts(
+            request_dto.song_id, since, request_dto.granularity
+        )
+        self.logger.debug(
+            f"Found {len(history)} {request_dto.granularity} buckets for song: {request_dto.song_id}"
+        )
+        return history
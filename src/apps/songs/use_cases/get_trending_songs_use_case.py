@@ -0,0 +1,33 @@
+from typing import List
+
+from common.interfaces.ibase_use_case import BaseUseCase
+from common.utils.logging_decorators import log_execution, log_performance
+
+from ..domain.entities import SongEntity
+from ..domain.repository import ISongRepository
+
+
+class GetTrendingSongsUseCase(BaseUseCase[None, List[SongEntity]]):
+    """Caso de uso para obtener las canciones en tendencia"""
+
+    def __init__(self, repository: ISongRepository):
+        super().__init__()
+        self.repository = repository
+
+    @log_execution(include_args=True, include_result=False, log_level="DEBUG")
+    @log_performance(threshold_seconds=1.0)  # Lectura del índice de trending_score
+    async def execute(self, limit: int = 20) -> List[SongEntity]:
+        """
+        Obtiene las canciones en tendencia (reproducciones recientes con decaimiento)
+
+        Args:
+            limit: Límite de resultados
+
+        Returns:
+            Lista de canciones ordenada por puntuación de tendencia
+        """
+        self.logger.debug(f"Getting trending songs with limit: {limit}")
+        songs = await self.repository.get_trending(limit)
+
+        self.logger.info(f"Found {len(songs)} trending songs")
+        return songs
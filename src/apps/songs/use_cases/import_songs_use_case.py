@@ -0,0 +1,37 @@
+from typing import Optional
+
+from common.mixins.logging_mixin import LoggingMixin
+
+from ..domain.song_import import DEFAULT_SOURCE_TYPE
+from ..infrastructure.song_import import SongImporter
+
+
+class ImportSongsUseCase(LoggingMixin):
+    """Use case para importar canciones en masa desde un manifiesto"""
+
+    async def execute(
+        self,
+        path: str,
+        format: Optional[str] = None,
+        limit: Optional[int] = None,
+        dry_run: bool = False,
+        batch_size: Optional[int] = None,
+        upload_concurrency: Optional[int] = None,
+        media_root: Optional[str] = None,
+        default_source_type: str = DEFAULT_SOURCE_TYPE,
+    ) -> dict:
+        """
+        Importa las canciones del manifiesto ``path``.
+
+        Las ya existentes (mismo ``source_type`` y ``source_id``) se omiten, así
+        que repetir la importación continúa donde terminó la anterior.
+        """
+        self.logger.info(f"Iniciando importación de canciones desde {path}")
+        importer = SongImporter(
+            batch_size=batch_size,
+            upload_concurrency=upload_concurrency,
+            media_root=media_root,
+            default_source_type=default_source_type,
+        )
+        stats = await importer.run(path, format=format, limit=limit, dry_run=dry_run)
+        return stats.to_dict()
@@ -40,19 +40,23 @@ class IncrementPlayCountUseCase(
                 f"Incrementing play count for song: {request_dto.song_id}"
             )
 
-            success = await self.repository.increment_play_count(request_dto.song_id)
-            if success:
-                song = await self.repository.get_by_id(request_dto.song_id)
-                self.logger.info(
-                    f"Successfully incremented play count for song: {request_dto.song_id}"
-                )
-                return song
-            else:
+            song = await self.repository.get_by_id(request_dto.song_id)
+            if not song:
                 self.logger.warning(
                     f"Failed to increment play count for song: {request_dto.song_id}"
                 )
                 return None
 
+            await self.repository.increment_play_count(request_dto.song_id)
+            # El contador se vuelca por lotes: se suman las reproducciones pendientes
+            song.play_count += await self.repository.get_pending_play_count(
+                request_dto.song_id
+            )
+            self.logger.info(
+                f"Successfully incremented play count for song: {request_dto.song_id}"
+            )
+            return song
+
         except Exception as e:
             self.logger.error(
                 f"Error incrementing play count for song {request_dto.song_id}: {str(e)}"
@@ -1,7 +1,9 @@
-from common.adapters.lyrics import LyricsUpdateService
+from typing import Optional
+
+from common.adapters.lyrics import LyricsService
 from common.mixins.logging_mixin import LoggingMixin
 
-from ...infrastructure.models.song_model import SongModel
+from ...infrastructure.lyrics_backfill import LyricsBackfill
 
 
 class BulkUpdateLyricsUseCase(LoggingMixin):
@@ -9,28 +11,35 @@ class BulkUpdateLyricsUseCase(LoggingMixin):
 
     def __init__(self):
         super().__init__()
-        self.lyrics_update_service = LyricsUpdateService()
+        self.lyrics_service = LyricsService()
 
     async def execute(
-        self, limit: int = 50, only_without_lyrics: bool = True, max_concurrent: int = 3
+        self,
+        limit: Optional[int] = 50,
+        only_without_lyrics: bool = True,
+        max_concurrent: Optional[int] = None,
+        resume: bool = True,
+        chunk_size: Optional[int] = None,
     ) -> dict:
         """
         Actualiza letras para múltiples canciones.
+
+        Con ``resume`` continúa donde terminó la ejecución anterior;
+        ``limit=None`` recorre todo el catálogo.
         """
         try:
-            queryset = SongModel.objects.select_related("artist").order_by(
-                "-play_count"
-            )
-            if only_without_lyrics:
-                queryset = queryset.filter(lyrics__isnull=True)
-            queryset = queryset[:limit]
             self.logger.info(
-                f"Iniciando actualización masiva de letras para {limit} canciones"
+                f"Iniciando actualización masiva de letras (límite: {limit})"
+            )
+            backfill = LyricsBackfill(
+                self.lyrics_service,
+                concurrency=max_concurrent,
+                chunk_size=chunk_size,
             )
-            stats = await self.lyrics_update_service.bulk_update_lyrics(
-                queryset, max_concurrent=max_concurrent
+            stats = await backfill.run(
+                limit=limit, only_without_lyrics=only_without_lyrics, resume=resume
             )
-            return stats
+            return stats.to_dict()
         except Exception as e:
             self.logger.error(f"Error en actualización masiva de letras: {str(e)}")
             return {
@@ -1,15 +1,24 @@
 import traceback
 from typing import Optional
 
+from django.utils import timezone
+
+from apps.songs.domain.entities import SongEntity
 from apps.songs.domain.exceptions import SongNotFoundException
+from apps.songs.domain.lyrics_lookup import ERROR, FOUND, NOT_FOUND
 from apps.songs.domain.repository.Isong_repository import ISongRepository
 from common.mixins.logging_mixin import LoggingMixin
 from common.services.lyrics_manager import LyricsManager
+from common.utils.single_flight import SingleFlight
 
 
 class GetSongLyricsUseCase(LoggingMixin):
     """Use case para obtener letras de una canción"""
 
+    # Búsquedas en curso por canción, compartidas por todas las peticiones del
+    # proceso: las simultáneas esperan a la primera en vez de repetirla
+    _in_flight: SingleFlight[Optional[str]] = SingleFlight()
+
     def __init__(self, song_repository: ISongRepository):
         super().__init__()
         self.lyrics_manager = LyricsManager()
@@ -18,28 +27,31 @@ class GetSongLyricsUseCase(LoggingMixin):
     async def execute(self, song_id: str) -> Optional[str]:
         """
         Obtiene las letras de una canción.
+
+        Si no las tiene se buscan, salvo que una búsqueda reciente no las
+        encontrara (ver ``domain.lyrics_lookup``).
         """
         try:
             song = await self.song_repository.get_by_id(song_id)
             if not song:
                 raise SongNotFoundException(f"Canción con ID {song_id} no encontrada")
-            if song.lyrics:
-                self.logger.debug(f"Letras encontradas en BD para: {song.title}")
-                return song.lyrics
-            self.logger.info(f"Buscando letras para: {song.title}")
-            lyrics = await self.lyrics_manager.get_lyrics(
-                title=song.title,
-                artist=song.artist_name if song.artist_name else "Unknown Artist",
-                youtube_id=song.source_id if song.source_type == "youtube" else None,
-            )
-            if lyrics:
-                song.lyrics = lyrics
-                await self.song_repository.save(song)
-                self.logger.info(f"Letras guardadas para: {song.title}")
-                return lyrics
-            else:
-                self.logger.warning(f"No se encontraron letras para: {song.title}")
+            if song.has_lyrics:
+                lyrics = await self.song_repository.get_lyrics(song_id)
+                if lyrics:
+                    self.logger.debug(f"Letras encontradas en BD para: {song.title}")
+                    return lyrics
+
+            attempt = await self.song_repository.get_lyrics_lookup(song_id)
+            if attempt and not attempt.is_due(timezone.now()):
+                self.logger.debug(
+                    f"Búsqueda de letras aplazada hasta {attempt.next_attempt_at} "
+                    f"para: {song.title}"
+                )
                 return None
+
+            return await self._in_flight.do(
+                str(song_id), lambda: self._search_lyrics(song)
+            )
         except SongNotFoundException:
             self.logger.error(f"Canción con ID {song_id} no encontrada")
             return None
@@ -49,3 +61,30 @@ class GetSongLyricsUseCase(LoggingMixin):
                 f"Error obteniendo letras para canción {song_id}: {str(e)}"
             )
             return None
+
+    async def _search_lyrics(self, song: SongEntity) -> Optional[str]:
+        """Busca la letra en las fuentes externas y registra el resultado"""
+        self.logger.info(f"Buscando letras para: {song.title}")
+        try:
+            lookup = await self.lyrics_manager.find_lyrics(
+                title=song.title,
+                artist=song.artist_name if song.artist_name else "Unknown Artist",
+                youtube_id=song.source_id if song.source_type == "youtube" else None,
+            )
+        except Exception:
+            await self.song_repository.record_lyrics_lookup(song.id, ERROR, [])
+            raise
+
+        if lookup.lyrics:
+            await self.song_repository.save_lyrics(song.id, lookup.lyrics)
+            await self.song_repository.record_lyrics_lookup(
+                song.id, FOUND, lookup.sources_tried
+            )
+            self.logger.info(f"Letras guardadas para: {song.title}")
+            return lookup.lyrics
+
+        await self.song_repository.record_lyrics_lookup(
+            song.id, NOT_FOUND, lookup.sources_tried
+        )
+        self.logger.warning(f"No se encontraron letras para: {song.title}")
+        return None
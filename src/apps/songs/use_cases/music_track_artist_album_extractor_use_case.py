@@ -1,33 +1,22 @@
 import re
-from typing import Dict, Optional
+from typing import Dict, List, Optional, Sequence
 
 from common.interfaces.ibase_use_case import BaseUseCase
 from common.types.media_types import MusicTrackData
 from common.utils.logging_decorators import log_execution, log_performance
 
-from ...albums.domain.repository import IAlbumRepository
-from ...albums.use_cases.save_album_use_case import SaveAlbumUseCase
-from ...artists.domain.repository import IArtistRepository
-from ...artists.use_cases.save_artist_use_case import SaveArtistUseCase
+from ..infrastructure.artist_album_resolver import (
+    ArtistAlbumRequest,
+    resolve_artists_albums,
+)
 
 
 class MusicTrackArtistAlbumExtractorUseCase(BaseUseCase[MusicTrackData, Dict]):
     """Caso de uso para extraer y guardar información de artistas y álbumes desde tracks de música"""
 
-    def __init__(
-        self, artist_repository: IArtistRepository, album_repository: IAlbumRepository
-    ):
-        super().__init__()
-        self.artist_repository = artist_repository
-        self.album_repository = album_repository
-
-        # Casos de uso para guardar
-        self.save_artist_use_case = SaveArtistUseCase(artist_repository)
-        self.save_album_use_case = SaveAlbumUseCase(album_repository)
-
     @log_execution(include_args=True, include_result=False, log_level="DEBUG")
     @log_performance(threshold_seconds=2.0)  # Reduced threshold for better monitoring
-    async def execute(self, track: MusicTrackData) -> Dict:
+    async def execute(self, track: MusicTrackData) -> Dict[str, Optional[str]]:
         """
         Extrae y guarda información de artista y álbum desde un track de música
 
@@ -43,74 +32,89 @@ class MusicTrackArtistAlbumExtractorUseCase(BaseUseCase[MusicTrackData, Dict]):
                 "album_title": str (opcional)
             }
         """
-        result = {
-            "artist_id": None,
-            "album_id": None,
-            "artist_name": None,
-            "album_title": None,
-        }
+        return (await self.execute_many([track]))[0]
 
-        try:
+    @log_performance(threshold_seconds=2.0)
+    async def execute_many(
+        self, tracks: Sequence[MusicTrackData]
+    ) -> List[Dict[str, Optional[str]]]:
+        """
+        Como ``execute`` para varios tracks: los artistas y álbumes se resuelven
+        en lote (ver ``infrastructure.artist_album_resolver``)
+
+        Returns:
+            Un diccionario por track, en el mismo orden
+        """
+        results: List[Dict[str, Optional[str]]] = [
+            {
+                "artist_id": None,
+                "album_id": None,
+                "artist_name": None,
+                "album_title": None,
+            }
+            for _ in tracks
+        ]
+
+        requests: List[ArtistAlbumRequest] = []
+        positions: List[int] = []
+        for position, track in enumerate(tracks):
             # Early validation
             if not track or not track.title:
                 self.logger.warning("Invalid track data provided")
-                return result
-
-            # 1. Extraer y procesar información del artista
-            try:
-                artist_info = self._extract_artist_info(track)
-                if artist_info:
-                    saved_artist = await self.save_artist_use_case.execute(artist_info)
-                    if saved_artist:
-                        result["artist_id"] = saved_artist.id
-                        result["artist_name"] = saved_artist.name
-                        self.logger.info(
-                            f"✅ Artist processed: {saved_artist.name} (ID: {saved_artist.id})"
-                        )
-                    else:
-                        self.logger.warning(
-                            f"⚠️  Failed to save artist: {artist_info.get('name', 'Unknown')}"
-                        )
-                else:
-                    self.logger.info("No artist information found in track")
-            except Exception as e:
-                self.logger.warning(f"Artist processing failed: {str(e)}")
-
-            # 2. Extraer y procesar información del álbum (solo si hay artista y título de álbum)
-            if result["artist_id"] and result["artist_name"] and track.album_title:
-                try:
-                    album_info = self._extract_album_info(
-                        track, result["artist_id"], result["artist_name"]
-                    )
-                    if album_info:
-                        saved_album = await self.save_album_use_case.execute(album_info)
-                        if saved_album:
-                            result["album_id"] = saved_album.id
-                            result["album_title"] = saved_album.title
-                            self.logger.info(
-                                f"✅ Album processed: {saved_album.title} (ID: {saved_album.id})"
-                            )
-                        else:
-                            self.logger.warning(
-                                f"⚠️  Failed to save album: {album_info.get('title', 'Unknown')}"
-                            )
-                    else:
-                        self.logger.info("No valid album information extracted")
-                except Exception as e:
-                    self.logger.warning(f"Album processing failed: {str(e)}")
+                continue
+            request = self._build_request(track)
+            if request:
+                requests.append(request)
+                positions.append(position)
             else:
-                if not result["artist_id"]:
-                    self.logger.info("Skipping album processing: no artist ID")
-                elif not track.album_title:
-                    self.logger.info(
-                        "Skipping album processing: no album title in track"
-                    )
+                self.logger.info("No artist information found in track")
 
-            return result
+        if not requests:
+            return results
 
+        try:
+            resolved = await resolve_artists_albums(requests)
         except Exception as e:
             self.logger.error(f"Error processing track artist/album info: {str(e)}")
-            return result
+            return results
+
+        for position, request, ref in zip(positions, requests, resolved):
+            results[position].update(
+                artist_id=ref.artist_id,
+                artist_name=ref.artist_name,
+                album_id=ref.album_id,
+                album_title=ref.album_title,
+            )
+            if ref.artist_id:
+                self.logger.debug(
+                    f"Artist processed: {ref.artist_name} (ID: {ref.artist_id})"
+                )
+            else:
+                self.logger.warning(f"Failed to save artist: {request.artist_name}")
+            if request.album_title and not ref.album_id:
+                self.logger.warning(f"Failed to save album: {request.album_title}")
+
+        return results
+
+    def _build_request(self, track: MusicTrackData) -> Optional[ArtistAlbumRequest]:
+        """Artista y álbum limpios del track, o None si no tiene artista"""
+        artist_info = self._extract_artist_info(track)
+        if not artist_info:
+            return None
+
+        album_title = None
+        if track.album_title:
+            album_title = (
+                self._clean_album_title(track.album_title, track.title) or None
+            )
+
+        return ArtistAlbumRequest(
+            artist_name=artist_info["name"],
+            album_title=album_title,
+            artist_image_url=artist_info.get("image_url"),
+            # Usar thumbnail como portada temporal
+            album_cover_url=track.thumbnail_url,
+        )
 
     def _extract_artist_info(self, track: MusicTrackData) -> Optional[Dict]:
         """
@@ -149,46 +153,6 @@ class MusicTrackArtistAlbumExtractorUseCase(BaseUseCase[MusicTrackData, Dict]):
             self.logger.warning(f"Error extracting artist info: {str(e)}")
             return None
 
-    def _extract_album_info(
-        self, track: MusicTrackData, artist_id: str, artist_name: str
-    ) -> Optional[Dict]:
-        """
-        Extrae información del álbum desde el track
-
-        Args:
-            track: Datos del track
-            artist_id: ID del artista
-            artist_name: Nombre del artista
-
-        Returns:
-            Diccionario con información del álbum o None
-        """
-        try:
-            album_title = track.album_title
-            if not album_title:
-                return None
-
-            # Limpiar el título del álbum
-            album_title = self._clean_album_title(album_title, track.title)
-            if not album_title:
-                return None
-
-            album_data = {
-                "title": album_title,
-                "artist_id": artist_id,
-                "artist_name": artist_name,
-                "cover_image_url": track.thumbnail_url,  # Usar thumbnail como portada temporal
-                "source_type": "youtube",
-                "source_id": f"{track.video_id}_album",  # ID único para el álbum basado en el video
-                "source_url": track.url,
-            }
-
-            return album_data
-
-        except Exception as e:
-            self.logger.warning(f"Error extracting album info: {str(e)}")
-            return None
-
     def _extract_channel_info(self, track: MusicTrackData) -> Optional[Dict]:
         """
         Extrae información del canal de YouTube desde los tags o URL
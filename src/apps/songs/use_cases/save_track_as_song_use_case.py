@@ -1,11 +1,9 @@
-from typing import List, Optional, Union
+from typing import List, Optional, Sequence, Union
 
 from common.interfaces.ibase_use_case import BaseUseCase
 from common.types.media_types import AudioTrackData, MusicTrackData
 from common.utils.logging_decorators import log_execution, log_performance
 
-from ...albums.infrastructure.repository.album_repository import AlbumRepository
-from ...artists.infrastructure.repository.artist_repository import ArtistRepository
 from ...genres.services.music_genre_analyzer import MusicGenreAnalyzer
 from ..domain.entities import SongEntity
 from ..domain.repository import ISongRepository
@@ -40,14 +38,8 @@ class SaveTrackAsSongUseCase(
         # Servicios específicos que se mantienen aquí
         self.genre_analyzer = MusicGenreAnalyzer()
 
-        # Repositorios para artistas y álbumes
-        self.artist_repository = ArtistRepository()
-        self.album_repository = AlbumRepository()
-
         # Extractor para procesar información de artistas y álbumes
-        self.artist_album_extractor = MusicTrackArtistAlbumExtractorUseCase(
-            self.artist_repository, self.album_repository
-        )
+        self.artist_album_extractor = MusicTrackArtistAlbumExtractorUseCase()
 
     @log_execution(include_args=True, include_result=False, log_level="DEBUG")
     @log_performance(
@@ -89,16 +81,31 @@ class SaveTrackAsSongUseCase(
                 artist_album_info.get("artist_id"),
                 artist_album_info.get("album_id"),
             )
+            # Nombres guardados del artista y álbum, para no recargar la canción
+            song_entity.artist_name = artist_album_info.get("artist_name")
+            song_entity.album_title = artist_album_info.get("album_title")
 
             # 4. Guardar en base de datos
             return await self.database_service.save_song_to_database(
-                song_entity, music_track.title
+                song_entity, music_track.title, reload=False
             )
 
         except Exception as e:
             self.logger.error(f"Error saving track as song: {str(e)}")
             return None
 
+    async def prefetch_artists_albums(
+        self, tracks: Sequence[Union[MusicTrackData, AudioTrackData]]
+    ) -> None:
+        """
+        Resuelve en lote los artistas y álbumes de varios tracks; los
+        ``execute`` posteriores los encuentran en la caché del resolver
+        """
+        music_tracks = [
+            self.data_converter.convert_to_music_track_data(track) for track in tracks
+        ]
+        await self.artist_album_extractor.execute_many(music_tracks)
+
     async def _process_artist_album_info(self, music_track: MusicTrackData) -> dict:
         """
         Procesa información de artistas y álbumes
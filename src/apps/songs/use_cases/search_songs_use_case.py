@@ -55,13 +55,19 @@ class SearchSongsUseCase(BaseUseCase[SongSearchRequestDTO, List[SongEntity]]):
             )
 
             # Guardar nuevas canciones encontradas
+            new_tracks = []
             for track in youtube_tracks:
                 existing_song = await self.song_repository.get_by_source(
                     "youtube", track.video_id
                 )
-
                 if not existing_song:
-                    save_track_use_case = SaveTrackAsSongUseCase(self.song_repository)
+                    new_tracks.append(track)
+
+            if new_tracks:
+                save_track_use_case = SaveTrackAsSongUseCase(self.song_repository)
+                # Artistas y álbumes de todos los tracks en un solo lote
+                await save_track_use_case.prefetch_artists_albums(new_tracks)
+                for track in new_tracks:
                     new_song = await save_track_use_case.execute(track)
                     if new_song:
                         local_songs.append(new_song)
@@ -17,7 +17,7 @@ class SongDatabaseService:
         self.song_repository = song_repository
 
     async def save_song_to_database(
-        self, song_entity: SongEntity, title: str
+        self, song_entity: SongEntity, title: str, reload: bool = True
     ) -> Optional[SongEntity]:
         """
         Guarda la canción en la base de datos
@@ -25,12 +25,13 @@ class SongDatabaseService:
         Args:
             song_entity: Entidad de canción a guardar
             title: Título de la canción para logs
+            reload: Si False, no se vuelve a leer la canción guardada
 
         Returns:
             Entidad guardada o None si falla
         """
         try:
-            saved_song = await self.song_repository.save(song_entity)
+            saved_song = await self.song_repository.save(song_entity, reload=reload)
 
             if saved_song:
                 self.logger.info(
@@ -1,16 +1,10 @@
 import json
-from datetime import timedelta
 
 from django.contrib import admin
-from django.db.models import Sum
-from django.db.models.functions import TruncDate
 from django.shortcuts import render
-from django.utils import timezone
-
-from apps.artists.infrastructure.models.artist_model import ArtistModel
-from apps.songs.infrastructure.models.song_model import SongModel
 
 from .models import StatisticsModel
+from .services import PlayStatisticsService
 
 
 class StatisticsAdmin(admin.ModelAdmin):
@@ -28,27 +22,22 @@ class StatisticsAdmin(admin.ModelAdmin):
     def changelist_view(self, request, extra_context=None):
         """Vista personalizada para mostrar estadísticas con gráficos mejorados"""
 
-        # Top 10 artistas y canciones
-        top_artists = (
-            ArtistModel.objects.annotate(total_plays=Sum("songs__play_count"))
-            .filter(total_plays__gt=0)
-            .order_by("-total_plays")[:10]
-        )
-
-        top_songs = (
-            SongModel.objects.select_related("artist")
-            .filter(play_count__gt=0)
-            .order_by("-play_count")[:10]
-        )
+        # Filas precalculadas: el coste no depende del tamaño del catálogo
+        dashboard = PlayStatisticsService().get_dashboard(days=14, top=10)
+        catalog = dashboard["catalog"]
+        top_artists = dashboard["top_artists"]
+        top_songs = dashboard["top_songs"]
 
         artists_data = {
             "labels": [
-                artist.name[:30] + "..." if len(artist.name) > 30 else artist.name
+                (
+                    artist["name"][:30] + "..."
+                    if len(artist["name"]) > 30
+                    else artist["name"]
+                )
                 for artist in top_artists
             ],
-            "data": [
-                artist.__dict__.get("total_plays", 0) or 0 for artist in top_artists
-            ],
+            "data": [artist["total_plays"] for artist in top_artists],
         }
 
         songs_data = {
@@ -60,38 +49,12 @@ class StatisticsAdmin(admin.ModelAdmin):
         }
 
         # === Estadísticas generales ===
-        total_songs = SongModel.objects.count()
-        total_artists = ArtistModel.objects.count()
-        total_plays = SongModel.objects.aggregate(total=Sum("play_count"))["total"] or 0
-        avg_plays_per_song = round(
-            (total_plays or 0)
-            / max(SongModel.objects.filter(play_count__gt=0).count(), 1)
-        )
-
-        # === Sparkline y tendencia semanal ===
-        today = timezone.now().date()
-        days = 14  # 7 días actuales + 7 previos
-
-        # Agrupar reproducciones por día (últimos 14 días)
-        plays_by_day_qs = (
-            SongModel.objects.filter(
-                created_at__date__gte=today - timedelta(days=days - 1)
-            )
-            .annotate(day=TruncDate("created_at"))
-            .values("day")
-            .order_by("day")
-            .annotate(total=Sum("play_count"))
-        )
-        # Dict {fecha: total}
-        plays_by_day = {item["day"]: item["total"] for item in plays_by_day_qs}
+        avg_plays_per_song = round(catalog.total_plays / max(catalog.played_songs, 1))
 
-        # Completar días faltantes con 0
-        sparkline_labels = []
-        sparkline_data = []
-        for i in range(days):
-            day = today - timedelta(days=days - 1 - i)
-            sparkline_labels.append(day.strftime("%d-%b"))
-            sparkline_data.append(plays_by_day.get(day, 0))
+        # === Sparkline y tendencia semanal (7 días actuales + 7 previos) ===
+        daily_plays = dashboard["daily_plays"]
+        sparkline_labels = [item["day"].strftime("%d-%b") for item in daily_plays]
+        sparkline_data = [item["plays"] for item in daily_plays]
 
         # Suma semana actual y anterior
         last_week_sum = sum(sparkline_data[7:14])
@@ -102,9 +65,9 @@ class StatisticsAdmin(admin.ModelAdmin):
             trend = 0.0
 
         stats_summary = {
-            "total_songs": total_songs,
-            "total_artists": total_artists,
-            "total_plays": total_plays,
+            "total_songs": catalog.total_songs,
+            "total_artists": catalog.total_artists,
+            "total_plays": catalog.total_plays,
             "avg_plays_per_song": avg_plays_per_song,
             "trend": trend,
             "sparkline_data": sparkline_data,
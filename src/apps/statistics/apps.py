@@ -5,3 +5,7 @@ class StatisticsConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "apps.statistics"
     verbose_name = "Estadísticas"
+
+    def ready(self):
+        # Mantenimiento incremental de las estadísticas
+        from .infrastructure import signals  # noqa: F401
@@ -0,0 +1,10 @@
+from .artist_play_stats_model import ArtistPlayStatsModel
+from .catalog_stats_model import CatalogStatsModel
+from .daily_play_stats_model import DailyPlayTotalModel, DailySongPlaysModel
+
+__all__ = [
+    "ArtistPlayStatsModel",
+    "CatalogStatsModel",
+    "DailyPlayTotalModel",
+    "DailySongPlaysModel",
+]
@@ -0,0 +1,25 @@
+from django.db import models
+
+
+class ArtistPlayStatsModel(models.Model):
+    """Reproducciones acumuladas por artista (ranking de artistas)"""
+
+    artist = models.OneToOneField(
+        "artists.ArtistModel",
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name="play_stats",
+    )
+    total_plays = models.BigIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = "statistics_artist_plays"
+        verbose_name = "Reproducciones por artista"
+        verbose_name_plural = "Reproducciones por artista"
+        indexes = [
+            models.Index(fields=["-total_plays"], name="stats_artist_top_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.artist_id}: {self.total_plays}"
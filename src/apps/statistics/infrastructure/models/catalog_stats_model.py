@@ -0,0 +1,26 @@
+from django.db import models
+
+
+class CatalogStatsModel(models.Model):
+    """
+    Totales del catálogo en una única fila (``id=1``), mantenidos de forma
+    incremental para que el dashboard no cuente ni sume la tabla de canciones.
+    """
+
+    SINGLETON_ID = 1
+
+    id = models.PositiveSmallIntegerField(primary_key=True, default=SINGLETON_ID)
+    total_songs = models.BigIntegerField(default=0)
+    total_artists = models.BigIntegerField(default=0)
+    total_plays = models.BigIntegerField(default=0)
+    # Canciones con al menos una reproducción (para la media por canción)
+    played_songs = models.BigIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = "statistics_catalog"
+        verbose_name = "Totales del catálogo"
+        verbose_name_plural = "Totales del catálogo"
+
+    def __str__(self):
+        return f"{self.total_songs} canciones, {self.total_plays} reproducciones"
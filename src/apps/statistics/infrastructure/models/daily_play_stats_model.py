@@ -0,0 +1,44 @@
+from django.db import models
+
+
+class DailySongPlaysModel(models.Model):
+    """Reproducciones de una canción en un día (fecha local de la reproducción)"""
+
+    day = models.DateField()
+    song = models.ForeignKey(
+        "songs.SongModel",
+        on_delete=models.CASCADE,
+        related_name="daily_plays",
+    )
+    plays = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        db_table = "statistics_daily_song_plays"
+        verbose_name = "Reproducciones diarias por canción"
+        verbose_name_plural = "Reproducciones diarias por canción"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["day", "song"], name="unique_daily_song_plays"
+            ),
+        ]
+        indexes = [
+            models.Index(fields=["song", "day"], name="stats_song_day_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.day} {self.song_id}: {self.plays}"
+
+
+class DailyPlayTotalModel(models.Model):
+    """Reproducciones totales de un día (una fila por día para el sparkline)"""
+
+    day = models.DateField(primary_key=True)
+    plays = models.BigIntegerField(default=0)
+
+    class Meta:
+        db_table = "statistics_daily_plays"
+        verbose_name = "Reproducciones diarias"
+        verbose_name_plural = "Reproducciones diarias"
+
+    def __str__(self):
+        return f"{self.day}: {self.plays}"
@@ -0,0 +1,46 @@
+"""Señales que mantienen actualizadas las estadísticas materializadas"""
+
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from apps.artists.infrastructure.models.artist_model import ArtistModel
+from apps.songs.infrastructure.models import SongModel
+from apps.songs.infrastructure.signals import plays_recorded, songs_imported
+
+from ..services import PlayStatisticsService
+
+play_statistics_service = PlayStatisticsService()
+
+
+@receiver(plays_recorded, dispatch_uid="statistics_record_plays")
+def record_plays(sender, plays, **kwargs):
+    play_statistics_service.record_plays(plays)
+
+
+@receiver(post_save, sender=SongModel, dispatch_uid="statistics_song_created")
+def count_created_song(sender, instance, created, raw=False, **kwargs):
+    if created and not raw:
+        play_statistics_service.song_added()
+
+
+@receiver(songs_imported, dispatch_uid="statistics_songs_imported")
+def count_imported_songs(sender, count, **kwargs):
+    play_statistics_service.song_added(count)
+
+
+@receiver(post_delete, sender=SongModel, dispatch_uid="statistics_song_deleted")
+def count_deleted_song(sender, instance, **kwargs):
+    play_statistics_service.song_removed(
+        instance.play_count, artist_id=instance.artist_id
+    )
+
+
+@receiver(post_save, sender=ArtistModel, dispatch_uid="statistics_artist_created")
+def count_created_artist(sender, instance, created, raw=False, **kwargs):
+    if created and not raw:
+        play_statistics_service.artist_added()
+
+
+@receiver(post_delete, sender=ArtistModel, dispatch_uid="statistics_artist_deleted")
+def count_deleted_artist(sender, instance, **kwargs):
+    play_statistics_service.artist_removed()
@@ -0,0 +1,11 @@
+from django.core.management.base import BaseCommand
+
+from apps.statistics.services import PlayStatisticsService
+
+
+class Command(BaseCommand):
+    help = "Recalculate catalog and per-artist play statistics from the songs table"
+
+    def handle(self, *args, **options):
+        PlayStatisticsService().rebuild()
+        self.stdout.write(self.style.SUCCESS("Statistics rebuilt"))
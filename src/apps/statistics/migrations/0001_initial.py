@@ -0,0 +1,130 @@
+# Generated by Django 5.2.4 on 2026-10-19 03:31
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    initial = True
+
+    dependencies = [
+        ("artists", "0004_remove_artistmodel_unique_artist_source_per_type_and_more"),
+        ("songs", "0005_remove_songmodel_songs_album_t_6c7985_idx_and_more"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="StatisticsModel",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Estadística",
+                "verbose_name_plural": "Estadísticas",
+                "managed": False,
+            },
+        ),
+        migrations.CreateModel(
+            name="CatalogStatsModel",
+            fields=[
+                (
+                    "id",
+                    models.PositiveSmallIntegerField(
+                        default=1, primary_key=True, serialize=False
+                    ),
+                ),
+                ("total_songs", models.BigIntegerField(default=0)),
+                ("total_artists", models.BigIntegerField(default=0)),
+                ("total_plays", models.BigIntegerField(default=0)),
+                ("played_songs", models.BigIntegerField(default=0)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                "verbose_name": "Totales del catálogo",
+                "verbose_name_plural": "Totales del catálogo",
+                "db_table": "statistics_catalog",
+            },
+        ),
+        migrations.CreateModel(
+            name="DailyPlayTotalModel",
+            fields=[
+                ("day", models.DateField(primary_key=True, serialize=False)),
+                ("plays", models.BigIntegerField(default=0)),
+            ],
+            options={
+                "verbose_name": "Reproducciones diarias",
+                "verbose_name_plural": "Reproducciones diarias",
+                "db_table": "statistics_daily_plays",
+            },
+        ),
+        migrations.CreateModel(
+            name="ArtistPlayStatsModel",
+            fields=[
+                (
+                    "artist",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="play_stats",
+                        serialize=False,
+                        to="artists.artistmodel",
+                    ),
+                ),
+                ("total_plays", models.BigIntegerField(default=0)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                "verbose_name": "Reproducciones por artista",
+                "verbose_name_plural": "Reproducciones por artista",
+                "db_table": "statistics_artist_plays",
+                "indexes": [
+                    models.Index(fields=["-total_plays"], name="stats_artist_top_idx")
+                ],
+            },
+        ),
+        migrations.CreateModel(
+            name="DailySongPlaysModel",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("day", models.DateField()),
+                ("plays", models.PositiveIntegerField(default=0)),
+                (
+                    "song",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="daily_plays",
+                        to="songs.songmodel",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Reproducciones diarias por canción",
+                "verbose_name_plural": "Reproducciones diarias por canción",
+                "db_table": "statistics_daily_song_plays",
+                "indexes": [
+                    models.Index(fields=["song", "day"], name="stats_song_day_idx")
+                ],
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("day", "song"), name="unique_daily_song_plays"
+                    )
+                ],
+            },
+        ),
+    ]
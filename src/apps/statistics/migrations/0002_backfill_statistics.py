@@ -0,0 +1,41 @@
+from django.db import migrations
+from django.db.models import Count, Q, Sum
+
+
+def backfill_statistics(apps, schema_editor):
+    """Totales del catálogo y por artista a partir de los contadores actuales"""
+    SongModel = apps.get_model("songs", "SongModel")
+    ArtistModel = apps.get_model("artists", "ArtistModel")
+    CatalogStatsModel = apps.get_model("statistics", "CatalogStatsModel")
+    ArtistPlayStatsModel = apps.get_model("statistics", "ArtistPlayStatsModel")
+
+    songs = SongModel.objects.aggregate(
+        total_songs=Count("id"),
+        total_plays=Sum("play_count"),
+        played_songs=Count("id", filter=Q(play_count__gt=0)),
+    )
+    CatalogStatsModel.objects.update_or_create(
+        id=1,
+        defaults={
+            "total_songs": songs["total_songs"],
+            "total_artists": ArtistModel.objects.count(),
+            "total_plays": songs["total_plays"] or 0,
+            "played_songs": songs["played_songs"],
+        },
+    )
+    ArtistPlayStatsModel.objects.bulk_create(
+        ArtistPlayStatsModel(artist_id=row["artist_id"], total_plays=row["total"])
+        for row in SongModel.objects.filter(artist__isnull=False, play_count__gt=0)
+        .values("artist_id")
+        .annotate(total=Sum("play_count"))
+    )
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("statistics", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_statistics, migrations.RunPython.noop),
+    ]
@@ -1,5 +1,12 @@
 from django.db import models
 
+from .infrastructure.models import (  # noqa: F401
+    ArtistPlayStatsModel,
+    CatalogStatsModel,
+    DailyPlayTotalModel,
+    DailySongPlaysModel,
+)
+
 
 class StatisticsModel(models.Model):
     """Modelo proxy para las estadísticas - no crea tabla nueva"""
@@ -0,0 +1,3 @@
+from .play_statistics_service import PlayStatisticsService
+
+__all__ = ["PlayStatisticsService"]
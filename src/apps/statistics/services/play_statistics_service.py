@@ -0,0 +1,200 @@
+"""
+Estadísticas de reproducción materializadas.
+
+Las reproducciones se acumulan de forma incremental en tablas pequeñas
+(reproducciones por día y canción, totales diarios, totales por artista y una
+fila con los totales del catálogo), así que el dashboard lee un número fijo de
+filas sin importar el tamaño del catálogo.
+"""
+
+from collections import Counter, defaultdict
+from datetime import date, timedelta
+from typing import Any, Dict, Iterable, List, Optional
+
+from django.db import IntegrityError, transaction
+from django.db.models import Count, F, Q, Sum
+from django.utils import timezone
+
+from apps.artists.infrastructure.models.artist_model import ArtistModel
+from apps.songs.infrastructure.models import SongModel
+from common.mixins.logging_mixin import LoggingMixin
+
+from ..infrastructure.models import (
+    ArtistPlayStatsModel,
+    CatalogStatsModel,
+    DailyPlayTotalModel,
+    DailySongPlaysModel,
+)
+
+
+class PlayStatisticsService(LoggingMixin):
+    """Mantiene y consulta las estadísticas de reproducción precalculadas"""
+
+    # === Escritura ===
+
+    def record_plays(self, plays: Iterable[Any]) -> None:
+        """
+        Suma reproducciones a las estadísticas.
+
+        Args:
+            plays: Registros con ``song_id``, ``artist_id``, ``played_at``,
+                ``count`` y ``first_play`` (ver ``PlayRecord`` de canciones)
+        """
+        song_days: Counter = Counter()
+        days: Counter = Counter()
+        artists: Counter = Counter()
+        total = 0
+        first_plays = 0
+
+        for play in plays:
+            day = timezone.localdate(play.played_at)
+            song_days[(day, play.song_id)] += play.count
+            days[day] += play.count
+            if play.artist_id:
+                artists[play.artist_id] += play.count
+            total += play.count
+            first_plays += int(play.first_play)
+
+        if not total:
+            return
+
+        with transaction.atomic():
+            for (day, song_id), count in song_days.items():
+                self._increment(
+                    DailySongPlaysModel, {"day": day, "song_id": song_id}, plays=count
+                )
+            for day, count in days.items():
+                self._increment(DailyPlayTotalModel, {"day": day}, plays=count)
+            for artist_id, count in artists.items():
+                self._increment(
+                    ArtistPlayStatsModel, {"artist_id": artist_id}, total_plays=count
+                )
+            self._increment_catalog(total_plays=total, played_songs=first_plays)
+
+    def song_added(self, count: int = 1) -> None:
+        self._increment_catalog(total_songs=count)
+
+    def song_removed(self, play_count: int, artist_id: Optional[str] = None) -> None:
+        """Descuenta una canción borrada y sus reproducciones acumuladas"""
+        with transaction.atomic():
+            self._increment_catalog(
+                total_songs=-1,
+                total_plays=-play_count,
+                played_songs=-int(play_count > 0),
+            )
+            if artist_id and play_count:
+                ArtistPlayStatsModel.objects.filter(artist_id=artist_id).update(
+                    total_plays=F("total_plays") - play_count
+                )
+
+    def artist_added(self) -> None:
+        self._increment_catalog(total_artists=1)
+
+    def artist_removed(self) -> None:
+        self._increment_catalog(total_artists=-1)
+
+    def rebuild(self) -> None:
+        """
+        Recalcula desde cero los totales del catálogo y por artista. El
+        histórico diario no se puede reconstruir: solo existe desde que se
+        registran las reproducciones.
+        """
+        songs = SongModel.objects.aggregate(
+            total_songs=Count("id"),
+            total_plays=Sum("play_count"),
+            played_songs=Count("id", filter=Q(play_count__gt=0)),
+        )
+        artist_plays = (
+            SongModel.objects.filter(artist__isnull=False, play_count__gt=0)
+            .values("artist_id")
+            .annotate(total=Sum("play_count"))
+        )
+
+        with transaction.atomic():
+            CatalogStatsModel.objects.update_or_create(
+                id=CatalogStatsModel.SINGLETON_ID,
+                defaults={
+                    "total_songs": songs["total_songs"],
+                    "total_artists": ArtistModel.objects.count(),
+                    "total_plays": songs["total_plays"] or 0,
+                    "played_songs": songs["played_songs"],
+                },
+            )
+            ArtistPlayStatsModel.objects.all().delete()
+            ArtistPlayStatsModel.objects.bulk_create(
+                ArtistPlayStatsModel(
+                    artist_id=row["artist_id"], total_plays=row["total"]
+                )
+                for row in artist_plays
+            )
+
+        self.logger.info("Play statistics rebuilt")
+
+    # === Lectura ===
+
+    def get_dashboard(self, days: int = 14, top: int = 10) -> Dict[str, Any]:
+        """Datos del dashboard leídos de las filas precalculadas"""
+        catalog = (
+            CatalogStatsModel.objects.filter(id=CatalogStatsModel.SINGLETON_ID).first()
+            or CatalogStatsModel()
+        )
+
+        # Índices descendentes: ambas consultas leen solo ``top`` filas
+        top_songs = list(
+            SongModel.objects.select_related("artist")
+            .filter(play_count__gt=0)
+            .order_by("-play_count")[:top]
+        )
+        top_artists = [
+            {"name": stats.artist.name, "total_plays": stats.total_plays}
+            for stats in ArtistPlayStatsModel.objects.select_related("artist")
+            .filter(total_plays__gt=0)
+            .order_by("-total_plays")[:top]
+        ]
+
+        return {
+            "catalog": catalog,
+            "top_songs": top_songs,
+            "top_artists": top_artists,
+            "daily_plays": self.get_daily_plays(days),
+        }
+
+    def get_daily_plays(self, days: int) -> List[Dict[str, Any]]:
+        """Reproducciones de los últimos ``days`` días (los días sin datos a 0)"""
+        today = timezone.localdate()
+        start = today - timedelta(days=days - 1)
+        totals: Dict[date, int] = defaultdict(int)
+        for row in DailyPlayTotalModel.objects.filter(day__gte=start).values(
+            "day", "plays"
+        ):
+            totals[row["day"]] = row["plays"]
+
+        return [
+            {"day": day, "plays": totals[day]}
+            for day in (start + timedelta(days=i) for i in range(days))
+        ]
+
+    # === Helpers ===
+
+    def _increment_catalog(self, **amounts: int) -> None:
+        self._increment(
+            CatalogStatsModel, {"id": CatalogStatsModel.SINGLETON_ID}, **amounts
+        )
+
+    @staticmethod
+    def _increment(model, lookup: Dict[str, Any], **amounts: int) -> None:
+        """``UPDATE ... SET campo = campo + n``; crea la fila si aún no existe"""
+        updates: Dict[str, Any] = {
+            field: F(field) + amount for field, amount in amounts.items()
+        }
+        if hasattr(model, "updated_at"):
+            # ``auto_now`` no se aplica en ``update()``
+            updates["updated_at"] = timezone.now()
+        if model.objects.filter(**lookup).update(**updates):
+            return
+        try:
+            with transaction.atomic():
+                model.objects.create(**lookup, **amounts)
+        except IntegrityError:
+            # Otro proceso creó la fila entre el UPDATE y el INSERT
+            model.objects.filter(**lookup).update(**updates)
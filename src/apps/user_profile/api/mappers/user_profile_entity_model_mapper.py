@@ -17,7 +17,7 @@ class UserProfileEntityModelMapper(
         """
         Convierte un modelo Django UserProfileModel a entidad del dominio UserProfileEntity.
         """
-        self.logger.debug(f"Converting model to entity for user {model.id}")
+        self.logger.debug("Converting model to entity for user %s", model.id)
         return UserProfileEntity(
             id=str(model.id),
             email=model.email,
@@ -28,7 +28,7 @@ class UserProfileEntityModelMapper(
         """
         Convierte una entidad UserProfileEntity a una instancia del modelo Django UserProfileModel.
         """
-        self.logger.debug(f"Converting entity to model instance for user {entity.id}")
+        self.logger.debug("Converting entity to model instance for user %s", entity.id)
         return UserProfileModel(
             id=entity.id,
             email=entity.email,
@@ -39,7 +39,7 @@ class UserProfileEntityModelMapper(
         """
         Convierte una entidad UserProfileEntity a datos del modelo Django (diccionario).
         """
-        self.logger.debug(f"Converting entity to model data for user {entity.id}")
+        self.logger.debug("Converting entity to model data for user %s", entity.id)
         return {
             "email": entity.email,
             "profile_picture": entity.profile_picture,
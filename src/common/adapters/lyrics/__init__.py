@@ -1,2 +1,2 @@
-from .lyrics_service import LyricsService
+from .lyrics_service import LyricsLookup, LyricsService
 from .lyrics_updater_service import LyricsUpdateService
@@ -1,15 +1,30 @@
 import asyncio
 import re
 import time
+from dataclasses import dataclass, field
 from typing import Awaitable, Callable, Dict, List, Optional, Tuple
 
-import aiohttp
 from django.conf import settings
 
 from ...mixins.logging_mixin import LoggingMixin
+from ...utils.lazy_import import lazy_import
 from ...utils.retry_manager import RetryManager
+from ...utils.request_timing import timed
 from ...utils.validators import TextCleaner
 
+aiohttp = lazy_import("aiohttp")
+yt_dlp = lazy_import("yt_dlp")
+
+
+@dataclass
+class LyricsLookup:
+    """Resultado de una búsqueda de letras"""
+
+    lyrics: Optional[str] = None
+    # Fuente que devolvió la letra y fuentes consultadas, en orden
+    source: Optional[str] = None
+    sources_tried: List[str] = field(default_factory=list)
+
 
 class LyricsService(LoggingMixin):
     """
@@ -52,6 +67,14 @@ class LyricsService(LoggingMixin):
         Returns:
             str: Letras de la canción o None si no se encuentran
         """
+        return (await self.find_lyrics(title, artist, youtube_id)).lyrics
+
+    @timed("lyrics")
+    async def find_lyrics(
+        self, title: str, artist: str, youtube_id: Optional[str] = None
+    ) -> LyricsLookup:
+        """Como ``get_lyrics``, indicando además qué fuentes se consultaron"""
+        lookup = LyricsLookup()
         self.logger.info(f"Buscando letras para: {artist} - {title}")
 
         # Limpiar y normalizar los datos de entrada
@@ -67,26 +90,25 @@ class LyricsService(LoggingMixin):
         ]
 
         for source_name, source_func in sources:
+            if source_name == "youtube" and not youtube_id:
+                continue  # No hay youtube_id, saltar
+            if source_name == "genius" and not self.genius_api_key:
+                continue  # Skip Genius si no hay API key
+
+            lookup.sources_tried.append(source_name)
             try:
                 self.logger.debug(f"Intentando obtener letras desde {source_name}")
 
                 if source_name == "youtube":
-                    if youtube_id:
-                        lyrics = await source_func(
-                            youtube_id, clean_title, clean_artist
-                        )
-                    else:
-                        continue  # No hay youtube_id, saltar
-                elif source_name == "genius":
-                    if not self.genius_api_key:
-                        continue  # Skip Genius si no hay API key
-                    lyrics = await source_func(clean_title, clean_artist)
+                    lyrics = await source_func(youtube_id, clean_title, clean_artist)
                 else:
                     lyrics = await source_func(clean_title, clean_artist)
 
                 if lyrics and self._validate_lyrics(lyrics):
                     self.logger.info(f"Letras encontradas desde {source_name}")
-                    return self._format_lyrics(lyrics)
+                    lookup.lyrics = self._format_lyrics(lyrics)
+                    lookup.source = source_name
+                    return lookup
 
             except Exception as e:
                 self.logger.warning(
@@ -95,15 +117,13 @@ class LyricsService(LoggingMixin):
                 continue
 
         self.logger.warning(f"No se pudieron encontrar letras para: {artist} - {title}")
-        return None
+        return lookup
 
     async def _get_lyrics_from_youtube(
         self, youtube_id: str, title: str, artist: str
     ) -> Optional[str]:
         """Intenta obtener letras desde YouTube usando yt-dlp"""
         try:
-            import yt_dlp
-
             ydl_opts = {
                 "quiet": True,
                 "no_warnings": True,
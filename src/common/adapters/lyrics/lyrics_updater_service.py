@@ -1,5 +1,3 @@
-import asyncio
-
 from ...mixins.logging_mixin import LoggingMixin
 from .lyrics_service import LyricsService
 
@@ -21,7 +19,7 @@ class LyricsUpdateService(LoggingMixin):
         Returns:
             bool: True si se actualizaron las letras, False en caso contrario
         """
-        if song_model.lyrics:
+        if song_model.has_lyrics:
             self.logger.debug(f"La canción '{song_model.title}' ya tiene letras")
             return False
 
@@ -37,8 +35,10 @@ class LyricsUpdateService(LoggingMixin):
             )
 
             if lyrics:
-                song_model.lyrics = lyrics
-                await song_model.asave(update_fields=["lyrics"])
+                from apps.songs.infrastructure.lyrics import save_song_lyrics
+
+                await save_song_lyrics(song_model.id, lyrics)
+                song_model.has_lyrics = True
                 self.logger.info(f"Letras actualizadas para: {song_model.title}")
                 return True
             else:
@@ -50,38 +50,3 @@ class LyricsUpdateService(LoggingMixin):
                 f"Error actualizando letras para {song_model.title}: {str(e)}"
             )
             return False
-
-    async def bulk_update_lyrics(self, song_queryset, max_concurrent=3):
-        """
-        Actualiza letras para múltiples canciones en paralelo.
-
-        Args:
-            song_queryset: QuerySet de canciones
-            max_concurrent: Máximo número de actualizaciones concurrentes
-
-        Returns:
-            dict: Estadísticas de la actualización
-        """
-        semaphore = asyncio.Semaphore(max_concurrent)
-
-        async def update_single_song(song):
-            async with semaphore:
-                return await self.update_song_lyrics(song)
-
-        tasks = [update_single_song(song) async for song in song_queryset]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-
-        # Calcular estadísticas
-        updated = sum(1 for result in results if result is True)
-        errors = sum(1 for result in results if isinstance(result, Exception))
-        total = len(results)
-
-        stats = {
-            "total_processed": total,
-            "updated": updated,
-            "errors": errors,
-            "skipped": total - updated - errors,
-        }
-
-        self.logger.info(f"Actualización masiva completada: {stats}")
-        return stats
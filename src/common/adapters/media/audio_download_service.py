@@ -4,17 +4,20 @@ import tempfile
 import uuid
 from typing import Any, Dict, Optional
 
-import yt_dlp
-
 from src.config.music_service_config import get_optimized_ydl_options
 
 from ...interfaces.imedia_service import IAudioDownloadService
 from ...mixins.logging_mixin import LoggingMixin
 from ...types.media_types import AudioServiceConfig, DownloadOptions
+from ...utils.lazy_import import lazy_import
 from ...utils.retry_manager import RetryManager
+from ...utils.request_timing import timed
 from ...utils.validators import MediaDataValidator, URLValidator
 from ...utils.youtube_error_handler import YouTubeErrorHandler
 
+# Se importa en la primera descarga (ver common.utils.warmup)
+yt_dlp = lazy_import("yt_dlp")
+
 
 class AudioDownloadService(IAudioDownloadService, LoggingMixin):
     """Servicio mejorado para descargar audio desde videos"""
@@ -56,6 +59,7 @@ class AudioDownloadService(IAudioDownloadService, LoggingMixin):
 
         return base_options
 
+    @timed("ytdlp")
     async def download_audio(
         self, video_url: str, options: Optional[DownloadOptions] = None
     ) -> Optional[bytes]:
@@ -96,6 +100,7 @@ class AudioDownloadService(IAudioDownloadService, LoggingMixin):
             None, self._download_audio_sync, video_url, options
         )
 
+    @timed("ytdlp")
     async def get_audio_info(self, video_url: str) -> Optional[Dict[str, Any]]:
         """Obtiene información del audio sin descargarlo"""
         if not self.url_validator.validate_youtube_url(video_url):
@@ -1,11 +1,12 @@
 from typing import Optional
 
-import aiohttp
-
 from common.interfaces.imedia_download_service import IMediaDownloadService
+from common.utils.lazy_import import lazy_import
 from common.utils.logging_config import get_logger
 from common.utils.logging_decorators import log_execution
 
+aiohttp = lazy_import("aiohttp")
+
 
 class MediaDownloadService(IMediaDownloadService):
     """Servicio para descarga de medios desde URLs"""
@@ -11,6 +11,7 @@ from ...types.media_types import (
     VideoInfo,
     YouTubeVideoInfo,
 )
+from ...utils.metrics import metrics
 from ...utils.music_metadata_extractor import MusicMetadataExtractor
 from .audio_download_service import AudioDownloadService
 from .youtube_service import YouTubeAPIService
@@ -27,6 +28,15 @@ class UnifiedMusicService(IMusicService, LoggingMixin):
     # Constante para el límite de tamaño de archivo (50MB)
     MAX_FILE_SIZE_BYTES = 50 * 1024 * 1024  # 50MB
 
+    METRIC_NAMES = (
+        "searches_performed",
+        "videos_processed",
+        "audio_downloads",
+        "metadata_extractions",
+        "errors",
+        "videos_filtered_by_size",
+    )
+
     def __init__(
         self,
         config: Optional[MusicServiceConfig] = None,
@@ -45,14 +55,9 @@ class UnifiedMusicService(IMusicService, LoggingMixin):
         self.artist_repository = None
         self.album_repository = None
 
-        # Métricas
+        # Métricas (contadores del registro compartido por todo el proceso)
         self._metrics = {
-            "searches_performed": 0,
-            "videos_processed": 0,
-            "audio_downloads": 0,
-            "metadata_extractions": 0,
-            "errors": 0,
-            "videos_filtered_by_size": 0,
+            name: metrics.counter(f"music_service.{name}") for name in self.METRIC_NAMES
         }
 
     def configure_repositories(self, artist_repository: Any, album_repository: Any):
@@ -85,7 +90,7 @@ class UnifiedMusicService(IMusicService, LoggingMixin):
                         f"Video {video_id} excede el límite de tamaño: "
                         f"{filesize / (1024 * 1024):.2f}MB > {self.MAX_FILE_SIZE_BYTES / (1024 * 1024)}MB"
                     )
-                    self._metrics["videos_filtered_by_size"] += 1
+                    self._metrics["videos_filtered_by_size"].inc()
                     return False
 
             # Si llegamos aquí, el archivo es aceptable o no se pudo determinar el tamaño
@@ -152,7 +157,7 @@ class UnifiedMusicService(IMusicService, LoggingMixin):
             Lista de pistas de audio procesadas que no excedan el límite de tamaño
         """
         try:
-            self._metrics["searches_performed"] += 1
+            self._metrics["searches_performed"].inc()
 
             # 1. Buscar videos en YouTube
             videos = await self._search_videos_with_metadata(
@@ -179,13 +184,13 @@ class UnifiedMusicService(IMusicService, LoggingMixin):
                     )
                     if track:
                         audio_tracks.append(track)
-                        self._metrics["videos_processed"] += 1
+                        self._metrics["videos_processed"].inc()
 
                 except Exception as e:
                     self.logger.error(
                         f"Error processing video {video.video_id}: {str(e)}"
                     )
-                    self._metrics["errors"] += 1
+                    self._metrics["errors"].inc()
 
             self.logger.info(
                 f"Processed {len(audio_tracks)} tracks from query '{query}' "
@@ -195,7 +200,7 @@ class UnifiedMusicService(IMusicService, LoggingMixin):
 
         except Exception as e:
             self.logger.error(f"Error in search_and_process_audio: {str(e)}")
-            self._metrics["errors"] += 1
+            self._metrics["errors"].inc()
             return []
 
     async def get_random_music(
@@ -278,7 +283,7 @@ class UnifiedMusicService(IMusicService, LoggingMixin):
                 )
                 return None
 
-            self._metrics["audio_downloads"] += 1
+            self._metrics["audio_downloads"].inc()
             url = f"https://www.youtube.com/watch?v={video_id}"
 
             # Configurar opciones con límite de tamaño si no se proporcionaron
@@ -290,7 +295,7 @@ class UnifiedMusicService(IMusicService, LoggingMixin):
 
         except Exception as e:
             self.logger.error(f"Error downloading audio for video {video_id}: {str(e)}")
-            self._metrics["errors"] += 1
+            self._metrics["errors"].inc()
             return None
 
     async def _search_videos_with_metadata(
@@ -303,7 +308,7 @@ class UnifiedMusicService(IMusicService, LoggingMixin):
         videos = await self.youtube_service.search_videos(query, options)
 
         if extract_metadata and videos:
-            self._metrics["metadata_extractions"] += len(videos)
+            self._metrics["metadata_extractions"].inc(len(videos))
             return [
                 self.metadata_extractor.extract_music_metadata(video)
                 for video in videos
@@ -318,7 +323,7 @@ class UnifiedMusicService(IMusicService, LoggingMixin):
         videos = await self.youtube_service.get_random_videos(options)
 
         if extract_metadata and videos:
-            self._metrics["metadata_extractions"] += len(videos)
+            self._metrics["metadata_extractions"].inc(len(videos))
             return [
                 self.metadata_extractor.extract_music_metadata(video)
                 for video in videos
@@ -393,7 +398,7 @@ class UnifiedMusicService(IMusicService, LoggingMixin):
     def get_service_metrics(self) -> Dict[str, Any]:
         """Obtiene métricas del servicio incluyendo filtrado por tamaño"""
         return {
-            **self._metrics,
+            **{name: counter.value for name, counter in self._metrics.items()},
             "max_file_size_mb": self.MAX_FILE_SIZE_BYTES / (1024 * 1024),
             "youtube_quota_usage": (
                 self.youtube_service.get_quota_usage()
@@ -408,15 +413,6 @@ class UnifiedMusicService(IMusicService, LoggingMixin):
         """Limpia recursos del servicio"""
         try:
             await self.audio_service.cleanup()
-            # Limpiar métricas
-            self._metrics = {
-                "searches_performed": 0,
-                "videos_processed": 0,
-                "audio_downloads": 0,
-                "metadata_extractions": 0,
-                "errors": 0,
-                "videos_filtered_by_size": 0,
-            }
 
             self.logger.info("UnifiedMusicService cleanup completed")
 
@@ -4,16 +4,21 @@ from datetime import datetime
 from typing import Any, Dict, List, Optional
 
 from django.conf import settings
-from googleapiclient.discovery import build
-from googleapiclient.errors import HttpError
 
 from ...interfaces.imedia_service import IYouTubeService
 from ...mixins.logging_mixin import LoggingMixin
 from ...types.media_types import SearchOptions, YouTubeServiceConfig, YouTubeVideoInfo
+from ...utils.lazy_import import lazy_import
+from ...utils.metrics import metrics
 from ...utils.music_metadata_extractor import MusicMetadataExtractor
 from ...utils.retry_manager import CircuitBreaker, RetryManager
+from ...utils.request_timing import timed
 from ...utils.validators import TextCleaner
 
+# googleapiclient se importa al crear el primer cliente (ver common.utils.warmup)
+discovery = lazy_import("googleapiclient.discovery")
+errors = lazy_import("googleapiclient.errors")
+
 
 class YouTubeAPIService(IYouTubeService, LoggingMixin):
     """Servicio simplificado para interactuar con la API de YouTube"""
@@ -39,7 +44,7 @@ class YouTubeAPIService(IYouTubeService, LoggingMixin):
         self.circuit_breaker = CircuitBreaker(
             failure_threshold=5,
             recovery_timeout=300.0,  # 5 minutes
-            expected_exception=HttpError,
+            expected_exception=errors.HttpError,
         )
 
         # Initialize YouTube client
@@ -52,7 +57,7 @@ class YouTubeAPIService(IYouTubeService, LoggingMixin):
     def _build_youtube_client(self):
         """Builds the YouTube API client"""
         try:
-            return build(
+            return discovery.build(
                 self.service_name,
                 self.api_version,
                 developerKey=self.api_key,
@@ -61,6 +66,7 @@ class YouTubeAPIService(IYouTubeService, LoggingMixin):
             self.logger.error(f"Failed to build YouTube client: {str(e)}")
             raise
 
+    @timed("youtube")
     async def search_videos(
         self, query: str, options: Optional[SearchOptions] = None
     ) -> List[YouTubeVideoInfo]:
@@ -126,8 +132,7 @@ class YouTubeAPIService(IYouTubeService, LoggingMixin):
             search_response = self.youtube.search().list(**search_params).execute()
             self.logger.debug(f"Search response: {search_response}")
 
-            if self.enable_quota_tracking:
-                self.quota_used_today += 100  # Cost of search operation
+            self._consume_quota(100, "search")  # Cost of search operation
 
             video_ids = [
                 item["id"]["videoId"]
@@ -141,9 +146,10 @@ class YouTubeAPIService(IYouTubeService, LoggingMixin):
 
             return await self._get_videos_details(video_ids)
 
-        except HttpError as e:
+        except errors.HttpError as e:
             if e.resp.status == 403:  # Quota exceeded
                 self.logger.error("YouTube API quota exceeded")
+                metrics.counter("youtube.quota_exceeded").inc()
                 if self.enable_quota_tracking:
                     self.quota_used_today = self.config.quota_limit_per_day
             raise e
@@ -174,6 +180,7 @@ class YouTubeAPIService(IYouTubeService, LoggingMixin):
 
         return search_params
 
+    @timed("youtube")
     async def get_video_details(self, video_id: str) -> Optional[YouTubeVideoInfo]:
         """Gets details of a specific video"""
         if not video_id or not isinstance(video_id, str):
@@ -234,8 +241,7 @@ class YouTubeAPIService(IYouTubeService, LoggingMixin):
                 video_ids,
             )
 
-            if self.enable_quota_tracking:
-                self.quota_used_today += 1  # Cost per videos.list call
+            self._consume_quota(1, "videos")  # Cost per videos.list call
 
             videos = []
             for video_data in videos_response.get("items", []):
@@ -355,6 +361,13 @@ class YouTubeAPIService(IYouTubeService, LoggingMixin):
         """Verifies if an operation can be performed without exceeding quota"""
         return (self.quota_used_today + cost) <= self.config.quota_limit_per_day
 
+    def _consume_quota(self, cost: int, operation: str) -> None:
+        """Records quota units spent by an API call"""
+        metrics.counter("youtube.api_calls", operation=operation).inc()
+        metrics.counter("youtube.quota_used").inc(cost)
+        if self.enable_quota_tracking:
+            self.quota_used_today += cost
+
     def get_quota_usage(self) -> Dict[str, int]:
         """Gets quota usage information"""
         return {
@@ -363,8 +376,11 @@ class YouTubeAPIService(IYouTubeService, LoggingMixin):
             "quota_remaining": max(
                 0, self.config.quota_limit_per_day - self.quota_used_today
             ),
+            # Unidades consumidas por todas las instancias del proceso
+            "quota_used_process": int(metrics.counter("youtube.quota_used").value),
         }
 
+    @timed("youtube")
     async def get_music_categories(self) -> List[Dict[str, Any]]:
         """Gets all available YouTube video categories with focus on music"""
         try:
@@ -377,8 +393,8 @@ class YouTubeAPIService(IYouTubeService, LoggingMixin):
                 self._fetch_video_categories
             )
 
-            if self.enable_quota_tracking:
-                self.quota_used_today += 1  # Cost per videoCategories.list call
+            # Cost per videoCategories.list call
+            self._consume_quota(1, "video_categories")
 
             music_categories = []
             for category in categories_response.get("items", []):
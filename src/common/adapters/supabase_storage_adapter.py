@@ -1,5 +1,6 @@
 from ..interfaces.istorage_service import IStorageService
 from ..mixins.logging_mixin import LoggingMixin
+from ..utils.request_timing import timed
 from ..utils.storage_utils import StorageUtils
 
 
@@ -13,6 +14,7 @@ class SupabaseStorageAdapter(IStorageService, LoggingMixin):
             f"SupabaseStorageAdapter initialized with bucket: {bucket_name}"
         )
 
+    @timed("storage")
     def upload_item(self, file_path: str, file_obj) -> bool:
         """Sube un archivo y retorna True si fue exitoso, False en caso contrario."""
         result = self._storage_utils.upload_item(file_path, file_obj)
@@ -23,11 +25,13 @@ class SupabaseStorageAdapter(IStorageService, LoggingMixin):
             self.logger.error("File upload failed.")
             return False
 
+    @timed("storage")
     def get_item_url(self, file_path: str) -> str | None:
         """Obtiene la URL pública de un archivo."""
         self.logger.debug(f"Getting public URL for file: {file_path}")
         return self._storage_utils.get_item_url(file_path)
 
+    @timed("storage")
     def delete_item(self, file_path: str) -> bool:
         """Elimina un archivo."""
         self.logger.debug(f"Deleting file: {file_path}")
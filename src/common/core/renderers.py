@@ -0,0 +1,47 @@
+from rest_framework.renderers import JSONRenderer
+
+try:
+    import orjson
+
+    HAS_ORJSON = True
+except ImportError:  # Dependencia opcional: sin ella se usa el renderer de DRF
+    HAS_ORJSON = False
+
+
+class ORJSONRenderer(JSONRenderer):
+    """
+    ``JSONRenderer`` que codifica con orjson manteniendo la salida de DRF:
+    JSON compacto en UTF-8, fechas ISO 8601 con ``Z`` para UTC y U+2028/U+2029
+    escapados. Los tipos que orjson no conoce (Decimal, lazy strings...) pasan
+    por el encoder de DRF.
+
+    Usa el renderer de DRF si orjson no está instalado, si se pide indentación
+    (p. ej. la API navegable) o si la configuración no es la compacta en UTF-8.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._default = self.encoder_class().default
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+        if not HAS_ORJSON or self.ensure_ascii or not self.compact:
+            return super().render(data, accepted_media_type, renderer_context)
+        if self.get_indent(accepted_media_type, renderer_context or {}) is not None:
+            return super().render(data, accepted_media_type, renderer_context)
+
+        try:
+            ret = orjson.dumps(
+                data,
+                default=self._default,
+                option=orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS,
+            )
+        except orjson.JSONEncodeError:
+            # Enteros de más de 64 bits, tipos no soportados...: mismo error
+            # o resultado que con DRF
+            return super().render(data, accepted_media_type, renderer_context)
+
+        return ret.replace(b"\xe2\x80\xa8", b"\\u2028").replace(
+            b"\xe2\x80\xa9", b"\\u2029"
+        )
@@ -0,0 +1,55 @@
+import logging
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+
+from ..utils.db_connection_metrics import (
+    db_connection_metrics,
+    install_connection_signal,
+)
+
+
+class DatabaseConnectionMetricsMiddleware:
+    """
+    Cuenta las conexiones a la base de datos abiertas en cada request.
+
+    Con el pool de psycopg cada préstamo del pool cuenta como apertura, ya que
+    Django emite ``connection_created`` al obtener la conexión.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.logger = logging.getLogger("django.db.connections")
+        self._is_coroutine = iscoroutinefunction(get_response)
+        if self._is_coroutine:
+            markcoroutinefunction(self)
+        install_connection_signal()
+
+    def __call__(self, request):
+        if self._is_coroutine:
+            return self.__acall__(request)
+        token = db_connection_metrics.start_request()
+        try:
+            response = self.get_response(request)
+        finally:
+            opens = db_connection_metrics.end_request(token)
+        return self._process_response(request, response, opens)
+
+    async def __acall__(self, request):
+        token = db_connection_metrics.start_request()
+        try:
+            response = await self.get_response(request)
+        finally:
+            opens = db_connection_metrics.end_request(token)
+        return self._process_response(request, response, opens)
+
+    def _process_response(self, request, response, opens):
+        if opens:
+            self.logger.debug(
+                f"[{getattr(request, 'request_id', 'unknown')}] "
+                f"{request.method} {request.path} opened {opens} DB connection(s)"
+            )
+        response["X-DB-Connections-Opened"] = str(opens)
+        return response
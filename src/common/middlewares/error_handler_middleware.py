@@ -1,5 +1,4 @@
-import asyncio
-
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
 from django.http import JsonResponse
 from rest_framework import status
 from rest_framework.serializers import ValidationError
@@ -8,15 +7,19 @@ from ..exceptions import DomainException
 
 
 class ErrorHandlerMiddleware:
+    # Middleware híbrido: Django lo ejecuta en modo async bajo ASGI
+    sync_capable = True
+    async_capable = True
+
     def __init__(self, get_response):
         self.get_response = get_response
-        # One-time configuration and initialization.
-        if asyncio.iscoroutinefunction(self.get_response):
-            # Mark that this middleware works with async views
-            self.async_capable = True
-            self.sync_capable = False
+        self._is_coroutine = iscoroutinefunction(get_response)
+        if self._is_coroutine:
+            markcoroutinefunction(self)
 
     def __call__(self, request):
+        if self._is_coroutine:
+            return self.__acall__(request)
         try:
             response = self.get_response(request)
             return response
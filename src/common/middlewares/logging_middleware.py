@@ -1,14 +1,21 @@
-import asyncio
 import logging
 import time
 import uuid
 
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+
 
 class LoggingMiddleware:
+    # Middleware híbrido: Django lo ejecuta en modo async bajo ASGI
+    sync_capable = True
+    async_capable = True
+
     def __init__(self, get_response):
         self.get_response = get_response
         self.logger = logging.getLogger("django.request")
-        self._is_coroutine = asyncio.iscoroutinefunction(get_response)
+        self._is_coroutine = iscoroutinefunction(get_response)
+        if self._is_coroutine:
+            markcoroutinefunction(self)
 
     def __call__(self, request):
         if self._is_coroutine:
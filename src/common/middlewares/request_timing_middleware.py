@@ -0,0 +1,84 @@
+import logging
+import time
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.core.exceptions import MiddlewareNotUsed
+
+from ..utils.request_timing import (
+    end_request,
+    format_server_timing,
+    get_request_timing_settings,
+    install_query_timer,
+    request_timing_stats,
+    start_request,
+)
+
+
+class RequestTimingMiddleware:
+    """
+    Mide cada request: número y tiempo de consultas, tiempo en servicios
+    externos y spans de casos de uso.
+
+    Los tiempos se agregan por endpoint (patrón de la ruta, no la URL) para que
+    una regresión N+1 se vea en el histograma de consultas de ese endpoint.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        config = get_request_timing_settings()
+        if not config["ENABLED"]:
+            raise MiddlewareNotUsed()
+
+        self.get_response = get_response
+        self.server_timing_header = config["SERVER_TIMING_HEADER"]
+        self.query_count_warning = config["QUERY_COUNT_WARNING"]
+        self.logger = logging.getLogger("django.db.queries")
+        self._is_coroutine = iscoroutinefunction(get_response)
+        if self._is_coroutine:
+            markcoroutinefunction(self)
+        install_query_timer()
+
+    def __call__(self, request):
+        if self._is_coroutine:
+            return self.__acall__(request)
+        token = start_request()
+        start = time.perf_counter()
+        try:
+            response = self.get_response(request)
+        finally:
+            timings = end_request(token)
+        return self._process_response(request, response, timings, start)
+
+    async def __acall__(self, request):
+        token = start_request()
+        start = time.perf_counter()
+        try:
+            response = await self.get_response(request)
+        finally:
+            timings = end_request(token)
+        return self._process_response(request, response, timings, start)
+
+    def _process_response(self, request, response, timings, start):
+        total = time.perf_counter() - start
+        endpoint = self._get_endpoint(request)
+        request_timing_stats.record(endpoint, timings, total)
+
+        if self.query_count_warning and timings.db_queries > self.query_count_warning:
+            self.logger.warning(
+                "[%s] %s executed %d queries (%.1f ms)",
+                getattr(request, "request_id", "unknown"),
+                endpoint,
+                timings.db_queries,
+                timings.db_time * 1000,
+            )
+
+        if self.server_timing_header:
+            response["Server-Timing"] = format_server_timing(timings, total)
+        return response
+
+    def _get_endpoint(self, request) -> str:
+        resolver_match = getattr(request, "resolver_match", None)
+        route = resolver_match.route if resolver_match else "unmatched"
+        return f"{request.method} /{route.rstrip('$')}"
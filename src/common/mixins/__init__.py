@@ -1,3 +1,6 @@
+from .async_api_view_mixin import AsyncAPIViewMixin
+from .cached_response_mixin import CachedResponseMixin
+from .conditional_get_mixin import ConditionalGetMixin
 from .crud_viewset_mixin import CRUDViewSetMixin
 from .filtered_viewset_mixin import FilteredViewSetMixin
 from .logging_mixin import LoggingMixin
@@ -0,0 +1,63 @@
+"""
+Mixin para ejecutar vistas de DRF de forma nativa bajo ASGI.
+
+DRF ejecuta ``dispatch`` de forma síncrona, por lo que las vistas que llaman
+a casos de uso async tienen que envolverlos en ``async_to_sync``. Este mixin
+sustituye ``dispatch`` por una corrutina para que los handlers ``async def``
+puedan esperar (``await``) los casos de uso directamente.
+"""
+
+import asyncio
+
+from asgiref.sync import markcoroutinefunction, sync_to_async
+
+
+class AsyncAPIViewMixin:
+    """
+    Mixin que convierte una APIView o ViewSet de DRF en una vista async.
+
+    Debe colocarse antes de la vista en la herencia:
+
+        class AsyncLyricsView(AsyncAPIViewMixin, LyricsView):
+            async def get(self, request, song_id): ...
+
+    - La autenticación, permisos y throttling (``initial``) pueden tocar la
+      base de datos, así que se ejecutan en el hilo sync.
+    - Los handlers ``async def`` se esperan directamente; los handlers sync
+      que se hereden se ejecutan con ``sync_to_async``.
+    """
+
+    @classmethod
+    def as_view(cls, *args, **initkwargs):
+        """Marca la vista como corrutina para que Django la ejecute en el loop"""
+        view = super().as_view(*args, **initkwargs)
+        return markcoroutinefunction(view)
+
+    async def dispatch(self, request, *args, **kwargs):
+        """Versión async de ``APIView.dispatch``"""
+        self.args = args
+        self.kwargs = kwargs
+        request = self.initialize_request(request, *args, **kwargs)
+        self.request = request
+        self.headers = self.default_response_headers
+
+        try:
+            await sync_to_async(self.initial)(request, *args, **kwargs)
+
+            if request.method.lower() in self.http_method_names:
+                handler = getattr(
+                    self, request.method.lower(), self.http_method_not_allowed
+                )
+            else:
+                handler = self.http_method_not_allowed
+
+            if asyncio.iscoroutinefunction(handler):
+                response = await handler(request, *args, **kwargs)
+            else:
+                response = await sync_to_async(handler)(request, *args, **kwargs)
+
+        except Exception as exc:
+            response = self.handle_exception(exc)
+
+        self.response = self.finalize_response(request, response, *args, **kwargs)
+        return self.response
@@ -0,0 +1,117 @@
+"""
+Mixin para cachear respuestas de lectura idénticas para todos los usuarios.
+
+Guarda en la fachada de caché los datos ya serializados junto con su ETag,
+de forma que un acierto no vuelve a ejecutar casos de uso, mappers ni
+serializers, y un ``If-None-Match`` coincidente responde 304 sin cuerpo.
+"""
+
+import hashlib
+import json
+from typing import Any, Awaitable, Callable, Dict
+
+from rest_framework import status
+from rest_framework.response import Response
+
+from ..utils.cache_facade import CacheFacade
+
+
+class _UncacheableResponse(Exception):
+    """Transporta una respuesta no-200 fuera de ``get_or_set`` sin cachearla"""
+
+    def __init__(self, response: Response):
+        super().__init__(response.status_code)
+        self.response = response
+
+
+def make_etag(data: Any) -> str:
+    """ETag débil a partir del contenido serializado"""
+    payload = json.dumps(data, sort_keys=True, default=str).encode()
+    return f'W/"{hashlib.md5(payload, usedforsecurity=False).hexdigest()}"'
+
+
+def etag_matches(request, etag: str) -> bool:
+    """Comprueba la cabecera ``If-None-Match`` (comparación débil)"""
+    if_none_match = request.META.get("HTTP_IF_NONE_MATCH")
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    weak_etag = etag.removeprefix("W/")
+    return any(
+        candidate.strip().removeprefix("W/") == weak_etag
+        for candidate in if_none_match.split(",")
+    )
+
+
+def make_request_key(request) -> str:
+    """Clave de una petición: host, ruta y parámetros de query ordenados"""
+    query = "&".join(
+        f"{key}={value}"
+        for key, values in sorted(request.GET.lists())
+        for value in values
+    )
+    # El host forma parte de la clave porque la paginación genera URLs absolutas
+    return f"{request.get_host()}{request.path}?{query}"
+
+
+class CachedResponseMixin:
+    """
+    Proporciona ``cached_response`` / ``acached_response`` para vistas DRF.
+
+    Usage:
+        def get(self, request):
+            return self.cached_response(
+                request, get_most_played_cache(), lambda: self._build(request)
+            )
+    """
+
+    def get_response_cache_key(self, request) -> str:
+        """Clave de la respuesta: host, ruta y parámetros de query ordenados"""
+        return make_request_key(request)
+
+    def cached_response(
+        self, request, cache: CacheFacade, build_response: Callable[[], Response]
+    ) -> Response:
+        """Read-through cache de la respuesta construida por ``build_response``"""
+
+        def factory() -> Dict[str, Any]:
+            return self._to_cache_entry(build_response())
+
+        try:
+            entry = cache.get_or_set(self.get_response_cache_key(request), factory)
+        except _UncacheableResponse as exc:
+            return exc.response
+        return self._from_cache_entry(request, entry)
+
+    async def acached_response(
+        self,
+        request,
+        cache: CacheFacade,
+        build_response: Callable[[], Awaitable[Response]],
+    ) -> Response:
+        """Variante async de ``cached_response``"""
+
+        async def factory() -> Dict[str, Any]:
+            return self._to_cache_entry(await build_response())
+
+        try:
+            entry = await cache.aget_or_set(
+                self.get_response_cache_key(request), factory
+            )
+        except _UncacheableResponse as exc:
+            return exc.response
+        return self._from_cache_entry(request, entry)
+
+    @staticmethod
+    def _to_cache_entry(response: Response) -> Dict[str, Any]:
+        if response.status_code != status.HTTP_200_OK:
+            raise _UncacheableResponse(response)
+        return {"data": response.data, "etag": make_etag(response.data)}
+
+    @staticmethod
+    def _from_cache_entry(request, entry: Dict[str, Any]) -> Response:
+        headers = {"ETag": entry["etag"]}
+        if etag_matches(request, entry["etag"]):
+            return Response(status=status.HTTP_304_NOT_MODIFIED, headers=headers)
+        return Response(entry["data"], status=status.HTTP_200_OK, headers=headers)
@@ -0,0 +1,192 @@
+"""
+Mixin para peticiones condicionales (ETag / Last-Modified) en ViewSets de lectura.
+
+Los validadores se calculan con una consulta barata (``values()`` de unas pocas
+columnas para el detalle, ``aggregate()`` sobre el queryset filtrado para el
+listado), de modo que un 304 se responde sin ejecutar mappers ni serializers.
+"""
+
+from datetime import datetime
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    NamedTuple,
+    Optional,
+    Sequence,
+)
+
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.db.models import Count, Max, Sum
+from django.utils.http import http_date, parse_http_date_safe
+from rest_framework import status
+from rest_framework.response import Response
+
+from .cached_response_mixin import etag_matches, make_etag, make_request_key
+
+
+class ResponseValidators(NamedTuple):
+    """Validadores HTTP de una representación"""
+
+    etag: str
+    last_modified: Optional[datetime] = None
+
+
+class ConditionalGetMixin:
+    """
+    Añade ``ETag`` y ``Last-Modified`` a ``list``/``retrieve`` y responde 304
+    cuando el cliente ya tiene la versión actual.
+
+    Usage:
+        class ArtistViewSet(ConditionalGetMixin, FilteredViewSetMixin):
+            conditional_fields = ("updated_at",)
+    """
+
+    # Columnas (admite lookups como "artist__updated_at") que determinan la
+    # representación de un objeto; su hash es la versión de la respuesta
+    conditional_fields: Sequence[str] = ("updated_at",)
+    # Columnas que sólo forman parte del detalle: el listado no las agrega
+    conditional_detail_fields: Sequence[str] = ()
+    # Contadores que se actualizan sin tocar updated_at; en el listado se suman
+    conditional_counter_fields: Sequence[str] = ()
+    # Columna usada como Last-Modified (None si hay cambios que no la actualizan)
+    last_modified_field: Optional[str] = "updated_at"
+    # Cambiarla invalida todos los ETags emitidos (p. ej. al cambiar el serializer)
+    conditional_version = "1"
+
+    if TYPE_CHECKING:
+        # Interfaz del ViewSet (GenericAPIView) con el que se combina
+        kwargs: Dict[str, Any]
+        lookup_field: str
+        lookup_url_kwarg: Optional[str]
+
+        def get_queryset(self) -> Any: ...
+
+        def filter_queryset(self, queryset: Any) -> Any: ...
+
+    def get_conditional_queryset(self):
+        """Queryset sobre el que se calculan los validadores"""
+        return self.get_queryset()
+
+    def get_conditional_list_aggregates(self) -> Dict[str, Any]:
+        """Agregados que cambian cuando cambia cualquier elemento del listado"""
+        aggregates: Dict[str, Any] = {"count": Count("pk")}
+        for field in self.conditional_fields:
+            aggregates[field] = Max(field)
+        for field in self.conditional_counter_fields:
+            aggregates[field] = Sum(field)
+        return aggregates
+
+    def get_detail_validators(
+        self, request, lookup_value
+    ) -> Optional[ResponseValidators]:
+        """Validadores de un objeto, o None si no existe"""
+        lookup_field = getattr(self, "lookup_field", "pk")
+        try:
+            values = (
+                self.get_conditional_queryset()
+                .filter(**{lookup_field: lookup_value})
+                .values(
+                    *self.conditional_fields,
+                    *self.conditional_detail_fields,
+                    *self.conditional_counter_fields,
+                )
+                .first()
+            )
+        except (DjangoValidationError, TypeError, ValueError):
+            # Identificador mal formado: la vista responderá 404
+            return None
+        if values is None:
+            return None
+        return self._make_validators(request, values)
+
+    def get_list_validators(self, request) -> ResponseValidators:
+        """Validadores del listado para los filtros de la petición"""
+        queryset = self.filter_queryset(self.get_conditional_queryset())
+        values = queryset.aggregate(**self.get_conditional_list_aggregates())
+        # Sin Last-Modified: Max(updated_at) no refleja los borrados, sólo el ETag
+        # (que incluye el conteo) es fiable para el listado
+        return self._make_validators(request, values, with_last_modified=False)
+
+    def conditional_response(
+        self,
+        request,
+        validators: Optional[ResponseValidators],
+        build_response: Callable[[], Response],
+    ) -> Response:
+        """Responde 304 si los validadores coinciden; si no, construye la respuesta"""
+        if validators is None:
+            return build_response()
+
+        headers = self._validator_headers(validators)
+        if self._is_not_modified(request, validators):
+            return Response(status=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+        response = build_response()
+        if response.status_code == status.HTTP_200_OK:
+            for header, value in headers.items():
+                response[header] = value
+        return response
+
+    def list(self, request, *args, **kwargs):
+        """Listado con soporte de peticiones condicionales"""
+        return self.conditional_response(
+            request,
+            self.get_list_validators(request),
+            lambda: super(ConditionalGetMixin, self).list(request, *args, **kwargs),
+        )
+
+    def retrieve(self, request, *args, **kwargs):
+        """Detalle con soporte de peticiones condicionales"""
+        lookup_url_kwarg = self.lookup_url_kwarg or self.lookup_field
+        return self.conditional_response(
+            request,
+            self.get_detail_validators(request, self.kwargs.get(lookup_url_kwarg)),
+            lambda: super(ConditionalGetMixin, self).retrieve(request, *args, **kwargs),
+        )
+
+    def _make_validators(
+        self, request, values: Dict[str, Any], with_last_modified: bool = True
+    ) -> ResponseValidators:
+        user_id = request.user.pk if request.user.is_authenticated else None
+        etag = make_etag(
+            [
+                self.conditional_version,
+                make_request_key(request),
+                user_id,
+                sorted(values.items()),
+            ]
+        )
+        last_modified = (
+            values.get(self.last_modified_field)
+            if with_last_modified and self.last_modified_field
+            else None
+        )
+        return ResponseValidators(etag=etag, last_modified=last_modified)
+
+    @staticmethod
+    def _validator_headers(validators: ResponseValidators) -> Dict[str, str]:
+        headers = {"ETag": validators.etag}
+        if validators.last_modified is not None:
+            headers["Last-Modified"] = http_date(validators.last_modified.timestamp())
+        return headers
+
+    @staticmethod
+    def _is_not_modified(request, validators: ResponseValidators) -> bool:
+        if request.method not in ("GET", "HEAD"):
+            return False
+
+        # If-None-Match tiene prioridad sobre If-Modified-Since (RFC 9110)
+        if request.META.get("HTTP_IF_NONE_MATCH"):
+            return etag_matches(request, validators.etag)
+
+        if validators.last_modified is None:
+            return False
+        if_modified_since = parse_http_date_safe(
+            request.META.get("HTTP_IF_MODIFIED_SINCE", "")
+        )
+        return (
+            if_modified_since is not None
+            and int(validators.last_modified.timestamp()) <= if_modified_since
+        )
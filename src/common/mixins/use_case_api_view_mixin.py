@@ -3,6 +3,7 @@ Mixin para vistas APIView que utilizan casos de uso y paginación.
 Elimina redundancia en vistas que heredan de PaginatedAPIView.
 """
 
+from asgiref.sync import sync_to_async
 from rest_framework.permissions import AllowAny
 
 from .paginated_api_view import PaginatedAPIView
@@ -59,6 +60,28 @@ class UseCaseAPIViewMixin(PaginatedAPIView):
             self.logger.error(f"Error executing use case: {str(e)}")
             raise
 
+    async def ahandle_use_case_execution(self, use_case, *args, **kwargs):
+        """
+        Variante async de ``handle_use_case_execution`` para vistas ASGI.
+
+        Espera el caso de uso directamente, sin el salto de hilo ni el event
+        loop extra que implica ``async_to_sync``.
+        """
+        try:
+            return await use_case.execute(*args, **kwargs)
+        except Exception as e:
+            self.logger.error(f"Error executing use case: {str(e)}")
+            raise
+
+    async def amap_entities_to_dtos(self, entities, mapper):
+        """
+        Variante async de ``map_entities_to_dtos``.
+
+        Los mappers pueden consultar la base de datos (p. ej. nombres de
+        géneros), por lo que se ejecutan en el hilo sync.
+        """
+        return await sync_to_async(self.map_entities_to_dtos)(entities, mapper)
+
     def map_entities_to_dtos(self, entities, mapper):
         """
         Método helper para convertir entidades a DTOs de forma consistente.
@@ -1,3 +1,3 @@
-from .base_entity_serializer import BaseEntitySerializer
+from .base_entity_serializer import BaseEntitySerializer, get_dto_converter
 
-__all__ = ["BaseEntitySerializer"]
+__all__ = ["BaseEntitySerializer", "get_dto_converter"]
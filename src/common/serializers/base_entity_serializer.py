@@ -1,4 +1,6 @@
-from typing import Any, Optional, Type
+from dataclasses import fields, is_dataclass
+from operator import attrgetter
+from typing import Any, Callable, Dict, Optional, Type
 
 from rest_framework import serializers
 
@@ -8,6 +10,42 @@ from ..utils.logging_config import get_logger
 
 logger = get_logger(__name__)
 
+# Convertidores DTO → dict precalculados por clase de DTO
+_DTO_CONVERTERS: Dict[type, Callable[[Any], dict]] = {}
+
+
+def _build_dataclass_converter(dto_type: type) -> Callable[[Any], dict]:
+    """
+    Convierte con un único ``attrgetter`` de todos los campos del DTO, sin
+    getattr dinámico por campo.
+    """
+    names = tuple(field.name for field in fields(dto_type))
+    if len(names) < 2:
+        # attrgetter con un solo nombre no devuelve tupla
+        return lambda dto: {name: getattr(dto, name) for name in names}
+
+    getter = attrgetter(*names)
+    return lambda dto: dict(zip(names, getter(dto)))
+
+
+def get_dto_converter(dto_type: type) -> Callable[[Any], dict]:
+    """
+    Devuelve una función que convierte instancias de ``dto_type`` en dict con
+    la misma forma que recorrer ``__dataclass_fields__`` (los objetos que no son
+    dataclasses usan su ``__dict__``). Se calcula una vez por clase.
+    """
+    converter = _DTO_CONVERTERS.get(dto_type)
+    if converter is None:
+        if is_dataclass(dto_type):
+            converter = _build_dataclass_converter(dto_type)
+        else:
+
+            def converter(dto):
+                return getattr(dto, "__dict__", {})
+
+        _DTO_CONVERTERS[dto_type] = converter
+    return converter
+
 
 class BaseEntitySerializer(serializers.Serializer):
     """
@@ -23,10 +61,6 @@ class BaseEntitySerializer(serializers.Serializer):
         """
         Convierte automáticamente entidades o modelos a DTOs, y luego a representación JSON.
         """
-        logger.debug(
-            f"[DEBUG] Tipo esperado: {self.dto_class}, tipo recibido: {type(instance)}"
-        )
-
         if not self.mapper_class or not self.entity_class or not self.dto_class:
             raise NotImplementedError(
                 f"{self.__class__.__name__} debe definir mapper_class, entity_class y dto_class"
@@ -34,20 +68,15 @@ class BaseEntitySerializer(serializers.Serializer):
 
         try:
             if isinstance(instance, self.dto_class):
-                logger.debug("Instancia es un DTO, convirtiendo a dict")
                 return self._dto_to_dict(instance)
 
             if isinstance(instance, self.entity_class):
-                logger.debug("Instancia es una entidad, mapeando a DTO")
                 dto = self.mapper_class.entity_to_dto(instance)
                 return self._dto_to_dict(dto)
 
             if getattr(instance, "_meta", None) and getattr(
                 instance._meta, "app_label", None
             ):
-                logger.debug(
-                    "Instancia es un modelo de Django, mapeando a entidad y luego a DTO"
-                )
                 entity = self.mapper_class.model_to_entity(instance)
                 dto = self.mapper_class.entity_to_dto(entity)
                 return self._dto_to_dict(dto)
@@ -62,10 +91,4 @@ class BaseEntitySerializer(serializers.Serializer):
 
     def _dto_to_dict(self, dto_instance: Any) -> dict:
         """Convierte un DTO a dict. Override si necesitas lógica personalizada."""
-        if hasattr(dto_instance, "__dataclass_fields__"):
-            return {
-                field: getattr(dto_instance, field)
-                for field in dto_instance.__dataclass_fields__
-            }
-
-        return getattr(dto_instance, "__dict__", {})
+        return get_dto_converter(type(dto_instance))(dto_instance)
@@ -1,6 +1,6 @@
 from typing import Optional
 
-from common.adapters.lyrics.lyrics_service import LyricsService
+from common.adapters.lyrics.lyrics_service import LyricsLookup, LyricsService
 from common.utils.lyrics_validators import validate_lyrics
 
 
@@ -15,7 +15,14 @@ class LyricsManager:
     async def get_lyrics(
         self, title: str, artist: str, youtube_id: Optional[str] = None
     ) -> Optional[str]:
-        lyrics = await self.lyrics_service.get_lyrics(title, artist, youtube_id)
-        if lyrics and validate_lyrics(lyrics):
-            return lyrics
-        return None
+        return (await self.find_lyrics(title, artist, youtube_id)).lyrics
+
+    async def find_lyrics(
+        self, title: str, artist: str, youtube_id: Optional[str] = None
+    ) -> LyricsLookup:
+        """Búsqueda con las fuentes consultadas; descarta las letras no válidas"""
+        lookup = await self.lyrics_service.find_lyrics(title, artist, youtube_id)
+        if not lookup.lyrics or not validate_lyrics(lookup.lyrics):
+            lookup.lyrics = None
+            lookup.source = None
+        return lookup
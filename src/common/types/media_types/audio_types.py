@@ -5,7 +5,7 @@ from typing import List, Optional
 from .extraction_types import ExtractedAlbumInfo, ExtractedArtistInfo
 
 
-@dataclass
+@dataclass(slots=True)
 class AudioTrackData:
     """Datos procesados de una pista de audio"""
 
@@ -30,7 +30,7 @@ class AudioTrackData:
             self.extracted_albums = []
 
 
-@dataclass
+@dataclass(slots=True)
 class YouTubeVideoInfo:
     """Información detallada de un video de YouTube"""
 
@@ -50,7 +50,7 @@ class YouTubeVideoInfo:
     url: str
 
 
-@dataclass
+@dataclass(slots=True)
 class MusicTrackData:
     """Datos procesados de una pista musical"""
 
@@ -2,7 +2,7 @@ from dataclasses import dataclass
 from typing import Any, Dict, Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class ExtractedArtistInfo:
     """Información de artista extraída de metadatos de video"""
 
@@ -13,7 +13,7 @@ class ExtractedArtistInfo:
     additional_info: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ExtractedAlbumInfo:
     """Información de álbum extraída de metadatos de video"""
 
@@ -5,7 +5,7 @@ from typing import List, Optional
 from .extraction_types import ExtractedAlbumInfo, ExtractedArtistInfo
 
 
-@dataclass
+@dataclass(slots=True)
 class VideoInfo:
     """Información detallada de un video"""
 
@@ -25,7 +25,7 @@ class VideoInfo:
     url: str
 
 
-@dataclass
+@dataclass(slots=True)
 class YouTubeVideoInfo(VideoInfo):
     """Información específica de un video de YouTube con datos extraídos"""
 
@@ -1,3 +1,31 @@
-from .logging_config import LoggingConfig, get_logger
-from .logging_decorators import log_execution, log_performance
-from .storage_utils import StorageUtils
+"""
+Utilidades comunes.
+
+Los nombres exportados aquí se importan en el primer acceso: importar un
+submódulo (``common.utils.logging_config`` desde los settings, por ejemplo)
+no carga Supabase ni el ORM de Django.
+"""
+
+import importlib
+
+_EXPORTS = {
+    "CacheFacade": ".cache_facade",
+    "get_cache": ".cache_facade",
+    "LoggingConfig": ".logging_config",
+    "configure_logging": ".logging_config",
+    "get_logger": ".logging_config",
+    "log_execution": ".logging_decorators",
+    "log_performance": ".logging_decorators",
+    "StorageUtils": ".storage_utils",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
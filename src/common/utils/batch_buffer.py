@@ -0,0 +1,147 @@
+"""
+Buffer en memoria que agrupa elementos y los vuelca por lotes.
+
+``add`` sólo toma un lock y añade el elemento; el volcado lo hace un hilo en
+segundo plano cuando se alcanzan ``flush_size`` elementos o cada
+``flush_interval`` segundos, y una última vez al terminar el proceso. Cada
+proceso (worker) tiene su propio buffer.
+"""
+
+import atexit
+import threading
+import time
+from typing import Callable, Generic, List, Optional, TypeVar
+
+from .logging_config import get_logger
+from .metrics import MetricsRegistry, metrics
+
+logger = get_logger("batch_buffer")
+
+T = TypeVar("T")
+
+
+class BatchBuffer(Generic[T]):
+    """
+    Buffer acotado con volcado por lotes en segundo plano.
+
+    Si el volcado falla los elementos vuelven al buffer y se reintentan en el
+    siguiente; por encima de ``max_pending`` se descartan los más antiguos.
+
+    Usage:
+        buffer = BatchBuffer(save_events, name="play_events")
+        buffer.add(event)
+    """
+
+    def __init__(
+        self,
+        flush: Callable[[List[T]], None],
+        name: str,
+        flush_size: int = 500,
+        flush_interval: float = 5.0,
+        max_pending: int = 50000,
+        registry: MetricsRegistry = metrics,
+    ):
+        self._flush = flush
+        self.name = name
+        self.flush_size = flush_size
+        self.flush_interval = flush_interval
+        self.max_pending = max_pending
+
+        self._items: List[T] = []
+        self._lock = threading.Lock()
+        # Un único volcado a la vez (hilo, flush manual o atexit)
+        self._flush_lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+        self._flushed = registry.counter(f"{name}.flushed")
+        self._dropped = registry.counter(f"{name}.dropped")
+        self._errors = registry.counter(f"{name}.flush_errors")
+        self._flush_ms = registry.histogram(f"{name}.flush_ms")
+        registry.gauge(f"{name}.pending", callback=self.__len__)
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def add(self, item: T) -> None:
+        """Añade un elemento; nunca hace E/S"""
+        with self._lock:
+            self._items.append(item)
+            dropped = self._trim()
+            full = len(self._items) >= self.flush_size
+            if self._thread is None:
+                self._start()
+
+        if dropped:
+            self.on_dropped(dropped)
+        if full:
+            self._wakeup.set()
+
+    def flush(self) -> int:
+        """Vuelca los elementos pendientes; devuelve cuántos se volcaron"""
+        with self._flush_lock:
+            with self._lock:
+                items, self._items = self._items, []
+            if not items:
+                return 0
+
+            start = time.perf_counter()
+            try:
+                self._flush(items)
+            except Exception:
+                self._errors.inc()
+                with self._lock:
+                    self._items[:0] = items
+                    dropped = self._trim()
+                if dropped:
+                    self.on_dropped(dropped)
+                raise
+
+            self._flush_ms.record((time.perf_counter() - start) * 1000)
+            self._flushed.inc(len(items))
+            self.on_flushed(items)
+            return len(items)
+
+    def stop(self) -> None:
+        """Detiene el hilo y vuelca lo pendiente"""
+        self._stopped.set()
+        self._wakeup.set()
+        try:
+            self.flush()
+        except Exception as e:
+            logger.error("Final flush of %s failed: %s", self.name, e)
+
+    def on_flushed(self, items: List[T]) -> None:
+        """Hook tras volcar ``items`` correctamente"""
+
+    def on_dropped(self, items: List[T]) -> None:
+        """Hook para los elementos descartados por superar ``max_pending``"""
+
+    def _trim(self) -> List[T]:
+        """Descarta los elementos más antiguos por encima de ``max_pending``"""
+        overflow = len(self._items) - self.max_pending
+        if overflow <= 0:
+            return []
+        dropped = self._items[:overflow]
+        del self._items[:overflow]
+        self._dropped.inc(overflow)
+        return dropped
+
+    def _start(self) -> None:
+        self._thread = threading.Thread(
+            target=self._run, name=f"{self.name}-flusher", daemon=True
+        )
+        self._thread.start()
+        atexit.register(self.stop)
+
+    def _run(self) -> None:
+        while not self._stopped.is_set():
+            self._wakeup.wait(self.flush_interval)
+            self._wakeup.clear()
+            if self._stopped.is_set():
+                return
+            try:
+                self.flush()
+            except Exception as e:
+                logger.error("Flush of %s failed: %s", self.name, e)
@@ -0,0 +1,97 @@
+"""
+Procesamiento concurrente acotado de un flujo asíncrono.
+
+Un productor lee ``items`` y los deja en una cola de ``concurrency`` huecos,
+``concurrency`` trabajadores los procesan y el consumidor recibe los
+resultados en orden de finalización. Las colas acotadas aplican
+contrapresión: si el consumidor se retrasa los trabajadores se detienen, y
+con ellos el productor, así que nunca hay más de ``3 * concurrency``
+elementos en memoria.
+"""
+
+import asyncio
+from dataclasses import dataclass
+from typing import (
+    AsyncIterable,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Generic,
+    Optional,
+    TypeVar,
+)
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+_DONE = object()
+
+
+@dataclass(slots=True)
+class PipelineResult(Generic[T, R]):
+    """Resultado de procesar un elemento (``error`` si ``func`` lanzó)"""
+
+    item: T
+    value: Optional[R] = None
+    error: Optional[Exception] = None
+
+
+async def bounded_map(
+    items: AsyncIterable[T],
+    func: Callable[[T], Awaitable[R]],
+    concurrency: int,
+) -> AsyncIterator[PipelineResult[T, R]]:
+    """
+    Aplica ``func`` a cada elemento con como mucho ``concurrency`` en curso.
+
+    Usage:
+        async for result in bounded_map(songs, fetch_lyrics, concurrency=3):
+            ...
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1")
+
+    pending: asyncio.Queue = asyncio.Queue(maxsize=concurrency)
+    results: asyncio.Queue = asyncio.Queue(maxsize=concurrency)
+
+    async def produce() -> None:
+        error: Optional[Exception] = None
+        try:
+            async for item in items:
+                await pending.put(item)
+        except Exception as e:
+            error = e
+        # Fuera de un finally: si se cancela no hay que esperar hueco en la cola
+        for _ in range(concurrency):
+            await pending.put(_DONE)
+        if error is not None:
+            raise error
+
+    async def work() -> None:
+        while True:
+            item = await pending.get()
+            if item is _DONE:
+                await results.put(_DONE)
+                return
+            try:
+                result = PipelineResult(item, value=await func(item))
+            except Exception as e:
+                result = PipelineResult(item, error=e)
+            await results.put(result)
+
+    producer = asyncio.create_task(produce())
+    workers = [asyncio.create_task(work()) for _ in range(concurrency)]
+    try:
+        running = concurrency
+        while running:
+            result = await results.get()
+            if result is _DONE:
+                running -= 1
+                continue
+            yield result
+        # Propaga los errores del propio flujo de entrada
+        await producer
+    finally:
+        for task in (producer, *workers):
+            task.cancel()
+        await asyncio.gather(producer, *workers, return_exceptions=True)
@@ -0,0 +1,367 @@
+"""
+Fachada de caché para repositorios y casos de uso.
+
+Dos niveles:
+- Local (por proceso): ``PerformanceCache`` con LRU + TTL.
+- Compartido (opcional): cualquier backend de ``django.core.cache`` (locmem,
+  Redis...), configurado en ``settings.CACHE_FACADE``.
+
+Las claves se agrupan por namespace y llevan la versión del namespace, así que
+``invalidate()`` incrementa la versión y deja obsoletas todas las entradas
+anteriores sin tener que borrarlas una a una.
+"""
+
+import threading
+import time
+from enum import Enum
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Final,
+    Generic,
+    Optional,
+    TypeVar,
+    Union,
+)
+
+from .logging_config import get_logger
+from .performance_cache import PerformanceCache
+from .single_flight import SingleFlight
+
+T = TypeVar("T")
+
+logger = get_logger(__name__)
+
+
+class _Missing(Enum):
+    """Clave ausente (``None`` es un valor cacheable)"""
+
+    MISSING = 0
+
+
+_MISSING: Final = _Missing.MISSING
+
+DEFAULT_CACHE_FACADE_SETTINGS: Dict[str, Any] = {
+    "KEY_PREFIX": "streamflow",
+    "DEFAULT_TTL": 300,
+    "LOCAL_MAX_SIZE": 1024,
+    # Alias de settings.CACHES usado como nivel compartido (None = sólo local)
+    "SHARED_ALIAS": None,
+    # Cada cuánto se relee la versión de un namespace del nivel compartido
+    "VERSION_CHECK_INTERVAL": 1.0,
+}
+
+
+def get_cache_facade_settings() -> Dict[str, Any]:
+    """Configuración de la fachada, con valores por defecto si Django no está listo"""
+    config = dict(DEFAULT_CACHE_FACADE_SETTINGS)
+    try:
+        from django.conf import settings
+
+        if settings.configured:
+            config.update(getattr(settings, "CACHE_FACADE", {}))
+    except ImportError:
+        pass
+    return config
+
+
+class CacheFacade(Generic[T]):
+    """
+    Caché tipada por namespace con single-flight y invalidación versionada.
+
+    Usage:
+        cache: CacheFacade[List[SongEntity]] = get_cache("songs.most_played", ttl=60)
+        songs = await cache.aget_or_set(f"limit:{limit}", load_songs)
+        cache.invalidate()
+    """
+
+    def __init__(
+        self,
+        namespace: str,
+        ttl: Optional[int] = None,
+        local_cache: Optional[PerformanceCache] = None,
+        shared_cache: Any = None,
+        key_prefix: Optional[str] = None,
+        version_check_interval: Optional[float] = None,
+    ):
+        config = get_cache_facade_settings()
+        self.namespace = namespace
+        self.ttl = ttl or config["DEFAULT_TTL"]
+        self.key_prefix = key_prefix or config["KEY_PREFIX"]
+        self.version_check_interval = (
+            config["VERSION_CHECK_INTERVAL"]
+            if version_check_interval is None
+            else version_check_interval
+        )
+        self._local = local_cache or PerformanceCache(
+            default_ttl=self.ttl, max_size=config["LOCAL_MAX_SIZE"]
+        )
+        self._shared = shared_cache
+        self._shared_alias = (
+            None if shared_cache is not None else config["SHARED_ALIAS"]
+        )
+
+        self._version = 1
+        self._version_checked_at = 0.0
+        self._lock = threading.Lock()
+        self._key_locks: Dict[str, threading.Lock] = {}
+        self._inflight: SingleFlight[Any] = SingleFlight()
+
+        self.hits = 0
+        self.shared_hits = 0
+        self.misses = 0
+
+    # ------------------------------------------------------------------ #
+    # Claves y versiones
+    # ------------------------------------------------------------------ #
+
+    @property
+    def shared(self):
+        """Nivel compartido (``django.core.cache``), resuelto en el primer uso"""
+        if self._shared is None and self._shared_alias:
+            from django.core.cache import caches
+
+            self._shared = caches[self._shared_alias]
+        return self._shared
+
+    @property
+    def _version_key(self) -> str:
+        return f"{self.key_prefix}:{self.namespace}:__version__"
+
+    @property
+    def version(self) -> int:
+        """Versión actual del namespace"""
+        shared = self.shared
+        if shared is None:
+            return self._version
+
+        now = time.monotonic()
+        if now - self._version_checked_at >= self.version_check_interval:
+            self._version = shared.get(self._version_key) or 1
+            self._version_checked_at = now
+        return self._version
+
+    def make_key(self, key: str) -> str:
+        """Clave completa: prefijo, namespace, versión y clave"""
+        return f"{self.key_prefix}:{self.namespace}:v{self.version}:{key}"
+
+    # ------------------------------------------------------------------ #
+    # API sync
+    # ------------------------------------------------------------------ #
+
+    def get(self, key: str, default: Optional[T] = None) -> Optional[T]:
+        """Obtiene un valor del nivel local o, si no está, del compartido"""
+        value = self._lookup(self.make_key(key))
+        return default if value is _MISSING else value
+
+    def set(self, key: str, value: T, ttl: Optional[int] = None) -> None:
+        """Guarda un valor en ambos niveles"""
+        self._store(self.make_key(key), value, ttl)
+
+    def _lookup(self, full_key: str) -> Union[T, _Missing]:
+        value: Any = self._local.get(full_key, _MISSING)
+        if value is not _MISSING:
+            self.hits += 1
+            return value
+
+        shared = self.shared
+        if shared is not None:
+            value = shared.get(full_key, _MISSING)
+            if value is not _MISSING:
+                self.shared_hits += 1
+                self._local.set(full_key, value, self.ttl)
+                return value
+
+        self.misses += 1
+        return _MISSING
+
+    def _store(self, full_key: str, value: T, ttl: Optional[int] = None) -> None:
+        ttl = ttl or self.ttl
+        self._local.set(full_key, value, ttl)
+        if self.shared is not None:
+            self.shared.set(full_key, value, ttl)
+
+    def delete(self, key: str) -> None:
+        """Elimina una clave de ambos niveles"""
+        full_key = self.make_key(key)
+        self._local.delete(full_key)
+        if self.shared is not None:
+            self.shared.delete(full_key)
+
+    def get_or_set(
+        self, key: str, factory: Callable[[], T], ttl: Optional[int] = None
+    ) -> T:
+        """
+        Devuelve el valor cacheado o lo calcula con ``factory``.
+
+        Single-flight: si varios hilos piden la misma clave a la vez, sólo uno
+        ejecuta ``factory`` y el resto reutiliza su resultado. El valor se
+        guarda con la versión leída antes de calcularlo: si ``invalidate()``
+        llega mientras tanto, queda obsoleto en vez de sobrevivir un TTL.
+        """
+        value = self._lookup(self.make_key(key))
+        if value is not _MISSING:
+            return value
+
+        with self._lock:
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+
+        with key_lock:
+            full_key = self.make_key(key)
+            value = self._lookup(full_key)
+            if value is not _MISSING:
+                return value
+
+            value = factory()
+            self._store(full_key, value, ttl)
+
+        with self._lock:
+            if self._key_locks.get(key) is key_lock and not key_lock.locked():
+                del self._key_locks[key]
+        return value
+
+    def invalidate(self) -> int:
+        """Invalida todas las entradas del namespace incrementando su versión"""
+        shared = self.shared
+        with self._lock:
+            if shared is None:
+                self._version += 1
+            else:
+                shared.add(self._version_key, 1, None)
+                try:
+                    self._version = shared.incr(self._version_key)
+                except ValueError:
+                    # La clave expiró o fue eliminada entre add e incr
+                    shared.set(self._version_key, self._version + 1, None)
+                    self._version += 1
+                self._version_checked_at = time.monotonic()
+
+        logger.debug(f"Cache namespace '{self.namespace}' -> v{self._version}")
+        return self._version
+
+    # ------------------------------------------------------------------ #
+    # API async
+    # ------------------------------------------------------------------ #
+
+    async def aget(self, key: str, default: Optional[T] = None) -> Optional[T]:
+        """Variante async de ``get``; el nivel compartido usa la API async de Django"""
+        value = await self._alookup(await self._amake_key(key))
+        return default if value is _MISSING else value
+
+    async def aset(self, key: str, value: T, ttl: Optional[int] = None) -> None:
+        """Variante async de ``set``"""
+        await self._astore(await self._amake_key(key), value, ttl)
+
+    async def _alookup(self, full_key: str) -> Union[T, _Missing]:
+        shared = self.shared
+        if shared is None:
+            return self._lookup(full_key)
+
+        value: Any = self._local.get(full_key, _MISSING)
+        if value is not _MISSING:
+            self.hits += 1
+            return value
+
+        value = await shared.aget(full_key, _MISSING)
+        if value is not _MISSING:
+            self.shared_hits += 1
+            self._local.set(full_key, value, self.ttl)
+            return value
+
+        self.misses += 1
+        return _MISSING
+
+    async def _astore(self, full_key: str, value: T, ttl: Optional[int] = None) -> None:
+        shared = self.shared
+        if shared is None:
+            return self._store(full_key, value, ttl)
+
+        ttl = ttl or self.ttl
+        self._local.set(full_key, value, ttl)
+        await shared.aset(full_key, value, ttl)
+
+    async def aget_or_set(
+        self,
+        key: str,
+        factory: Callable[[], Awaitable[T]],
+        ttl: Optional[int] = None,
+    ) -> T:
+        """
+        Variante async de ``get_or_set``.
+
+        Las llamadas concurrentes que piden la misma clave (también desde otros
+        hilos) comparten una ejecución de ``factory`` con ``SingleFlight``.
+        """
+        full_key = await self._amake_key(key)
+        value = await self._alookup(full_key)
+        if value is not _MISSING:
+            return value
+
+        async def load() -> T:
+            value = await factory()
+            await self._astore(full_key, value, ttl)
+            return value
+
+        return await self._inflight.do(full_key, load)
+
+    async def ainvalidate(self) -> int:
+        """Variante async de ``invalidate``"""
+        shared = self.shared
+        if shared is None:
+            return self.invalidate()
+
+        await shared.aadd(self._version_key, 1, None)
+        try:
+            self._version = await shared.aincr(self._version_key)
+        except ValueError:
+            self._version += 1
+            await shared.aset(self._version_key, self._version, None)
+        self._version_checked_at = time.monotonic()
+
+        logger.debug(f"Cache namespace '{self.namespace}' -> v{self._version}")
+        return self._version
+
+    async def _amake_key(self, key: str) -> str:
+        """Variante async de ``make_key``"""
+        if self.shared is None:
+            return self.make_key(key)
+
+        now = time.monotonic()
+        if now - self._version_checked_at >= self.version_check_interval:
+            self._version = await self.shared.aget(self._version_key) or 1
+            self._version_checked_at = now
+        return f"{self.key_prefix}:{self.namespace}:v{self._version}:{key}"
+
+    def stats(self) -> Dict[str, Any]:
+        """Estadísticas de aciertos y fallos"""
+        return {
+            "namespace": self.namespace,
+            "version": self._version,
+            "hits": self.hits,
+            "shared_hits": self.shared_hits,
+            "misses": self.misses,
+            "local_size": self._local.size(),
+            "local_evictions": self._local.evictions,
+        }
+
+
+_registry: Dict[str, CacheFacade] = {}
+_registry_lock = threading.Lock()
+
+
+def get_cache(namespace: str, ttl: Optional[int] = None) -> CacheFacade:
+    """Devuelve la fachada (única por proceso) de un namespace"""
+    with _registry_lock:
+        cache = _registry.get(namespace)
+        if cache is None:
+            cache = CacheFacade(namespace, ttl=ttl)
+            _registry[namespace] = cache
+        return cache
+
+
+def get_all_caches() -> Dict[str, CacheFacade]:
+    """Fachadas registradas, por namespace"""
+    with _registry_lock:
+        return dict(_registry)
@@ -0,0 +1,86 @@
+"""
+Métricas de aperturas de conexiones a la base de datos por request.
+
+Permite comprobar que las conexiones persistentes / el pool funcionan: con
+``CONN_MAX_AGE`` o pool activos, la mayoría de requests no deberían abrir
+ninguna conexión nueva.
+"""
+
+import contextvars
+import threading
+from typing import Dict, List, Optional
+
+
+class DatabaseConnectionMetrics:
+    """Contador thread-safe de conexiones abiertas, global y por request"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        # Lista mutable por request: sync_to_async copia el contexto al hilo
+        # sync, pero el objeto compartido sigue siendo el mismo
+        self._current: contextvars.ContextVar[Optional[List[int]]] = (
+            contextvars.ContextVar("db_connection_opens", default=None)
+        )
+        self.total_requests = 0
+        self.total_opens = 0
+        self.requests_with_opens = 0
+
+    def start_request(self) -> contextvars.Token:
+        """Empieza a contar las conexiones abiertas del request actual"""
+        return self._current.set([0])
+
+    def record_open(self) -> None:
+        """Registra la apertura de una conexión"""
+        counter = self._current.get()
+        if counter is not None:
+            counter[0] += 1
+        with self._lock:
+            self.total_opens += 1
+
+    def end_request(self, token: contextvars.Token) -> int:
+        """Termina el request actual y devuelve cuántas conexiones abrió"""
+        counter = self._current.get()
+        opens = counter[0] if counter is not None else 0
+        self._current.reset(token)
+        with self._lock:
+            self.total_requests += 1
+            if opens:
+                self.requests_with_opens += 1
+        return opens
+
+    def snapshot(self) -> Dict[str, float]:
+        """Resumen de las métricas acumuladas"""
+        with self._lock:
+            return {
+                "total_requests": self.total_requests,
+                "total_opens": self.total_opens,
+                "requests_with_opens": self.requests_with_opens,
+                "opens_per_request": (
+                    self.total_opens / self.total_requests
+                    if self.total_requests
+                    else 0.0
+                ),
+            }
+
+    def reset(self) -> None:
+        """Reinicia los contadores acumulados"""
+        with self._lock:
+            self.total_requests = 0
+            self.total_opens = 0
+            self.requests_with_opens = 0
+
+
+db_connection_metrics = DatabaseConnectionMetrics()
+
+
+def _on_connection_created(sender, connection, **kwargs):
+    db_connection_metrics.record_open()
+
+
+def install_connection_signal() -> None:
+    """Conecta la señal ``connection_created`` de Django con las métricas"""
+    from django.db.backends.signals import connection_created
+
+    connection_created.connect(
+        _on_connection_created, dispatch_uid="db_connection_metrics"
+    )
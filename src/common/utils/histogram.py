@@ -0,0 +1,110 @@
+"""
+Histograma log-lineal (estilo HDR) para latencias y conteos.
+
+Cada potencia de 2 se divide en ``SUB_BUCKETS`` intervalos iguales, así que el
+error relativo de los percentiles está acotado (<6,25% con 16 sub-buckets) y la
+memoria no crece con el número de muestras: sólo se guardan los buckets usados.
+"""
+
+import math
+import threading
+from typing import Dict, Iterable, Optional
+
+SUB_BUCKETS = 16
+DEFAULT_PERCENTILES = (50, 90, 95, 99)
+
+
+def _bucket_index(value: float) -> int:
+    """Índice del bucket de ``value`` (valores <= 1 comparten los primeros)"""
+    if value < 1:
+        return int(value * SUB_BUCKETS)
+    mantissa, exponent = math.frexp(value)
+    # mantissa en [0.5, 1): la posición dentro de la potencia de 2
+    return exponent * SUB_BUCKETS + int((mantissa - 0.5) * 2 * SUB_BUCKETS)
+
+
+def _bucket_upper_bound(index: int) -> float:
+    """Límite superior del bucket (valor que se reporta en los percentiles)"""
+    if index < SUB_BUCKETS:
+        return (index + 1) / SUB_BUCKETS
+    exponent, sub_bucket = divmod(index, SUB_BUCKETS)
+    return math.ldexp(0.5 + (sub_bucket + 1) / (2 * SUB_BUCKETS), exponent)
+
+
+class Histogram:
+    """
+    Histograma thread-safe de valores no negativos.
+
+    Usage:
+        histogram = Histogram()
+        histogram.record(12.5)
+        histogram.percentile(99)
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._buckets: Dict[int, int] = {}
+        self.count = 0
+        self.total = 0.0
+        self.min: Optional[float] = None
+        self.max: Optional[float] = None
+
+    def record(self, value: float) -> None:
+        """Registra una muestra"""
+        value = max(value, 0.0)
+        index = _bucket_index(value)
+        with self._lock:
+            self._buckets[index] = self._buckets.get(index, 0) + 1
+            self.count += 1
+            self.total += value
+            if self.min is None or value < self.min:
+                self.min = value
+            if self.max is None or value > self.max:
+                self.max = value
+
+    def percentile(self, percentile: float) -> float:
+        """Valor por debajo del cual está el ``percentile``% de las muestras"""
+        with self._lock:
+            return self._percentiles((percentile,))[percentile]
+
+    def snapshot(self, percentiles: Iterable[float] = DEFAULT_PERCENTILES) -> Dict:
+        """Resumen: conteo, media, mínimo, máximo y percentiles"""
+        with self._lock:
+            summary = {
+                "count": self.count,
+                "mean": self.total / self.count if self.count else 0.0,
+                "min": self.min or 0.0,
+                "max": self.max or 0.0,
+            }
+            for percentile, value in self._percentiles(percentiles).items():
+                summary[f"p{percentile:g}"] = value
+            return summary
+
+    def reset(self) -> None:
+        """Elimina todas las muestras"""
+        with self._lock:
+            self._buckets.clear()
+            self.count = 0
+            self.total = 0.0
+            self.min = None
+            self.max = None
+
+    def _percentiles(self, percentiles: Iterable[float]) -> Dict[float, float]:
+        targets = sorted(percentiles)
+        results = {percentile: 0.0 for percentile in targets}
+        maximum = self.max
+        if not self.count or maximum is None:
+            return results
+
+        seen = 0
+        pending = iter(targets)
+        current = next(pending, None)
+        for index in sorted(self._buckets):
+            seen += self._buckets[index]
+            while current is not None and seen >= math.ceil(current / 100 * self.count):
+                # El máximo real es más preciso que el límite del último bucket
+                results[current] = min(_bucket_upper_bound(index), maximum)
+                current = next(pending, None)
+            if current is None:
+                break
+        return results
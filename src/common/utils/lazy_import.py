@@ -0,0 +1,108 @@
+"""
+Importación diferida de dependencias pesadas.
+
+``yt_dlp``, ``googleapiclient`` o ``stripe`` tardan cientos de milisegundos en
+importarse y sólo los usan algunos endpoints. Con ``lazy_import`` el módulo se
+importa la primera vez que se accede a uno de sus atributos, no al cargar las
+vistas, y el arranque del worker no paga por ellos:
+
+    yt_dlp = lazy_import("yt_dlp")
+
+    with yt_dlp.YoutubeDL(opts) as ydl:  # aquí se importa yt_dlp
+        ...
+
+``preload_lazy_modules`` los importa todos de antemano (ver
+``common.utils.warmup``) para que tampoco los pague la primera petición.
+"""
+
+import importlib
+import threading
+import time
+from types import ModuleType
+from typing import Dict, List
+
+from .logging_config import get_logger
+
+logger = get_logger(__name__)
+
+_registry: Dict[str, "LazyModule"] = {}
+_registry_lock = threading.Lock()
+
+
+class LazyModule:
+    """Proxy de un módulo que lo importa en el primer acceso a un atributo"""
+
+    __slots__ = ("_name", "_module", "_lock")
+
+    def __init__(self, name: str):
+        object.__setattr__(self, "_name", name)
+        object.__setattr__(self, "_module", None)
+        object.__setattr__(self, "_lock", threading.Lock())
+
+    @property
+    def loaded(self) -> bool:
+        return self._module is not None
+
+    def load(self) -> ModuleType:
+        """Importa el módulo (una sola vez) y lo devuelve"""
+        module = self._module
+        if module is None:
+            with self._lock:
+                module = self._module
+                if module is None:
+                    start = time.perf_counter()
+                    module = importlib.import_module(self._name)
+                    object.__setattr__(self, "_module", module)
+                    logger.debug(
+                        f"Lazy import of {self._name} took "
+                        f"{(time.perf_counter() - start) * 1000:.1f}ms"
+                    )
+        return module
+
+    def __getattr__(self, attr: str):
+        return getattr(self.load(), attr)
+
+    def __setattr__(self, attr: str, value) -> None:
+        # p. ej. ``stripe.api_key = ...`` configura el módulo real
+        setattr(self.load(), attr, value)
+
+    def __delattr__(self, attr: str) -> None:
+        delattr(self.load(), attr)
+
+    def __dir__(self) -> List[str]:
+        return dir(self.load())
+
+    def __repr__(self) -> str:
+        state = "loaded" if self.loaded else "not loaded"
+        return f"<LazyModule {self._name!r} ({state})>"
+
+
+def lazy_import(name: str) -> LazyModule:
+    """Proxy diferido del módulo ``name`` (el mismo para cada nombre)"""
+    with _registry_lock:
+        module = _registry.get(name)
+        if module is None:
+            module = _registry[name] = LazyModule(name)
+        return module
+
+
+def preload_lazy_modules() -> Dict[str, float]:
+    """
+    Importa los módulos diferidos que aún no se han cargado.
+
+    Returns:
+        Segundos que tardó cada import; los que fallan se registran y se
+        omiten (el error volverá a aparecer en el primer uso)
+    """
+    timings: Dict[str, float] = {}
+    with _registry_lock:
+        pending = [module for module in _registry.values() if not module.loaded]
+    for module in pending:
+        start = time.perf_counter()
+        try:
+            module.load()
+        except Exception as e:
+            logger.warning(f"Could not preload {module._name}: {e}")
+            continue
+        timings[module._name] = time.perf_counter() - start
+    return timings
@@ -1,11 +1,25 @@
+import json
 import logging
 import logging.config
 import sys
+from datetime import datetime, timezone
 from pathlib import Path
 
+from .queue_logging import DROP_NEW, install_queue_handlers, stop_queue_listener
+
+# Atributos estándar de LogRecord; el resto son campos ``extra``
+_RESERVED_RECORD_ATTRS = frozenset(
+    vars(logging.LogRecord("", 0, "", 0, "", None, None))
+) | {"message", "asctime", "log_targets"}
+
 
 class CustomFormatter(logging.Formatter):
     def format(self, record):
+        self.set_relative_filename(record)
+        return super().format(record)
+
+    @staticmethod
+    def set_relative_filename(record):
         if hasattr(record, "pathname"):
             project_root = Path(__file__).resolve().parents[2]
             try:
@@ -14,12 +28,43 @@ class CustomFormatter(logging.Formatter):
                 ).replace("\\", "/")
             except ValueError:
                 record.filename = Path(record.pathname).name
-        return super().format(record)
+
+
+class JsonFormatter(CustomFormatter):
+    """Una línea JSON por registro, con los campos ``extra`` incluidos"""
+
+    def format(self, record):
+        self.set_relative_filename(record)
+        payload = {
+            "timestamp": datetime.fromtimestamp(record.created, timezone.utc).isoformat(
+                timespec="milliseconds"
+            ),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+            "file": record.filename,
+            "line": record.lineno,
+            "function": record.funcName,
+            "thread": record.threadName,
+        }
+        if record.exc_info:
+            payload["exception"] = self.formatException(record.exc_info)
+        for key, value in vars(record).items():
+            if key not in _RESERVED_RECORD_ATTRS and not key.startswith("_"):
+                payload[key] = value
+        return json.dumps(payload, default=str, ensure_ascii=False)
 
 
 class LoggingConfig:
     @staticmethod
-    def get_logging_config(debug: bool = False, env: str = "dev") -> dict:
+    def get_logging_config(
+        debug: bool = False,
+        env: str = "dev",
+        json_format: bool = False,
+        queue_enabled: bool = False,
+        queue_size: int = 10_000,
+        drop_policy: str = DROP_NEW,
+    ) -> dict:
         log_dir = Path("logs")
         log_dir.mkdir(exist_ok=True)
 
@@ -40,19 +85,22 @@ class LoggingConfig:
                 "style": "{",
                 "datefmt": "%Y-%m-%d %H:%M:%S",
             },
+            "json": {"()": JsonFormatter},
         }
+        file_formatter = "json" if json_format else "detailed"
+        console_formatter = "json" if json_format else "console"
 
         handlers = {
             "console": {
                 "class": "logging.StreamHandler",
                 "level": "DEBUG" if debug else "INFO",
-                "formatter": "console",
+                "formatter": console_formatter,
                 "stream": sys.stdout,
             },
             "file_info": {
                 "class": "logging.handlers.RotatingFileHandler",
                 "level": "INFO",
-                "formatter": "detailed",
+                "formatter": file_formatter,
                 "filename": f"logs/{env}.log",
                 "maxBytes": 10_485_760,
                 "backupCount": 5,
@@ -61,7 +109,7 @@ class LoggingConfig:
             "file_error": {
                 "class": "logging.handlers.RotatingFileHandler",
                 "level": "ERROR",
-                "formatter": "detailed",
+                "formatter": file_formatter,
                 "filename": f"logs/{env}_errors.log",
                 "maxBytes": 10_485_760,
                 "backupCount": 5,
@@ -82,7 +130,7 @@ class LoggingConfig:
                 },
                 # Logger específico para detectar problemas de middleware async
                 "django.request": {
-                    "level": "DEBUG",
+                    "level": "DEBUG" if debug else "INFO",
                     "handlers": ["console", "file_info"],
                     "propagate": False,
                 },
@@ -92,16 +140,42 @@ class LoggingConfig:
                 "level": "DEBUG" if debug else "INFO",
                 "handlers": ["console", "file_info", "file_error"],
             },
+            # Clave propia (no de dictConfig): la consume configure_logging
+            "queue": {
+                "enabled": queue_enabled,
+                "max_size": queue_size,
+                "drop_policy": drop_policy,
+            },
         }
 
     @staticmethod
     def setup_logging(debug: bool = False, env: str = "dev") -> logging.Logger:
         config = LoggingConfig.get_logging_config(debug, env)
-        logging.config.dictConfig(config)
+        configure_logging(config)
         logger = logging.getLogger("app")
         logger.info("Logging configured successfully")
         return logger
 
 
+def configure_logging(config: dict) -> None:
+    """
+    Aplica la configuración con ``dictConfig`` y, si está activado, mueve el
+    formateo y la escritura de logs a un hilo en segundo plano.
+
+    Se usa como ``LOGGING_CONFIG`` de Django.
+    """
+    config = dict(config)
+    queue_config = config.pop("queue", None) or {}
+
+    stop_queue_listener()
+    logging.config.dictConfig(config)
+
+    if queue_config.get("enabled"):
+        install_queue_handlers(
+            max_size=queue_config.get("max_size", 10_000),
+            drop_policy=queue_config.get("drop_policy", DROP_NEW),
+        )
+
+
 def get_logger(name: str = "app") -> logging.Logger:
     return logging.getLogger(name)
@@ -1,14 +1,54 @@
 import asyncio
 import functools
+import logging
 import time
-from typing import Any, Callable, Tuple
+from typing import Any, Callable, Dict, Tuple
 
 from django.db.models.query import QuerySet  # Import the QuerySet class
 
 from .logging_config import get_logger
+from .request_timing import current_timings
 
 logger = get_logger("decorators")
 
+DEFAULT_LOGGING_DECORATORS_SETTINGS: Dict[str, Any] = {
+    "ENABLED": True,
+    # Prefijo de módulo -> activado; gana el prefijo más largo
+    # p. ej. {"apps.songs": False, "apps.songs.use_cases": True}
+    "MODULES": {},
+}
+
+
+def get_logging_decorators_settings() -> Dict[str, Any]:
+    """Configuración de los decoradores (por defecto si Django no está listo)"""
+    config = dict(DEFAULT_LOGGING_DECORATORS_SETTINGS)
+    try:
+        from django.conf import settings
+
+        if settings.configured:
+            config.update(getattr(settings, "LOGGING_DECORATORS", {}))
+    except ImportError:
+        pass
+    return config
+
+
+def is_decorator_logging_enabled(module: str) -> bool:
+    """Indica si los decoradores de logging están activos para un módulo"""
+    config = get_logging_decorators_settings()
+    enabled = bool(config["ENABLED"])
+    matched_length = -1
+    for prefix, value in config["MODULES"].items():
+        matches = module == prefix or module.startswith(f"{prefix}.")
+        if matches and len(prefix) > matched_length:
+            enabled = bool(value)
+            matched_length = len(prefix)
+    return enabled
+
+
+def _get_decorator_logger(func: Callable) -> logging.Logger:
+    """Logger hijo de "decorators" por módulo, configurable desde LOGGING"""
+    return get_logger(f"{logger.name}.{func.__module__}")
+
 
 def _get_class_name(args: tuple) -> str:
     """Extract class name from function arguments."""
@@ -56,9 +96,9 @@ def _format_result(result: Any, include_result: bool) -> str:
     return f" -> {type(result).__name__}"
 
 
-def _log_message(logger_instance, level: str, message: str) -> None:
+def _log_message(logger_instance, level: int, message: str) -> None:
     """Log message with specified level."""
-    getattr(logger_instance, level.lower())(message)
+    logger_instance.log(level, message)
 
 
 def _get_execution_context(
@@ -76,93 +116,130 @@ def _get_execution_context(
 
 
 def _log_execution_start(
-    func_name: str, class_name: str, args_info: str, log_level: str
+    log: logging.Logger,
+    func_name: str,
+    class_name: str,
+    args_info: str,
+    log_level: int,
 ) -> None:
     """Log the start of function execution."""
-    _log_message(logger, log_level, f"→ {class_name}{func_name}{args_info}")
+    _log_message(log, log_level, f"→ {class_name}{func_name}{args_info}")
 
 
 def _log_execution_success(
+    log: logging.Logger,
     func_name: str,
     class_name: str,
     result: Any,
     duration: float,
     include_result: bool,
-    log_level: str,
+    log_level: int,
 ) -> None:
     """Log successful function execution."""
     result_info = _format_result(result, include_result)
     _log_message(
-        logger, log_level, f"← {class_name}{func_name}{result_info} ({duration:.3f}s)"
+        log, log_level, f"← {class_name}{func_name}{result_info} ({duration:.3f}s)"
     )
 
 
 def _log_execution_error(
-    func_name: str, class_name: str, error: Exception, duration: float
+    log: logging.Logger,
+    func_name: str,
+    class_name: str,
+    error: Exception,
+    duration: float,
 ) -> None:
     """Log failed function execution."""
-    logger.error(f"✗ {class_name}{func_name} failed: {str(error)} ({duration:.3f}s)")
+    log.error(f"✗ {class_name}{func_name} failed: {str(error)} ({duration:.3f}s)")
 
 
 def _execute_with_logging(
     func: Callable,
+    log: logging.Logger,
     args: tuple,
     kwargs: dict,
     func_name: str,
     class_name: str,
     include_args: bool,
     include_result: bool,
-    log_level: str,
+    log_level: int,
 ) -> Tuple[Any, float]:
     """Execute function with logging and return result and duration."""
     args_info = ""
     if _should_include_args(include_args, args, kwargs):
         args_info = _format_arguments(args, kwargs, bool(class_name))
 
-    _log_execution_start(func_name, class_name, args_info, log_level)
+    _log_execution_start(log, func_name, class_name, args_info, log_level)
 
     start_time = time.perf_counter()
     try:
         result = func(*args, **kwargs)
         duration = time.perf_counter() - start_time
         _log_execution_success(
-            func_name, class_name, result, duration, include_result, log_level
+            log, func_name, class_name, result, duration, include_result, log_level
         )
         return result, duration
     except Exception as e:
         duration = time.perf_counter() - start_time
-        _log_execution_error(func_name, class_name, e, duration)
+        _log_execution_error(log, func_name, class_name, e, duration)
         raise
 
 
 async def _async_execute_with_logging(
     func: Callable,
+    log: logging.Logger,
     args: tuple,
     kwargs: dict,
     func_name: str,
     class_name: str,
     include_args: bool,
     include_result: bool,
-    log_level: str,
+    log_level: int,
 ) -> Tuple[Any, float]:
     """Execute async function with logging and return result and duration."""
     args_info = ""
     if _should_include_args(include_args, args, kwargs):
         args_info = _format_arguments(args, kwargs, bool(class_name))
 
-    _log_execution_start(func_name, class_name, args_info, log_level)
+    _log_execution_start(log, func_name, class_name, args_info, log_level)
 
     start_time = time.perf_counter()
     try:
         result = await func(*args, **kwargs)
         duration = time.perf_counter() - start_time
         _log_execution_success(
-            func_name, class_name, result, duration, include_result, log_level
+            log, func_name, class_name, result, duration, include_result, log_level
         )
         return result, duration
     except Exception as e:
         duration = time.perf_counter() - start_time
-        _log_execution_error(func_name, class_name, e, duration)
+        _log_execution_error(log, func_name, class_name, e, duration)
+        raise
+
+
+def _execute_logging_errors(
+    log: logging.Logger, func: Callable, args: tuple, kwargs: dict, func_name: str
+) -> Any:
+    """Camino rápido: sólo registra el error si la ejecución falla."""
+    start_time = time.perf_counter()
+    try:
+        return func(*args, **kwargs)
+    except Exception as e:
+        duration = time.perf_counter() - start_time
+        _log_execution_error(log, func_name, _get_class_name(args), e, duration)
+        raise
+
+
+async def _async_execute_logging_errors(
+    log: logging.Logger, func: Callable, args: tuple, kwargs: dict, func_name: str
+) -> Any:
+    """Camino rápido async: sólo registra el error si la ejecución falla."""
+    start_time = time.perf_counter()
+    try:
+        return await func(*args, **kwargs)
+    except Exception as e:
+        duration = time.perf_counter() - start_time
+        _log_execution_error(log, func_name, _get_class_name(args), e, duration)
         raise
 
 
@@ -175,42 +252,55 @@ def log_execution(
         include_args: Si incluir los argumentos en el log
         include_result: Si incluir el resultado en el log
         log_level: Nivel de log (DEBUG, INFO, WARNING, ERROR)
+
+    Si el módulo está desactivado en ``settings.LOGGING_DECORATORS`` devuelve la
+    función original; si el nivel no está habilitado, no formatea nada.
     """
+    level = logging.getLevelName(log_level.upper())
 
     def decorator(func: Callable) -> Callable:
+        if not is_decorator_logging_enabled(func.__module__):
+            return func
+
+        log = _get_decorator_logger(func)
+        func_name = func.__name__
         is_coroutine = asyncio.iscoroutinefunction(func)
 
         @functools.wraps(func)
         async def async_wrapper(*args, **kwargs) -> Any:
-            func_name = func.__name__
-            class_name = _get_class_name(args)
+            if not log.isEnabledFor(level):
+                return await _async_execute_logging_errors(
+                    log, func, args, kwargs, func_name
+                )
 
             result, _ = await _async_execute_with_logging(
                 func,
+                log,
                 args,
                 kwargs,
                 func_name,
-                class_name,
+                _get_class_name(args),
                 include_args,
                 include_result,
-                log_level,
+                level,
             )
             return result
 
         @functools.wraps(func)
         def sync_wrapper(*args, **kwargs) -> Any:
-            func_name = func.__name__
-            class_name = _get_class_name(args)
+            if not log.isEnabledFor(level):
+                return _execute_logging_errors(log, func, args, kwargs, func_name)
 
             result, _ = _execute_with_logging(
                 func,
+                log,
                 args,
                 kwargs,
                 func_name,
-                class_name,
+                _get_class_name(args),
                 include_args,
                 include_result,
-                log_level,
+                level,
             )
             return result
 
@@ -220,10 +310,14 @@ def log_execution(
 
 
 def _log_slow_execution(
-    func_name: str, class_name: str, duration: float, threshold: float
+    log: logging.Logger,
+    func_name: str,
+    class_name: str,
+    duration: float,
+    threshold: float,
 ) -> None:
     """Log slow execution warning."""
-    logger.warning(
+    log.warning(
         f"⚠️  SLOW EXECUTION: {class_name}{func_name} took {duration:.3f}s "
         f"(threshold: {threshold}s)"
     )
@@ -235,41 +329,68 @@ def _is_slow_execution(duration: float, threshold: float) -> bool:
 
 
 def _check_and_log_performance(
-    func: Callable, args: tuple, duration: float, threshold: float
+    log: logging.Logger, func: Callable, args: tuple, duration: float, threshold: float
 ) -> None:
     """Check performance and log if threshold exceeded."""
     if not _is_slow_execution(duration, threshold):
         return
 
     class_name = _get_class_name(args)
-    _log_slow_execution(func.__name__, class_name, duration, threshold)
+    _log_slow_execution(log, func.__name__, class_name, duration, threshold)
+
+
+def _get_span_name(func: Callable, args: tuple) -> str:
+    """Nombre del span del request (``Clase.método``)"""
+    return f"{_get_class_name(args)}{func.__name__}"
 
 
 def log_performance(threshold_seconds: float = 1.0):
     """
     Decorador que registra métodos que tardan más de un umbral específico.
     Soporta funciones async y sync.
+
+    Dentro de un request medido por ``RequestTimingMiddleware`` añade además un
+    span ``Clase.método`` con la duración de cada llamada.
+
+    Si el módulo está desactivado en ``settings.LOGGING_DECORATORS`` devuelve la
+    función original.
     """
 
     def decorator(func: Callable) -> Callable:
+        if not is_decorator_logging_enabled(func.__module__):
+            return func
+
+        log = _get_decorator_logger(func)
         is_coroutine = asyncio.iscoroutinefunction(func)
 
         @functools.wraps(func)
         async def async_wrapper(*args, **kwargs):
+            timings = current_timings()
+            if timings is None and not log.isEnabledFor(logging.WARNING):
+                return await func(*args, **kwargs)
+
             start = time.perf_counter()
             result = await func(*args, **kwargs)
             duration = time.perf_counter() - start
 
-            _check_and_log_performance(func, args, duration, threshold_seconds)
+            if timings is not None:
+                timings.add_span(_get_span_name(func, args), duration)
+            _check_and_log_performance(log, func, args, duration, threshold_seconds)
             return result
 
         @functools.wraps(func)
         def sync_wrapper(*args, **kwargs):
+            timings = current_timings()
+            if timings is None and not log.isEnabledFor(logging.WARNING):
+                return func(*args, **kwargs)
+
             start = time.perf_counter()
             result = func(*args, **kwargs)
             duration = time.perf_counter() - start
 
-            _check_and_log_performance(func, args, duration, threshold_seconds)
+            if timings is not None:
+                timings.add_span(_get_span_name(func, args), duration)
+            _check_and_log_performance(log, func, args, duration, threshold_seconds)
             return result
 
         return async_wrapper if is_coroutine else sync_wrapper
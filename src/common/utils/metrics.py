@@ -0,0 +1,272 @@
+"""
+Registro de métricas en memoria: contadores, gauges e histogramas de latencia.
+
+El registro está acotado (``max_metrics``) y las lecturas de métricas ya
+creadas no toman el lock del registro; cada métrica tiene su propio lock.
+``MetricsExporter`` escribe snapshots periódicos en un fichero JSON desde un
+hilo en segundo plano, así que registrar una métrica nunca hace E/S.
+"""
+
+import json
+import os
+import tempfile
+import threading
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, TypeVar, Union
+
+from .db_connection_metrics import db_connection_metrics
+from .histogram import Histogram
+from .logging_config import get_logger
+from .request_timing import request_timing_stats
+
+logger = get_logger("metrics")
+
+DEFAULT_METRICS_SETTINGS: Dict[str, Any] = {
+    "MAX_METRICS": 1000,
+    # Fichero donde se exportan los snapshots (None = sin exportación)
+    "EXPORT_PATH": None,
+    "EXPORT_INTERVAL": 60.0,
+}
+
+
+def get_metrics_settings() -> Dict[str, Any]:
+    """Configuración de las métricas, por defecto si Django no está listo"""
+    config = dict(DEFAULT_METRICS_SETTINGS)
+    try:
+        from django.conf import settings
+
+        if settings.configured:
+            config.update(getattr(settings, "METRICS", {}))
+    except ImportError:
+        pass
+    return config
+
+
+class Counter:
+    """Contador monótono"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._value = 0
+
+    def inc(self, amount: Union[int, float] = 1) -> None:
+        with self._lock:
+            self._value += amount
+
+    @property
+    def value(self) -> Union[int, float]:
+        return self._value
+
+    def reset(self) -> None:
+        with self._lock:
+            self._value = 0
+
+
+class Gauge:
+    """Valor instantáneo; con ``callback`` se calcula al leerlo"""
+
+    def __init__(self, callback: Optional[Callable[[], float]] = None):
+        self._lock = threading.Lock()
+        self._value: float = 0
+        self.callback = callback
+
+    def set(self, value: float) -> None:
+        self._value = value
+
+    def inc(self, amount: float = 1) -> None:
+        with self._lock:
+            self._value += amount
+
+    def dec(self, amount: float = 1) -> None:
+        self.inc(-amount)
+
+    @property
+    def value(self) -> float:
+        if self.callback is not None:
+            return self.callback()
+        return self._value
+
+    def reset(self) -> None:
+        self._value = 0
+
+
+Metric = Union[Counter, Gauge, Histogram]
+MetricT = TypeVar("MetricT", Counter, Gauge, Histogram)
+
+
+def metric_key(name: str, labels: Dict[str, Any]) -> str:
+    """Clave de una métrica: ``nombre{etiqueta=valor,...}``"""
+    if not labels:
+        return name
+    rendered = ",".join(f"{key}={value}" for key, value in sorted(labels.items()))
+    return f"{name}{{{rendered}}}"
+
+
+class MetricsRegistry:
+    """
+    Registro de métricas por nombre y etiquetas.
+
+    Usage:
+        metrics.counter("youtube.api_calls", operation="search").inc()
+        metrics.histogram("search.duration_ms").record(12.5)
+        metrics.snapshot()
+    """
+
+    def __init__(self, max_metrics: int = DEFAULT_METRICS_SETTINGS["MAX_METRICS"]):
+        self.max_metrics = max_metrics
+        self._lock = threading.Lock()
+        self._counters: Dict[str, Counter] = {}
+        self._gauges: Dict[str, Gauge] = {}
+        self._histograms: Dict[str, Histogram] = {}
+        self._size = 0
+        # Métricas que no se registraron por superar max_metrics
+        self.dropped = 0
+
+    def counter(self, name: str, **labels) -> Counter:
+        return self._get_or_create(self._counters, metric_key(name, labels), Counter)
+
+    def gauge(
+        self, name: str, callback: Optional[Callable[[], float]] = None, **labels
+    ) -> Gauge:
+        gauge = self._get_or_create(self._gauges, metric_key(name, labels), Gauge)
+        if callback is not None:
+            gauge.callback = callback
+        return gauge
+
+    def histogram(self, name: str, **labels) -> Histogram:
+        return self._get_or_create(
+            self._histograms, metric_key(name, labels), Histogram
+        )
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Valores actuales de todas las métricas"""
+        with self._lock:
+            counters = dict(self._counters)
+            gauges = dict(self._gauges)
+            histograms = dict(self._histograms)
+
+        snapshot: Dict[str, Any] = {
+            "counters": {
+                key: counter.value for key, counter in sorted(counters.items())
+            },
+            "gauges": {},
+            "histograms": {
+                key: histogram.snapshot()
+                for key, histogram in sorted(histograms.items())
+            },
+            "dropped_metrics": self.dropped,
+        }
+        for key, gauge in sorted(gauges.items()):
+            try:
+                snapshot["gauges"][key] = gauge.value
+            except Exception:
+                snapshot["gauges"][key] = None
+        return snapshot
+
+    def reset(self) -> None:
+        """
+        Reinicia los valores. Las métricas siguen registradas, así que las
+        referencias guardadas por los servicios siguen siendo válidas.
+        """
+        with self._lock:
+            metrics: List[Metric] = [
+                *self._counters.values(),
+                *self._gauges.values(),
+                *self._histograms.values(),
+            ]
+            self.dropped = 0
+        for metric in metrics:
+            metric.reset()
+
+    def _get_or_create(
+        self, registry: Dict[str, MetricT], key: str, factory: Callable[[], MetricT]
+    ) -> MetricT:
+        metric = registry.get(key)
+        if metric is not None:
+            return metric
+
+        with self._lock:
+            metric = registry.get(key)
+            if metric is not None:
+                return metric
+            metric = factory()
+            if self._size >= self.max_metrics:
+                # Funciona pero no se registra: el registro no crece sin límite
+                self.dropped += 1
+                return metric
+            registry[key] = metric
+            self._size += 1
+            return metric
+
+
+metrics = MetricsRegistry()
+
+
+def collect_metrics() -> Dict[str, Any]:
+    """Snapshot completo: registro, tiempos por endpoint y conexiones a la BD"""
+    return {
+        "generated_at": datetime.now().isoformat(),
+        **metrics.snapshot(),
+        "endpoints": request_timing_stats.snapshot(),
+        "db_connections": db_connection_metrics.snapshot(),
+    }
+
+
+class MetricsExporter(threading.Thread):
+    """Hilo que exporta ``collect()`` a un fichero JSON cada ``interval`` segundos"""
+
+    def __init__(
+        self,
+        path: str,
+        interval: float,
+        collect: Callable[[], Dict[str, Any]] = collect_metrics,
+    ):
+        super().__init__(name="metrics-exporter", daemon=True)
+        self.path = path
+        self.interval = interval
+        self.collect = collect
+        self._stopped = threading.Event()
+
+    def run(self) -> None:
+        while not self._stopped.wait(self.interval):
+            self.export()
+
+    def stop(self) -> None:
+        self._stopped.set()
+
+    def export(self) -> None:
+        """Escribe el snapshot de forma atómica (fichero temporal + rename)"""
+        directory = os.path.dirname(os.path.abspath(self.path))
+        tmp_path = None
+        try:
+            fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+            with os.fdopen(fd, "w") as file:
+                json.dump(self.collect(), file)
+            os.replace(tmp_path, self.path)
+        except Exception as e:
+            if tmp_path and os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            metrics.counter("metrics.export_errors").inc()
+            logger.warning("Failed to export metrics: %s", e)
+
+
+_exporter: Optional[MetricsExporter] = None
+_exporter_lock = threading.Lock()
+
+
+def start_metrics_exporter() -> Optional[MetricsExporter]:
+    """Arranca el exportador si ``METRICS["EXPORT_PATH"]`` está definido"""
+    global _exporter
+
+    config = get_metrics_settings()
+    metrics.max_metrics = config["MAX_METRICS"]
+    if not config["EXPORT_PATH"]:
+        return None
+
+    with _exporter_lock:
+        if _exporter is None:
+            _exporter = MetricsExporter(
+                config["EXPORT_PATH"], float(config["EXPORT_INTERVAL"])
+            )
+            _exporter.start()
+    return _exporter
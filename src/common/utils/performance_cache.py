@@ -1,40 +1,55 @@
 """
-Simple in-memory cache for song search results to avoid repeated YouTube API calls
+In-memory LRU + TTL cache, used as the process-local tier of the cache facade
 """
 
 import threading
 import time
-from typing import Any, Dict, Optional
+from collections import OrderedDict
+from typing import Any, Optional, Tuple
 
 
 class PerformanceCache:
-    """Simple thread-safe in-memory cache for performance optimization"""
+    """Thread-safe in-memory cache with TTL expiration and LRU eviction"""
 
-    def __init__(self, default_ttl: int = 300):  # 5 minutes default TTL
-        self._cache: Dict[str, Dict[str, Any]] = {}
-        self._lock = threading.RLock()
+    def __init__(self, default_ttl: int = 300, max_size: int = 1024):
+        # key -> (expires_at, value); el orden refleja el uso más reciente
+        self._cache: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
         self.default_ttl = default_ttl
+        self.max_size = max_size
+        self.evictions = 0
 
-    def get(self, key: str) -> Optional[Any]:
+    def get(self, key: str, default: Optional[Any] = None) -> Optional[Any]:
         """Get value from cache if not expired"""
         with self._lock:
-            if key not in self._cache:
-                return None
+            item = self._cache.get(key)
+            if item is None:
+                return default
 
-            item = self._cache[key]
-            if time.time() > item["expires_at"]:
+            expires_at, value = item
+            if time.monotonic() > expires_at:
                 del self._cache[key]
-                return None
+                return default
 
-            return item["value"]
+            self._cache.move_to_end(key)
+            return value
 
     def set(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
-        """Set value in cache with TTL"""
+        """Set value in cache with TTL, evicting the least recently used items"""
         ttl = ttl or self.default_ttl
-        expires_at = time.time() + ttl
+        expires_at = time.monotonic() + ttl
 
         with self._lock:
-            self._cache[key] = {"value": value, "expires_at": expires_at}
+            self._cache[key] = (expires_at, value)
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.max_size:
+                self._cache.popitem(last=False)
+                self.evictions += 1
+
+    def delete(self, key: str) -> bool:
+        """Remove a key, returning whether it was present"""
+        with self._lock:
+            return self._cache.pop(key, None) is not None
 
     def clear(self) -> None:
         """Clear all cached items"""
@@ -48,21 +63,19 @@ class PerformanceCache:
 
     def cleanup_expired(self) -> int:
         """Remove expired items and return count of removed items"""
-        current_time = time.time()
-        removed_count = 0
+        current_time = time.monotonic()
 
         with self._lock:
             expired_keys = [
                 key
-                for key, item in self._cache.items()
-                if current_time > item["expires_at"]
+                for key, (expires_at, _) in self._cache.items()
+                if current_time > expires_at
             ]
 
             for key in expired_keys:
                 del self._cache[key]
-                removed_count += 1
 
-        return removed_count
+        return len(expired_keys)
 
 
 # Global cache instances
@@ -1,40 +1,47 @@
 """
 Simple performance monitoring utility for tracking search improvements
+
+Las métricas viven en el registro en memoria (``common.utils.metrics``): cada
+búsqueda actualiza contadores e histogramas en tiempo constante y no se escribe
+ningún fichero. Para persistirlas se usa ``MetricsExporter`` en segundo plano.
 """
 
-import json
-import os
+import itertools
 import time
+from collections import OrderedDict, deque
 from datetime import datetime
 from typing import Any, Dict, List, Optional
 
+from .metrics import MetricsRegistry, metrics
+
 
 class PerformanceMonitor:
     """Simple performance monitoring for music search operations"""
 
-    def __init__(self, log_file: str = "performance_metrics.json"):
-        self.log_file = log_file
-        self.current_metrics: Dict[str, Any] = {}
-        self.load_existing_metrics()
-
-    def load_existing_metrics(self):
-        """Load existing performance metrics if they exist"""
-        try:
-            if os.path.exists(self.log_file):
-                with open(self.log_file, "r") as f:
-                    self.current_metrics = json.load(f)
-        except Exception:
-            self.current_metrics = {"searches": [], "summary": {}}
+    def __init__(
+        self,
+        registry: MetricsRegistry = metrics,
+        max_pending: int = 1000,
+        recent_size: int = 100,
+    ):
+        self.registry = registry
+        self.max_pending = max_pending
+        self._ids = itertools.count()
+        self._pending: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._recent: deque = deque(maxlen=recent_size)
 
     def start_search(self, query: str, operation: str = "search") -> str:
         """Start tracking a search operation"""
-        search_id = f"{operation}_{int(time.time() * 1000)}"
-        self.current_metrics[search_id] = {
+        search_id = f"{operation}_{int(time.time() * 1000)}_{next(self._ids)}"
+        self._pending[search_id] = {
             "query": query,
             "operation": operation,
             "start_time": time.time(),
             "timestamp": datetime.now().isoformat(),
         }
+        # Búsquedas que nunca terminaron: se descartan las más antiguas
+        while len(self._pending) > self.max_pending:
+            self._pending.popitem(last=False)
         return search_id
 
     def end_search(
@@ -45,92 +52,79 @@ class PerformanceMonitor:
         error: Optional[str] = None,
     ):
         """End tracking a search operation"""
-        if search_id in self.current_metrics:
-            search_data = self.current_metrics[search_id]
-            search_data.update(
-                {
-                    "end_time": time.time(),
-                    "duration": time.time() - search_data["start_time"],
-                    "result_count": result_count,
-                    "success": success,
-                    "error": error,
-                }
-            )
-
-            # Move to searches list
-            if "searches" not in self.current_metrics:
-                self.current_metrics["searches"] = []
-
-            self.current_metrics["searches"].append(search_data)
-            del self.current_metrics[search_id]
-
-            # Update summary statistics
-            self.update_summary()
+        search_data = self._pending.pop(search_id, None)
+        if search_data is None:
+            return
 
-            # Save to file
-            self.save_metrics()
+        end_time = time.time()
+        duration = end_time - search_data["start_time"]
+        search_data.update(
+            {
+                "end_time": end_time,
+                "duration": duration,
+                "result_count": result_count,
+                "success": success,
+                "error": error,
+            }
+        )
+        self._recent.append(search_data)
+
+        operation = search_data["operation"]
+        self.registry.counter("search.total", operation=operation).inc()
+        self.registry.counter("search.total").inc()
+        if not success:
+            self.registry.counter("search.errors", operation=operation).inc()
+            return
 
-    def update_summary(self):
-        """Update summary statistics"""
-        searches = self.current_metrics.get("searches", [])
+        self.registry.counter("search.successful").inc()
+        self.registry.counter("search.results").inc(result_count)
+        self.registry.histogram("search.duration_ms").record(duration * 1000)
+        self.registry.histogram("search.duration_ms", operation=operation).record(
+            duration * 1000
+        )
 
-        if not searches:
-            return
+    def get_recent_performance(self, limit: int = 10) -> List[Dict[str, Any]]:
+        """Get recent search performance data"""
+        return list(self._recent)[-limit:]
 
-        successful_searches = [s for s in searches if s.get("success", False)]
+    def get_summary(self) -> Dict[str, Any]:
+        """Get performance summary"""
+        total = self.registry.counter("search.total").value
+        if not total:
+            return {}
 
+        successful = self.registry.counter("search.successful").value
         summary = {
-            "total_searches": len(searches),
-            "successful_searches": len(successful_searches),
-            "success_rate": len(successful_searches) / len(searches) * 100,
+            "total_searches": total,
+            "successful_searches": successful,
+            "success_rate": successful / total * 100,
             "last_updated": datetime.now().isoformat(),
         }
 
-        if successful_searches:
-            durations = [s["duration"] for s in successful_searches]
-            result_counts = [s.get("result_count", 0) for s in successful_searches]
-
+        if successful:
+            durations = self.registry.histogram("search.duration_ms").snapshot()
+            total_results = self.registry.counter("search.results").value
             summary.update(
                 {
-                    "avg_duration": sum(durations) / len(durations),
-                    "max_duration": max(durations),
-                    "min_duration": min(durations),
-                    "avg_results": sum(result_counts) / len(result_counts),
-                    "total_results_found": sum(result_counts),
+                    "avg_duration": durations["mean"] / 1000,
+                    "max_duration": durations["max"] / 1000,
+                    "min_duration": durations["min"] / 1000,
+                    "p95_duration": durations["p95"] / 1000,
+                    "p99_duration": durations["p99"] / 1000,
+                    "avg_results": total_results / successful,
+                    "total_results_found": total_results,
                 }
             )
 
-        self.current_metrics["summary"] = summary
-
-    def save_metrics(self):
-        """Save metrics to file"""
-        try:
-            with open(self.log_file, "w") as f:
-                json.dump(self.current_metrics, f, indent=2)
-        except Exception as e:
-            print(f"Failed to save performance metrics: {e}")
-
-    def get_recent_performance(self, limit: int = 10) -> List[Dict[str, Any]]:
-        """Get recent search performance data"""
-        searches = self.current_metrics.get("searches", [])
-        return searches[-limit:] if searches else []
-
-    def get_summary(self) -> Dict[str, Any]:
-        """Get performance summary"""
-        return self.current_metrics.get("summary", {})
+        return summary
 
     def clear_old_data(self, days: int = 7):
-        """Clear performance data older than specified days"""
+        """Clear recent search data older than specified days"""
         cutoff_time = time.time() - (days * 24 * 60 * 60)
-        searches = self.current_metrics.get("searches", [])
-
-        filtered_searches = [
-            s for s in searches if s.get("start_time", 0) > cutoff_time
-        ]
-
-        self.current_metrics["searches"] = filtered_searches
-        self.update_summary()
-        self.save_metrics()
+        self._recent = deque(
+            (s for s in self._recent if s.get("start_time", 0) > cutoff_time),
+            maxlen=self._recent.maxlen,
+        )
 
 
 # Global performance monitor instance
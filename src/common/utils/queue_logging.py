@@ -0,0 +1,208 @@
+"""
+Logging no bloqueante: los loggers sólo encolan el registro y un hilo en segundo
+plano (``QueueListener``) lo formatea y escribe en consola y ficheros.
+
+La cola está acotada; cuando se llena se aplica una política de descarte en
+lugar de bloquear el hilo de la petición o el event loop.
+"""
+
+import atexit
+import copy
+import logging
+import queue
+import threading
+from logging.handlers import QueueHandler, QueueListener
+from typing import Dict, List, Optional, Sequence
+
+DROP_NEW = "drop_new"
+DROP_OLDEST = "drop_oldest"
+DROP_POLICIES = (DROP_NEW, DROP_OLDEST)
+
+
+class BoundedQueueHandler(QueueHandler):
+    """
+    ``QueueHandler`` que nunca bloquea.
+
+    Con la cola llena descarta el registro nuevo (``drop_new``) o el más
+    antiguo (``drop_oldest``). Los registros ERROR o superiores siempre
+    desplazan al más antiguo para no perder errores.
+    """
+
+    def __init__(
+        self,
+        log_queue: queue.Queue,
+        targets: Sequence[logging.Handler],
+        drop_policy: str = DROP_NEW,
+    ):
+        if drop_policy not in DROP_POLICIES:
+            raise ValueError(f"Invalid drop policy: {drop_policy}")
+        super().__init__(log_queue)
+        # ``self.queue`` está tipada como protocolo sin ``get_nowait``
+        self.log_queue = log_queue
+        self.targets = tuple(targets)
+        self.drop_policy = drop_policy
+        self.dropped = 0
+        self._lock = threading.Lock()
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """
+        Preparación mínima en el hilo que emite: el mensaje se interpola ya
+        (los args podrían mutar), pero el formateo queda para el listener.
+        """
+        record = copy.copy(record)
+        record.message = record.getMessage()
+        record.msg = record.message
+        record.args = None
+        record.log_targets = self.targets
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.log_queue.put_nowait(record)
+            return
+        except queue.Full:
+            pass
+
+        if self.drop_policy == DROP_NEW and record.levelno < logging.ERROR:
+            self._count_drop()
+            return
+
+        # Hace sitio descartando el registro más antiguo
+        try:
+            self.log_queue.get_nowait()
+            self._count_drop()
+        except queue.Empty:
+            pass
+        try:
+            self.log_queue.put_nowait(record)
+        except queue.Full:
+            self._count_drop()
+
+    def _count_drop(self) -> None:
+        with self._lock:
+            self.dropped += 1
+
+
+class LogDispatcher(QueueListener):
+    """
+    ``QueueListener`` que entrega cada registro a los handlers del logger que lo
+    emitió (``record.log_targets``) y avisa de los registros descartados.
+    """
+
+    def __init__(self, log_queue: queue.Queue):
+        super().__init__(log_queue)
+        self.log_queue = log_queue
+        self.queue_handlers: List[BoundedQueueHandler] = []
+        self._reported_drops = 0
+
+    @property
+    def dropped(self) -> int:
+        return sum(handler.dropped for handler in self.queue_handlers)
+
+    def enqueue_sentinel(self) -> None:
+        # Bloqueante: con la cola llena put_nowait fallaría y el hilo no pararía
+        self.log_queue.put(self._sentinel)  # type: ignore[attr-defined]
+
+    def handle(self, record: logging.LogRecord) -> None:
+        targets = getattr(record, "log_targets", ())
+        self._report_drops(targets)
+        for handler in targets:
+            if record.levelno >= handler.level:
+                handler.handle(record)
+
+    def _report_drops(self, targets: Sequence[logging.Handler]) -> None:
+        dropped = self.dropped
+        if dropped <= self._reported_drops:
+            return
+
+        record = logging.LogRecord(
+            name=__name__,
+            level=logging.WARNING,
+            pathname=__file__,
+            lineno=0,
+            msg=(
+                f"Logging queue full: {dropped - self._reported_drops} "
+                f"records dropped ({dropped} total)"
+            ),
+            args=None,
+            exc_info=None,
+        )
+        self._reported_drops = dropped
+        for handler in targets:
+            if record.levelno >= handler.level:
+                handler.handle(record)
+
+
+_dispatcher_lock = threading.Lock()
+_dispatcher: Optional[LogDispatcher] = None
+
+
+def install_queue_handlers(max_size: int = 10_000, drop_policy: str = DROP_NEW) -> None:
+    """
+    Sustituye los handlers de root y de cada logger configurado por un
+    ``BoundedQueueHandler`` y arranca el hilo que los atiende.
+
+    Se llama después de ``dictConfig``: los handlers originales pasan a
+    ejecutarse en el hilo del listener.
+    """
+    global _dispatcher
+
+    with _dispatcher_lock:
+        stop_queue_listener()
+
+        log_queue: queue.Queue = queue.Queue(maxsize=max_size)
+        dispatcher = LogDispatcher(log_queue)
+        # Un QueueHandler por conjunto de handlers: los loggers que comparten
+        # handlers comparten también el QueueHandler
+        by_targets: Dict[tuple, BoundedQueueHandler] = {}
+
+        loggers = [logging.getLogger()] + [
+            logger
+            for logger in logging.Logger.manager.loggerDict.values()
+            if isinstance(logger, logging.Logger)
+        ]
+        for logger in loggers:
+            targets = tuple(
+                handler
+                for handler in logger.handlers
+                if not isinstance(handler, QueueHandler)
+            )
+            if not targets:
+                continue
+
+            queue_handler = by_targets.get(targets)
+            if queue_handler is None:
+                queue_handler = BoundedQueueHandler(log_queue, targets, drop_policy)
+                by_targets[targets] = queue_handler
+                dispatcher.queue_handlers.append(queue_handler)
+
+            for handler in targets:
+                logger.removeHandler(handler)
+            logger.addHandler(queue_handler)
+
+        dispatcher.start()
+        _dispatcher = dispatcher
+
+
+def stop_queue_listener() -> None:
+    """Vacía la cola y detiene el hilo del listener (si está activo)"""
+    global _dispatcher
+
+    if _dispatcher is not None:
+        _dispatcher.stop()
+        _dispatcher = None
+
+
+def get_logging_queue_stats() -> Dict[str, int]:
+    """Tamaño de la cola y registros descartados"""
+    dispatcher = _dispatcher
+    if dispatcher is None:
+        return {"enabled": 0, "queued": 0, "dropped": 0}
+    return {
+        "enabled": 1,
+        "queued": dispatcher.log_queue.qsize(),
+        "dropped": dispatcher.dropped,
+    }
+
+
+atexit.register(stop_queue_listener)
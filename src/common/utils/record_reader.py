@@ -0,0 +1,161 @@
+"""
+Lectura en streaming de ficheros de registros (CSV, JSON y JSON Lines).
+
+Los registros se leen de uno en uno sin cargar el fichero entero: un CSV con
+cabecera, un array JSON de objetos o un objeto JSON por línea (``.jsonl`` o
+``.ndjson``). Cada registro se devuelve con su posición (1, 2, ...) para poder
+señalar errores.
+
+Un registro mal formado en CSV o JSON Lines no detiene la lectura si se pasa
+``on_error``; en un array JSON no se puede seguir y siempre se lanza.
+"""
+
+import csv
+import json
+import os
+from typing import Any, Callable, Dict, Iterator, Optional, TextIO, Tuple
+
+FORMATS = {
+    ".csv": "csv",
+    ".json": "json",
+    ".jsonl": "jsonl",
+    ".ndjson": "jsonl",
+}
+
+# Caracteres leídos de una vez de un array JSON
+_JSON_CHUNK = 64 * 1024
+
+Record = Dict[str, Any]
+
+
+class RecordError(ValueError):
+    """Registro ilegible o que no es un objeto"""
+
+    def __init__(self, position: int, message: str):
+        super().__init__(f"Record {position}: {message}")
+        self.position = position
+
+
+def detect_format(path: str) -> str:
+    """Formato del fichero según su extensión"""
+    extension = os.path.splitext(path)[1].lower()
+    if extension not in FORMATS:
+        raise ValueError(
+            f"Unsupported file type '{extension}' (expected one of: "
+            f"{', '.join(sorted(FORMATS))})"
+        )
+    return FORMATS[extension]
+
+
+def iter_records(
+    path: str,
+    format: Optional[str] = None,
+    on_error: Optional[Callable[[RecordError], None]] = None,
+) -> Iterator[Tuple[int, Record]]:
+    """
+    Registros del fichero como ``(posición, dict)``.
+
+    Args:
+        path: Ruta del fichero
+        format: "csv", "json" o "jsonl"; por defecto según la extensión
+        on_error: Recibe los registros mal formados en vez de lanzarlos
+    """
+    format = format or detect_format(path)
+    with open(path, encoding="utf-8-sig", newline="") as file:
+        if format == "csv":
+            yield from _iter_csv(file, on_error)
+        elif format == "jsonl":
+            yield from _iter_json_lines(file, on_error)
+        elif format == "json":
+            yield from _iter_json_array(file)
+        else:
+            raise ValueError(f"Unsupported format '{format}'")
+
+
+def _report(error: RecordError, on_error) -> None:
+    if on_error is None:
+        raise error
+    on_error(error)
+
+
+def _iter_csv(file: TextIO, on_error) -> Iterator[Tuple[int, Record]]:
+    reader = csv.DictReader(file)
+    for position, row in enumerate(reader, start=1):
+        # Las columnas de más quedan bajo la clave None
+        if None in row:
+            _report(RecordError(position, "more values than columns"), on_error)
+            continue
+        yield position, row
+
+
+def _iter_json_lines(file: TextIO, on_error) -> Iterator[Tuple[int, Record]]:
+    position = 0
+    for line in file:
+        if not line.strip():
+            continue
+        position += 1
+        try:
+            record = json.loads(line)
+        except ValueError as e:
+            _report(RecordError(position, f"invalid JSON ({e})"), on_error)
+            continue
+        if not isinstance(record, dict):
+            _report(RecordError(position, "expected a JSON object"), on_error)
+            continue
+        yield position, record
+
+
+def _iter_json_array(file: TextIO) -> Iterator[Tuple[int, Record]]:
+    """Objetos de un array JSON, decodificados a medida que se leen"""
+    decoder = json.JSONDecoder()
+    buffer = ""
+    index = 0
+    eof = False
+    position = 0
+    # Tras "[" o "," se espera un valor; tras un valor, "," o "]"
+    expect_value = True
+
+    def next_char() -> str:
+        """Siguiente carácter que no es espacio ("" al final del fichero)"""
+        nonlocal buffer, index, eof
+        while True:
+            while index < len(buffer) and buffer[index] in " \t\r\n":
+                index += 1
+            if index < len(buffer) or eof:
+                return buffer[index : index + 1]
+            buffer, index = file.read(_JSON_CHUNK), 0
+            eof = not buffer
+
+    if next_char() != "[":
+        raise RecordError(1, "expected a JSON array")
+    index += 1
+
+    while True:
+        char = next_char()
+        if not char:
+            raise RecordError(position + 1, "unexpected end of file")
+        if char == "]" and (not expect_value or position == 0):
+            return
+        if not expect_value:
+            if char != ",":
+                raise RecordError(position + 1, "expected ',' or ']'")
+            index += 1
+            expect_value = True
+            continue
+
+        try:
+            record, index = decoder.raw_decode(buffer, index)
+        except ValueError as e:
+            if eof:
+                raise RecordError(position + 1, f"invalid JSON ({e})")
+            # El valor puede seguir en el siguiente bloque
+            chunk = file.read(_JSON_CHUNK)
+            eof = not chunk
+            buffer, index = buffer[index:] + chunk, 0
+            continue
+
+        position += 1
+        expect_value = False
+        if not isinstance(record, dict):
+            raise RecordError(position, "expected a JSON object")
+        yield position, record
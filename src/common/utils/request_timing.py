@@ -0,0 +1,252 @@
+"""
+Instrumentación por request: consultas a la base de datos, llamadas a servicios
+externos (YouTube, yt-dlp, Supabase, letras, Stripe) y spans de casos de uso.
+
+Los tiempos se acumulan en un objeto por request guardado en un ContextVar
+(``sync_to_async`` y ``asyncio.to_thread`` copian el contexto, así que los hilos
+auxiliares escriben en el mismo objeto), se exponen en la cabecera
+``Server-Timing`` y se agregan por endpoint en histogramas en memoria.
+"""
+
+import asyncio
+import contextvars
+import functools
+import re
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from .histogram import Histogram
+
+_TOKEN_INVALID_CHARS = re.compile(r"[^A-Za-z0-9!#$%&'*+.^_`|~-]")
+
+DEFAULT_REQUEST_TIMING_SETTINGS: Dict[str, Any] = {
+    "ENABLED": True,
+    # Añadir la cabecera Server-Timing a las respuestas
+    "SERVER_TIMING_HEADER": False,
+    # Avisar (WARNING) cuando un request supera este número de consultas
+    "QUERY_COUNT_WARNING": 50,
+}
+
+
+def get_request_timing_settings() -> Dict[str, Any]:
+    """Configuración de la instrumentación, por defecto si Django no está listo"""
+    config = dict(DEFAULT_REQUEST_TIMING_SETTINGS)
+    try:
+        from django.conf import settings
+
+        if settings.configured:
+            config.update(getattr(settings, "REQUEST_TIMING", {}))
+    except ImportError:
+        pass
+    return config
+
+
+class RequestTimings:
+    """Tiempos acumulados de un request"""
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.db_queries = 0
+        self.db_time = 0.0
+        # nombre -> [segundos acumulados, llamadas]
+        self.spans: Dict[str, List[float]] = {}
+
+    def add_query(self, duration: float) -> None:
+        self.db_queries += 1
+        self.db_time += duration
+
+    def add_span(self, name: str, duration: float) -> None:
+        span = self.spans.get(name)
+        if span is None:
+            self.spans[name] = [duration, 1]
+        else:
+            span[0] += duration
+            span[1] += 1
+
+    @property
+    def elapsed(self) -> float:
+        return time.perf_counter() - self.started
+
+
+_current: contextvars.ContextVar[Optional[RequestTimings]] = contextvars.ContextVar(
+    "request_timings", default=None
+)
+
+
+def start_request() -> contextvars.Token:
+    """Empieza a medir el request actual"""
+    return _current.set(RequestTimings())
+
+
+def end_request(token: contextvars.Token) -> Optional[RequestTimings]:
+    """Termina el request actual y devuelve sus tiempos"""
+    timings = _current.get()
+    _current.reset(token)
+    return timings
+
+
+def current_timings() -> Optional[RequestTimings]:
+    """Tiempos del request en curso, o None fuera de un request"""
+    return _current.get()
+
+
+@contextmanager
+def span(name: str) -> Iterator[None]:
+    """Mide un bloque como span ``name`` del request en curso"""
+    timings = _current.get()
+    if timings is None:
+        yield
+        return
+
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        timings.add_span(name, time.perf_counter() - start)
+
+
+def timed(name: str) -> Callable:
+    """
+    Decorador que mide cada llamada como span ``name``. Soporta async y sync.
+
+    Usage:
+        @timed("youtube")
+        async def search_videos(self, query): ...
+    """
+
+    def decorator(func: Callable) -> Callable:
+        if asyncio.iscoroutinefunction(func):
+
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs) -> Any:
+                with span(name):
+                    return await func(*args, **kwargs)
+
+            return async_wrapper
+
+        @functools.wraps(func)
+        def sync_wrapper(*args, **kwargs) -> Any:
+            with span(name):
+                return func(*args, **kwargs)
+
+        return sync_wrapper
+
+    return decorator
+
+
+class QueryTimer:
+    """``execute_wrapper`` de Django que cuenta y mide las consultas del request"""
+
+    def __call__(self, execute, sql, params, many, context):
+        timings = _current.get()
+        if timings is None:
+            return execute(sql, params, many, context)
+
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            timings.add_query(time.perf_counter() - start)
+
+
+query_timer = QueryTimer()
+
+
+def _attach_query_timer(connection) -> None:
+    if query_timer not in connection.execute_wrappers:
+        connection.execute_wrappers.append(query_timer)
+
+
+def _on_connection_created(sender, connection, **kwargs):
+    _attach_query_timer(connection)
+
+
+def install_query_timer() -> None:
+    """
+    Añade ``query_timer`` a cada conexión al abrirse.
+
+    Se engancha a ``connection_created`` en lugar de usar el context manager
+    ``connection.execute_wrapper`` en el middleware porque, bajo ASGI, las
+    consultas se ejecutan en los hilos de ``sync_to_async`` con su propia conexión.
+    """
+    from django.db import connections
+    from django.db.backends.signals import connection_created
+
+    connection_created.connect(_on_connection_created, dispatch_uid="query_timer")
+    for connection in connections.all(initialized_only=True):
+        _attach_query_timer(connection)
+
+
+def server_timing_metric(name: str) -> str:
+    """Convierte un nombre de span en un token válido para ``Server-Timing``"""
+    return _TOKEN_INVALID_CHARS.sub("-", name)
+
+
+def format_server_timing(timings: RequestTimings, total: float) -> str:
+    """Valor de la cabecera ``Server-Timing`` (duraciones en milisegundos)"""
+    metrics = [
+        f"total;dur={total * 1000:.1f}",
+        f'db;dur={timings.db_time * 1000:.1f};desc="{timings.db_queries} queries"',
+    ]
+    for name, (duration, calls) in timings.spans.items():
+        metric = f"{server_timing_metric(name)};dur={duration * 1000:.1f}"
+        if calls > 1:
+            metric += f';desc="{int(calls)} calls"'
+        metrics.append(metric)
+    return ", ".join(metrics)
+
+
+class RequestTimingStats:
+    """
+    Histogramas agregados por endpoint: tiempo total, tiempo y número de
+    consultas, y tiempo de cada span.
+    """
+
+    def __init__(self, max_endpoints: int = 500):
+        self.max_endpoints = max_endpoints
+        self._lock = threading.Lock()
+        self._histograms: Dict[Tuple[str, str], Histogram] = {}
+        self._endpoints: Dict[str, None] = {}
+
+    def record(self, endpoint: str, timings: RequestTimings, total: float) -> None:
+        """Agrega los tiempos de un request al endpoint"""
+        if endpoint not in self._endpoints:
+            with self._lock:
+                if len(self._endpoints) >= self.max_endpoints:
+                    endpoint = "other"
+                self._endpoints.setdefault(endpoint, None)
+
+        self._histogram(endpoint, "total_ms").record(total * 1000)
+        self._histogram(endpoint, "db_ms").record(timings.db_time * 1000)
+        self._histogram(endpoint, "db_queries").record(timings.db_queries)
+        for name, (duration, _) in timings.spans.items():
+            self._histogram(endpoint, f"{name}_ms").record(duration * 1000)
+
+    def snapshot(self) -> Dict[str, Dict[str, Dict[str, float]]]:
+        """Percentiles por endpoint y métrica"""
+        with self._lock:
+            items = list(self._histograms.items())
+
+        result: Dict[str, Dict[str, Dict[str, float]]] = {}
+        for (endpoint, metric), histogram in sorted(items):
+            result.setdefault(endpoint, {})[metric] = histogram.snapshot()
+        return result
+
+    def reset(self) -> None:
+        """Elimina todos los histogramas"""
+        with self._lock:
+            self._histograms.clear()
+            self._endpoints.clear()
+
+    def _histogram(self, endpoint: str, metric: str) -> Histogram:
+        key = (endpoint, metric)
+        histogram = self._histograms.get(key)
+        if histogram is None:
+            with self._lock:
+                histogram = self._histograms.setdefault(key, Histogram())
+        return histogram
+
+
+request_timing_stats = RequestTimingStats()
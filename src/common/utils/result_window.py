@@ -0,0 +1,38 @@
+from typing import Callable, Generic, List, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+class ResultWindow(Generic[T]):
+    """
+    Resultados paginables que sólo cargan la página pedida.
+
+    El paginador de Django pide ``count()`` y un slice ``[offset:offset+limit]``;
+    ambos se delegan en ``count`` y ``fetch(offset, limit)`` (p. ej. un caso de
+    uso), de modo que nunca se materializa el resultado completo.
+
+    Usage:
+        window = ResultWindow(count=count_items, fetch=get_items)
+        page = self.paginate_queryset(window)
+    """
+
+    def __init__(self, count: Callable[[], int], fetch: Callable[[int, int], List[T]]):
+        self._count = count
+        self._fetch = fetch
+        self._total: Optional[int] = None
+
+    def count(self) -> int:
+        if self._total is None:
+            self._total = self._count()
+        return self._total
+
+    def __len__(self) -> int:
+        return self.count()
+
+    def __getitem__(self, index: slice) -> List[T]:
+        if not isinstance(index, slice) or index.step not in (None, 1):
+            raise TypeError("ResultWindow only supports contiguous slices")
+        start, stop, _ = index.indices(self.count())
+        if stop <= start:
+            return []
+        return self._fetch(start, stop - start)
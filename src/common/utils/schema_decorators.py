@@ -68,3 +68,25 @@ def paginated_list_endpoint(serializer_class, tags=None, description=None, **kwa
     kwargs["responses"] = kwargs.get("responses", {200: serializer_class(many=True)})
 
     return paginated_endpoint(tags=tags, description=description, **kwargs)
+
+
+def same_schema_as(handler):
+    """
+    Decorator que reutiliza la documentación OpenAPI de otro handler.
+
+    Útil para las variantes async de una vista, que sobrescriben el handler
+    sync y perderían su ``extend_schema``.
+
+    Usage:
+        @same_schema_as(LyricsView.get)
+        async def get(self, request, song_id):
+            ...
+    """
+
+    def decorator(func):
+        annotation = getattr(handler, "_spectacular_annotation", None)
+        if annotation is not None:
+            func._spectacular_annotation = annotation.copy()
+        return func
+
+    return decorator
@@ -0,0 +1,59 @@
+"""
+Agrupa llamadas concurrentes con la misma clave en una sola ejecución.
+
+La primera llamada con una clave ejecuta la función; las que llegan mientras
+tanto esperan su resultado (o su excepción) en lugar de repetir el trabajo.
+Usa ``concurrent.futures.Future`` para que funcione también entre hilos con
+bucles de eventos distintos (``async_to_sync`` en vistas síncronas).
+"""
+
+import asyncio
+import threading
+from concurrent.futures import Future
+from typing import Awaitable, Callable, Dict, Generic, Hashable, TypeVar
+
+T = TypeVar("T")
+
+
+class SingleFlight(Generic[T]):
+    """
+    Deduplicación de trabajo en curso por clave.
+
+    Usage:
+        lookups = SingleFlight()
+        lyrics = await lookups.do(song_id, lambda: fetch_lyrics(song))
+    """
+
+    def __init__(self):
+        self._calls: Dict[Hashable, "Future[T]"] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._calls)
+
+    async def do(self, key: Hashable, func: Callable[[], Awaitable[T]]) -> T:
+        """Resultado de ``func``, compartido con las llamadas simultáneas a ``key``"""
+        with self._lock:
+            running = self._calls.get(key)
+            if running is None:
+                future: "Future[T]" = Future()
+                self._calls[key] = future
+
+        if running is not None:
+            # shield: cancelar a quien espera no cancela la llamada compartida
+            return await asyncio.shield(asyncio.wrap_future(running))
+
+        try:
+            result = await func()
+        except Exception as e:
+            future.set_exception(e)
+            raise
+        except BaseException:
+            future.cancel()
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
@@ -0,0 +1,101 @@
+"""
+Calentamiento del worker tras crear la aplicación WSGI/ASGI.
+
+Django carga el URLconf (y con él todas las vistas, factorías y adaptadores)
+en la primera petición, y las dependencias pesadas (``lazy_import``) en el
+primer uso. ``start_warmup`` hace ambas cosas al arrancar para que la primera
+petición no pague por ellas:
+
+- con ``BACKGROUND`` (por defecto) en un hilo, así el worker acepta peticiones
+  enseguida; una petición que llegue durante el calentamiento espera al import
+  en curso en vez de repetirlo.
+- sin ``BACKGROUND``, antes de devolver la aplicación, para que el worker sólo
+  se dé por listo cuando está caliente (``gunicorn --preload``, donde los hilos
+  del proceso maestro no sobreviven al fork).
+"""
+
+import threading
+import time
+from typing import Any, Dict, Optional
+
+from .lazy_import import preload_lazy_modules
+from .logging_config import get_logger
+from .metrics import metrics
+
+logger = get_logger(__name__)
+
+DEFAULT_WARMUP_SETTINGS: Dict[str, Any] = {
+    "ENABLED": True,
+    "BACKGROUND": True,
+    # Cargar el URLconf además de los módulos diferidos
+    "URLCONF": True,
+}
+
+_started = False
+_started_lock = threading.Lock()
+
+
+def get_warmup_settings() -> Dict[str, Any]:
+    """Configuración del calentamiento, por defecto si Django no está listo"""
+    config = dict(DEFAULT_WARMUP_SETTINGS)
+    try:
+        from django.conf import settings
+
+        if settings.configured:
+            config.update(getattr(settings, "WARMUP", {}))
+    except ImportError:
+        pass
+    return config
+
+
+def warm_up(urlconf: bool = True) -> Dict[str, float]:
+    """
+    Carga el URLconf y los módulos diferidos.
+
+    Returns:
+        Segundos de cada paso ("urlconf" y uno por módulo diferido)
+    """
+    timings: Dict[str, float] = {}
+    start = time.perf_counter()
+    if urlconf:
+        try:
+            from django.urls import get_resolver
+
+            get_resolver().url_patterns
+            timings["urlconf"] = time.perf_counter() - start
+        except Exception as e:
+            logger.warning(f"Could not load URLconf during warm-up: {e}")
+    timings.update(preload_lazy_modules())
+
+    total = time.perf_counter() - start
+    metrics.gauge("worker.warmup_seconds").set(round(total, 3))
+    logger.info(
+        f"Worker warm-up finished in {total:.2f}s: "
+        + ", ".join(f"{name}={seconds:.2f}s" for name, seconds in timings.items())
+    )
+    return timings
+
+
+def start_warmup() -> Optional[threading.Thread]:
+    """Lanza el calentamiento según ``WARMUP`` (una vez por proceso)"""
+    global _started
+
+    config = get_warmup_settings()
+    if not config["ENABLED"]:
+        return None
+    with _started_lock:
+        if _started:
+            return None
+        _started = True
+
+    if not config["BACKGROUND"]:
+        warm_up(urlconf=config["URLCONF"])
+        return None
+    thread = threading.Thread(
+        target=warm_up,
+        kwargs={"urlconf": config["URLCONF"]},
+        name="worker-warmup",
+        daemon=True,
+    )
+    thread.start()
+    return thread
@@ -0,0 +1,3 @@
+from .metrics_view import metrics_view
+
+__all__ = ["metrics_view"]
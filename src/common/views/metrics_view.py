@@ -0,0 +1,15 @@
+from django.http import JsonResponse
+from django.views.decorators.cache import never_cache
+from django.views.decorators.http import require_GET
+
+from ..utils.metrics import collect_metrics
+
+
+@require_GET
+@never_cache
+def metrics_view(request):
+    """
+    Snapshot de sólo lectura del registro de métricas, los tiempos por endpoint
+    y las conexiones a la base de datos. Se monta detrás de ``admin_view``.
+    """
+    return JsonResponse(collect_metrics())
@@ -0,0 +1,98 @@
+"""
+Tests for the async dispatch of DRF views under ASGI
+"""
+
+import threading
+
+import pytest
+from asgiref.sync import iscoroutinefunction
+
+
+@pytest.fixture
+def views(django_setup):
+    """Vistas de prueba con handlers async"""
+    from rest_framework.exceptions import NotFound
+    from rest_framework.permissions import AllowAny, IsAuthenticated
+    from rest_framework.response import Response
+    from rest_framework.views import APIView
+
+    from common.mixins import AsyncAPIViewMixin
+
+    class EchoView(AsyncAPIViewMixin, APIView):
+        authentication_classes = []
+        permission_classes = [AllowAny]
+
+        async def get(self, request):
+            return Response({"handler": "async", "query": request.GET.get("q")})
+
+        async def delete(self, request):
+            raise NotFound("missing")
+
+    class PrivateView(EchoView):
+        permission_classes = [IsAuthenticated]
+
+    return EchoView, PrivateView
+
+
+@pytest.fixture
+def factory(django_setup):
+    from rest_framework.test import APIRequestFactory
+
+    return APIRequestFactory()
+
+
+class TestAsyncAPIViewMixin:
+    """Test ``AsyncAPIViewMixin.dispatch``"""
+
+    def test_as_view_is_marked_as_coroutine(self, views):
+        echo_view, _ = views
+
+        assert iscoroutinefunction(echo_view.as_view())
+
+    async def test_async_handler_is_awaited(self, views, factory):
+        echo_view, _ = views
+
+        response = await echo_view.as_view()(factory.get("/", {"q": "queen"}))
+
+        assert response.status_code == 200
+        assert response.data == {"handler": "async", "query": "queen"}
+
+    async def test_inherited_sync_handler_runs_in_a_thread(
+        self, views, factory, monkeypatch
+    ):
+        echo_view, _ = views
+        threads = []
+        options = echo_view.options
+
+        def record_thread(self, request, *args, **kwargs):
+            threads.append(threading.get_ident())
+            return options(self, request, *args, **kwargs)
+
+        monkeypatch.setattr(echo_view, "options", record_thread)
+
+        response = await echo_view.as_view()(factory.options("/"))
+
+        assert response.status_code == 200
+        assert threads and threads[0] != threading.get_ident()
+
+    async def test_handler_exceptions_are_handled_by_drf(self, views, factory):
+        echo_view, _ = views
+
+        response = await echo_view.as_view()(factory.delete("/"))
+
+        assert response.status_code == 404
+        assert response.data == {"detail": "missing"}
+
+    async def test_permissions_are_checked_before_the_handler(self, views, factory):
+        _, private_view = views
+
+        response = await private_view.as_view()(factory.get("/"))
+
+        assert response.status_code in (401, 403)
+
+    async def test_unsupported_method_is_not_allowed(self, views, factory):
+        echo_view, _ = views
+
+        response = await echo_view.as_view()(factory.put("/"))
+
+        assert response.status_code == 405
@@ -0,0 +1,73 @@
+"""
+Tests for the in-memory batch buffer
+"""
+
+import pytest
+
+from common.utils.batch_buffer import BatchBuffer
+from common.utils.metrics import MetricsRegistry
+
+
+class RecordingBuffer(BatchBuffer):
+    def __init__(self, flush, **kwargs):
+        super().__init__(flush, name="test", registry=MetricsRegistry(), **kwargs)
+        self.flushed_items = []
+        self.dropped_items = []
+
+    def _start(self):
+        # Sin hilo en los tests: los volcados son explícitos
+        self._thread = object()
+
+    def on_flushed(self, items):
+        self.flushed_items.extend(items)
+
+    def on_dropped(self, items):
+        self.dropped_items.extend(items)
+
+
+class TestBatchBuffer:
+    """Test batching, retries and bounds"""
+
+    def test_flush_hands_over_all_pending_items(self):
+        batches = []
+        buffer = RecordingBuffer(batches.append)
+        for i in range(3):
+            buffer.add(i)
+
+        assert buffer.flush() == 3
+        assert batches == [[0, 1, 2]]
+        assert buffer.flushed_items == [0, 1, 2]
+        assert len(buffer) == 0
+        assert buffer.flush() == 0
+
+    def test_failed_flush_keeps_items_in_order(self):
+        def failing(items):
+            raise RuntimeError("db down")
+
+        buffer = RecordingBuffer(failing)
+        buffer.add("a")
+        buffer.add("b")
+
+        with pytest.raises(RuntimeError):
+            buffer.flush()
+        buffer.add("c")
+
+        batches = []
+        buffer._flush = batches.append
+        buffer.flush()
+        assert batches == [["a", "b", "c"]]
+
+    def test_oldest_items_are_dropped_over_max_pending(self):
+        buffer = RecordingBuffer(lambda items: None, max_pending=2)
+        for i in range(4):
+            buffer.add(i)
+
+        assert buffer.dropped_items == [0, 1]
+        assert buffer._items == [2, 3]
+
+    def test_reaching_flush_size_wakes_the_flusher(self):
+        buffer = RecordingBuffer(lambda items: None, flush_size=2)
+        buffer.add(1)
+        assert not buffer._wakeup.is_set()
+        buffer.add(2)
+        assert buffer._wakeup.is_set()
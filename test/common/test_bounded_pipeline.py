@@ -0,0 +1,94 @@
+"""
+Tests for the bounded async pipeline
+"""
+
+import asyncio
+
+import pytest
+
+from common.utils.bounded_pipeline import bounded_map
+
+
+async def numbers(count, produced=None):
+    for i in range(count):
+        if produced is not None:
+            produced.append(i)
+        yield i
+
+
+class TestBoundedMap:
+    """Test results, error handling and the in-flight bound"""
+
+    async def test_processes_every_item(self):
+        async def double(value):
+            await asyncio.sleep(0)
+            return value * 2
+
+        results = [result async for result in bounded_map(numbers(20), double, 4)]
+
+        assert sorted(result.item for result in results) == list(range(20))
+        assert all(result.value == result.item * 2 for result in results)
+        assert all(result.error is None for result in results)
+
+    async def test_errors_are_returned_per_item(self):
+        async def fail_on_odd(value):
+            if value % 2:
+                raise RuntimeError(f"odd {value}")
+            return value
+
+        results = [result async for result in bounded_map(numbers(6), fail_on_odd, 2)]
+
+        failed = sorted(result.item for result in results if result.error)
+        assert failed == [1, 3, 5]
+        assert all(isinstance(r.error, RuntimeError) for r in results if r.error)
+
+    async def test_in_flight_work_is_capped(self):
+        in_flight = 0
+        peak = 0
+
+        async def track(value):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.001)
+            in_flight -= 1
+            return value
+
+        results = [result async for result in bounded_map(numbers(50), track, 3)]
+
+        assert len(results) == 50
+        assert peak == 3
+
+    async def test_slow_consumer_stops_the_producer(self):
+        produced = []
+
+        async def identity(value):
+            return value
+
+        stream = bounded_map(numbers(1000, produced), identity, 2)
+        await stream.__anext__()
+        await asyncio.sleep(0.01)
+
+        # Colas de entrada y salida más los trabajadores, no el flujo entero
+        assert len(produced) <= 3 * 2 + 2
+        await stream.aclose()
+
+    async def test_source_errors_are_raised(self):
+        async def broken():
+            yield 1
+            raise ValueError("source failed")
+
+        async def identity(value):
+            return value
+
+        with pytest.raises(ValueError, match="source failed"):
+            async for _ in bounded_map(broken(), identity, 2):
+                pass
+
+    async def test_rejects_zero_concurrency(self):
+        async def identity(value):
+            return value
+
+        with pytest.raises(ValueError):
+            async for _ in bounded_map(numbers(1), identity, 0):
+                pass
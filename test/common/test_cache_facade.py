@@ -0,0 +1,249 @@
+"""
+Tests for the cache facade and the LRU + TTL local tier
+"""
+
+import asyncio
+import threading
+import time
+
+import pytest
+from django.core.cache.backends.locmem import LocMemCache
+
+from common.utils.cache_facade import CacheFacade
+from common.utils.performance_cache import PerformanceCache
+
+
+@pytest.fixture
+def shared_cache():
+    cache = LocMemCache("test-cache-facade", {})
+    cache.clear()
+    return cache
+
+
+class TestPerformanceCache:
+    """Test LRU + TTL eviction"""
+
+    def test_evicts_least_recently_used(self):
+        cache = PerformanceCache(max_size=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        assert cache.get("a") == 1
+        assert cache.get("b") is None
+        assert cache.get("c") == 3
+        assert cache.evictions == 1
+
+    def test_expires_after_ttl(self, monkeypatch):
+        cache = PerformanceCache(default_ttl=10)
+        now = time.monotonic()
+        cache.set("a", 1)
+
+        monkeypatch.setattr(time, "monotonic", lambda: now + 11)
+
+        assert cache.get("a", "missing") == "missing"
+        assert cache.size() == 0
+
+
+class TestCacheFacade:
+    """Test namespaced keys, tiers, single-flight and invalidation"""
+
+    def test_local_only_get_set(self):
+        cache = CacheFacade("songs", ttl=60)
+
+        assert cache.get("k") is None
+        cache.set("k", [1, 2])
+
+        assert cache.get("k") == [1, 2]
+        assert cache.make_key("k") == "streamflow:songs:v1:k"
+
+    def test_caches_none_values(self):
+        cache = CacheFacade("songs", ttl=60)
+        calls = []
+
+        def factory():
+            calls.append(1)
+            return None
+
+        assert cache.get_or_set("k", factory) is None
+        assert cache.get_or_set("k", factory) is None
+        assert len(calls) == 1
+
+    def test_invalidate_bumps_version(self):
+        cache = CacheFacade("genres", ttl=60)
+        cache.set("popular", ["rock"])
+
+        assert cache.invalidate() == 2
+        assert cache.get("popular") is None
+        assert cache.make_key("popular") == "streamflow:genres:v2:popular"
+
+    def test_shared_tier_is_read_through(self, shared_cache):
+        writer = CacheFacade("songs", ttl=60, shared_cache=shared_cache)
+        reader = CacheFacade("songs", ttl=60, shared_cache=shared_cache)
+
+        writer.set("k", "value")
+
+        assert reader.get("k") == "value"
+        assert reader.shared_hits == 1
+        assert reader.get("k") == "value"
+        assert reader.hits == 1
+
+    def test_invalidation_is_visible_across_processes(self, shared_cache):
+        first = CacheFacade(
+            "songs", ttl=60, shared_cache=shared_cache, version_check_interval=0
+        )
+        second = CacheFacade(
+            "songs", ttl=60, shared_cache=shared_cache, version_check_interval=0
+        )
+        first.set("k", "old")
+        assert second.get("k") == "old"
+
+        first.invalidate()
+
+        assert second.get("k") is None
+        assert second.version == 2
+
+    def test_get_or_set_single_flight_threads(self):
+        cache = CacheFacade("songs", ttl=60)
+        calls = []
+        barrier = threading.Barrier(5)
+
+        def factory():
+            calls.append(1)
+            time.sleep(0.05)
+            return "value"
+
+        results = []
+
+        def worker():
+            barrier.wait()
+            results.append(cache.get_or_set("k", factory))
+
+        threads = [threading.Thread(target=worker) for _ in range(5)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert results == ["value"] * 5
+        assert len(calls) == 1
+
+    @pytest.mark.parametrize("use_shared", [False, True])
+    def test_aget_or_set_single_flight(self, shared_cache, use_shared):
+        cache = CacheFacade(
+            "songs", ttl=60, shared_cache=shared_cache if use_shared else None
+        )
+        calls = []
+
+        async def factory():
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            return "value"
+
+        async def run():
+            return await asyncio.gather(
+                *(cache.aget_or_set("k", factory) for _ in range(10))
+            )
+
+        assert asyncio.run(run()) == ["value"] * 10
+        assert len(calls) == 1
+
+    def test_aget_or_set_single_flight_across_event_loops(self):
+        cache = CacheFacade("songs", ttl=60)
+        started = threading.Event()
+        release = threading.Event()
+        calls = []
+
+        async def factory():
+            calls.append(1)
+            started.set()
+            await asyncio.get_running_loop().run_in_executor(None, release.wait)
+            return "value"
+
+        results = []
+
+        def run():
+            results.append(asyncio.run(cache.aget_or_set("k", factory)))
+
+        leader = threading.Thread(target=run)
+        leader.start()
+        assert started.wait(timeout=5)
+        follower = threading.Thread(target=run)
+        follower.start()
+        # El seguidor espera la llamada del líder (callback de wrap_future)
+        pending = next(iter(cache._inflight._calls.values()))
+        deadline = time.monotonic() + 5
+        while not pending._done_callbacks and time.monotonic() < deadline:
+            time.sleep(0.001)
+        release.set()
+        leader.join(timeout=5)
+        follower.join(timeout=5)
+
+        assert results == ["value", "value"]
+        assert len(calls) == 1
+
+    def test_aget_or_set_propagates_errors_and_retries(self):
+        cache = CacheFacade("songs", ttl=60)
+
+        async def failing():
+            raise RuntimeError("boom")
+
+        async def ok():
+            return "value"
+
+        with pytest.raises(RuntimeError):
+            asyncio.run(cache.aget_or_set("k", failing))
+
+        assert asyncio.run(cache.aget_or_set("k", ok)) == "value"
+
+    @pytest.mark.parametrize("use_shared", [False, True])
+    def test_ainvalidate(self, shared_cache, use_shared):
+        cache = CacheFacade(
+            "songs", ttl=60, shared_cache=shared_cache if use_shared else None
+        )
+
+        async def run():
+            await cache.aset("k", "old")
+            version = await cache.ainvalidate()
+            return version, await cache.aget("k")
+
+        assert asyncio.run(run()) == (2, None)
+
+    @pytest.mark.parametrize("use_shared", [False, True])
+    def test_get_or_set_does_not_store_stale_value_after_invalidate(
+        self, shared_cache, use_shared
+    ):
+        cache = CacheFacade(
+            "songs", ttl=60, shared_cache=shared_cache if use_shared else None
+        )
+
+        def factory():
+            # Los datos cambian (e invalidan la caché) mientras se calculan
+            cache.invalidate()
+            return "stale"
+
+        assert cache.get_or_set("k", factory) == "stale"
+        assert cache.get("k") is None
+        assert cache.get_or_set("k", lambda: "fresh") == "fresh"
+
+    @pytest.mark.parametrize("use_shared", [False, True])
+    def test_aget_or_set_does_not_store_stale_value_after_invalidate(
+        self, shared_cache, use_shared
+    ):
+        cache = CacheFacade(
+            "songs", ttl=60, shared_cache=shared_cache if use_shared else None
+        )
+
+        async def factory():
+            await cache.ainvalidate()
+            return "stale"
+
+        async def fresh():
+            return "fresh"
+
+        async def run():
+            first = await cache.aget_or_set("k", factory)
+            return first, await cache.aget("k"), await cache.aget_or_set("k", fresh)
+
+        assert asyncio.run(run()) == ("stale", None, "fresh")
@@ -0,0 +1,162 @@
+"""
+Tests for conditional GET (ETag / Last-Modified) on read-only viewsets
+"""
+
+import uuid
+from datetime import timedelta
+
+import pytest
+from django.utils.http import http_date
+
+
+@pytest.fixture
+def factory(django_setup):
+    from rest_framework.test import APIRequestFactory
+
+    return APIRequestFactory()
+
+
+@pytest.fixture
+def artist(db):
+    from apps.artists.infrastructure.models import ArtistModel
+
+    return ArtistModel.objects.create(id=uuid.uuid4(), name="Queen")
+
+
+@pytest.fixture
+def list_view(django_setup):
+    from apps.artists.api.views import ArtistViewSet
+
+    return ArtistViewSet.as_view({"get": "list"})
+
+
+@pytest.fixture
+def detail_view(django_setup):
+    from apps.artists.api.views import ArtistViewSet
+
+    return ArtistViewSet.as_view({"get": "retrieve"})
+
+
+def get_detail(detail_view, factory, artist, **headers):
+    return detail_view(factory.get(f"/artists/{artist.pk}/", **headers), pk=artist.pk)
+
+
+class TestConditionalDetail:
+    """``retrieve`` with ETag and Last-Modified"""
+
+    def test_response_has_validators(self, detail_view, factory, artist):
+        response = get_detail(detail_view, factory, artist)
+
+        assert response.status_code == 200
+        assert response["ETag"]
+        assert response["Last-Modified"] == http_date(artist.updated_at.timestamp())
+
+    def test_matching_if_none_match_returns_304(self, detail_view, factory, artist):
+        etag = get_detail(detail_view, factory, artist)["ETag"]
+
+        response = get_detail(detail_view, factory, artist, HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == 304
+        assert response["ETag"] == etag
+        assert not response.data
+
+    def test_changed_object_gets_a_new_etag(self, detail_view, factory, artist):
+        etag = get_detail(detail_view, factory, artist)["ETag"]
+        artist.name = "Queen + Adam Lambert"
+        artist.updated_at = artist.updated_at + timedelta(seconds=5)
+        type(artist).objects.filter(pk=artist.pk).update(
+            name=artist.name, updated_at=artist.updated_at
+        )
+
+        response = get_detail(detail_view, factory, artist, HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == 200
+        assert response["ETag"] != etag
+        assert response.data["name"] == "Queen + Adam Lambert"
+
+    def test_if_modified_since_returns_304_when_not_modified(
+        self, detail_view, factory, artist
+    ):
+        since = http_date(artist.updated_at.timestamp() + 1)
+
+        response = get_detail(
+            detail_view, factory, artist, HTTP_IF_MODIFIED_SINCE=since
+        )
+
+        assert response.status_code == 304
+
+    def test_if_modified_since_returns_200_when_modified(
+        self, detail_view, factory, artist
+    ):
+        since = http_date(artist.updated_at.timestamp() - 60)
+
+        response = get_detail(
+            detail_view, factory, artist, HTTP_IF_MODIFIED_SINCE=since
+        )
+
+        assert response.status_code == 200
+
+    def test_if_none_match_takes_precedence_over_if_modified_since(
+        self, detail_view, factory, artist
+    ):
+        since = http_date(artist.updated_at.timestamp() + 1)
+
+        response = get_detail(
+            detail_view,
+            factory,
+            artist,
+            HTTP_IF_NONE_MATCH='"outdated"',
+            HTTP_IF_MODIFIED_SINCE=since,
+        )
+
+        assert response.status_code == 200
+
+    def test_missing_object_returns_404_without_validators(
+        self, detail_view, factory, db
+    ):
+        missing = uuid.uuid4()
+
+        response = detail_view(factory.get(f"/artists/{missing}/"), pk=missing)
+
+        assert response.status_code == 404
+        assert not response.has_header("ETag")
+
+
+class TestConditionalList:
+    """``list`` with an ETag over the filtered queryset"""
+
+    def test_response_has_etag_but_no_last_modified(self, list_view, factory, artist):
+        response = list_view(factory.get("/artists/"))
+
+        assert response.status_code == 200
+        assert response.has_header("ETag")
+        assert not response.has_header("Last-Modified")
+
+    def test_matching_if_none_match_returns_304(self, list_view, factory, artist):
+        etag = list_view(factory.get("/artists/"))["ETag"]
+
+        response = list_view(factory.get("/artists/", HTTP_IF_NONE_MATCH=etag))
+
+        assert response.status_code == 304
+        assert response["ETag"] == etag
+
+    def test_new_item_changes_the_etag(self, list_view, factory, artist):
+        from apps.artists.infrastructure.models import ArtistModel
+
+        etag = list_view(factory.get("/artists/"))["ETag"]
+        ArtistModel.objects.create(id=uuid.uuid4(), name="Muse")
+
+        response = list_view(factory.get("/artists/", HTTP_IF_NONE_MATCH=etag))
+
+        assert response.status_code == 200
+        assert response["ETag"] != etag
+
+    def test_etag_depends_on_the_query(self, list_view, factory, artist):
+        etag = list_view(factory.get("/artists/"))["ETag"]
+
+        response = list_view(
+            factory.get("/artists/", {"name": "Queen"}, HTTP_IF_NONE_MATCH=etag)
+        )
+
+        assert response.status_code == 200
+        assert response["ETag"] != etag
@@ -0,0 +1,59 @@
+"""
+Tests for database connection metrics
+"""
+
+import asyncio
+
+from asgiref.sync import sync_to_async
+
+from common.utils.db_connection_metrics import DatabaseConnectionMetrics
+
+
+class TestDatabaseConnectionMetrics:
+    """Test connection opens counted per request and globally"""
+
+    def test_counts_opens_per_request(self):
+        metrics = DatabaseConnectionMetrics()
+
+        token = metrics.start_request()
+        metrics.record_open()
+        metrics.record_open()
+        assert metrics.end_request(token) == 2
+
+        token = metrics.start_request()
+        assert metrics.end_request(token) == 0
+
+        snapshot = metrics.snapshot()
+        assert snapshot["total_requests"] == 2
+        assert snapshot["total_opens"] == 2
+        assert snapshot["requests_with_opens"] == 1
+        assert snapshot["opens_per_request"] == 1.0
+
+    def test_open_outside_request_only_counts_globally(self):
+        metrics = DatabaseConnectionMetrics()
+
+        metrics.record_open()
+
+        assert metrics.snapshot()["total_opens"] == 1
+        assert metrics.snapshot()["total_requests"] == 0
+
+    def test_opens_in_sync_to_async_thread_are_attributed_to_request(self):
+        metrics = DatabaseConnectionMetrics()
+
+        async def handle_request():
+            token = metrics.start_request()
+            await sync_to_async(metrics.record_open)()
+            return metrics.end_request(token)
+
+        assert asyncio.run(handle_request()) == 1
+
+    def test_reset(self):
+        metrics = DatabaseConnectionMetrics()
+        token = metrics.start_request()
+        metrics.record_open()
+        metrics.end_request(token)
+
+        metrics.reset()
+
+        assert metrics.snapshot()["total_requests"] == 0
+        assert metrics.snapshot()["opens_per_request"] == 0.0
@@ -0,0 +1,71 @@
+"""
+Tests for the precomputed DTO -> dict converter
+"""
+
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import List, Optional
+
+from common.serializers.base_entity_serializer import get_dto_converter
+
+
+@dataclass
+class TrackDTO:
+    id: str
+    title: str
+    genre_names: List[str] = field(default_factory=list)
+    created_at: Optional[datetime] = None
+
+    @property
+    def duration_formatted(self) -> str:
+        return "00:00"
+
+
+@dataclass
+class SingleFieldDTO:
+    id: str
+
+
+@dataclass
+class EmptyDTO:
+    pass
+
+
+@dataclass(slots=True)
+class SlottedDTO:
+    id: str
+    title: str = ""
+
+
+class PlainDTO:
+    def __init__(self):
+        self.id = "1"
+
+
+def legacy_dto_to_dict(dto):
+    return {name: getattr(dto, name) for name in dto.__dataclass_fields__}
+
+
+class TestDtoConverter:
+    """Test that the fast converter keeps the field-by-field output"""
+
+    def test_matches_dataclass_fields_in_order(self):
+        dto = TrackDTO(id="1", title="Song", genre_names=["rock"])
+
+        result = get_dto_converter(TrackDTO)(dto)
+
+        assert result == legacy_dto_to_dict(dto)
+        assert list(result) == ["id", "title", "genre_names", "created_at"]
+
+    def test_converter_is_cached_per_class(self):
+        assert get_dto_converter(TrackDTO) is get_dto_converter(TrackDTO)
+
+    def test_single_field_and_plain_objects(self):
+        assert get_dto_converter(SingleFieldDTO)(SingleFieldDTO(id="1")) == {"id": "1"}
+        assert get_dto_converter(EmptyDTO)(EmptyDTO()) == {}
+        assert get_dto_converter(PlainDTO)(PlainDTO()) == {"id": "1"}
+
+    def test_slotted_dataclass(self):
+        dto = SlottedDTO(id="1", title="Song")
+
+        assert get_dto_converter(SlottedDTO)(dto) == {"id": "1", "title": "Song"}
@@ -0,0 +1,117 @@
+"""
+Tests for deferred imports and the worker warm-up
+"""
+
+import sys
+
+import pytest
+
+from common.utils import lazy_import as lazy_import_module
+from common.utils import warmup
+from common.utils.lazy_import import LazyModule, lazy_import, preload_lazy_modules
+
+
+@pytest.fixture
+def fake_module(tmp_path, monkeypatch):
+    """Módulo de prueba en un directorio temporal, sin importar todavía"""
+    (tmp_path / "lazy_fake_sdk.py").write_text(
+        "api_key = None\n\ndef ping():\n    return 'pong'\n"
+    )
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.setattr(lazy_import_module, "_registry", {})
+    yield "lazy_fake_sdk"
+    sys.modules.pop("lazy_fake_sdk", None)
+
+
+class TestLazyModule:
+    """Test that the module is only imported on first attribute access"""
+
+    def test_module_is_imported_on_first_attribute_access(self, fake_module):
+        module = LazyModule(fake_module)
+
+        assert fake_module not in sys.modules
+        assert not module.loaded
+        assert module.ping() == "pong"
+        assert module.loaded
+        assert fake_module in sys.modules
+
+    def test_setting_an_attribute_configures_the_real_module(self, fake_module):
+        module = LazyModule(fake_module)
+
+        module.api_key = "sk_test"
+
+        assert sys.modules[fake_module].api_key == "sk_test"
+
+    def test_missing_attribute_raises_attribute_error(self, fake_module):
+        with pytest.raises(AttributeError):
+            LazyModule(fake_module).missing
+
+    def test_missing_module_raises_on_first_use(self):
+        module = LazyModule("lazy_module_that_does_not_exist")
+
+        with pytest.raises(ImportError):
+            module.anything
+
+    def test_lazy_import_returns_one_proxy_per_name(self, fake_module):
+        assert lazy_import(fake_module) is lazy_import(fake_module)
+
+
+class TestPreload:
+    """Test preloading of the registered lazy modules"""
+
+    def test_preload_imports_pending_modules(self, fake_module):
+        module = lazy_import(fake_module)
+
+        timings = preload_lazy_modules()
+
+        assert module.loaded
+        assert list(timings) == [fake_module]
+        assert preload_lazy_modules() == {}
+
+    def test_preload_skips_modules_that_fail(self, fake_module):
+        lazy_import("lazy_module_that_does_not_exist")
+        lazy_import(fake_module)
+
+        timings = preload_lazy_modules()
+
+        assert list(timings) == [fake_module]
+
+
+class TestWarmup:
+    """Test the warm-up hook"""
+
+    @pytest.fixture(autouse=True)
+    def not_started(self, monkeypatch):
+        monkeypatch.setattr(warmup, "_started", False)
+
+    def test_warm_up_preloads_lazy_modules(self, fake_module):
+        module = lazy_import(fake_module)
+
+        timings = warmup.warm_up(urlconf=False)
+
+        assert module.loaded
+        assert fake_module in timings
+
+    def test_start_warmup_runs_in_background_once(self, fake_module, monkeypatch):
+        monkeypatch.setattr(
+            warmup,
+            "get_warmup_settings",
+            lambda: {**warmup.DEFAULT_WARMUP_SETTINGS, "URLCONF": False},
+        )
+        module = lazy_import(fake_module)
+
+        thread = warmup.start_warmup()
+        thread.join(timeout=30)
+
+        assert module.loaded
+        assert warmup.start_warmup() is None
+
+    def test_start_warmup_can_be_disabled(self, monkeypatch):
+        monkeypatch.setattr(
+            warmup,
+            "get_warmup_settings",
+            lambda: {**warmup.DEFAULT_WARMUP_SETTINGS, "ENABLED": False},
+        )
+
+        assert warmup.start_warmup() is None
+        assert warmup._started is False
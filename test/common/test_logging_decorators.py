@@ -0,0 +1,113 @@
+"""
+Tests for the logging decorators fast paths
+"""
+
+import asyncio
+import logging
+
+import pytest
+
+from common.utils import logging_decorators
+from common.utils.logging_decorators import (
+    is_decorator_logging_enabled,
+    log_execution,
+    log_performance,
+)
+
+
+class ReprCounter:
+    calls = 0
+
+    def __repr__(self):
+        ReprCounter.calls += 1
+        return "ReprCounter()"
+
+
+@pytest.fixture
+def decorators_logger():
+    logger = logging.getLogger(f"decorators.{__name__}")
+    previous_level = logger.level
+    yield logger
+    logger.setLevel(previous_level)
+
+
+@pytest.fixture
+def decorator_settings(monkeypatch):
+    def configure(enabled=True, modules=None):
+        monkeypatch.setattr(
+            logging_decorators,
+            "get_logging_decorators_settings",
+            lambda: {"ENABLED": enabled, "MODULES": modules or {}},
+        )
+
+    return configure
+
+
+class TestLogExecution:
+    """Test that disabled logging does no formatting work"""
+
+    def test_skips_argument_formatting_when_level_disabled(self, decorators_logger):
+        decorators_logger.setLevel(logging.INFO)
+
+        @log_execution(include_args=True)
+        def run(value):
+            return "ok"
+
+        ReprCounter.calls = 0
+        assert run(ReprCounter()) == "ok"
+        assert ReprCounter.calls == 0
+
+    def test_formats_arguments_when_level_enabled(self, decorators_logger, caplog):
+        decorators_logger.setLevel(logging.DEBUG)
+
+        class UseCase:
+            @log_execution(include_args=True)
+            async def execute(self, value):
+                return "ok"
+
+        ReprCounter.calls = 0
+        with caplog.at_level(logging.DEBUG, logger=decorators_logger.name):
+            assert asyncio.run(UseCase().execute(ReprCounter())) == "ok"
+
+        assert ReprCounter.calls == 1
+        assert "UseCase.execute(ReprCounter())" in caplog.text
+
+    def test_logs_errors_when_level_disabled(self, decorators_logger, caplog):
+        decorators_logger.setLevel(logging.INFO)
+
+        @log_execution()
+        def run():
+            raise ValueError("boom")
+
+        with caplog.at_level(logging.INFO, logger=decorators_logger.name):
+            with pytest.raises(ValueError):
+                run()
+
+        assert "run failed: boom" in caplog.text
+
+    def test_disabled_module_returns_original_function(self, decorator_settings):
+        decorator_settings(modules={__name__: False})
+
+        def run():
+            return "ok"
+
+        assert log_execution()(run) is run
+        assert log_performance()(run) is run
+
+
+class TestModuleSettings:
+    """Test per-module configuration"""
+
+    def test_longest_prefix_wins(self, decorator_settings):
+        decorator_settings(modules={"apps.songs": False, "apps.songs.use_cases": True})
+
+        assert is_decorator_logging_enabled("apps.genres.views")
+        assert not is_decorator_logging_enabled("apps.songs.api.mappers")
+        assert is_decorator_logging_enabled("apps.songs.use_cases.search")
+        assert is_decorator_logging_enabled("apps.songsextra")
+
+    def test_globally_disabled(self, decorator_settings):
+        decorator_settings(enabled=False, modules={"apps.songs": True})
+
+        assert not is_decorator_logging_enabled("apps.genres")
+        assert is_decorator_logging_enabled("apps.songs.use_cases")
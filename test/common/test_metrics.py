@@ -0,0 +1,92 @@
+"""
+Tests for the in-memory metrics registry and the search performance monitor
+"""
+
+import json
+
+from common.utils.metrics import MetricsExporter, MetricsRegistry
+from common.utils.performance_monitor import PerformanceMonitor
+
+
+class TestMetricsRegistry:
+    """Test metric registration, labels and bounds"""
+
+    def test_same_name_and_labels_return_same_metric(self):
+        registry = MetricsRegistry()
+
+        registry.counter("youtube.api_calls", operation="search").inc()
+        registry.counter("youtube.api_calls", operation="search").inc(2)
+        registry.counter("youtube.api_calls", operation="videos").inc()
+
+        counters = registry.snapshot()["counters"]
+        assert counters["youtube.api_calls{operation=search}"] == 3
+        assert counters["youtube.api_calls{operation=videos}"] == 1
+
+    def test_gauges_and_histograms(self):
+        registry = MetricsRegistry()
+        registry.gauge("queue.size").set(7)
+        registry.gauge("pending", callback=lambda: 3)
+        registry.histogram("latency_ms").record(10)
+
+        snapshot = registry.snapshot()
+        assert snapshot["gauges"] == {"pending": 3, "queue.size": 7}
+        assert snapshot["histograms"]["latency_ms"]["count"] == 1
+
+    def test_registry_is_bounded(self):
+        registry = MetricsRegistry(max_metrics=2)
+        for i in range(4):
+            registry.counter(f"c{i}").inc()
+
+        snapshot = registry.snapshot()
+        assert set(snapshot["counters"]) == {"c0", "c1"}
+        assert snapshot["dropped_metrics"] == 2
+
+    def test_reset_keeps_references_valid(self):
+        registry = MetricsRegistry()
+        counter = registry.counter("requests")
+        counter.inc(5)
+
+        registry.reset()
+        counter.inc()
+
+        assert registry.snapshot()["counters"]["requests"] == 1
+
+
+class TestMetricsExporter:
+    """Test snapshot export"""
+
+    def test_export_writes_json(self, tmp_path):
+        path = tmp_path / "metrics.json"
+        exporter = MetricsExporter(str(path), 60, collect=lambda: {"counters": {}})
+
+        exporter.export()
+
+        assert json.loads(path.read_text()) == {"counters": {}}
+        assert [p.name for p in tmp_path.iterdir()] == ["metrics.json"]
+
+
+class TestPerformanceMonitor:
+    """Test search tracking on top of the registry"""
+
+    def test_summary(self):
+        monitor = PerformanceMonitor(registry=MetricsRegistry())
+
+        for results in (4, 6):
+            monitor.end_search(monitor.start_search("rock"), result_count=results)
+        monitor.end_search(monitor.start_search("jazz"), success=False, error="boom")
+
+        summary = monitor.get_summary()
+        assert summary["total_searches"] == 3
+        assert summary["successful_searches"] == 2
+        assert summary["avg_results"] == 5
+        assert len(monitor.get_recent_performance()) == 3
+
+    def test_pending_searches_are_bounded(self):
+        monitor = PerformanceMonitor(registry=MetricsRegistry(), max_pending=2)
+
+        first = monitor.start_search("a")
+        monitor.start_search("b")
+        monitor.start_search("c")
+        monitor.end_search(first)
+
+        assert monitor.get_summary() == {}
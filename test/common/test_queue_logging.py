@@ -0,0 +1,114 @@
+"""
+Tests for the queue-based logging pipeline
+"""
+
+import json
+import logging
+import queue
+
+import pytest
+
+from common.utils.logging_config import JsonFormatter
+from common.utils.queue_logging import (
+    DROP_NEW,
+    DROP_OLDEST,
+    BoundedQueueHandler,
+    LogDispatcher,
+)
+
+
+class ListHandler(logging.Handler):
+    def __init__(self, level=logging.NOTSET):
+        super().__init__(level)
+        self.records = []
+
+    def emit(self, record):
+        self.records.append(record)
+
+
+def make_record(msg, level=logging.INFO, args=None):
+    return logging.LogRecord("test", level, __file__, 1, msg, args, None)
+
+
+class TestBoundedQueueHandler:
+    """Test non-blocking enqueue and drop policies"""
+
+    def test_prepare_interpolates_message_without_formatting(self):
+        target = ListHandler()
+        handler = BoundedQueueHandler(queue.Queue(), [target])
+        items = ["a"]
+
+        handler.handle(make_record("items=%s", args=(items,)))
+        items.append("b")
+
+        record = handler.queue.get_nowait()
+        assert record.msg == "items=['a']"
+        assert record.args is None
+        assert record.log_targets == (target,)
+
+    def test_drop_new_discards_incoming_record(self):
+        handler = BoundedQueueHandler(queue.Queue(maxsize=2), [], DROP_NEW)
+
+        for i in range(4):
+            handler.handle(make_record(f"m{i}"))
+
+        assert [r.msg for r in handler.queue.queue] == ["m0", "m1"]
+        assert handler.dropped == 2
+
+    def test_drop_oldest_keeps_latest_records(self):
+        handler = BoundedQueueHandler(queue.Queue(maxsize=2), [], DROP_OLDEST)
+
+        for i in range(4):
+            handler.handle(make_record(f"m{i}"))
+
+        assert [r.msg for r in handler.queue.queue] == ["m2", "m3"]
+        assert handler.dropped == 2
+
+    def test_errors_are_never_dropped_for_newer_records(self):
+        handler = BoundedQueueHandler(queue.Queue(maxsize=1), [], DROP_NEW)
+
+        handler.handle(make_record("info"))
+        handler.handle(make_record("boom", level=logging.ERROR))
+
+        assert [r.msg for r in handler.queue.queue] == ["boom"]
+
+    def test_invalid_policy(self):
+        with pytest.raises(ValueError):
+            BoundedQueueHandler(queue.Queue(), [], "block")
+
+
+class TestLogDispatcher:
+    """Test background delivery to each logger's handlers"""
+
+    def test_routes_records_and_reports_drops(self):
+        log_queue = queue.Queue(maxsize=1)
+        info_target = ListHandler()
+        error_target = ListHandler(logging.ERROR)
+        handler = BoundedQueueHandler(log_queue, [info_target, error_target])
+        dispatcher = LogDispatcher(log_queue)
+        dispatcher.queue_handlers.append(handler)
+
+        handler.handle(make_record("kept"))
+        handler.handle(make_record("dropped"))
+
+        dispatcher.start()
+        dispatcher.stop()
+
+        messages = [r.getMessage() for r in info_target.records]
+        assert messages[0].startswith("Logging queue full: 1 records dropped")
+        assert messages[1] == "kept"
+        assert error_target.records == []
+
+
+class TestJsonFormatter:
+    """Test structured output"""
+
+    def test_includes_extra_fields(self):
+        record = make_record("hello %s", args=("world",))
+        record.request_id = "abc"
+
+        payload = json.loads(JsonFormatter().format(record))
+
+        assert payload["message"] == "hello world"
+        assert payload["level"] == "INFO"
+        assert payload["request_id"] == "abc"
@@ -0,0 +1,88 @@
+"""
+Tests for the streaming CSV / JSON / JSON Lines reader
+"""
+
+import json
+
+import pytest
+
+from common.utils import record_reader
+from common.utils.record_reader import RecordError, detect_format, iter_records
+
+
+def write(tmp_path, name, content):
+    path = tmp_path / name
+    path.write_text(content, encoding="utf-8")
+    return str(path)
+
+
+class TestIterRecords:
+    """Test reading records from each format"""
+
+    def test_csv_rows_are_dicts(self, tmp_path):
+        path = write(tmp_path, "tracks.csv", "title,artist\nOne,A\nTwo,B\n")
+
+        assert list(iter_records(path)) == [
+            (1, {"title": "One", "artist": "A"}),
+            (2, {"title": "Two", "artist": "B"}),
+        ]
+
+    def test_json_lines_skip_blank_lines(self, tmp_path):
+        path = write(tmp_path, "tracks.jsonl", '{"title": "One"}\n\n{"title": "Two"}\n')
+
+        assert [record["title"] for _, record in iter_records(path)] == ["One", "Two"]
+
+    def test_json_array_is_read_in_chunks(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(record_reader, "_JSON_CHUNK", 5)
+        records = [{"title": f"Song {i}", "tags": ["a", "b"]} for i in range(20)]
+        path = write(tmp_path, "tracks.json", json.dumps(records, indent=2))
+
+        result = list(iter_records(path))
+
+        assert [position for position, _ in result] == list(range(1, 21))
+        assert [record for _, record in result] == records
+
+    def test_empty_json_array(self, tmp_path):
+        path = write(tmp_path, "tracks.json", " [ ] ")
+
+        assert list(iter_records(path)) == []
+
+    def test_malformed_lines_are_reported_and_skipped(self, tmp_path):
+        path = write(
+            tmp_path, "tracks.jsonl", '{"title": "One"}\n{oops\n[1]\n{"title": "Two"}\n'
+        )
+        errors = []
+
+        records = list(iter_records(path, on_error=errors.append))
+
+        assert [position for position, _ in records] == [1, 4]
+        assert [error.position for error in errors] == [2, 3]
+
+    def test_malformed_lines_raise_without_handler(self, tmp_path):
+        path = write(tmp_path, "tracks.jsonl", "{oops\n")
+
+        with pytest.raises(RecordError):
+            list(iter_records(path))
+
+    def test_csv_rows_with_extra_values_are_reported(self, tmp_path):
+        path = write(tmp_path, "tracks.csv", "title\nOne\nTwo,extra\n")
+        errors = []
+
+        records = list(iter_records(path, on_error=errors.append))
+
+        assert records == [(1, {"title": "One"})]
+        assert errors[0].position == 2
+
+    @pytest.mark.parametrize(
+        "content",
+        ['{"title": "One"}', '[{"a": 1} {"b": 2}]', '[{"a": 1},]', '[{"a": 1}'],
+    )
+    def test_invalid_json_arrays_raise(self, tmp_path, content):
+        path = write(tmp_path, "tracks.json", content)
+
+        with pytest.raises(RecordError):
+            list(iter_records(path))
+
+    def test_unknown_extension_is_rejected(self):
+        with pytest.raises(ValueError):
+            detect_format("tracks.xml")
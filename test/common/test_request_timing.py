@@ -0,0 +1,138 @@
+"""
+Tests for request-scoped timing and the latency histogram
+"""
+
+import asyncio
+import random
+
+import pytest
+
+from common.utils.histogram import Histogram
+from common.utils.request_timing import (
+    RequestTimings,
+    RequestTimingStats,
+    current_timings,
+    end_request,
+    format_server_timing,
+    query_timer,
+    span,
+    start_request,
+    timed,
+)
+
+
+@pytest.fixture
+def request_scope():
+    token = start_request()
+    yield current_timings()
+    end_request(token)
+
+
+class TestHistogram:
+    """Test percentile accuracy and bookkeeping"""
+
+    def test_percentiles_within_relative_error(self):
+        rng = random.Random(42)
+        samples = [rng.expovariate(1 / 50) for _ in range(20_000)]
+        histogram = Histogram()
+        for sample in samples:
+            histogram.record(sample)
+
+        samples.sort()
+        for percentile in (50, 90, 99):
+            exact = samples[int(len(samples) * percentile / 100) - 1]
+            assert histogram.percentile(percentile) == pytest.approx(exact, rel=0.07)
+
+    def test_snapshot_and_reset(self):
+        histogram = Histogram()
+        for value in (1, 2, 3, 100):
+            histogram.record(value)
+
+        snapshot = histogram.snapshot()
+        assert snapshot["count"] == 4
+        assert snapshot["mean"] == 26.5
+        assert snapshot["min"] == 1
+        assert snapshot["p99"] == 100
+
+        histogram.reset()
+        assert histogram.snapshot()["count"] == 0
+        assert histogram.percentile(50) == 0.0
+
+
+class TestRequestTimings:
+    """Test span and query accumulation in the current request"""
+
+    def test_nothing_recorded_outside_request(self):
+        with span("youtube"):
+            pass
+        assert current_timings() is None
+
+    def test_spans_accumulate(self, request_scope):
+        @timed("youtube")
+        async def search():
+            return "ok"
+
+        @timed("stripe")
+        def charge():
+            return "ok"
+
+        async def run():
+            await search()
+            await search()
+            # Los hilos auxiliares comparten el objeto del request
+            await asyncio.to_thread(charge)
+
+        asyncio.run(run())
+
+        assert request_scope.spans["youtube"][1] == 2
+        assert request_scope.spans["stripe"][1] == 1
+
+    def test_query_timer_counts_queries(self, request_scope):
+        def execute(sql, params, many, context):
+            return "rows"
+
+        assert query_timer(execute, "SELECT 1", (), False, {}) == "rows"
+        assert query_timer(execute, "SELECT 2", (), False, {}) == "rows"
+
+        assert request_scope.db_queries == 2
+
+    def test_server_timing_format(self):
+        timings = RequestTimings()
+        timings.add_query(0.002)
+        timings.add_span("SearchSongsUseCase.execute", 0.010)
+        timings.add_span("youtube api", 0.004)
+        timings.add_span("youtube api", 0.004)
+
+        header = format_server_timing(timings, 0.025)
+
+        assert header == (
+            'total;dur=25.0, db;dur=2.0;desc="1 queries", '
+            "SearchSongsUseCase.execute;dur=10.0, "
+            'youtube-api;dur=8.0;desc="2 calls"'
+        )
+
+
+class TestRequestTimingStats:
+    """Test per-endpoint aggregation"""
+
+    def test_aggregates_by_endpoint(self):
+        stats = RequestTimingStats()
+        timings = RequestTimings()
+        for _ in range(3):
+            timings.add_query(0.001)
+        timings.add_span("youtube", 0.05)
+
+        stats.record("GET /api/songs/", timings, 0.1)
+        stats.record("GET /api/songs/", RequestTimings(), 0.01)
+
+        snapshot = stats.snapshot()["GET /api/songs/"]
+        assert snapshot["total_ms"]["count"] == 2
+        assert snapshot["db_queries"]["max"] == 3
+        assert snapshot["youtube_ms"]["count"] == 1
+
+    def test_endpoint_count_is_bounded(self):
+        stats = RequestTimingStats(max_endpoints=2)
+        for i in range(5):
+            stats.record(f"GET /{i}", RequestTimings(), 0.01)
+
+        assert set(stats.snapshot()) == {"GET /0", "GET /1", "other"}
@@ -0,0 +1,60 @@
+"""
+Tests for the lazily paginated result window
+"""
+
+import pytest
+from django.core.paginator import Paginator
+
+from common.utils.result_window import ResultWindow
+
+
+def make_window(total):
+    calls = {"count": 0, "fetch": []}
+    items = list(range(total))
+
+    def count():
+        calls["count"] += 1
+        return total
+
+    def fetch(offset, limit):
+        calls["fetch"].append((offset, limit))
+        return items[offset : offset + limit]
+
+    return ResultWindow(count=count, fetch=fetch), calls
+
+
+class TestResultWindow:
+    """Test that only the requested page is fetched"""
+
+    def test_paginator_fetches_only_requested_page(self):
+        window, calls = make_window(25)
+
+        page = Paginator(window, 10).page(2)
+
+        assert list(page) == list(range(10, 20))
+        assert page.paginator.count == 25
+        assert page.paginator.num_pages == 3
+        assert calls["fetch"] == [(10, 10)]
+        assert calls["count"] == 1
+
+    def test_last_page_is_truncated_to_count(self):
+        window, calls = make_window(25)
+
+        page = Paginator(window, 10).page(3)
+
+        assert list(page) == [20, 21, 22, 23, 24]
+        assert calls["fetch"] == [(20, 5)]
+
+    def test_empty_slice_does_not_fetch(self):
+        window, calls = make_window(0)
+
+        assert window[0:10] == []
+        assert calls["fetch"] == []
+
+    def test_only_contiguous_slices(self):
+        window, _ = make_window(5)
+
+        with pytest.raises(TypeError):
+            window[1]
+        with pytest.raises(TypeError):
+            window[0:4:2]
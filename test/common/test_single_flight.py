@@ -0,0 +1,140 @@
+"""
+Tests for the in-flight call deduplication
+"""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from common.utils.single_flight import SingleFlight
+
+
+class TestSingleFlight:
+    """Test sharing of results and errors between concurrent callers"""
+
+    async def test_concurrent_calls_share_one_execution(self):
+        flight = SingleFlight()
+        calls = 0
+        release = asyncio.Event()
+
+        async def lookup():
+            nonlocal calls
+            calls += 1
+            await release.wait()
+            return "lyrics"
+
+        tasks = [asyncio.create_task(flight.do("song-1", lookup)) for _ in range(5)]
+        await asyncio.sleep(0)
+        assert len(flight) == 1
+        release.set()
+
+        assert await asyncio.gather(*tasks) == ["lyrics"] * 5
+        assert calls == 1
+        assert len(flight) == 0
+
+    async def test_different_keys_run_separately(self):
+        flight = SingleFlight()
+
+        async def lookup(value):
+            await asyncio.sleep(0)
+            return value
+
+        results = await asyncio.gather(
+            flight.do("a", lambda: lookup(1)), flight.do("b", lambda: lookup(2))
+        )
+
+        assert results == [1, 2]
+
+    async def test_errors_reach_every_waiter(self):
+        flight = SingleFlight()
+        release = asyncio.Event()
+
+        async def failing():
+            await release.wait()
+            raise RuntimeError("scrape failed")
+
+        tasks = [asyncio.create_task(flight.do("song", failing)) for _ in range(3)]
+        await asyncio.sleep(0)
+        release.set()
+
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+        assert all(isinstance(result, RuntimeError) for result in results)
+        assert len(flight) == 0
+
+    async def test_cancelled_waiter_does_not_cancel_the_call(self):
+        flight = SingleFlight()
+        release = asyncio.Event()
+
+        async def lookup():
+            await release.wait()
+            return "lyrics"
+
+        leader = asyncio.create_task(flight.do("song", lookup))
+        await asyncio.sleep(0)
+        waiter = asyncio.create_task(flight.do("song", lookup))
+        await asyncio.sleep(0)
+        waiter.cancel()
+        release.set()
+
+        assert await leader == "lyrics"
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+
+    async def test_finished_calls_are_not_cached(self):
+        flight = SingleFlight()
+        calls = 0
+
+        async def lookup():
+            nonlocal calls
+            calls += 1
+            return calls
+
+        assert await flight.do("song", lookup) == 1
+        assert await flight.do("song", lookup) == 2
+
+    def test_calls_from_other_event_loops_are_shared(self):
+        flight = SingleFlight()
+        started = threading.Event()
+        release = threading.Event()
+        calls = 0
+
+        async def lookup():
+            nonlocal calls
+            calls += 1
+            started.set()
+            await asyncio.get_running_loop().run_in_executor(None, release.wait)
+            return "lyrics"
+
+        results = []
+        leader = threading.Thread(
+            target=lambda: results.append(asyncio.run(flight.do("song", lookup)))
+        )
+        leader.start()
+        assert started.wait(timeout=5)
+
+        follower = threading.Thread(
+            target=lambda: results.append(asyncio.run(flight.do("song", lookup)))
+        )
+        follower.start()
+        # El seguidor espera al futuro del líder (callback de wrap_future)
+        pending = flight._calls["song"]
+        deadline = time.monotonic() + 5
+        while not pending._done_callbacks and time.monotonic() < deadline:
+            time.sleep(0.001)
+        release.set()
+        leader.join(timeout=5)
+        follower.join(timeout=5)
+
+        assert results == ["lyrics", "lyrics"]
+        assert calls == 1
+
+    async def test_leader_error_is_raised(self):
+        flight = SingleFlight()
+
+        async def failing():
+            raise ValueError("bad")
+
+        with pytest.raises(ValueError):
+            await flight.do("song", failing)
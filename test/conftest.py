@@ -4,6 +4,7 @@
 Configuración básica de pytest para tests simples
 """
 
+import os
 import pytest
 import sys
 from pathlib import Path
@@ -12,6 +13,8 @@ from pathlib import Path
 current_dir = Path(__file__).parent
 sys.path.insert(0, str(current_dir))
 
+from fixtures.django_env import DJANGO_TEST_ENV  # noqa: E402
+
 
 @pytest.fixture
 def sample_song_data():
@@ -76,3 +79,47 @@ def sample_playlist_data():
         "is_public": True,
         "is_active": True,
     }
+
+
+@pytest.fixture(scope="session")
+def django_setup():
+    """Django configurado con ``config.settings`` y los settings de test"""
+    postgres_url = os.getenv("TEST_POSTGRES_URL")
+    if postgres_url:
+        os.environ["DATABASE_URL"] = postgres_url
+    for name, value in DJANGO_TEST_ENV.items():
+        os.environ.setdefault(name, value)
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings")
+    # Antes que src/, que también tiene un paquete ``config``
+    sys.path.insert(0, str(current_dir.parent))
+
+    import django
+
+    django.setup()
+
+
+@pytest.fixture(scope="session")
+def django_db_setup(django_setup):
+    """
+    Base de datos de test migrada.
+
+    SQLite en memoria por defecto; con ``TEST_POSTGRES_URL`` se usa (y se
+    crea y destruye) una base de datos de test en ese servidor.
+    """
+    from django.db import connection
+
+    old_name = connection.creation.create_test_db(verbosity=0, serialize=False)
+    yield connection
+    connection.creation.destroy_test_db(old_name, verbosity=0)
+
+
+@pytest.fixture
+def db(django_db_setup):
+    """Base de datos de test; lo que escribe el test se deshace al terminar"""
+    from django.core.cache import cache
+    from django.db import transaction
+
+    with transaction.atomic():
+        yield django_db_setup
+        transaction.set_rollback(True)
+    cache.clear()
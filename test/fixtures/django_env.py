@@ -0,0 +1,32 @@
+"""
+Settings obligatorios para arrancar Django en los tests.
+
+Los usan los tests con base de datos (``db``) y los que arrancan la aplicación
+en un subproceso; los que ya estén en el entorno se respetan.
+"""
+
+DJANGO_TEST_ENV = {
+    "DATABASE_URL": "sqlite:///:memory:",
+    "SECRET_KEY": "test-secret-key",
+    "DEBUG": "false",
+    "ALLOWED_HOSTS": "*",
+    "CORS_ALLOWED_ORIGINS": "http://localhost",
+    "SUPABASE_URL": "http://localhost",
+    "SUPABASE_ANON_KEY": "test",
+    "SUPABASE_SERVICE_KEY": "test",
+    "SUPABASE_JWT_SECRET": "test",
+    "SUPABASE_JWT_ALGORITHM": "HS256",
+    "SUPABASE_PROJECT_ID": "test",
+    "YOUTUBE_API_KEY": "test",
+    "YOUTUBE_API_SERVICE_NAME": "youtube",
+    "YOUTUBE_API_VERSION": "v3",
+    "GENIUS_CLIENT_ID": "test",
+    "GENIUS_CLIENT_SECRET": "test",
+    "STRIPE_SECRET_KEY": "test",
+    "STRIPE_PUBLISHABLE_KEY": "test",
+    "STRIPE_WEBHOOK_SECRET": "test",
+    "STRIPE_PREMIUM_MONTHLY_PRICE_ID": "test",
+    "STRIPE_PREMIUM_YEARLY_PRICE_ID": "test",
+    "TOKEN_EXPIRATION_TIME": "3600",
+    "WARMUP_ENABLED": "false",
+}
@@ -0,0 +1,104 @@
+"""
+Tests for the genre popularity refresh
+"""
+
+import uuid
+from datetime import timedelta
+
+import pytest
+from django.utils import timezone
+
+
+@pytest.fixture
+def genres(db):
+    from apps.genres.infrastructure.models import GenreModel
+
+    return {
+        name: GenreModel.objects.create(id=uuid.uuid4(), name=name)
+        for name in ("Rock", "Pop", "Jazz")
+    }
+
+
+def create_song(title, genres, play_count, plays_ago_days=()):
+    """Canción con ``play_count`` y un evento por cada antigüedad en días"""
+    from apps.songs.infrastructure.models import PlayEventModel, SongModel
+
+    song = SongModel.objects.create(title=title, play_count=play_count)
+    song.genres.set(genres)
+    now = timezone.now()
+    for days in plays_ago_days:
+        played_at = now - timedelta(days=days)
+        PlayEventModel.objects.create(
+            song=song, played_at=played_at, day=timezone.localdate(played_at)
+        )
+    return song
+
+
+def scores(genres):
+    return {
+        name: type(genre).objects.get(pk=genre.pk).popularity_score
+        for name, genre in genres.items()
+    }
+
+
+class TestRefreshGenrePopularity:
+    """``total plays + RECENT_WEIGHT * recent plays`` per genre"""
+
+    @pytest.fixture(autouse=True)
+    def popularity_settings(self, django_setup, monkeypatch):
+        monkeypatch.setattr(
+            "django.conf.settings.GENRE_POPULARITY",
+            {"RECENT_DAYS": 7, "RECENT_WEIGHT": 10},
+            raising=False,
+        )
+
+    def test_song_in_several_genres_counts_for_each(self, genres):
+        from apps.genres.infrastructure.popularity import refresh_genre_popularity
+
+        # 2 reproducciones recientes y 1 fuera de la ventana
+        create_song("Crossover", [genres["Rock"], genres["Pop"]], 50, (0, 3, 30))
+        create_song("Ballad", [genres["Pop"]], 20, (1,))
+
+        updated = refresh_genre_popularity()
+
+        assert updated == 3
+        assert scores(genres) == {
+            "Rock": 50 + 10 * 2,
+            "Pop": (50 + 20) + 10 * (2 + 1),
+            "Jazz": 0,
+        }
+
+    def test_recent_weight_and_window_come_from_settings(self, genres, monkeypatch):
+        from apps.genres.infrastructure.popularity import refresh_genre_popularity
+
+        monkeypatch.setattr(
+            "django.conf.settings.GENRE_POPULARITY",
+            {"RECENT_DAYS": 60, "RECENT_WEIGHT": 2},
+        )
+        create_song("Crossover", [genres["Rock"], genres["Pop"]], 50, (0, 3, 30))
+
+        refresh_genre_popularity()
+
+        assert scores(genres)["Rock"] == 50 + 2 * 3
+
+    def test_scores_are_recomputed_from_scratch(self, genres):
+        from apps.genres.infrastructure.models import GenreModel
+        from apps.genres.infrastructure.popularity import refresh_genre_popularity
+
+        GenreModel.objects.update(popularity_score=999)
+        create_song("Crossover", [genres["Rock"]], 5)
+
+        refresh_genre_popularity()
+
+        assert scores(genres) == {"Rock": 5, "Pop": 0, "Jazz": 0}
+
+    def test_popular_genres_cache_is_invalidated(self, genres):
+        from apps.genres.infrastructure.cache import get_popular_genres_cache
+        from apps.genres.infrastructure.popularity import refresh_genre_popularity
+
+        cache = get_popular_genres_cache()
+        cache.set("top", ["stale"])
+
+        refresh_genre_popularity()
+
+        assert cache.get("top") is None
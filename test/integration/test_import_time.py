@@ -0,0 +1,126 @@
+"""
+Presupuesto de tiempo de import del arranque del worker.
+
+Se arranca la aplicación en un subproceso con ``python -X importtime``
+(``config.asgi`` y el URLconf, lo que carga un worker antes de atender la
+primera petición) y se comprueba que:
+
+- las dependencias de import diferido (``common.utils.lazy_import``) no se
+  cargan al arrancar;
+- el tiempo total de import no supera ``IMPORT_TIME_BUDGET_SECONDS``. Depende
+  de la máquina, así que sólo se comprueba si se define esa variable de
+  entorno (en CI, por ejemplo) y lleva la marca ``slow``.
+
+Los settings obligatorios que falten en el entorno se rellenan con los de
+``fixtures.django_env``: arrancar no conecta con ningún servicio externo.
+"""
+
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict, Optional
+
+import pytest
+from fixtures.django_env import DJANGO_TEST_ENV
+
+ROOT_DIR = Path(__file__).resolve().parents[2]
+
+# Opcional: sin la variable de entorno no se comprueba el tiempo
+IMPORT_TIME_BUDGET_SECONDS: Optional[float] = (
+    float(os.environ["IMPORT_TIME_BUDGET_SECONDS"])
+    if os.getenv("IMPORT_TIME_BUDGET_SECONDS")
+    else None
+)
+
+# Se importan en el primer uso o en el calentamiento, nunca al arrancar
+LAZY_MODULES = ("yt_dlp", "googleapiclient", "stripe", "aiohttp")
+
+BOOT_SCRIPT = """
+import json, sys
+import config.asgi
+from django.urls import get_resolver
+get_resolver().url_patterns
+print("BOOT " + json.dumps(sorted(sys.modules)))
+"""
+
+
+def parse_import_times(output: str) -> Dict[str, int]:
+    """Microsegundos acumulados de cada import de primer nivel"""
+    times = {}
+    for line in output.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        _, cumulative, name = line[len("import time:") :].split("|")
+        if cumulative.strip().isdigit() and not name.startswith("  "):
+            times[name.strip()] = int(cumulative)
+    return times
+
+
+@pytest.fixture(scope="module")
+def boot():
+    """Módulos cargados y tiempos de import de un arranque en frío"""
+    env = {**DJANGO_TEST_ENV, **os.environ}
+    env.update(
+        {
+            "DJANGO_SETTINGS_MODULE": "config.settings",
+            "PYTHONPATH": os.pathsep.join([str(ROOT_DIR), str(ROOT_DIR / "src")]),
+            "WARMUP_ENABLED": "false",
+            "METRICS_EXPORT_PATH": "",
+        }
+    )
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", BOOT_SCRIPT],
+        cwd=ROOT_DIR,
+        env=env,
+        capture_output=True,
+        text=True,
+        timeout=300,
+    )
+    modules = [
+        line[len("BOOT ") :]
+        for line in result.stdout.splitlines()
+        if line.startswith("BOOT ")
+    ]
+    if result.returncode != 0 or not modules:
+        pytest.fail(f"Application failed to boot:\n{result.stderr[-3000:]}")
+    return set(json.loads(modules[-1])), parse_import_times(result.stderr)
+
+
+class TestImportTime:
+    """Presupuesto de import del arranque del worker"""
+
+    def test_lazy_modules_are_not_imported_at_boot(self, boot):
+        modules, _ = boot
+
+        loaded = [
+            name
+            for name in LAZY_MODULES
+            if any(module.split(".")[0] == name for module in modules)
+        ]
+
+        assert loaded == []
+
+    def test_project_packages_are_imported_once(self, boot):
+        modules, _ = boot
+
+        # ``src.common`` y ``common`` serían el mismo código cargado dos veces
+        assert not any(module.startswith("src.common") for module in modules)
+
+    @pytest.mark.slow
+    @pytest.mark.skipif(
+        IMPORT_TIME_BUDGET_SECONDS is None,
+        reason="set IMPORT_TIME_BUDGET_SECONDS to check the boot import time",
+    )
+    def test_boot_import_time_is_within_budget(self, boot):
+        _, times = boot
+        budget = IMPORT_TIME_BUDGET_SECONDS
+
+        total = sum(times.values()) / 1_000_000
+        slowest = sorted(times.items(), key=lambda item: item[1], reverse=True)[:10]
+
+        assert total <= budget, (
+            f"Boot imports took {total:.2f}s (budget {budget:.2f}s). Slowest: "
+            + ", ".join(f"{name}={us / 1_000_000:.2f}s" for name, us in slowest)
+        )
@@ -0,0 +1,93 @@
+"""
+Backfill de ``songs.lyrics`` a ``song_lyrics`` (migración 0009).
+
+Se vuelve a la migración 0008 (que aún tiene la columna ``lyrics``), se crean
+canciones con los modelos históricos y se migra hacia delante. Las migraciones
+no pueden ejecutarse dentro de la transacción del fixture ``db``: el test
+deja la base de datos migrada y sin filas al terminar.
+"""
+
+import importlib
+import uuid
+
+import pytest
+
+pytestmark = pytest.mark.slow
+
+BEFORE_BACKFILL = ("songs", "0008_songlyricsmodel_songmodel_has_lyrics")
+BACKFILL = ("songs", "0009_backfill_song_lyrics")
+
+
+@pytest.fixture
+def executor(django_db_setup):
+    from django.db.migrations.executor import MigrationExecutor
+
+    connection = django_db_setup
+    executor = MigrationExecutor(connection)
+    leaf_nodes = executor.loader.graph.leaf_nodes()
+    executor.migrate([BEFORE_BACKFILL])
+    yield MigrationExecutor(connection)
+
+    executor = MigrationExecutor(connection)
+    executor.migrate(leaf_nodes)
+    from apps.songs.infrastructure.models import SongModel
+
+    SongModel.objects.all().delete()
+
+
+def historical_models(executor, target):
+    apps = executor.loader.project_state(target).apps
+    return apps.get_model("songs", "SongModel"), apps.get_model(
+        "songs", "SongLyricsModel"
+    )
+
+
+def test_backfill_copies_lyrics_and_sets_flag(executor, monkeypatch):
+    SongModel, _ = historical_models(executor, BEFORE_BACKFILL)
+    with_lyrics = [
+        SongModel.objects.create(id=uuid.uuid4(), title=f"Song {i}", lyrics=f"L{i}")
+        for i in range(5)
+    ]
+    empty = SongModel.objects.create(id=uuid.uuid4(), title="Empty", lyrics="")
+    missing = SongModel.objects.create(id=uuid.uuid4(), title="Missing")
+    # Varios lotes
+    backfill = importlib.import_module(
+        "apps.songs.migrations.0009_backfill_song_lyrics"
+    )
+    monkeypatch.setattr(backfill, "BATCH_SIZE", 2)
+
+    executor.migrate([BACKFILL])
+
+    SongModel, SongLyricsModel = historical_models(executor, BACKFILL)
+    assert dict(SongLyricsModel.objects.values_list("song_id", "text")) == {
+        song.id: song.lyrics for song in with_lyrics
+    }
+    flags = dict(SongModel.objects.values_list("id", "has_lyrics"))
+    assert all(flags[song.id] for song in with_lyrics)
+    assert not flags[empty.id]
+    assert not flags[missing.id]
+
+
+def test_backfill_resumes_after_partial_run(executor):
+    SongModel, SongLyricsModel = historical_models(executor, BEFORE_BACKFILL)
+    song = SongModel.objects.create(id=uuid.uuid4(), title="Song", lyrics="new")
+    # Fila ya copiada por una ejecución interrumpida
+    SongLyricsModel.objects.create(song_id=song.id, text="copied")
+
+    executor.migrate([BACKFILL])
+
+    _, SongLyricsModel = historical_models(executor, BACKFILL)
+    assert list(SongLyricsModel.objects.values_list("text", flat=True)) == ["copied"]
+
+
+def test_backfill_is_reversible(executor):
+    SongModel, _ = historical_models(executor, BEFORE_BACKFILL)
+    song = SongModel.objects.create(id=uuid.uuid4(), title="Song", lyrics="text")
+    executor.migrate([BACKFILL])
+    SongModel.objects.filter(id=song.id).update(lyrics=None)
+
+    executor = type(executor)(executor.connection)
+    executor.migrate([BEFORE_BACKFILL])
+
+    SongModel, _ = historical_models(executor, BEFORE_BACKFILL)
+    assert SongModel.objects.get(id=song.id).lyrics == "text"
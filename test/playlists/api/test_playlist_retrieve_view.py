@@ -0,0 +1,132 @@
+"""
+Tests for the playlist detail endpoint (``/playlists/<id>/``)
+"""
+
+import uuid
+from types import SimpleNamespace
+
+import pytest
+
+
+@pytest.fixture
+def factory(django_setup):
+    from rest_framework.test import APIRequestFactory
+
+    return APIRequestFactory()
+
+
+@pytest.fixture
+def view(django_setup):
+    from apps.playlists.api.views.playlist_views import PlaylistViewSet
+
+    return PlaylistViewSet.as_view({"get": "retrieve"})
+
+
+@pytest.fixture
+def owner(db):
+    from apps.user_profile.infrastructure.models import UserProfileModel
+
+    return UserProfileModel.objects.create(id=uuid.uuid4(), email="owner@test.com")
+
+
+@pytest.fixture
+def make_playlist(owner):
+    from apps.artists.infrastructure.models import ArtistModel
+    from apps.playlists.infrastructure.models import PlaylistModel, PlaylistSongModel
+    from apps.songs.infrastructure.models import SongModel
+
+    def make(is_public: bool, songs: int = 0):
+        playlist = PlaylistModel.objects.create(
+            name="Road trip", user=owner, is_public=is_public
+        )
+        artist = ArtistModel.objects.create(id=uuid.uuid4(), name="Queen")
+        for position in range(1, songs + 1):
+            song = SongModel.objects.create(
+                title=f"Song {position}", artist=artist, duration_seconds=180
+            )
+            PlaylistSongModel.objects.create(
+                playlist=playlist, song=song, position=position
+            )
+        return playlist
+
+    return make
+
+
+def retrieve(view, factory, playlist_id, user_id=None, **params):
+    from rest_framework.test import force_authenticate
+
+    request = factory.get(f"/playlists/{playlist_id}/", params)
+    if user_id is not None:
+        user = SimpleNamespace(id=user_id, pk=user_id, is_authenticated=True)
+        force_authenticate(request, user=user)
+    return view(request, pk=str(playlist_id))
+
+
+class TestPlaylistRetrieveView:
+    """Propietario o playlist pública, con canciones opcionales"""
+
+    def test_non_owner_can_retrieve_public_playlist(self, view, factory, make_playlist):
+        playlist = make_playlist(is_public=True)
+
+        response = retrieve(view, factory, playlist.id, user_id=uuid.uuid4())
+
+        assert response.status_code == 200
+        assert response.data["id"] == str(playlist.id)
+        assert "songs" not in response.data
+
+    def test_non_owner_cannot_retrieve_private_playlist(
+        self, view, factory, make_playlist
+    ):
+        playlist = make_playlist(is_public=False)
+
+        response = retrieve(view, factory, playlist.id, user_id=uuid.uuid4())
+
+        assert response.status_code in (403, 404)
+
+    def test_owner_can_retrieve_private_playlist(
+        self, view, factory, make_playlist, owner
+    ):
+        playlist = make_playlist(is_public=False)
+
+        response = retrieve(view, factory, playlist.id, user_id=owner.id)
+
+        assert response.status_code == 200
+
+    def test_missing_playlist(self, view, factory, db):
+        response = retrieve(view, factory, uuid.uuid4(), user_id=uuid.uuid4())
+
+        assert response.status_code == 404
+
+    def test_include_songs_embeds_first_page(self, view, factory, make_playlist):
+        from django.db import connection
+        from django.test.utils import CaptureQueriesContext
+
+        playlist = make_playlist(is_public=True, songs=5)
+
+        with CaptureQueriesContext(connection) as few:
+            response = retrieve(
+                view, factory, playlist.id, include_songs="true", songs_limit=2
+            )
+
+        assert response.status_code == 200
+        songs = response.data["songs"]
+        assert [song["position"] for song in songs] == [1, 2]
+        assert [song["song_title"] for song in songs] == ["Song 1", "Song 2"]
+        assert songs[0]["song_artist"] == "Queen"
+        assert songs[0]["song_duration"] == 180
+
+        # Los datos de cada canción vienen en la misma consulta de la página
+        with CaptureQueriesContext(connection) as many:
+            retrieve(view, factory, playlist.id, include_songs="true", songs_limit=5)
+        assert len(many) == len(few)
+
+    @pytest.mark.parametrize("songs_limit", ["0", "101", "abc"])
+    def test_invalid_songs_limit(self, view, factory, make_playlist, songs_limit):
+        playlist = make_playlist(is_public=True)
+
+        response = retrieve(
+            view, factory, playlist.id, include_songs="true", songs_limit=songs_limit
+        )
+
+        assert response.status_code == 400
+        assert "songs_limit" in response.data["error"]
@@ -103,6 +103,33 @@ class TestPlaylistEntity:
         playlist.songs = songs
         assert playlist.song_count == 2
 
+    def test_playlist_entity_song_count_uses_total_songs(self):
+        """Test song_count con el total calculado en la consulta"""
+        playlist = PlaylistEntity(
+            id="playlist-1",
+            name="Playlist Paginada",
+            description=None,
+            user_id="user-123",
+            is_default=False,
+            is_public=True,
+            created_at=datetime.now(),
+            total_songs=40
+        )
+
+        assert playlist.song_count == 40
+
+        # Sólo la primera página de canciones cargada
+        playlist.songs = [
+            PlaylistSongEntity(
+                id="ps-1",
+                playlist_id="playlist-1",
+                song_id="song-1",
+                position=1,
+                added_at=datetime.now()
+            )
+        ]
+        assert playlist.song_count == 40
+
     def test_playlist_entity_name_validation_empty(self):
         """Test validación de nombre vacío"""
         with pytest.raises(ValueError, match="El nombre de la playlist no puede estar vacío"):
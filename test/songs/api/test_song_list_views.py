@@ -0,0 +1,83 @@
+"""
+Tests for the sync and async variants of the song list views
+"""
+
+import uuid
+
+import pytest
+
+
+@pytest.fixture
+def factory(django_setup):
+    from rest_framework.test import APIRequestFactory
+
+    return APIRequestFactory()
+
+
+@pytest.fixture
+def trending_views(django_setup):
+    from apps.songs.api.views.async_song_views import AsyncTrendingSongsView
+    from apps.songs.api.views.trending_songs_view import TrendingSongsView
+
+    return TrendingSongsView, AsyncTrendingSongsView
+
+
+@pytest.fixture
+def use_case(django_setup, monkeypatch):
+    """Resultado (o error) del caso de uso de tendencias"""
+    from apps.songs.use_cases import GetTrendingSongsUseCase
+
+    outcome = {"songs": [], "error": None}
+
+    async def execute(self, limit=20):
+        if outcome["error"]:
+            raise outcome["error"]
+        return outcome["songs"]
+
+    monkeypatch.setattr(GetTrendingSongsUseCase, "execute", execute)
+    return outcome
+
+
+async def call(view_class, request):
+    from asgiref.sync import iscoroutinefunction, sync_to_async
+
+    view = view_class.as_view()
+    if iscoroutinefunction(view):
+        return await view(request)
+    return await sync_to_async(view)(request)
+
+
+@pytest.mark.parametrize("variant", [0, 1], ids=["sync", "async"])
+class TestTrendingSongsViews:
+    """Sync and async variants share the response and error helpers"""
+
+    async def test_success_returns_paginated_songs(
+        self, variant, trending_views, use_case, factory
+    ):
+        # Query única: la respuesta se cachea por URL
+        request = factory.get("/", {"limit": "5", "nonce": uuid.uuid4().hex})
+
+        response = await call(trending_views[variant], request)
+
+        assert response.status_code == 200
+        assert response.data["results"] == []
+        assert response.has_header("ETag")
+
+    async def test_invalid_limit_returns_400(
+        self, variant, trending_views, use_case, factory
+    ):
+        response = await call(trending_views[variant], factory.get("/", {"limit": "0"}))
+
+        assert response.status_code == 400
+        assert response.data == {"error": "Invalid limit parameter"}
+
+    async def test_use_case_error_returns_500(
+        self, variant, trending_views, use_case, factory
+    ):
+        use_case["error"] = RuntimeError("database is down")
+        request = factory.get("/", {"nonce": uuid.uuid4().hex})
+
+        response = await call(trending_views[variant], request)
+
+        assert response.status_code == 500
+        assert response.data == {"error": "Internal server error"}
@@ -0,0 +1,86 @@
+"""
+Tests for the play history endpoint (``/songs/<id>/plays/``)
+"""
+
+import uuid
+from datetime import timedelta
+
+import pytest
+from django.utils import timezone
+
+
+@pytest.fixture
+def factory(django_setup):
+    from rest_framework.test import APIRequestFactory
+
+    return APIRequestFactory()
+
+
+@pytest.fixture
+def view(django_setup):
+    from apps.songs.api.views import SongPlayHistoryView
+
+    return SongPlayHistoryView.as_view()
+
+
+@pytest.fixture
+def song(db):
+    from apps.songs.infrastructure.models import PlayEventModel, SongModel
+
+    song = SongModel.objects.create(title="Bohemian Rhapsody")
+    now = timezone.now()
+    for played_at in (now, now, now - timedelta(days=2), now - timedelta(days=30)):
+        PlayEventModel.objects.create(
+            song=song, played_at=played_at, day=timezone.localdate(played_at)
+        )
+    return song
+
+
+def get_history(view, factory, song_id, **params):
+    return view(factory.get(f"/songs/{song_id}/plays/", params), song_id=song_id)
+
+
+class TestSongPlayHistoryView:
+    """Plays per day or hour over a window"""
+
+    def test_plays_per_day(self, view, factory, song):
+        response = get_history(view, factory, song.id, days=7)
+
+        assert response.status_code == 200
+        assert response.data["song_id"] == str(song.id)
+        assert response.data["granularity"] == "day"
+        assert response.data["total"] == 3
+        today = timezone.localdate()
+        assert [(item["period"], item["plays"]) for item in response.data["plays"]] == [
+            (today - timedelta(days=2), 1),
+            (today, 2),
+        ]
+
+    def test_plays_per_hour(self, view, factory, song):
+        response = get_history(view, factory, song.id, granularity="hour", days=1)
+
+        assert response.status_code == 200
+        assert response.data["total"] == 2
+        assert [item["plays"] for item in response.data["plays"]] == [2]
+
+    def test_wider_window_includes_older_plays(self, view, factory, song):
+        response = get_history(view, factory, song.id, days=60)
+
+        assert response.data["total"] == 4
+
+    def test_song_without_plays(self, view, factory, db):
+        response = get_history(view, factory, uuid.uuid4())
+
+        assert response.status_code == 200
+        assert response.data["total"] == 0
+        assert response.data["plays"] == []
+
+    @pytest.mark.parametrize(
+        "params",
+        [{"granularity": "week"}, {"days": 0}, {"days": "abc"}, {"days": 1000}],
+    )
+    def test_invalid_parameters(self, view, factory, params, db):
+        response = get_history(view, factory, uuid.uuid4(), **params)
+
+        assert response.status_code == 400
+        assert "error" in response.data
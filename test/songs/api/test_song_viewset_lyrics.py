@@ -0,0 +1,112 @@
+"""
+Tests for lyrics in the song detail and list responses
+"""
+
+import pytest
+
+
+@pytest.fixture
+def factory(django_setup):
+    from rest_framework.test import APIRequestFactory
+
+    return APIRequestFactory()
+
+
+@pytest.fixture
+def list_view(django_setup):
+    from apps.songs.api.views import SongViewSet
+
+    return SongViewSet.as_view({"get": "list"})
+
+
+@pytest.fixture
+def detail_view(django_setup):
+    from apps.songs.api.views import SongViewSet
+
+    return SongViewSet.as_view({"get": "retrieve"})
+
+
+@pytest.fixture
+def song(db):
+    from apps.songs.infrastructure.lyrics import save_song_lyrics_sync
+    from apps.songs.infrastructure.models import SongModel
+
+    song = SongModel.objects.create(title="Bohemian Rhapsody")
+    save_song_lyrics_sync(song.id, "Is this the real life?")
+    return song
+
+
+def get_detail(detail_view, factory, song, **headers):
+    return detail_view(factory.get(f"/songs/{song.id}/", **headers), id=song.id)
+
+
+def get_list(list_view, factory, **headers):
+    return list_view(factory.get("/songs/", **headers))
+
+
+def executed_sql(func):
+    from django.db import connection
+    from django.test.utils import CaptureQueriesContext
+
+    with CaptureQueriesContext(connection) as queries:
+        response = func()
+    return response, " ".join(query["sql"] for query in queries)
+
+
+class TestSongLyricsResponses:
+    """Only the detail reads the song_lyrics row"""
+
+    def test_detail_includes_lyrics(self, detail_view, factory, song):
+        response = get_detail(detail_view, factory, song)
+
+        assert response.status_code == 200
+        assert response.data["lyrics"] == "Is this the real life?"
+        assert response.data["has_lyrics"] is True
+
+    def test_list_returns_flag_without_lyrics(self, list_view, factory, song):
+        response, sql = executed_sql(lambda: get_list(list_view, factory))
+
+        assert response.status_code == 200
+        results = response.data.get("results", response.data)
+        assert [(item["lyrics"], item["has_lyrics"]) for item in results] == [
+            (None, True)
+        ]
+        # Ni los validadores ni la página leen la tabla de letras
+        assert "song_lyrics" not in sql
+
+
+class TestSongLyricsValidators:
+    """The lyrics version is part of the detail ETag only"""
+
+    def test_list_aggregates_do_not_join_lyrics(self, django_setup):
+        from apps.songs.api.views import SongViewSet
+
+        aggregates = SongViewSet().get_conditional_list_aggregates()
+
+        assert "lyrics_entry__updated_at" not in aggregates
+        assert "updated_at" in aggregates
+
+    def test_detail_etag_changes_with_lyrics(self, detail_view, factory, song):
+        from datetime import timedelta
+
+        from apps.songs.infrastructure.models import SongLyricsModel
+
+        etag = get_detail(detail_view, factory, song)["ETag"]
+        entry = SongLyricsModel.objects.get(song=song)
+        SongLyricsModel.objects.filter(song=song).update(
+            text="Is this just fantasy?",
+            updated_at=entry.updated_at + timedelta(seconds=1),
+        )
+
+        response = get_detail(detail_view, factory, song, HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == 200
+        assert response["ETag"] != etag
+        assert response.data["lyrics"] == "Is this just fantasy?"
+
+    def test_detail_not_modified(self, detail_view, factory, song):
+        etag = get_detail(detail_view, factory, song)["ETag"]
+
+        response = get_detail(detail_view, factory, song, HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == 304
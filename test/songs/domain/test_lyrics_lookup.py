@@ -0,0 +1,52 @@
+"""
+Tests para el aplazamiento de búsquedas de letras
+"""
+
+from datetime import datetime, timedelta
+
+from apps.songs.domain.lyrics_lookup import (
+    FOUND,
+    NOT_FOUND,
+    LyricsLookupAttempt,
+    retry_delay,
+)
+
+
+class TestRetryDelay:
+    """Tests para retry_delay"""
+
+    def test_no_delay_without_misses(self):
+        assert retry_delay(0, 24, 2, 720) == timedelta(0)
+
+    def test_delay_grows_with_each_miss(self):
+        delays = [retry_delay(misses, 24, 2, 720) for misses in range(1, 5)]
+
+        assert delays == [timedelta(hours=hours) for hours in (24, 48, 96, 192)]
+
+    def test_delay_is_capped(self):
+        assert retry_delay(6, 24, 2, 720) == timedelta(hours=720)
+        assert retry_delay(10_000, 24, 2, 720) == timedelta(hours=720)
+
+
+class TestLyricsLookupAttempt:
+    """Tests para LyricsLookupAttempt.is_due"""
+
+    def test_miss_is_due_after_next_attempt(self):
+        now = datetime(2025, 1, 1, 12)
+        attempt = LyricsLookupAttempt(
+            song_id="song-1",
+            outcome=NOT_FOUND,
+            last_attempt_at=now,
+            misses=1,
+            next_attempt_at=now + timedelta(hours=24),
+        )
+
+        assert not attempt.is_due(now + timedelta(hours=23))
+        assert attempt.is_due(now + timedelta(hours=24))
+
+    def test_found_is_always_due(self):
+        attempt = LyricsLookupAttempt(
+            song_id="song-1", outcome=FOUND, last_attempt_at=datetime(2025, 1, 1)
+        )
+
+        assert attempt.is_due(datetime(2025, 1, 1))
@@ -314,3 +314,16 @@ class TestSongEntity:
         assert song.lyrics == ""
         assert song.album_title == ""
         assert song.artist_name == ""
+
+    def test_song_entity_uses_slots(self):
+        """Test que la entidad no reserva __dict__ por instancia"""
+        import pickle
+
+        song = SongEntity(id="song-slots", title="Slots", genre_ids=["rock"])
+
+        assert not hasattr(song, "__dict__")
+        with pytest.raises(AttributeError):
+            song.unknown_field = "x"
+
+        song.play_count += 1
+        assert pickle.loads(pickle.dumps(song)) == song
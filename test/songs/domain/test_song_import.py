@@ -0,0 +1,82 @@
+"""
+Tests para la validación de registros de importación de canciones
+"""
+
+import pytest
+
+from apps.songs.domain.exceptions import InvalidImportRowException
+from apps.songs.domain.song_import import parse_import_track
+
+
+def record(**overrides):
+    data = {
+        "title": "  Bohemian   Rhapsody ",
+        "artist": "Queen",
+        "source_id": "bq-001",
+        "file_url": "https://cdn.example.com/bq-001.mp3",
+    }
+    data.update(overrides)
+    return data
+
+
+class TestParseImportTrack:
+    """Tests para parse_import_track"""
+
+    def test_valid_record(self):
+        track = parse_import_track(
+            record(album="A Night at the Opera", duration_seconds="354"), 3
+        )
+
+        assert track.position == 3
+        assert track.title == "Bohemian Rhapsody"
+        assert track.source_key == ("upload", "bq-001")
+        assert track.duration_seconds == 354
+        assert track.track_number is None
+
+    def test_default_source_type(self):
+        track = parse_import_track(record(), 1, default_source_type="youtube")
+
+        assert track.source_type == "youtube"
+
+    def test_genres_from_text_or_list(self):
+        from_text = parse_import_track(record(genres="Rock; Opera|rock |Rock"), 1)
+        from_list = parse_import_track(record(genres=["Rock", " ", "Opera"]), 1)
+
+        assert from_text.genres == ["Rock", "Opera", "rock"]
+        assert from_list.genres == ["Rock", "Opera"]
+
+    def test_empty_csv_values_are_missing(self):
+        track = parse_import_track(record(album="", track_number="", genres=""), 1)
+
+        assert track.album is None
+        assert track.track_number is None
+        assert track.genres == []
+
+    @pytest.mark.parametrize(
+        "overrides",
+        [
+            {"title": " "},
+            {"artist": None},
+            {"source_id": ""},
+            {"source_type": "vinyl"},
+            {"file_url": None},
+            {"file_url": "ftp://cdn.example.com/a.mp3"},
+            {"duration_seconds": "3:54"},
+            {"duration_seconds": 100000},
+            {"track_number": 0},
+            {"title": "x" * 256},
+            {"artist_name": "Queen"},
+        ],
+    )
+    def test_invalid_records(self, overrides):
+        with pytest.raises(InvalidImportRowException) as exc_info:
+            parse_import_track(record(**overrides), 7)
+
+        assert exc_info.value.position == 7
+        assert exc_info.value.message.startswith("Record 7:")
+
+    def test_local_file_instead_of_url(self):
+        track = parse_import_track(record(file_url=None, file_path="audio/bq.mp3"), 1)
+
+        assert track.file_path == "audio/bq.mp3"
+        assert track.file_url is None
@@ -0,0 +1,41 @@
+"""
+Tests para la puntuación de tendencia con decaimiento exponencial
+Archivo: src/apps/songs/domain/trending.py
+"""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from apps.songs.domain.trending import current_score, play_weight, rebase_factor
+
+EPOCH = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+
+class TestTrendingScore:
+    """Tests para los pesos y el cambio de época"""
+
+    def test_play_at_epoch_weighs_one(self):
+        assert play_weight(EPOCH, EPOCH, 24) == 1
+
+    def test_weight_doubles_every_half_life(self):
+        assert play_weight(EPOCH + timedelta(hours=24), EPOCH, 24) == 2
+        assert play_weight(EPOCH - timedelta(hours=48), EPOCH, 24) == 0.25
+
+    def test_recent_plays_outrank_older_bigger_bursts(self):
+        now = EPOCH + timedelta(days=10)
+        old_burst = 10 * play_weight(now - timedelta(days=3), EPOCH, 24)
+        recent = 3 * play_weight(now - timedelta(hours=1), EPOCH, 24)
+
+        assert recent > old_burst
+        assert current_score(old_burst, EPOCH, now, 24) == pytest.approx(1.25)
+
+    def test_rebase_keeps_current_score(self):
+        now = EPOCH + timedelta(days=30)
+        score = 5 * play_weight(now - timedelta(hours=6), EPOCH, 24)
+
+        rebased = score * rebase_factor(EPOCH, now, 24)
+
+        assert current_score(rebased, now, now, 24) == pytest.approx(
+            current_score(score, EPOCH, now, 24)
+        )
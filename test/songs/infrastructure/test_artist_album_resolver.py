@@ -0,0 +1,180 @@
+"""
+Tests for batched artist and album resolution during ingestion
+"""
+
+import uuid
+
+import pytest
+
+
+@pytest.fixture
+def resolver(db):
+    from apps.songs.infrastructure import artist_album_resolver
+
+    artist_album_resolver.get_artist_album_cache().clear()
+    yield artist_album_resolver
+    artist_album_resolver.get_artist_album_cache().clear()
+
+
+def request(artist_name, album_title=None):
+    from apps.songs.infrastructure.artist_album_resolver import ArtistAlbumRequest
+
+    return ArtistAlbumRequest(artist_name=artist_name, album_title=album_title)
+
+
+def total_artists():
+    from apps.statistics.infrastructure.models import CatalogStatsModel
+
+    catalog = CatalogStatsModel.objects.filter(
+        id=CatalogStatsModel.SINGLETON_ID
+    ).first()
+    return catalog.total_artists if catalog else 0
+
+
+class TestNameKey:
+    """Comparison key of artist names and album titles"""
+
+    def test_ignores_case_and_collapses_whitespace(self, django_setup):
+        from apps.songs.infrastructure.artist_album_resolver import name_key
+
+        assert name_key("  the   Beatles ") == name_key("The Beatles") == "THE BEATLES"
+
+
+class TestResolveArtistsAlbums:
+    """Resolving and creating artists and albums"""
+
+    def test_missing_artists_and_albums_are_created_once(self, resolver):
+        from apps.albums.infrastructure.models import AlbumModel
+        from apps.artists.infrastructure.models import ArtistModel
+
+        results = resolver.resolve_artists_albums_sync(
+            [
+                request("Queen", "A Night at the Opera"),
+                request("queen", "a night at the opera"),
+                request("Queen", "News of the World"),
+                request("Muse"),
+            ]
+        )
+
+        assert ArtistModel.objects.count() == 2
+        assert AlbumModel.objects.count() == 2
+        assert results[0].artist_id == results[1].artist_id == results[2].artist_id
+        assert results[0].album_id == results[1].album_id != results[2].album_id
+        assert results[3].artist_name == "Muse"
+        assert results[3].album_id is None
+
+    def test_existing_rows_are_reused(self, resolver):
+        from apps.albums.infrastructure.models import AlbumModel
+        from apps.artists.infrastructure.models import ArtistModel
+
+        artist = ArtistModel.objects.create(id=uuid.uuid4(), name="Queen")
+        album = AlbumModel.objects.create(
+            id=uuid.uuid4(), title="Jazz", artist_id=artist.id
+        )
+
+        (result,) = resolver.resolve_artists_albums_sync([request("QUEEN", "jazz")])
+
+        assert (result.artist_id, result.artist_name) == (str(artist.id), "Queen")
+        assert (result.album_id, result.album_title) == (str(album.id), "Jazz")
+        assert ArtistModel.objects.count() == 1
+
+    def test_oldest_duplicate_wins(self, resolver):
+        from datetime import timedelta
+
+        from apps.artists.infrastructure.models import ArtistModel
+
+        newer = ArtistModel.objects.create(id=uuid.uuid4(), name="Queen")
+        older = ArtistModel.objects.create(id=uuid.uuid4(), name="queen")
+        ArtistModel.objects.filter(id=older.id).update(
+            created_at=newer.created_at - timedelta(days=1)
+        )
+
+        (result,) = resolver.resolve_artists_albums_sync([request("Queen")])
+
+        assert result.artist_id == str(older.id)
+
+    def test_albums_are_scoped_to_their_artist(self, resolver):
+        results = resolver.resolve_artists_albums_sync(
+            [request("Queen", "Greatest Hits"), request("ABBA", "Greatest Hits")]
+        )
+
+        assert results[0].album_id != results[1].album_id
+
+    def test_resolved_refs_are_cached(self, resolver):
+        from django.db import connection
+        from django.test.utils import CaptureQueriesContext
+
+        resolver.resolve_artists_albums_sync([request("Queen", "Jazz")])
+
+        with CaptureQueriesContext(connection) as queries:
+            resolver.resolve_artists_albums_sync([request("queen", "JAZZ")])
+
+        assert len(queries) == 0
+
+    def test_created_artists_are_counted_in_the_catalog(self, resolver):
+        before = total_artists()
+
+        resolver.resolve_artists_albums_sync(
+            [request("Queen"), request("queen"), request("Muse")]
+        )
+
+        assert total_artists() - before == 2
+
+
+class TestConcurrentCreation:
+    """Creation re-reads the rows once the key locks are held"""
+
+    def test_artist_created_while_waiting_for_the_lock_is_reused(
+        self, resolver, monkeypatch
+    ):
+        from apps.artists.infrastructure.models import ArtistModel
+
+        winner = {}
+        lock_keys = resolver._lock_keys
+
+        def lock_after_concurrent_insert(kind, keys):
+            # Otra ingesta inserta y confirma mientras esperamos el bloqueo
+            if kind == "artist":
+                winner["artist"] = ArtistModel.objects.create(
+                    id=uuid.uuid4(), name="Queen"
+                )
+            lock_keys(kind, keys)
+
+        monkeypatch.setattr(resolver, "_lock_keys", lock_after_concurrent_insert)
+        before = total_artists()
+
+        results = resolver.resolve_artists_albums_sync(
+            [request("Queen", "Jazz"), request("Muse")]
+        )
+
+        assert results[0].artist_id == str(winner["artist"].id)
+        assert ArtistModel.objects.filter(name__iexact="queen").count() == 1
+        # Queen lo cuenta el save() de la otra ingesta; aquí solo Muse
+        assert total_artists() - before == 2
+        assert ArtistModel.objects.count() == 2
+
+    def test_lock_ids_are_stable_sorted_and_per_kind(self, django_setup):
+        from apps.songs.infrastructure.artist_album_resolver import _lock_ids
+
+        ids = _lock_ids("artist", ["QUEEN", "MUSE", "QUEEN"])
+
+        assert ids == sorted(ids)
+        assert len(ids) == 2
+        assert ids == _lock_ids("artist", ["MUSE", "QUEEN"])
+        assert _lock_ids("album", [("1", "QUEEN")]) != _lock_ids("artist", ["QUEEN"])
+        assert all(-(2**63) <= lock_id < 2**63 for lock_id in ids)
+
+    def test_advisory_locks_on_postgresql(self, resolver):
+        from django.db import connection
+
+        if connection.vendor != "postgresql":
+            pytest.skip("Advisory locks are PostgreSQL only")
+
+        resolver._lock_keys("artist", ["QUEEN", "MUSE"])
+
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT count(*) FROM pg_locks "
+                "WHERE locktype = 'advisory' AND pid = pg_backend_pid()"
+            )
+            assert cursor.fetchone()[0] == 2
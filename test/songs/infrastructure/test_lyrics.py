@@ -0,0 +1,93 @@
+"""
+Tests for lyrics storage in the song_lyrics table
+"""
+
+import uuid
+
+import pytest
+from asgiref.sync import async_to_sync
+
+
+@pytest.fixture
+def song(db):
+    from apps.songs.infrastructure.models import SongModel
+
+    return SongModel.objects.create(title="Bohemian Rhapsody")
+
+
+def stored(song):
+    from apps.songs.infrastructure.models import SongLyricsModel, SongModel
+
+    return (
+        SongLyricsModel.objects.filter(song=song)
+        .values_list("text", flat=True)
+        .first(),
+        SongModel.objects.get(pk=song.pk).has_lyrics,
+    )
+
+
+class TestSaveSongLyrics:
+    """Writing lyrics keeps ``has_lyrics`` in step"""
+
+    def test_new_lyrics_set_has_lyrics(self, song):
+        from apps.songs.infrastructure.lyrics import save_song_lyrics
+
+        async_to_sync(save_song_lyrics)(str(song.id), "Is this the real life?")
+
+        assert stored(song) == ("Is this the real life?", True)
+
+    def test_lyrics_are_replaced(self, song):
+        from apps.songs.infrastructure.lyrics import save_song_lyrics_sync
+
+        save_song_lyrics_sync(song.id, "first")
+        save_song_lyrics_sync(song.id, "second")
+
+        assert stored(song) == ("second", True)
+
+    def test_get_song_lyrics(self, song):
+        from apps.songs.infrastructure.lyrics import (
+            get_song_lyrics,
+            save_song_lyrics_sync,
+        )
+
+        assert async_to_sync(get_song_lyrics)(str(song.id)) is None
+
+        save_song_lyrics_sync(song.id, "Is this the real life?")
+
+        assert async_to_sync(get_song_lyrics)(str(song.id)) == "Is this the real life?"
+
+    def test_deleting_the_song_deletes_its_lyrics(self, song):
+        from apps.songs.infrastructure.lyrics import save_song_lyrics_sync
+        from apps.songs.infrastructure.models import SongLyricsModel
+
+        save_song_lyrics_sync(song.id, "Is this the real life?")
+        song.delete()
+
+        assert not SongLyricsModel.objects.exists()
+
+
+class TestSaveLyricsBatch:
+    """Batch upsert of lyrics"""
+
+    def test_batch_upserts_and_skips_deleted_songs(self, song):
+        from apps.songs.infrastructure.lyrics import (
+            save_lyrics_batch_sync,
+            save_song_lyrics_sync,
+        )
+        from apps.songs.infrastructure.models import SongModel
+
+        other = SongModel.objects.create(title="Under Pressure")
+        save_song_lyrics_sync(song.id, "old")
+
+        saved = save_lyrics_batch_sync(
+            {str(song.id): "new", str(other.id): "Pressure", str(uuid.uuid4()): "x"}
+        )
+
+        assert saved == 2
+        assert stored(song) == ("new", True)
+        assert stored(other) == ("Pressure", True)
+
+    def test_empty_batch(self, db):
+        from apps.songs.infrastructure.lyrics import save_lyrics_batch_sync
+
+        assert save_lyrics_batch_sync({}) == 0
@@ -0,0 +1,135 @@
+"""
+Tests for the resumable bulk lyrics backfill (``update_lyrics``)
+"""
+
+from collections import Counter
+
+import pytest
+from asgiref.sync import async_to_sync
+
+
+class StubLyricsService:
+    """Encuentra letra para los títulos pares y anota cada búsqueda"""
+
+    def __init__(self):
+        self.looked_up = Counter()
+
+    async def find_lyrics(self, title, artist, youtube_id=None):
+        from common.adapters.lyrics import LyricsLookup
+
+        self.looked_up[title] += 1
+        if int(title.split()[-1]) % 2 == 0:
+            return LyricsLookup(lyrics=f"{title} lyrics", source="stub")
+        return LyricsLookup(sources_tried=["stub"])
+
+
+@pytest.fixture
+def songs(db):
+    from apps.songs.infrastructure.models import SongModel
+
+    for number in range(7):
+        SongModel.objects.create(title=f"Song {number}")
+    # Orden de lectura del backfill
+    return list(SongModel.objects.order_by("id").values_list("title", flat=True))
+
+
+def run_backfill(service, **kwargs):
+    from apps.songs.infrastructure.lyrics_backfill import LyricsBackfill
+
+    backfill = LyricsBackfill(service, concurrency=1, chunk_size=2)
+    return async_to_sync(backfill.run)(only_without_lyrics=False, **kwargs)
+
+
+def checkpoint():
+    from apps.songs.infrastructure.models import LyricsBackfillCheckpointModel
+
+    return LyricsBackfillCheckpointModel.objects.filter(name="all").first()
+
+
+def song_id(title):
+    from apps.songs.infrastructure.models import SongModel
+
+    return str(SongModel.objects.get(title=title).id)
+
+
+class TestLyricsBackfill:
+    """Limited runs save a checkpoint and the next run continues after it"""
+
+    def test_limited_runs_resume_without_repeating_songs(self, songs):
+        service = StubLyricsService()
+
+        first = run_backfill(service, limit=3)
+
+        assert first.processed == 3
+        assert first.completed is False
+        assert sorted(service.looked_up) == sorted(songs[:3])
+        saved = checkpoint()
+        assert str(saved.last_song_id) == song_id(songs[2])
+        assert saved.processed == 3
+
+        second = run_backfill(service)
+
+        assert second.resumed_from == song_id(songs[2])
+        assert second.processed == 4
+        assert second.completed is True
+        assert sorted(service.looked_up) == sorted(songs)
+        assert set(service.looked_up.values()) == {1}
+        assert checkpoint() is None
+
+    def test_lyrics_found_are_saved(self, songs):
+        from apps.songs.infrastructure.models import SongLyricsModel, SongModel
+
+        stats = run_backfill(StubLyricsService())
+
+        assert stats.to_dict()["updated"] == 4
+        assert stats.to_dict()["skipped"] == 3
+        assert stats.source_hits["stub"] == 4
+        with_lyrics = SongModel.objects.filter(has_lyrics=True)
+        assert sorted(with_lyrics.values_list("title", flat=True)) == [
+            "Song 0",
+            "Song 2",
+            "Song 4",
+            "Song 6",
+        ]
+        assert SongLyricsModel.objects.count() == 4
+
+    def test_interrupted_run_resumes_after_last_saved_batch(self, songs, monkeypatch):
+        from apps.songs.infrastructure import lyrics_backfill
+
+        save_lyrics_batch = lyrics_backfill.save_lyrics_batch
+        flushes = []
+
+        async def failing_save(found):
+            flushes.append(found)
+            if len(flushes) == 2:
+                raise RuntimeError("connection lost")
+            return await save_lyrics_batch(found)
+
+        monkeypatch.setattr(lyrics_backfill, "save_lyrics_batch", failing_save)
+        service = StubLyricsService()
+
+        with pytest.raises(RuntimeError):
+            run_backfill(service)
+
+        # Sólo el primer lote (dos canciones) quedó guardado
+        assert str(checkpoint().last_song_id) == song_id(songs[1])
+
+        monkeypatch.setattr(lyrics_backfill, "save_lyrics_batch", save_lyrics_batch)
+        stats = run_backfill(service)
+
+        assert stats.completed is True
+        assert stats.processed == 5
+        # Se repiten las del lote perdido (y las ya leídas), no las del guardado
+        assert [service.looked_up[title] for title in songs[:4]] == [1, 1, 2, 2]
+        assert sorted(service.looked_up) == sorted(songs)
+        assert checkpoint() is None
+
+    def test_restart_ignores_checkpoint(self, songs):
+        service = StubLyricsService()
+        run_backfill(service, limit=3)
+
+        stats = run_backfill(service, resume=False)
+
+        assert stats.resumed_from is None
+        assert stats.processed == 7
+        assert checkpoint() is None
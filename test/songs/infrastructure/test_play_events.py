@@ -0,0 +1,259 @@
+"""
+Tests for batched play ingestion and play event retention
+"""
+
+import uuid
+from datetime import timedelta
+from io import StringIO
+
+import pytest
+from django.utils import timezone
+
+
+@pytest.fixture
+def play_events(django_setup, monkeypatch):
+    from apps.songs.infrastructure import play_events
+
+    # El volcado corre dentro de la transacción del test
+    monkeypatch.setattr(play_events, "close_old_connections", lambda: None)
+    return play_events
+
+
+@pytest.fixture
+def artist(db):
+    from apps.artists.infrastructure.models import ArtistModel
+
+    return ArtistModel.objects.create(id=uuid.uuid4(), name="Queen")
+
+
+@pytest.fixture
+def songs(artist):
+    from apps.songs.infrastructure.models import SongModel
+
+    return [
+        SongModel.objects.create(title=f"Song {i}", artist=artist) for i in range(3)
+    ]
+
+
+@pytest.fixture
+def received(django_setup):
+    """Registros enviados con ``plays_recorded``"""
+    from apps.songs.infrastructure.signals import plays_recorded
+
+    records = []
+
+    def receiver(sender, plays, **kwargs):
+        records.extend(plays)
+
+    plays_recorded.connect(receiver, dispatch_uid="test_play_events_receiver")
+    yield records
+    plays_recorded.disconnect(dispatch_uid="test_play_events_receiver")
+
+
+def event(play_events, song, played_at=None):
+    return play_events.PlayEvent(
+        song_id=str(song.id), played_at=played_at or timezone.now()
+    )
+
+
+class TestSavePlayEvents:
+    """Flushing a batch of plays"""
+
+    def test_events_are_inserted_with_their_local_day(self, play_events, songs):
+        from apps.songs.infrastructure.models import PlayEventModel
+
+        played_at = timezone.now()
+
+        play_events.save_play_events([event(play_events, songs[0], played_at)] * 2)
+
+        rows = list(PlayEventModel.objects.filter(song=songs[0]))
+        assert len(rows) == 2
+        assert {row.day for row in rows} == {timezone.localdate(played_at)}
+
+    def test_counters_are_updated_per_song(self, play_events, songs, monkeypatch):
+        # Un CASE por canción para comprobar también el troceo de los UPDATE
+        monkeypatch.setattr(play_events, "COUNTER_UPDATE_CHUNK", 2)
+        now = timezone.now()
+        earlier = now - timedelta(hours=1)
+        events = (
+            [event(play_events, songs[0], earlier), event(play_events, songs[0], now)]
+            + [event(play_events, songs[1], earlier)] * 3
+            + [event(play_events, songs[2], now)]
+        )
+
+        play_events.save_play_events(events)
+
+        for song in songs:
+            song.refresh_from_db()
+        assert [song.play_count for song in songs] == [2, 3, 1]
+        assert [song.last_played_at for song in songs] == [now, earlier, now]
+        assert all(song.trending_score > 0 for song in songs)
+        assert songs[1].trending_score > songs[0].trending_score
+
+    def test_later_flushes_add_to_the_counters(self, play_events, songs):
+        play_events.save_play_events([event(play_events, songs[0])])
+        play_events.save_play_events([event(play_events, songs[0])] * 2)
+
+        songs[0].refresh_from_db()
+        assert songs[0].play_count == 3
+
+    def test_events_of_deleted_songs_are_skipped(self, play_events, songs, received):
+        from apps.songs.infrastructure.models import PlayEventModel
+
+        missing = play_events.PlayEvent(
+            song_id=str(uuid.uuid4()), played_at=timezone.now()
+        )
+
+        play_events.save_play_events([missing])
+
+        assert not PlayEventModel.objects.exists()
+        assert received == []
+
+    def test_plays_recorded_per_song_and_day(
+        self, play_events, songs, artist, received
+    ):
+        now = timezone.now()
+        yesterday = now - timedelta(days=1)
+        events = [
+            event(play_events, songs[0], yesterday),
+            event(play_events, songs[0], now),
+            event(play_events, songs[0], now),
+        ]
+
+        play_events.save_play_events(events)
+
+        assert [(r.song_id, r.played_at, r.count) for r in received] == [
+            (str(songs[0].id), yesterday, 1),
+            (str(songs[0].id), now, 2),
+        ]
+        assert all(r.artist_id == str(artist.id) for r in received)
+        # Solo el primer registro cuenta la canción como reproducida
+        assert [r.first_play for r in received] == [True, False]
+
+    def test_rankings_are_invalidated(self, play_events, songs):
+        from apps.songs.infrastructure.cache import (
+            get_most_played_cache,
+            get_trending_cache,
+        )
+
+        most_played = get_most_played_cache()
+        trending = get_trending_cache()
+        most_played.set("top", ["stale"])
+        trending.set("top", ["stale"])
+
+        play_events.save_play_events([event(play_events, songs[0])])
+
+        assert most_played.get("top") is None
+        assert trending.get("top") is None
+
+
+class TestFlushAfterCommit:
+    """Failures after the commit must not make the buffer retry the batch"""
+
+    @pytest.fixture
+    def buffer(self, play_events):
+        buffer = play_events.PlayEventBuffer(
+            flush=play_events.save_play_events,
+            name=f"test_play_events_{uuid.uuid4().hex}",
+            flush_interval=3600,
+        )
+        yield buffer
+        buffer.stop()
+
+    def test_failed_invalidation_does_not_rebuffer_events(
+        self, play_events, buffer, songs, received, monkeypatch
+    ):
+        from apps.songs.infrastructure.models import PlayEventModel
+
+        def fail():
+            raise ConnectionError("cache down")
+
+        monkeypatch.setattr(play_events, "invalidate_most_played_cache", fail)
+        monkeypatch.setattr(play_events, "invalidate_trending_cache", fail)
+        buffer.record(songs[0].id)
+        buffer.record(songs[0].id)
+
+        assert buffer.flush() == 2
+
+        songs[0].refresh_from_db()
+        assert songs[0].play_count == 2
+        assert PlayEventModel.objects.filter(song=songs[0]).count() == 2
+        assert len(buffer) == 0
+        assert buffer.pending_count(songs[0].id) == 0
+        # Las estadísticas se notifican aunque falle la invalidación
+        assert sum(record.count for record in received) == 2
+
+    def test_failed_notification_does_not_rebuffer_events(
+        self, play_events, buffer, songs, monkeypatch
+    ):
+        def fail(songs, per_song_day):
+            raise RuntimeError("broken receiver")
+
+        monkeypatch.setattr(play_events, "_send_plays_recorded", fail)
+        buffer.record(songs[0].id)
+
+        assert buffer.flush() == 1
+        assert len(buffer) == 0
+
+    def test_failed_write_keeps_events_buffered(
+        self, play_events, buffer, songs, monkeypatch
+    ):
+        def fail():
+            raise RuntimeError("database down")
+
+        monkeypatch.setattr(play_events, "lock_trending_state", fail)
+        buffer.record(songs[0].id)
+
+        with pytest.raises(RuntimeError):
+            buffer.flush()
+
+        assert len(buffer) == 1
+        assert buffer.pending_count(songs[0].id) == 1
+        # Que ``stop`` no lo reintente al terminar
+        buffer._items.clear()
+
+
+class TestPrunePlayEvents:
+    """``prune_play_events`` management command"""
+
+    def test_deletes_events_older_than_retention(self, songs):
+        from django.core.management import call_command
+
+        from apps.songs.infrastructure.models import PlayEventModel
+
+        today = timezone.localdate()
+        for days_ago in (0, 5, 10, 11, 30):
+            day = today - timedelta(days=days_ago)
+            PlayEventModel.objects.create(
+                song=songs[0], played_at=timezone.now(), day=day
+            )
+        out = StringIO()
+
+        call_command("prune_play_events", days=10, stdout=out)
+
+        remaining = sorted(
+            (today - day).days
+            for day in PlayEventModel.objects.values_list("day", flat=True)
+        )
+        assert remaining == [0, 5, 10]
+        assert "Deleted 2 play events" in out.getvalue()
+
+    def test_defaults_to_retention_setting(self, songs, monkeypatch):
+        from django.core.management import call_command
+
+        from apps.songs.infrastructure.models import PlayEventModel
+
+        monkeypatch.setattr(
+            "django.conf.settings.PLAY_EVENTS", {"RETENTION_DAYS": 1}, raising=False
+        )
+        today = timezone.localdate()
+        PlayEventModel.objects.create(
+            song=songs[0], played_at=timezone.now(), day=today
+        )
+        PlayEventModel.objects.create(
+            song=songs[0], played_at=timezone.now(), day=today - timedelta(days=2)
+        )
+
+        call_command("prune_play_events", stdout=StringIO())
+
+        assert list(PlayEventModel.objects.values_list("day", flat=True)) == [today]
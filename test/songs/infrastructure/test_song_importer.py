@@ -0,0 +1,171 @@
+"""
+Tests for the bulk song import (``import_songs``) against the database
+"""
+
+import csv
+import uuid
+
+import pytest
+from asgiref.sync import async_to_sync
+
+COLUMNS = ("title", "artist", "album", "genres", "source_id", "file_path", "file_url")
+
+ROWS = [
+    ("Bohemian Rhapsody", "Queen", "A Night at the Opera", "Rock;Opera", "a", "", "https://cdn.example.com/a.mp3"),
+    ("Love of My Life", "Queen", "A Night at the Opera", "rock", "b", "b.mp3", ""),
+    ("Uprising", "Muse", "", "Polka", "c", "c.mp3", ""),
+    ("Starlight", "Muse", "", "", "d", "d.mp3", ""),
+    ("Bohemian Rhapsody (dup)", "Queen", "", "", "a", "", "https://cdn.example.com/a.mp3"),
+]  # fmt: skip
+
+
+class StubStorage:
+    """Storage en memoria; las subidas de ``failing`` devuelven False"""
+
+    def __init__(self, failing=()):
+        self.failing = set(failing)
+        self.uploaded = []
+
+    def upload_item(self, file_name, file_obj):
+        if file_name in self.failing:
+            return False
+        self.uploaded.append(file_name)
+        return True
+
+    def get_item_url(self, file_name):
+        return f"https://storage.example.com/{file_name}"
+
+
+@pytest.fixture
+def manifest(tmp_path):
+    for name in ("b.mp3", "c.mp3", "d.mp3"):
+        (tmp_path / name).write_bytes(b"ID3")
+    path = tmp_path / "catalog.csv"
+    with open(path, "w", newline="") as file_obj:
+        writer = csv.writer(file_obj)
+        writer.writerow(COLUMNS)
+        writer.writerows(ROWS)
+    return str(path)
+
+
+@pytest.fixture
+def rock(db):
+    from apps.genres.infrastructure.models import GenreModel
+
+    return GenreModel.objects.create(id=uuid.uuid4(), name="Rock")
+
+
+def run_import(manifest, storage, **kwargs):
+    from apps.songs.infrastructure.song_import import SongImporter
+
+    importer = SongImporter(storage_service=storage, **kwargs)
+    return async_to_sync(importer.run)(manifest)
+
+
+def genres_by_source_id():
+    from apps.songs.infrastructure.models import SongModel
+
+    through = SongModel.genres.through
+    rows = through.objects.values_list("songmodel__source_id", "genremodel__name")
+    genres = {}
+    for source_id, name in rows:
+        genres.setdefault(source_id, []).append(name)
+    return genres
+
+
+class TestSongImporter:
+    """Batched, idempotent import keyed by (source_type, source_id)"""
+
+    def test_import_counts_and_genres(self, manifest, rock):
+        from apps.songs.infrastructure.models import SongModel
+
+        storage = StubStorage(failing={"audio/imports/upload/d.mp3"})
+
+        stats = run_import(manifest, storage)
+
+        assert stats.read == 5
+        assert stats.imported == 3
+        assert stats.duplicates == 1
+        assert stats.failed == 1
+        assert stats.existing == 0
+        assert stats.unknown_genres == {"Opera": 1, "Polka": 1}
+        assert "Record 4" in stats.errors[0]
+        songs = {song.source_id: song for song in SongModel.objects.all()}
+        assert sorted(songs) == ["a", "b", "c"]
+        assert songs["a"].file_url == "https://cdn.example.com/a.mp3"
+        assert songs["b"].file_url == (
+            "https://storage.example.com/audio/imports/upload/b.mp3"
+        )
+        assert songs["a"].artist.name == "Queen"
+        assert songs["a"].album.title == "A Night at the Opera"
+        assert songs["a"].album_id == songs["b"].album_id
+        assert genres_by_source_id() == {"a": ["Rock"], "b": ["Rock"]}
+
+    def test_second_run_skips_existing_songs(self, manifest, rock):
+        from apps.songs.infrastructure.models import SongModel
+
+        run_import(manifest, StubStorage(failing={"audio/imports/upload/d.mp3"}))
+        storage = StubStorage()
+
+        stats = run_import(manifest, storage)
+
+        assert stats.existing == 3
+        assert stats.imported == 1
+        assert stats.failed == 0
+        # Sólo se sube el audio que faltaba
+        assert storage.uploaded == ["audio/imports/upload/d.mp3"]
+        assert SongModel.objects.count() == 4
+        assert genres_by_source_id() == {"a": ["Rock"], "b": ["Rock"]}
+
+        again = run_import(manifest, storage)
+
+        assert (again.imported, again.existing) == (0, 4)
+        assert SongModel.objects.count() == 4
+
+    def test_interrupted_run_resumes(self, manifest, rock, monkeypatch):
+        from apps.songs.infrastructure import song_import
+        from apps.songs.infrastructure.models import SongModel
+
+        resolve = song_import.resolve_artists_albums_sync
+        calls = []
+
+        def failing_resolve(requests):
+            calls.append(requests)
+            if len(calls) == 2:
+                raise RuntimeError("connection lost")
+            return resolve(requests)
+
+        monkeypatch.setattr(song_import, "resolve_artists_albums_sync", failing_resolve)
+
+        with pytest.raises(RuntimeError):
+            run_import(manifest, StubStorage(), batch_size=2)
+
+        # El primer lote quedó guardado
+        assert sorted(SongModel.objects.values_list("source_id", flat=True)) == [
+            "a",
+            "b",
+        ]
+
+        monkeypatch.setattr(song_import, "resolve_artists_albums_sync", resolve)
+        storage = StubStorage()
+        stats = run_import(manifest, storage, batch_size=2)
+
+        assert stats.existing == 3
+        assert stats.imported == 2
+        assert sorted(storage.uploaded) == [
+            "audio/imports/upload/c.mp3",
+            "audio/imports/upload/d.mp3",
+        ]
+        assert SongModel.objects.count() == 4
+
+    def test_dry_run_writes_nothing(self, manifest, rock):
+        from apps.songs.infrastructure.models import SongModel
+        from apps.songs.infrastructure.song_import import SongImporter
+
+        storage = StubStorage()
+        importer = SongImporter(storage_service=storage)
+        stats = async_to_sync(importer.run)(manifest, dry_run=True)
+
+        assert stats.imported == 4
+        assert storage.uploaded == []
+        assert not SongModel.objects.exists()
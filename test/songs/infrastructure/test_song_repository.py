@@ -0,0 +1,154 @@
+"""
+Tests for SongRepository.save
+"""
+
+import uuid
+
+import pytest
+from asgiref.sync import async_to_sync
+
+
+@pytest.fixture
+def repository(django_setup):
+    from apps.songs.infrastructure.repository.song_repository import SongRepository
+
+    return SongRepository()
+
+
+@pytest.fixture
+def genres(db):
+    from apps.genres.infrastructure.models import GenreModel
+
+    return [
+        str(GenreModel.objects.create(id=uuid.uuid4(), name=name).id)
+        for name in ("Rock", "Pop", "Jazz")
+    ]
+
+
+def song_entity(**fields):
+    from apps.songs.domain.entities import SongEntity
+
+    return SongEntity(**{"id": "", "title": "Bohemian Rhapsody", **fields})
+
+
+def stored_genres(song_id):
+    """Filas de la tabla intermedia (SQLite no comprueba la FK hasta el commit)"""
+    from apps.songs.infrastructure.models import SongModel
+
+    through = SongModel.genres.through
+    return {
+        str(genre_id)
+        for genre_id in through.objects.filter(songmodel_id=song_id).values_list(
+            "genremodel_id", flat=True
+        )
+    }
+
+
+class TestSaveSong:
+    """Creating and updating songs"""
+
+    def test_new_song_is_created_with_genres(self, repository, genres):
+        saved = async_to_sync(repository.save)(song_entity(genre_ids=genres[:2]))
+
+        assert saved.id
+        assert saved.title == "Bohemian Rhapsody"
+        assert set(saved.genre_ids) == set(genres[:2])
+        assert stored_genres(saved.id) == set(genres[:2])
+
+    def test_existing_song_is_updated(self, repository, genres):
+        from apps.songs.infrastructure.models import SongModel
+
+        song = SongModel.objects.create(title="Old title", play_count=7)
+
+        saved = async_to_sync(repository.save)(
+            song_entity(id=str(song.id), title="New title", play_count=8)
+        )
+
+        assert saved.id == str(song.id)
+        song.refresh_from_db()
+        assert (song.title, song.play_count) == ("New title", 8)
+        assert SongModel.objects.count() == 1
+
+    def test_unknown_id_creates_the_song(self, repository, genres):
+        from apps.songs.infrastructure.models import SongModel
+
+        saved = async_to_sync(repository.save)(song_entity(id=str(uuid.uuid4())))
+
+        assert SongModel.objects.filter(id=saved.id).exists()
+        assert SongModel.objects.count() == 1
+
+    def test_genres_are_replaced(self, repository, genres):
+        saved = async_to_sync(repository.save)(song_entity(genre_ids=genres[:2]))
+
+        async_to_sync(repository.save)(
+            song_entity(id=saved.id, genre_ids=[genres[1], genres[2]])
+        )
+
+        assert stored_genres(saved.id) == {genres[1], genres[2]}
+
+    def test_empty_genres_clear_the_song_genres(self, repository, genres):
+        saved = async_to_sync(repository.save)(song_entity(genre_ids=genres))
+
+        async_to_sync(repository.save)(song_entity(id=saved.id, genre_ids=[]))
+
+        assert stored_genres(saved.id) == set()
+
+    def test_unknown_genres_are_skipped(self, repository, genres):
+        unknown = str(uuid.uuid4())
+
+        saved = async_to_sync(repository.save)(
+            song_entity(genre_ids=[genres[0], unknown, genres[0]])
+        )
+        async_to_sync(repository.save)(
+            song_entity(id=saved.id, genre_ids=[unknown, genres[1]])
+        )
+
+        assert stored_genres(saved.id) == {genres[1]}
+
+    def test_lyrics_are_saved_and_none_keeps_them(self, repository, db):
+        from apps.songs.infrastructure.models import SongLyricsModel
+
+        saved = async_to_sync(repository.save)(song_entity(lyrics="Is this real?"))
+        reloaded = async_to_sync(repository.save)(song_entity(id=saved.id, lyrics=None))
+
+        assert SongLyricsModel.objects.get(song_id=saved.id).text == "Is this real?"
+        assert reloaded.has_lyrics is True
+        assert reloaded.lyrics == "Is this real?"
+
+
+class TestSaveWithoutReload:
+    """``reload=False`` returns the entity built from the written data"""
+
+    def test_returns_written_data_without_reading_the_song(self, repository, genres):
+        from django.db import connection
+        from django.test.utils import CaptureQueriesContext
+
+        unknown = str(uuid.uuid4())
+        entity = song_entity(genre_ids=[genres[0], unknown], lyrics="Is this real?")
+
+        with CaptureQueriesContext(connection) as queries:
+            saved = async_to_sync(repository.save)(entity, reload=False)
+
+        assert saved.id
+        assert saved.title == entity.title
+        assert saved.genre_ids == [genres[0]]
+        assert saved.has_lyrics is True
+        assert saved.created_at is not None
+        assert saved.updated_at is not None
+        assert not any(
+            query["sql"].startswith("SELECT") and '"songs"' in query["sql"]
+            for query in queries
+        )
+
+    def test_update_keeps_known_fields(self, repository, genres):
+        from apps.songs.infrastructure.models import SongModel
+
+        song = SongModel.objects.create(title="Old title")
+        entity = song_entity(id=str(song.id), title="New title", genre_ids=genres)
+
+        saved = async_to_sync(repository.save)(entity, reload=False)
+
+        assert saved.id == str(song.id)
+        assert saved.title == "New title"
+        assert saved.genre_ids == genres
+        assert saved.updated_at > song.updated_at
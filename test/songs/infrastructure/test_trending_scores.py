@@ -0,0 +1,166 @@
+"""
+Tests for trending score maintenance
+"""
+
+from datetime import timedelta
+
+import pytest
+from django.utils import timezone
+
+HALF_LIFE = 24.0
+
+
+@pytest.fixture
+def trending(django_setup, monkeypatch):
+    from apps.songs.infrastructure import trending
+
+    monkeypatch.setattr(
+        "django.conf.settings.TRENDING",
+        {"HALF_LIFE_HOURS": HALF_LIFE, "MIN_SCORE": 0.05},
+        raising=False,
+    )
+    return trending
+
+
+@pytest.fixture
+def epoch(db):
+    """Época fijada (en punto) para que los pesos sean reproducibles"""
+    from apps.songs.infrastructure.models import TrendingStateModel
+
+    epoch = timezone.now().replace(minute=0, second=0, microsecond=0)
+    TrendingStateModel.objects.update_or_create(
+        id=TrendingStateModel.SINGLETON_ID, defaults={"epoch": epoch}
+    )
+    return epoch
+
+
+@pytest.fixture
+def play_events(django_setup, monkeypatch):
+    from apps.songs.infrastructure import play_events
+
+    monkeypatch.setattr(play_events, "close_old_connections", lambda: None)
+    return play_events
+
+
+def create_songs(*scores):
+    from apps.songs.infrastructure.models import SongModel
+
+    return [
+        SongModel.objects.create(title=f"Song {i}", trending_score=score)
+        for i, score in enumerate(scores)
+    ]
+
+
+def scores(songs):
+    from apps.songs.infrastructure.models import SongModel
+
+    values = dict(
+        SongModel.objects.filter(id__in=[song.id for song in songs]).values_list(
+            "id", "trending_score"
+        )
+    )
+    return [values[song.id] for song in songs]
+
+
+def current_epoch():
+    from apps.songs.infrastructure.models import TrendingStateModel
+
+    return TrendingStateModel.objects.get(id=TrendingStateModel.SINGLETON_ID).epoch
+
+
+class TestRebase:
+    """Moving the epoch"""
+
+    def test_rebase_keeps_order_and_clears_decayed_scores(self, trending, epoch):
+        songs = create_songs(10.0, 2.0, 0.1, 0.0)
+        now = epoch + timedelta(hours=2 * HALF_LIFE)
+
+        cleared = trending.rebase_trending_scores(now=now)
+
+        assert cleared == 1
+        assert scores(songs) == pytest.approx([2.5, 0.5, 0.0, 0.0])
+        assert current_epoch() == now
+
+    def test_recent_epoch_is_not_moved_by_the_flush(self, trending, epoch):
+        songs = create_songs(4.0)
+
+        state = trending.lock_trending_state()
+        moved = trending.rebase_stale_epoch(state, now=epoch + timedelta(days=1))
+
+        assert moved is False
+        assert scores(songs) == [4.0]
+        assert current_epoch() == epoch
+
+    def test_flush_rebases_a_very_old_epoch(self, trending, play_events, epoch):
+        from apps.songs.infrastructure.models import TrendingStateModel
+
+        # Unas 2000 vidas medias: 2 ** 2000 desborda un float
+        old_epoch = epoch - timedelta(days=2000)
+        TrendingStateModel.objects.filter(id=TrendingStateModel.SINGLETON_ID).update(
+            epoch=old_epoch
+        )
+        (song,) = create_songs(0.0)
+
+        play_events.save_play_events(
+            [play_events.PlayEvent(song_id=str(song.id), played_at=timezone.now())]
+        )
+
+        song.refresh_from_db()
+        assert song.play_count == 1
+        assert 0 < song.trending_score <= 1
+        assert current_epoch() > old_epoch
+
+
+class TestRebuild:
+    """Recomputing scores from the play event log"""
+
+    def test_rebuild_matches_incremental_scores(self, trending, play_events, epoch):
+        songs = create_songs(0.0, 0.0)
+        # A mitad de hora: el instante que usa la reconstrucción
+        played = [
+            (songs[0], epoch - timedelta(minutes=30)),
+            (songs[0], epoch - timedelta(hours=5, minutes=30)),
+            (songs[1], epoch - timedelta(hours=30, minutes=30)),
+            (songs[1], epoch - timedelta(hours=30, minutes=30)),
+        ]
+        play_events.save_play_events(
+            [
+                play_events.PlayEvent(song_id=str(song.id), played_at=played_at)
+                for song, played_at in played
+            ]
+        )
+        incremental = scores(songs)
+
+        scored = trending.rebuild_trending_scores(now=epoch)
+
+        assert scored == 2
+        assert scores(songs) == pytest.approx(incremental)
+        assert incremental[0] > incremental[1] > 0
+
+    def test_rebuild_clears_songs_without_recent_plays(self, trending, epoch):
+        songs = create_songs(5.0)
+
+        assert trending.rebuild_trending_scores(now=epoch) == 0
+        assert scores(songs) == [0.0]
+
+
+class TestTrendingFilter:
+    """``trending=true`` on the song list"""
+
+    def test_trending_orders_by_score(self, trending, epoch):
+        from rest_framework.test import APIRequestFactory
+
+        from apps.songs.api.views import SongViewSet
+
+        songs = create_songs(1.0, 0.0, 7.5, 3.0)
+        view = SongViewSet.as_view({"get": "list"})
+
+        response = view(APIRequestFactory().get("/songs/", {"trending": "true"}))
+
+        assert response.status_code == 200
+        results = response.data.get("results", response.data)
+        assert [item["id"] for item in results] == [
+            str(songs[2].id),
+            str(songs[3].id),
+            str(songs[0].id),
+        ]
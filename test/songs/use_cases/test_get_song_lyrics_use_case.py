@@ -0,0 +1,109 @@
+"""
+Tests for GetSongLyricsUseCase and its back-off of repeated misses
+"""
+
+from datetime import timedelta
+
+import pytest
+from asgiref.sync import async_to_sync
+from django.utils import timezone
+
+
+class StubLyricsManager:
+    """Devuelve siempre el mismo resultado y cuenta las búsquedas"""
+
+    def __init__(self, lyrics=None):
+        self.lyrics = lyrics
+        self.calls = 0
+
+    async def find_lyrics(self, title, artist, youtube_id=None):
+        from common.adapters.lyrics import LyricsLookup
+
+        self.calls += 1
+        if self.lyrics:
+            return LyricsLookup(
+                lyrics=self.lyrics, source="lyrics_ovh", sources_tried=["lyrics_ovh"]
+            )
+        return LyricsLookup(sources_tried=["youtube", "lyrics_ovh"])
+
+
+@pytest.fixture
+def song(db):
+    from apps.songs.infrastructure.models import SongModel
+
+    return SongModel.objects.create(title="Bohemian Rhapsody")
+
+
+def get_lyrics(song_id, manager):
+    from apps.songs.infrastructure.repository.song_repository import SongRepository
+    from apps.songs.use_cases.lyrics.get_song_lyrics_use_case import (
+        GetSongLyricsUseCase,
+    )
+
+    use_case = GetSongLyricsUseCase(SongRepository())
+    use_case.lyrics_manager = manager
+    return async_to_sync(use_case.execute)(str(song_id))
+
+
+def lookup_row(song):
+    from apps.songs.infrastructure.models import SongLyricsLookupModel
+
+    return SongLyricsLookupModel.objects.get(song=song)
+
+
+class TestGetSongLyricsUseCase:
+    """Lookups are recorded and misses are not repeated until due"""
+
+    def test_miss_is_recorded_with_next_attempt(self, song, monkeypatch):
+        monkeypatch.setattr(
+            "django.conf.settings.LYRICS_LOOKUP",
+            {"RETRY_AFTER_HOURS": 24.0},
+            raising=False,
+        )
+        manager = StubLyricsManager()
+        before = timezone.now()
+
+        assert get_lyrics(song.id, manager) is None
+
+        assert manager.calls == 1
+        row = lookup_row(song)
+        assert row.outcome == "not_found"
+        assert row.misses == 1
+        assert row.sources_tried == ["youtube", "lyrics_ovh"]
+        assert before + timedelta(hours=24) <= row.next_attempt_at
+        assert row.next_attempt_at <= timezone.now() + timedelta(hours=24)
+
+    def test_deferred_lookup_skips_lyrics_manager(self, song):
+        manager = StubLyricsManager()
+        get_lyrics(song.id, manager)
+
+        assert get_lyrics(song.id, manager) is None
+
+        assert manager.calls == 1
+        assert lookup_row(song).misses == 1
+
+    def test_due_lookup_is_retried(self, song):
+        from apps.songs.infrastructure.models import SongLyricsLookupModel
+
+        get_lyrics(song.id, StubLyricsManager())
+        SongLyricsLookupModel.objects.filter(song=song).update(
+            next_attempt_at=timezone.now() - timedelta(minutes=1)
+        )
+        manager = StubLyricsManager("Is this the real life?")
+
+        assert get_lyrics(song.id, manager) == "Is this the real life?"
+
+        assert manager.calls == 1
+        row = lookup_row(song)
+        assert row.outcome == "found"
+        assert row.misses == 0
+        assert row.next_attempt_at is None
+
+    def test_stored_lyrics_skip_the_lookup(self, song):
+        from apps.songs.infrastructure.lyrics import save_song_lyrics_sync
+
+        save_song_lyrics_sync(song.id, "Is this the real life?")
+        manager = StubLyricsManager()
+
+        assert get_lyrics(song.id, manager) == "Is this the real life?"
+        assert manager.calls == 0
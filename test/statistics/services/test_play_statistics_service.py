@@ -0,0 +1,317 @@
+"""
+Tests for the materialized play statistics
+"""
+
+import uuid
+from datetime import timedelta
+
+import pytest
+from django.utils import timezone
+
+
+@pytest.fixture
+def service(django_setup):
+    from apps.statistics.services import PlayStatisticsService
+
+    return PlayStatisticsService()
+
+
+@pytest.fixture
+def artist(db):
+    from apps.artists.infrastructure.models import ArtistModel
+
+    return ArtistModel.objects.create(id=uuid.uuid4(), name="Queen")
+
+
+@pytest.fixture
+def song(artist):
+    from apps.songs.infrastructure.models import SongModel
+
+    return SongModel.objects.create(title="Bohemian Rhapsody", artist=artist)
+
+
+def catalog():
+    from apps.statistics.infrastructure.models import CatalogStatsModel
+
+    return CatalogStatsModel.objects.filter(
+        id=CatalogStatsModel.SINGLETON_ID
+    ).first() or CatalogStatsModel(id=CatalogStatsModel.SINGLETON_ID)
+
+
+def catalog_totals():
+    row = catalog()
+    return {
+        "total_songs": row.total_songs,
+        "total_artists": row.total_artists,
+        "total_plays": row.total_plays,
+        "played_songs": row.played_songs,
+    }
+
+
+def artist_plays(artist):
+    from apps.statistics.infrastructure.models import ArtistPlayStatsModel
+
+    stats = ArtistPlayStatsModel.objects.filter(artist_id=artist.id).first()
+    return stats.total_plays if stats else None
+
+
+def play(song, count=1, first_play=False, played_at=None):
+    from apps.songs.infrastructure.signals import PlayRecord
+
+    return PlayRecord(
+        song_id=song.id,
+        artist_id=song.artist_id,
+        played_at=played_at or timezone.now(),
+        count=count,
+        first_play=first_play,
+    )
+
+
+def record(service, song, count, first_play=False):
+    """Suma las reproducciones a la canción y a las estadísticas"""
+    from django.db.models import F
+
+    from apps.songs.infrastructure.models import SongModel
+
+    SongModel.objects.filter(id=song.id).update(play_count=F("play_count") + count)
+    service.record_plays([play(song, count, first_play=first_play)])
+    song.refresh_from_db()
+
+
+class TestRecordPlays:
+    """Incremental counters"""
+
+    def test_plays_are_added_to_every_table(self, service, song, artist):
+        from apps.statistics.infrastructure.models import (
+            DailyPlayTotalModel,
+            DailySongPlaysModel,
+        )
+
+        before = catalog_totals()
+        today = timezone.localdate()
+
+        service.record_plays([play(song, 2, first_play=True)])
+        service.record_plays([play(song, 3)])
+
+        assert DailySongPlaysModel.objects.get(day=today, song=song).plays == 5
+        assert DailyPlayTotalModel.objects.get(day=today).plays == 5
+        assert artist_plays(artist) == 5
+        after = catalog_totals()
+        assert after["total_plays"] - before["total_plays"] == 5
+        assert after["played_songs"] - before["played_songs"] == 1
+
+    def test_plays_are_grouped_by_local_day(self, service, song):
+        from apps.statistics.infrastructure.models import DailyPlayTotalModel
+
+        now = timezone.now()
+        yesterday = now - timedelta(days=1)
+
+        service.record_plays(
+            [play(song, played_at=now), play(song, played_at=yesterday)]
+        )
+
+        assert DailyPlayTotalModel.objects.get(day=timezone.localdate(now)).plays == 1
+        assert (
+            DailyPlayTotalModel.objects.get(day=timezone.localdate(yesterday)).plays
+            == 1
+        )
+
+    def test_no_plays_writes_nothing(self, service, song):
+        from apps.statistics.infrastructure.models import DailyPlayTotalModel
+
+        before = catalog_totals()
+
+        service.record_plays([])
+
+        assert not DailyPlayTotalModel.objects.exists()
+        assert catalog_totals() == before
+
+    def test_plays_recorded_signal_updates_statistics(self, song, artist):
+        from apps.songs.infrastructure.signals import plays_recorded
+
+        plays_recorded.send(sender=None, plays=[play(song, 4)])
+
+        assert artist_plays(artist) == 4
+
+
+class TestIncrement:
+    """``UPDATE ... F() + n`` upsert"""
+
+    def test_missing_row_is_created(self, service, db):
+        from apps.statistics.infrastructure.models import DailyPlayTotalModel
+
+        today = timezone.localdate()
+
+        service._increment(DailyPlayTotalModel, {"day": today}, plays=2)
+        service._increment(DailyPlayTotalModel, {"day": today}, plays=3)
+
+        assert DailyPlayTotalModel.objects.get(day=today).plays == 5
+
+    def test_row_created_concurrently_is_updated(self, service, db, monkeypatch):
+        from django.db.models.query import QuerySet
+
+        from apps.statistics.infrastructure.models import DailyPlayTotalModel
+
+        today = timezone.localdate()
+        DailyPlayTotalModel.objects.create(day=today, plays=1)
+        update = QuerySet.update
+        calls = []
+
+        def update_after_concurrent_insert(queryset, **kwargs):
+            # El primer UPDATE no ve la fila que otro proceso acaba de crear
+            calls.append(kwargs)
+            if len(calls) == 1:
+                return 0
+            return update(queryset, **kwargs)
+
+        monkeypatch.setattr(QuerySet, "update", update_after_concurrent_insert)
+
+        service._increment(DailyPlayTotalModel, {"day": today}, plays=2)
+
+        assert len(calls) == 2
+        assert DailyPlayTotalModel.objects.get(day=today).plays == 3
+
+    def test_updated_at_is_refreshed(self, service, artist):
+        from apps.statistics.infrastructure.models import ArtistPlayStatsModel
+
+        service._increment(
+            ArtistPlayStatsModel, {"artist_id": artist.id}, total_plays=1
+        )
+        stats = ArtistPlayStatsModel.objects.get(artist_id=artist.id)
+        ArtistPlayStatsModel.objects.filter(artist_id=artist.id).update(
+            updated_at=stats.updated_at - timedelta(days=1)
+        )
+
+        service._increment(
+            ArtistPlayStatsModel, {"artist_id": artist.id}, total_plays=1
+        )
+
+        stats.refresh_from_db()
+        assert stats.total_plays == 2
+        assert stats.updated_at > timezone.now() - timedelta(minutes=1)
+
+
+class TestCatalogSignals:
+    """Song and artist creation and deletion keep the catalog in step"""
+
+    def test_created_song_and_artist_are_counted(self, db):
+        from apps.artists.infrastructure.models import ArtistModel
+        from apps.songs.infrastructure.models import SongModel
+
+        before = catalog_totals()
+
+        artist = ArtistModel.objects.create(id=uuid.uuid4(), name="Muse")
+        SongModel.objects.create(title="Uprising", artist=artist)
+
+        after = catalog_totals()
+        assert after["total_songs"] - before["total_songs"] == 1
+        assert after["total_artists"] - before["total_artists"] == 1
+
+    def test_deleted_song_removes_its_plays(self, service, song, artist):
+        record(service, song, 3, first_play=True)
+        before = catalog_totals()
+
+        song.delete()
+
+        after = catalog_totals()
+        assert before["total_songs"] - after["total_songs"] == 1
+        assert before["total_plays"] - after["total_plays"] == 3
+        assert before["played_songs"] - after["played_songs"] == 1
+        assert artist_plays(artist) == 0
+
+    def test_song_removed_without_plays(self, service, song, artist):
+        before = catalog_totals()
+
+        service.song_removed(0, artist_id=artist.id)
+
+        after = catalog_totals()
+        assert before["total_songs"] - after["total_songs"] == 1
+        assert after["total_plays"] == before["total_plays"]
+        assert after["played_songs"] == before["played_songs"]
+        assert artist_plays(artist) is None
+
+    def test_deleted_artist_is_discounted(self, service, song, artist):
+        record(service, song, 2, first_play=True)
+        before = catalog_totals()
+
+        artist.delete()
+
+        after = catalog_totals()
+        assert before["total_artists"] - after["total_artists"] == 1
+        # Las canciones se quedan sin artista pero conservan sus reproducciones
+        assert after["total_plays"] == before["total_plays"]
+        assert artist_plays(artist) is None
+
+
+class TestRebuild:
+    """Recomputing the catalog and artist totals"""
+
+    def test_rebuild_restores_catalog_and_artist_rows(self, service, song, artist):
+        from apps.artists.infrastructure.models import ArtistModel
+        from apps.songs.infrastructure.models import SongModel
+        from apps.statistics.infrastructure.models import (
+            ArtistPlayStatsModel,
+            CatalogStatsModel,
+        )
+
+        other = ArtistModel.objects.create(id=uuid.uuid4(), name="Muse")
+        SongModel.objects.create(title="Uprising", artist=other, play_count=4)
+        SongModel.objects.create(title="Unplayed", artist=other)
+        SongModel.objects.filter(id=song.id).update(play_count=6)
+        CatalogStatsModel.objects.all().delete()
+        ArtistPlayStatsModel.objects.create(artist=artist, total_plays=999)
+
+        service.rebuild()
+
+        assert catalog_totals() == {
+            "total_songs": SongModel.objects.count(),
+            "total_artists": ArtistModel.objects.count(),
+            "total_plays": 10,
+            "played_songs": 2,
+        }
+        assert artist_plays(artist) == 6
+        assert artist_plays(other) == 4
+
+    def test_rebuild_drops_artists_without_plays(self, service, song, artist):
+        from apps.statistics.infrastructure.models import ArtistPlayStatsModel
+
+        ArtistPlayStatsModel.objects.create(artist=artist, total_plays=5)
+
+        service.rebuild()
+
+        assert artist_plays(artist) is None
+        assert catalog().total_plays == 0
+
+
+class TestDashboard:
+    """Dashboard data read from the materialized rows"""
+
+    def test_dashboard_rankings_and_daily_plays(self, service, song, artist):
+        record(service, song, 3, first_play=True)
+
+        dashboard = service.get_dashboard(days=14, top=10)
+
+        assert [s.id for s in dashboard["top_songs"]] == [song.id]
+        assert dashboard["top_artists"] == [{"name": "Queen", "total_plays": 3}]
+        assert len(dashboard["daily_plays"]) == 14
+        assert dashboard["daily_plays"][-1] == {
+            "day": timezone.localdate(),
+            "plays": 3,
+        }
+        assert all(item["plays"] == 0 for item in dashboard["daily_plays"][:-1])
+
+    def test_admin_dashboard_renders(self, service, song):
+        from django.contrib import admin
+        from django.contrib.auth.models import User
+        from django.test import RequestFactory
+
+        from apps.statistics.models import StatisticsModel
+
+        record(service, song, 2, first_play=True)
+        request = RequestFactory().get("/admin/statistics/")
+        request.user = User(username="admin", is_staff=True, is_superuser=True)
+
+        response = admin.site._registry[StatisticsModel].changelist_view(request)
+
+        assert response.status_code == 200
+        assert b"Bohemian Rhapsody" in response.content